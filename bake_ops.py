@@ -40,14 +40,7 @@ def apply_vertex_color_to_mesh(mesh, color, attr_name=BAKECOLOR_ATTR):
         color: 颜色数据
         attr_name: 顶点色属性名称
     """
-    vertex_color_layer = check_vertex_color(mesh)
-    if vertex_color_layer:
-        set_active_color_attribute(mesh, vertex_color_layer.name)
-        set_object_vertexcolor(mesh, color, vertex_color_layer.name)
-    else:
-        add_vertexcolor_attribute(mesh, attr_name)
-        set_active_color_attribute(mesh, attr_name)
-        set_object_vertexcolor(mesh, color, attr_name)
+    batch_set_vertex_color([mesh], color, attr_name)
 
 
 class HST_OT_SetBakeCollectionLow(bpy.types.Operator):
@@ -124,10 +117,9 @@ class HST_OT_SetObjectVertexColor(bpy.types.Operator):
             message_box("No mesh selected | 未选择Mesh")
             return {"CANCELLED"}
 
-        for mesh in selected_meshes:
-            apply_vertex_color_to_mesh(mesh, color)
+        updated_count = batch_set_vertex_color(selected_meshes, color, BAKECOLOR_ATTR)
 
-        self.report({"INFO"}, "Set vertex color")
+        self.report({"INFO"}, f"Set vertex color on {updated_count} meshes")
         return {"FINISHED"}
 
 
@@ -151,10 +143,9 @@ class HST_OT_CopyColorAttributeFromActive(bpy.types.Operator):
             self.report({'ERROR'}, "Source object has no vertex color")
             return {"CANCELLED"}
 
-        for mesh in selected_meshes:
-            apply_vertex_color_to_mesh(mesh, color)
+        updated_count = batch_set_vertex_color(selected_meshes, color, BAKECOLOR_ATTR)
 
-        self.report({"INFO"}, "Set vertex color")
+        self.report({"INFO"}, f"Set vertex color on {updated_count} meshes")
         return {"FINISHED"}
     def invoke(self, context, event):
         selected_objs = context.selected_objects
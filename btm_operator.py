@@ -289,39 +289,22 @@ class HST_OT_BatchSetVertexColor(bpy.types.Operator):
     bl_description = "为选中的物体赋予顶点色,用于烘焙ID Mask"
 
     def execute(self, context):
-        obj: bpy.types.Object
         sel_obj = bpy.context.selected_objects
         ver_col = bpy.data.brushes["TexDraw"].color
 
-        for obj in sel_obj:
-            # Blender 5.0+: 空 mesh 无法添加 color attribute
-            if len(obj.data.vertices) == 0:
-                print(f"{obj.name} has no vertices, skipping color attribute")
-                continue
-            if "ID_Color" in obj.data.color_attributes:
-                colattr = obj.data.color_attributes[0]
-            else:
-                colattr = obj.data.color_attributes.new(
-                    name="ID_Color",
-                    type="BYTE_COLOR",
-                    domain="CORNER",
-                )
+        sel_meshes = filter_type(sel_obj, "MESH")
 
         # Create Palette
         pal = bpy.data.palettes.get("ID_Palette")
         if pal is None:
             pal = bpy.data.palettes.new("ID_Palette")
-            # add a color to that palette
-            create_palettes_color(pal, ver_col)
-            set_all_vertex_color(sel_obj, colattr, ver_col)
-
-        elif len(pal.colors) <= 15:
-            create_palettes_color(pal, ver_col)
-            set_all_vertex_color(sel_obj, colattr, ver_col)
-        else:
+        elif len(pal.colors) > 15:
             pal.colors.remove(pal.colors[0])
-            create_palettes_color(pal, ver_col)
-            set_all_vertex_color(sel_obj, colattr, ver_col)
+        # add a color to that palette
+        create_palettes_color(pal, ver_col)
+        batch_set_vertex_color(
+            sel_meshes, (*ver_col, 1.0), "ID_Color", use_active=False, srgb=False
+        )
 
         ts = bpy.context.tool_settings
         ts.image_paint.palette = pal
@@ -1,7 +1,27 @@
+import time
+
 import bpy
 from .const import *
 from .functions.common_functions import *
 from .functions.asset_check_functions import *
+from .utils.batch_export_utils import (
+    ADDON_ROOT,
+    BATCH_EXPORT_LOG_PREFIX,
+    ExportPlan,
+    ExportPlanEntry,
+    estimate_collection_cost,
+    resolve_worker_count,
+    run_batch_export,
+    serialize_origin_transforms,
+    write_export_manifest,
+)
+from .utils.export_cache_utils import (
+    collection_export_hash,
+    is_export_current,
+    load_export_cache,
+    record_export,
+    save_export_cache,
+)
 
 GROUPPRO_SUFFIX = "_coll" #hack for group pro addon
 CAT_GROUP_MOD = "CAT_MeshGroup"
@@ -134,6 +154,13 @@ def resolve_export_targets(export_format):
     )
 
 
+def resolve_export_settings(export_format):
+    """根据导出格式返回 StaticMesh 导出器参数，用于增量导出缓存签名"""
+    if export_format == "GLB":
+        return GLB_EXPORT_SETTINGS
+    return FBX_STATICMESH_EXPORT_SETTINGS
+
+
 def parse_sorted_collections(sorted_collections):
     """兼容 Collection.sort_hst_types 的 dict / tuple 两种返回格式"""
     if isinstance(sorted_collections, dict):
@@ -174,6 +201,80 @@ def parse_sorted_collections(sorted_collections):
     )
 
 
+# 生成 StaticMesh Collection 的导出文件路径，串行与批量 worker 路径共用。
+# 参数:
+#     collection: 待导出的 Collection。
+#     export_path: 导出目录，必须以 / 结尾。
+#     file_prefix: 用户配置的导出名前缀。
+#     export_ext: 导出文件后缀，例如 .fbx。
+def make_staticmesh_file_path(collection, export_path, file_prefix, export_ext):
+    new_name = collection.name.removeprefix(Const.SKELETAL_MESH_PREFIX)
+    new_name = Const.STATICMESH_PREFIX + file_prefix + new_name
+    return export_path + new_name + export_ext
+
+
+# 使用多个 headless Blender worker 并行导出 StaticMesh Collection，并在导出目录写入 manifest。
+# 参数:
+#     context: 当前 Blender context。
+#     target_collections: 已筛选的 StaticMesh Collection。
+#     origin_objects: {origin Object: 导出时的 matrix_world}，快照中已应用，worker 仍按计划重放。
+#     export_path: 导出目录，必须以 / 结尾。
+#     file_prefix: 用户配置的导出名前缀。
+#     export_format: 当前导出格式配置。
+#     requested_workers: 用户设置的 worker 数量，0 表示自动。
+# 返回:
+#     (results, manifest_path, work_dir)；work_dir 仅在存在失败时保留，用于查看 worker 日志。
+def export_collections_with_workers(
+    context,
+    target_collections,
+    origin_objects,
+    export_path,
+    file_prefix,
+    export_format,
+    requested_workers,
+):
+    export_ext, _, _, _ = resolve_export_targets(export_format)
+    plan = ExportPlan(
+        blend_path="",
+        scene_name=context.scene.name,
+        export_format=export_format,
+        addon_root=str(ADDON_ROOT),
+        entries=[
+            ExportPlanEntry(
+                collection_name=collection.name,
+                file_path=make_staticmesh_file_path(collection, export_path, file_prefix, export_ext),
+                estimated_cost=estimate_collection_cost(collection),
+            )
+            for collection in target_collections
+        ],
+        origin_transforms=serialize_origin_transforms(origin_objects),
+    )
+    worker_count = resolve_worker_count(requested_workers, len(plan.entries))
+    window_manager = context.window_manager
+
+    def report_progress(done, total, result):
+        window_manager.progress_update(done)
+        print(
+            f"{BATCH_EXPORT_LOG_PREFIX} {done}/{total} {result['status']} "
+            f"{result['collection_name']} {result['seconds']}s"
+        )
+
+    start_time = time.perf_counter()
+    window_manager.progress_begin(0, len(plan.entries))
+    try:
+        results, work_dir = run_batch_export(plan, worker_count, progress_callback=report_progress)
+    finally:
+        window_manager.progress_end()
+    manifest_path = write_export_manifest(
+        export_path,
+        plan,
+        results,
+        worker_count,
+        time.perf_counter() - start_time,
+    )
+    return results, manifest_path, work_dir
+
+
 def export_instance_collection(target, export_path, file_prefix, export_format="FBX"):
     """导出实例化的collection"""
     new_name = target.name.removeprefix(Const.SKELETAL_MESH_PREFIX)
@@ -345,6 +446,13 @@ class HST_OT_StaticMeshExport(bpy.types.Operator):
 
 #TODO: 增加对GPro Instance的支持， 增加对MeshGroupInstance的支持
 
+    force: bpy.props.BoolProperty(
+        name="Force",
+        description="忽略增量导出缓存，重新导出全部 Collection",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
     def execute(self, context):
         scene_objects = context.scene.objects #只导出当前 Scene 内的物体
         parameters = context.scene.hst_params
@@ -382,7 +490,6 @@ class HST_OT_StaticMeshExport(bpy.types.Operator):
         # print(f"visible_colls: {visible_collections}")
         # selected_objects = bpy.context.selected_objects
         store_mode = prep_select_mode()
-        bpy.ops.object.select_all(action="DESELECT")
         
         # collection 类型筛查：兼容旧版 tuple 返回和新版 dict 返回
         sorted_collections = Collection.sort_hst_types(visible_collections)
@@ -435,7 +542,11 @@ class HST_OT_StaticMeshExport(bpy.types.Operator):
         # check_collections(self, bake_collections, prop_collections, decal_collections)
 
 
+        written_names = []
+        skipped_names = []
         if len(target_collections) > 0:
+            export_cache = load_export_cache(export_path)
+            exporter_settings = resolve_export_settings(export_format)
             # save origin objects transform and move to world origin
             origin_transform = {}
             invisible_origin_colls=[]
@@ -459,15 +570,68 @@ class HST_OT_StaticMeshExport(bpy.types.Operator):
                 if collection in target_collections:
                     target_collections.remove(collection)
 
+            # 增量导出：内容哈希与缓存一致且文件完好的 Collection 直接跳过
+            pending_collections = []
+            collection_hashes = {}
             for collection in target_collections:
-
-                new_name = collection.name.removeprefix(Const.SKELETAL_MESH_PREFIX)
-                new_name = Const.STATICMESH_PREFIX + file_prefix + new_name
-                file_path = export_path + new_name + export_ext
-                print(f"exporting {collection.name} to {file_path}")
-                staticmesh_exporter(collection, file_path)
-                export_count += 1
-
+                file_path = make_staticmesh_file_path(
+                    collection, export_path, file_prefix, export_ext
+                )
+                content_hash = collection_export_hash(collection, file_path, exporter_settings)
+                if not self.force and is_export_current(
+                    export_cache, collection.name, file_path, content_hash
+                ):
+                    skipped_names.append(collection.name)
+                    continue
+                collection_hashes[collection.name] = (file_path, content_hash)
+                pending_collections.append(collection)
+
+            use_batch_export = (
+                parameters.use_batch_export
+                and len(pending_collections) > 1
+                and bool(bpy.app.binary_path)
+            )
+            if use_batch_export:
+                origin_objects = {
+                    origin_obj: origin_obj.matrix_world.copy()
+                    for origin_obj in origin_transform
+                }
+                batch_results, manifest_path, work_dir = export_collections_with_workers(
+                    context,
+                    pending_collections,
+                    origin_objects,
+                    export_path,
+                    file_prefix,
+                    export_format,
+                    parameters.batch_export_workers,
+                )
+                failed_results = [
+                    result for result in batch_results if result["status"] != "written"
+                ]
+                for result in batch_results:
+                    if result["status"] == "written":
+                        written_names.append(result["collection_name"])
+                export_count += len(batch_results) - len(failed_results)
+                print(f"export manifest: {manifest_path}")
+                if failed_results:
+                    self.report(
+                        {"WARNING"},
+                        f"{len(failed_results)} collection(s) failed in batch export: "
+                        + ", ".join(result["collection_name"] for result in failed_results)
+                        + f" | worker logs: {work_dir}",
+                    )
+            else:
+                for collection in pending_collections:
+                    file_path = collection_hashes[collection.name][0]
+                    print(f"exporting {collection.name} to {file_path}")
+                    staticmesh_exporter(collection, file_path)
+                    written_names.append(collection.name)
+                    export_count += 1
+
+            for collection_name in written_names:
+                file_path, content_hash = collection_hashes[collection_name]
+                record_export(export_cache, collection_name, file_path, content_hash)
+            save_export_cache(export_path, export_cache, written_names, skipped_names)
 
             if len(origin_transform)>0: #reset origin transform
                 for origin_obj in origin_transform:
@@ -512,9 +676,14 @@ class HST_OT_StaticMeshExport(bpy.types.Operator):
         export_count = (
             export_count + skm_count + len(rig_collections)
         )
+        if skipped_names:
+            print(f"skipped unchanged collections: {skipped_names}")
+        if written_names:
+            print(f"written collections: {written_names}")
         self.report(
             {"INFO"},
-            f"{export_count} Meshes exported to {export_path} ({export_format})",
+            f"{export_count} Meshes exported to {export_path} ({export_format}), "
+            f"{len(skipped_names)} unchanged skipped",
         )
         return {"FINISHED"}
 
@@ -15,6 +15,7 @@ from .common_functions import (
     clean_user as cleanuser,          # 保持原有命名的兼容性
     rename_meshes as renamemesh,      # 保持原有命名的兼容性
     filter_type,
+    batch_set_vertex_color,
 )
 
 # from ..UIPanel import BTMPropGroup
@@ -393,11 +394,6 @@ def create_palettes_color(pal, ver_col):
 
 
 def set_all_vertex_color(sel_obj, colattr, ver_col):
-    obj: bpy.types.Object
-    for obj in sel_obj:
-        for v in obj.data.vertices:
-            v_index = v.index
-            col_vec = mathutils.Vector(ver_col)
-            bpy.data.meshes[obj.to_mesh().name].sculpt_vertex_colors[colattr.name].data[
-                v_index
-            ].color = col_vec.to_4d()
+    batch_set_vertex_color(
+        filter_type(sel_obj, "MESH"), (*ver_col[:3], 1.0), colattr.name, use_active=False, srgb=False
+    )
@@ -27,12 +27,15 @@ from ..utils.modifier_utils import (
 from ..utils.vertex_color_utils import (
     cleanup_color_attributes, add_vertexcolor_attribute, set_active_color_attribute,
     get_vertex_color_from_obj, vertexcolor_to_vertices, set_object_vertexcolor,
-    get_color_data, VertexColor
+    get_color_data, find_color_attribute, read_color_array, write_color_array,
+    average_color, selection_mask, convert_color_domain, copy_color_attribute,
+    fill_color_attribute, batch_set_vertex_color, VertexColor
 )
 from ..utils.uv_utils import (
     rename_uv_layers, add_uv_layers, check_uv_layer, has_uv_attribute,
     scale_uv, uv_unwrap, uv_average_scale, uv_editor_fit_view,
-    culculate_td_areas, get_texel_density, UV
+    culculate_td_areas, get_texel_density, texel_density_report, batch_texel_density,
+    batch_merge_and_unwrap, average_islands_scale, UV
 )
 from ..utils.material_utils import (
     get_materials, get_object_material, get_object_material_slots,
@@ -51,6 +54,7 @@ from ..utils.outliner_utils import Outliner
 from ..utils.mesh_attributes_utils import MeshAttributes
 from ..utils.file_utils import make_dir, normalize_path, copy_to_clip, FilePath
 from ..utils.armature_utils import Armature
+from ..utils.export_utils import export_selection_context
 from ..utils.misc_utils import (
     set_default_scene_units, capture_scene_unit_settings, restore_scene_unit_settings,
     convert_length_by_scene_unit, text_capitalize,
@@ -136,6 +140,70 @@ def filter_collection_by_visibility(type="VISIBLE", filter_instance=False) -> li
             return hidden_collections
 
 
+# 导出器参数集中定义，供导出调用与增量导出缓存的 settings 签名共用。
+FBX_STATICMESH_EXPORT_SETTINGS = {
+    "use_selection": True,
+    "use_active_collection": False,
+    "use_visible": False,
+    "axis_forward": "-Z",
+    "axis_up": "Y",
+    "global_scale": 1.0,
+    "apply_unit_scale": True,
+    "apply_scale_options": "FBX_SCALE_NONE",
+    "colors_type": "LINEAR",
+    "object_types": {"MESH", "EMPTY"},
+    "use_mesh_modifiers": True,
+    "mesh_smooth_type": "FACE",
+    "use_triangles": True,
+    "use_tspace": True,
+    "bake_space_transform": True,
+    "path_mode": "AUTO",
+    "embed_textures": False,
+    "batch_mode": "OFF",
+    "use_metadata": False,
+    "use_custom_props": False,
+    "add_leaf_bones": False,
+    "use_armature_deform_only": False,
+    "bake_anim": False,
+}
+
+FBX_SKELETAL_EXPORT_SETTINGS = {
+    "use_selection": True,
+    "use_active_collection": False,
+    "use_visible": False,
+    "axis_forward": "Y",
+    "axis_up": "Z",
+    "global_scale": 1,
+    "apply_unit_scale": True,
+    "apply_scale_options": "FBX_SCALE_NONE",
+    "colors_type": "LINEAR",
+    "object_types": {"MESH", "ARMATURE"},
+    "use_mesh_modifiers": True,
+    "mesh_smooth_type": "FACE",
+    "use_triangles": True,
+    "use_tspace": True,
+    "bake_space_transform": True,
+    "path_mode": "AUTO",
+    "embed_textures": False,
+    "batch_mode": "OFF",
+    "primary_bone_axis": "Y",
+    "secondary_bone_axis": "X",
+    "use_metadata": False,
+    "use_custom_props": False,
+    "add_leaf_bones": False,
+    "use_armature_deform_only": True,
+    "armature_nodetype": "NULL",
+    "bake_anim": False,
+}
+
+GLB_EXPORT_SETTINGS = {
+    "export_format": "GLB",
+    "use_selection": True,
+    "export_apply": True,
+    "export_animations": False,
+}
+
+
 class FBXExport:
     """
     FBX 导出工具类
@@ -145,11 +213,10 @@ class FBXExport:
     
     def instance_collection(target, file_path: str, reset_transform=False):
         """导出 Instance Collection 为 FBX"""
-        bpy.ops.object.select_all(action="DESELECT")
-
+        export_objects = []
         obj_transform = {}
         if target.type == "EMPTY":
-            target.select_set(True) #for use_selection=True
+            export_objects.append(target)
             if reset_transform is True:
                 obj_transform[target] = target.matrix_world.copy()
                 target.location = (0, 0, 0)
@@ -159,32 +226,8 @@ class FBXExport:
         if isinstance(target, bpy.types.Collection):
             bpy.context.view_layer.active_layer_collection.exclude = False
 
-        bpy.ops.export_scene.fbx(
-            filepath=file_path,
-            use_selection=True,
-            use_active_collection=False,
-            use_visible=False,
-            axis_forward="-Z",
-            axis_up="Y",
-            global_scale=1.0,
-            apply_unit_scale=True,
-            apply_scale_options="FBX_SCALE_NONE",
-            colors_type="LINEAR",
-            object_types={"MESH", "EMPTY"},
-            use_mesh_modifiers=True,
-            mesh_smooth_type="FACE",
-            use_triangles=True,
-            use_tspace=True,
-            bake_space_transform=True,
-            path_mode="AUTO",
-            embed_textures=False,
-            batch_mode="OFF",
-            use_metadata=False,
-            use_custom_props=False,
-            add_leaf_bones=False,
-            use_armature_deform_only=False,
-            bake_anim=False,
-        )
+        with export_selection_context(export_objects):
+            bpy.ops.export_scene.fbx(filepath=file_path, **FBX_STATICMESH_EXPORT_SETTINGS)
 
         if reset_transform is True:
             for target in obj_transform:
@@ -193,7 +236,6 @@ class FBXExport:
 
     def staticmesh(target, file_path: str, reset_transform=False):
         """导出 StaticMesh FBX"""
-        bpy.ops.object.select_all(action="DESELECT")
         export_objects = []
         hidden_objects = []
 
@@ -230,7 +272,6 @@ class FBXExport:
 
         for obj in export_objects:
             obj.hide_set(False)
-            obj.select_set(True)
             if obj.type=="MESH":
                 Modifier.add_triangulate(obj)
 
@@ -240,32 +281,8 @@ class FBXExport:
                 obj.rotation_euler = (0, 0, 0)
                 obj.rotation_quaternion = Quaternion((1, 0, 0, 0))
 
-        bpy.ops.export_scene.fbx(
-            filepath=file_path,
-            use_selection=True,
-            use_active_collection=False,
-            use_visible=False,
-            axis_forward="-Z",
-            axis_up="Y",
-            global_scale=1.0,
-            apply_unit_scale=True,
-            apply_scale_options="FBX_SCALE_NONE",
-            colors_type="LINEAR",
-            object_types={"MESH", "EMPTY"},
-            use_mesh_modifiers=True,
-            mesh_smooth_type="FACE",
-            use_triangles=True,
-            use_tspace=True,
-            bake_space_transform=True,
-            path_mode="AUTO",
-            embed_textures=False,
-            batch_mode="OFF",
-            use_metadata=False,
-            use_custom_props=False,
-            add_leaf_bones=False,
-            use_armature_deform_only=False,
-            bake_anim=False,
-        )
+        with export_selection_context(export_objects):
+            bpy.ops.export_scene.fbx(filepath=file_path, **FBX_STATICMESH_EXPORT_SETTINGS)
         for object in hidden_objects:
             object.hide_set(True)
 
@@ -280,7 +297,6 @@ class FBXExport:
         bpy.context.scene.unit_settings.scale_length = 0.01
         bpy.context.scene.unit_settings.length_unit = "METERS"
 
-        bpy.ops.object.select_all(action="DESELECT")
         hide_objects = []
 
         export_objects = []
@@ -296,7 +312,9 @@ class FBXExport:
                         object.name = "Armature"  # fix armature export as redundant root bone
                     else:
                         print("Export Armature as root")
-                    Armature.ops_scale_bones(object, (100, 100, 100))
+                    # 骨骼缩放走 Edit Mode 算子，只让当前 Armature 处于选中，避免其他已选 Armature 一并进入编辑
+                    with export_selection_context([object], sync_object_selection=True):
+                        Armature.ops_scale_bones(object, (100, 100, 100))
                 if object.type == "MESH" or object.type == "ARMATURE":
                     export_objects.append(object)
         elif target.type == "MESH":
@@ -307,42 +325,14 @@ class FBXExport:
         obj_transform = {}
         for obj in export_objects:
             obj.hide_set(False)
-            obj.select_set(True)
             obj_transform[obj] = obj.matrix_world.copy()
 
             obj.location = (0, 0, 0)
             obj.rotation_euler = (0, 0, 0)
             obj.rotation_quaternion = Quaternion((1, 0, 0, 0))
 
-        bpy.ops.export_scene.fbx(
-            filepath=file_path,
-            use_selection=True,
-            use_active_collection=False,
-            use_visible=False,
-            axis_forward="Y",
-            axis_up="Z",
-            global_scale=1,
-            apply_unit_scale=True,
-            apply_scale_options="FBX_SCALE_NONE",
-            colors_type="LINEAR",
-            object_types={"MESH", "ARMATURE"},
-            use_mesh_modifiers=True,
-            mesh_smooth_type="FACE",
-            use_triangles=True,
-            use_tspace=True,
-            bake_space_transform=True,
-            path_mode="AUTO",
-            embed_textures=False,
-            batch_mode="OFF",
-            primary_bone_axis="Y",
-            secondary_bone_axis="X",
-            use_metadata=False,
-            use_custom_props=False,
-            add_leaf_bones=False,
-            use_armature_deform_only=True,
-            armature_nodetype="NULL",
-            bake_anim=False,
-        )
+        with export_selection_context(export_objects):
+            bpy.ops.export_scene.fbx(filepath=file_path, **FBX_SKELETAL_EXPORT_SETTINGS)
 
         for object in hide_objects:
             object.hide_set(True)
@@ -351,7 +341,8 @@ class FBXExport:
         for obj in export_objects:
             if obj.type == "ARMATURE":
                 obj.name = armature_names[obj]
-                Armature.ops_scale_bones(obj, (0.01, 0.01, 0.01))
+                with export_selection_context([obj], sync_object_selection=True):
+                    Armature.ops_scale_bones(obj, (0.01, 0.01, 0.01))
 
         restore_scene_unit_settings(original_unit_settings)
 
@@ -364,30 +355,24 @@ class GLBExport:
     """
 
     @staticmethod
-    def _export_selected(file_path: str):
-        """导出当前选中对象为 GLB"""
-        bpy.ops.export_scene.gltf(
-            filepath=file_path,
-            export_format="GLB",
-            use_selection=True,
-            export_apply=True,
-            export_animations=False,
-        )
+    def _export_objects(export_objects, file_path: str):
+        """导出指定对象为 GLB；glTF 通过 select_get() 过滤，只临时同步这些对象的选择"""
+        with export_selection_context(export_objects, sync_object_selection=True):
+            bpy.ops.export_scene.gltf(filepath=file_path, **GLB_EXPORT_SETTINGS)
 
     def instance_collection(target, file_path: str, reset_transform=False):
         """导出 Instance Collection 为 GLB"""
-        bpy.ops.object.select_all(action="DESELECT")
-
+        export_objects = []
         obj_transform = {}
         if target.type == "EMPTY":
-            target.select_set(True)  # for use_selection=True
+            export_objects.append(target)
             if reset_transform is True:
                 obj_transform[target] = target.matrix_world.copy()
                 target.location = (0, 0, 0)
                 target.rotation_euler = (0, 0, 0)
                 target.rotation_quaternion = Quaternion((1, 0, 0, 0))
 
-        GLBExport._export_selected(file_path)
+        GLBExport._export_objects(export_objects, file_path)
 
         if reset_transform is True:
             for obj in obj_transform:
@@ -395,7 +380,6 @@ class GLBExport:
 
     def staticmesh(target, file_path: str, reset_transform=False):
         """导出 StaticMesh GLB"""
-        bpy.ops.object.select_all(action="DESELECT")
         export_objects = []
         hidden_objects = []
 
@@ -429,7 +413,6 @@ class GLBExport:
 
         for obj in export_objects:
             obj.hide_set(False)
-            obj.select_set(True)
             if obj.type == "MESH":
                 Modifier.add_triangulate(obj)
 
@@ -439,7 +422,7 @@ class GLBExport:
                 obj.rotation_euler = (0, 0, 0)
                 obj.rotation_quaternion = Quaternion((1, 0, 0, 0))
 
-        GLBExport._export_selected(file_path)
+        GLBExport._export_objects(export_objects, file_path)
 
         for obj in hidden_objects:
             obj.hide_set(True)
@@ -451,7 +434,6 @@ class GLBExport:
     def skeletal(target, file_path: str, armature_as_root=False):
         """导出骨骼 GLB（armature_as_root 参数保留用于兼容调用）"""
         _ = armature_as_root
-        bpy.ops.object.select_all(action="DESELECT")
         hide_objects = []
         export_objects = []
 
@@ -469,13 +451,12 @@ class GLBExport:
         obj_transform = {}
         for obj in export_objects:
             obj.hide_set(False)
-            obj.select_set(True)
             obj_transform[obj] = obj.matrix_world.copy()
             obj.location = (0, 0, 0)
             obj.rotation_euler = (0, 0, 0)
             obj.rotation_quaternion = Quaternion((1, 0, 0, 0))
 
-        GLBExport._export_selected(file_path)
+        GLBExport._export_objects(export_objects, file_path)
 
         for obj in hide_objects:
             obj.hide_set(True)
@@ -178,6 +178,12 @@ class HST_OT_MarkCurvatureRaw(bpy.types.Operator):
     bl_description = "为选中的 Mesh 标记 CORNER 域 raw curvature signed / convex / concave attribute"
     bl_options = {"REGISTER", "UNDO"}
 
+    use_adjacency_cache: bpy.props.BoolProperty(
+        name="Cache Adjacency",
+        description="按拓扑缓存 corner 邻接，仅移动顶点后重跑时跳过邻接重建",
+        default=False,
+    )
+
     def execute(self, context):
         selected_objects = bpy.context.selected_objects
         selected_meshes = filter_type(selected_objects, "MESH")
@@ -201,7 +207,9 @@ class HST_OT_MarkCurvatureRaw(bpy.types.Operator):
                 continue
 
             try:
-                stats = Mesh.mark_curvature_corner_attributes(mesh)
+                stats = Mesh.mark_curvature_corner_attributes(
+                    mesh, use_adjacency_cache=self.use_adjacency_cache
+                )
                 processed_stats.append(stats)
             except Exception as error:
                 failed_meshes.append(f"{mesh.name}({error})")
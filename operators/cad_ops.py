@@ -6,10 +6,14 @@ CAD 模型处理 Operators
 包含 CAD 模型导入后的预处理、修复、清理等功能。
 """
 
+import time
+
 import bpy
 from ..const import *
 from ..functions.common_functions import *
+from ..utils.mesh_array_utils import HAS_NUMPY, read_edge_flags, write_edge_flags
 from ..utils.mesh_utils import check_non_solid_meshes
+from ..utils.uv_utils import batch_merge_and_unwrap
 from ..utils.misc_utils import set_default_scene_units
 
 
@@ -87,32 +91,52 @@ class HST_OT_PrepCADMesh(bpy.types.Operator):
             )
             return {"CANCELLED"}
 
+        # 批量路径：一次 transform_apply、一次多对象 Edit Mode 会话，逐对象只做数据级处理
+        timings = {}
+        started_at = time.perf_counter()
+        Transform.apply_batch(selected_meshes, location=False, rotation=True, scale=True)
+        timings["transform_apply"] = time.perf_counter() - started_at
+
+        for stage_name in ("clean_verts", "uv_layers", "seams", "auto_seam"):
+            timings[stage_name] = 0.0
         for mesh in selected_meshes:
-            Transform.apply(mesh, location=False, rotation=True, scale=True)
+            started_at = time.perf_counter()
             Mesh.clean_mid_verts(mesh)
             Mesh.clean_loose_verts(mesh)
             Object.mark_hst_type(mesh, "STATICMESH")
+            timings["clean_verts"] += time.perf_counter() - started_at
 
+            started_at = time.perf_counter()
             has_uv = has_uv_attribute(mesh)
             if has_uv is True:
                 uv_base = rename_uv_layers(mesh, new_name=UV_BASE, uv_index=0)
             else:
                 uv_base = add_uv_layers(mesh, uv_name=UV_BASE)
             uv_base.active = True
+            timings["uv_layers"] += time.perf_counter() - started_at
 
-            for edge in mesh.data.edges:
-                edge.use_seam = True if edge.use_edge_sharp else False
+            started_at = time.perf_counter()
+            if HAS_NUMPY:
+                write_edge_flags(mesh.data, "use_seam", read_edge_flags(mesh.data, "use_edge_sharp"))
+            else:
+                for edge in mesh.data.edges:
+                    edge.use_seam = True if edge.use_edge_sharp else False
+            timings["seams"] += time.perf_counter() - started_at
 
+            started_at = time.perf_counter()
             Mesh.auto_seam(mesh, mode=self.uv_seam_mode)
+            timings["auto_seam"] += time.perf_counter() - started_at
 
-        Mesh.merge_verts_ops(selected_meshes)
-
-        uv_unwrap(
+        edit_timings = batch_merge_and_unwrap(
             selected_meshes, method="ANGLE_BASED", margin=0.005, correct_aspect=True
         )
+        timings.update({f"edit_session.{name}": seconds for name, seconds in edit_timings.items()})
         bpy.context.scene.tool_settings.use_uv_select_sync = True
         restore_select_mode(store_mode)
-        self.report({"INFO"}, "Selected meshes prepped")
+
+        timing_text = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+        print(f"PrepCADMesh timings ({len(selected_meshes)} meshes): {timing_text}")
+        self.report({"INFO"}, f"Selected meshes prepped | {timing_text}")
         return {"FINISHED"}
 
 
@@ -164,12 +164,8 @@ class HST_OT_SetupLookDevEnv(bpy.types.Operator):
         world_name = LOOKDEV_HDR
         store_mode = prep_select_mode()
 
-        import_world(file_path=file_path, world_name=world_name)
-        for world in bpy.data.worlds:
-            if world.name == world_name:
-                world = world
-                break
-        if bpy.context.scene.world is not world:
+        world = import_world(file_path=file_path, world_name=world_name)
+        if world is not None and bpy.context.scene.world is not world:
             bpy.context.scene.world = world
 
         switch_to_eevee()
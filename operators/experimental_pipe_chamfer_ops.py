@@ -1,79 +1,46 @@
 # -*- coding: utf-8 -*-
 """实验性多 Pipe Chamfer Operator。"""
 
-import hashlib
 import json
-import sys
-import tempfile
-from datetime import datetime
-from pathlib import Path
 
 import bpy
 
+from ..utils.diagnostic_utils import write_diagnostic_event
 from ..utils.experimental_pipe_chamfer_utils import PipeChamferError
 from ..utils.experimental_pipe_chamfer_utils import build_pipe_chamfer
+from ..utils.mesh_fingerprint_utils import mesh_fingerprint
 
 
 RESULT_PREFIX = "[HST_PIPE_CHAMFER_RESULT]"
-DIAGNOSTIC_LOG_PATH = Path(tempfile.gettempdir()) / "hst_feature_chamfer_diagnostic.jsonl"
 
 
 # 生成源 Mesh 的稳定指纹，用来区分磁盘原始文件、Undo 后 Mesh 和不同插件副本收到的输入。
 # source_object: 当前 Feature Chamfer 输入 Mesh；返回可写入 JSON 的诊断字段。
 def _source_diagnostic(source_object):
     mesh = source_object.data
-    sharp_attribute = mesh.attributes.get("sharp_edge")
-    fingerprint_payload = {
-        "vertices": [tuple(round(value, 8) for value in vertex.co) for vertex in mesh.vertices],
-        "edges": [tuple(edge.vertices) for edge in mesh.edges],
-        "polygons": [tuple(polygon.vertices) for polygon in mesh.polygons],
-        "sharp_edges": [
-            edge.index
-            for edge in mesh.edges
-            if sharp_attribute is not None and sharp_attribute.data[edge.index].value
-        ],
-    }
-    fingerprint = hashlib.sha256(
-        json.dumps(fingerprint_payload, separators=(",", ":")).encode("utf-8")
-    ).hexdigest()
+    fingerprint = mesh_fingerprint(mesh, use_cache=False)
     return {
         "blend_file": bpy.data.filepath,
         "object_name": source_object.name,
         "mesh_name": mesh.name,
-        "mesh_fingerprint": fingerprint,
+        "mesh_fingerprint": fingerprint.digest,
+        "topology_fingerprint": fingerprint.topology,
+        "position_fingerprint": fingerprint.positions,
         "vertex_count": len(mesh.vertices),
         "edge_count": len(mesh.edges),
         "face_count": len(mesh.polygons),
-        "sharp_edge_count": len(fingerprint_payload["sharp_edges"]),
+        "sharp_edge_count": fingerprint.sharp_edge_count,
         "object_scale": list(source_object.scale),
         "modifier_types": [modifier.type for modifier in source_object.modifiers],
     }
 
 
-# 追加一次 Feature Chamfer 诊断事件；写入失败时输出明确上下文但不改变几何流程。
-# event: 事件名称；payload: 参数、代码来源、Mesh 指纹或阶段统计。
-def _write_diagnostic_event(event, payload):
-    record = {
-        "time": datetime.now().astimezone().isoformat(timespec="milliseconds"),
-        "event": event,
-        "blender_version": bpy.app.version_string,
-        "operator_module": __file__,
-        "utils_module": sys.modules[build_pipe_chamfer.__module__].__file__,
-        **payload,
-    }
-    try:
-        with DIAGNOSTIC_LOG_PATH.open("a", encoding="utf-8") as log_file:
-            log_file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
-    except OSError as error:
-        print(f"[HST_PIPE_CHAMFER_DIAGNOSTIC_ERROR] path={DIAGNOSTIC_LOG_PATH}: {error}")
-
-
 # 为 GUI 闪退补写当前执行状态；应用退出或正常 Blender shutdown 时不会写入误报。
 # dummy: Blender handler 兼容参数；只有仍存在 active run 时记录。
 def _write_crash_diagnostic(dummy):
     del dummy
     if _ACTIVE_DIAGNOSTIC_RUN is not None:
-        _write_diagnostic_event("application_crash", _ACTIVE_DIAGNOSTIC_RUN)
+        write_diagnostic_event("application_crash", _ACTIVE_DIAGNOSTIC_RUN, operator_module=__file__)
 
 
 _ACTIVE_DIAGNOSTIC_RUN = None
@@ -151,7 +118,7 @@ class HST_OT_ExperimentalPipeChamfer(bpy.types.Operator):
             },
             "source": _source_diagnostic(source_object),
         }
-        _write_diagnostic_event(
+        write_diagnostic_event(
             "execute_start",
             {
                 "parameters": {
@@ -165,6 +132,7 @@ class HST_OT_ExperimentalPipeChamfer(bpy.types.Operator):
                 },
                 "source": _source_diagnostic(source_object),
             },
+            operator_module=__file__,
         )
         try:
             result = build_pipe_chamfer(
@@ -186,13 +154,14 @@ class HST_OT_ExperimentalPipeChamfer(bpy.types.Operator):
                 "error_message": str(error),
                 "stats": error.stats,
             }
-            _write_diagnostic_event(
+            write_diagnostic_event(
                 "geometry_failure",
                 {
                     "error_type": type(error).__name__,
                     "error_message": str(error),
                     "stats": error.stats,
                 },
+                operator_module=__file__,
             )
             print(RESULT_PREFIX + json.dumps(error.stats, ensure_ascii=False, separators=(",", ":")))
             self.report({"WARNING"}, str(error))
@@ -203,7 +172,7 @@ class HST_OT_ExperimentalPipeChamfer(bpy.types.Operator):
                 f"Experimental Pipe Chamfer failed unexpectedly: object={source_object.name}, "
                 f"stage={self.debug_stage}, radius={self.radius}"
             ) from error
-        _write_diagnostic_event("geometry_success", {"stats": result})
+        write_diagnostic_event("geometry_success", {"stats": result}, operator_module=__file__)
         context.scene["hst_pipe_chamfer_last_result"] = json.dumps(
             result, ensure_ascii=False, separators=(",", ":")
         )
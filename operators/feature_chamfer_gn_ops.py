@@ -8,6 +8,7 @@ from ..const import FEATURE_CHAMFER_GN_MODIFIER
 from ..const import FEATURE_CHAMFER_GN_STATE_TAG
 from ..const import FEATURE_CHAMFER_PATCHED
 from ..const import FEATURE_CHAMFER_SOURCE_OBJECT_TAG
+from ..utils.diagnostic_utils import write_diagnostic_event
 from ..utils.experimental_pipe_chamfer_utils import CHAMFER_FACE_ATTRIBUTE
 from ..utils.experimental_pipe_chamfer_utils import PipeChamferError
 from ..utils.experimental_pipe_chamfer_utils import build_pipe_chamfer
@@ -18,6 +19,8 @@ from ..utils.feature_chamfer_gn_utils import ensure_gn_feature_chamfer_preview
 from ..utils.feature_chamfer_gn_utils import live_preview_parameters
 from ..utils.feature_chamfer_gn_utils import owned_preview_modifier
 from ..utils.feature_chamfer_gn_utils import preview_state
+from ..utils.feature_chamfer_gn_utils import tracked_preview_state
+from ..utils.profiling_utils import profiling_session
 
 
 # 返回 source 是否有至少一条显式 sharp_edge。
@@ -121,9 +124,11 @@ class HST_OT_FeatureChamferGN(bpy.types.Operator):
             return {"CANCELLED"}
         self.source_object_name = source_object.name
         if self.action == "AUTO":
-            self.resolved_action = (
-                "FINALIZE" if preview_state(source_object) == PREVIEW_VALID else "PREVIEW"
-            )
+            # 缓存状态 O(1) 解析；仅在判定为 VALID 时用完整校验确认，避免过期缓存误触发 Finalize。
+            state = tracked_preview_state(source_object)
+            if state == PREVIEW_VALID:
+                state = preview_state(source_object)
+            self.resolved_action = "FINALIZE" if state == PREVIEW_VALID else "PREVIEW"
         else:
             self.resolved_action = self.action
         return self.execute(context)
@@ -140,7 +145,31 @@ class HST_OT_FeatureChamferGN(bpy.types.Operator):
         if actual_action == "AUTO":
             actual_action = "FINALIZE" if preview_state(source_object) == PREVIEW_VALID else "PREVIEW"
         source_object[FEATURE_CHAMFER_GN_LAST_ACTION_TAG] = actual_action
+        if actual_action not in {"PREVIEW", "FINALIZE"}:
+            return self._run_action(context, source_object, actual_action)
+
+        profiler = None
+        result = None
+        try:
+            with profiling_session(f"feature_chamfer_gn_{actual_action.lower()}") as profiler:
+                result = self._run_action(context, source_object, actual_action)
+        finally:
+            if profiler is not None:
+                write_diagnostic_event(
+                    "feature_chamfer_gn_profile",
+                    {
+                        "action": actual_action,
+                        "source_object": self.source_object_name,
+                        "result": sorted(result) if result is not None else "EXCEPTION",
+                        "profile": profiler.summary(),
+                    },
+                    operator_module=__file__,
+                )
+        return result
 
+    # 执行已解析的 Preview / Finalize / Cancel 动作；返回 Operator 结果集合。
+    # context/source_object/actual_action: Blender 上下文、source Mesh 与解析后的动作。
+    def _run_action(self, context, source_object, actual_action):
         if actual_action == "CANCEL_PREVIEW":
             cancel_gn_feature_chamfer_preview(source_object)
             self.report({"INFO"}, "Feature Chamfer Preview removed")
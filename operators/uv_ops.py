@@ -124,10 +124,19 @@ class HST_OT_SetTexelDensity(bpy.types.Operator):
 
         uv_average_scale(selected_objects, uv_layer_name=UV_BASE)
 
+        # 一次批量统计全部对象，逐面等权平均与原 get_texel_density 一致
+        td_reports = batch_texel_density(selected_meshes, texture_size_x, texture_size_y)
         for mesh in selected_meshes:
             uv_layer = check_uv_layer(mesh, UV_BASE)
-            old_td = get_texel_density(mesh, texture_size_x, texture_size_y)
-            scale_factor = texel_density / old_td
+            td_report = td_reports.get(mesh.name)
+            if td_report is None or td_report["mean"] <= 0:
+                self.report(
+                    {"WARNING"},
+                    f"{mesh.name} has no measurable UV area, skipped\n"
+                    + f"{mesh.name} 没有可测量的 UV 面积，已跳过",
+                )
+                continue
+            scale_factor = texel_density / td_report["mean"]
             scale_uv(mesh, uv_layer, (scale_factor, scale_factor), (0.5, 0.5))
 
         restore_select_mode(store_mode)
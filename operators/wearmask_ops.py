@@ -6,37 +6,54 @@ Wearmask 操作 Operators
 包含 Wearmask 烘焙和代理模型相关的操作。
 """
 
+import time
+
 import bpy
 from ..const import *
 from ..functions.hst_functions import *
 from ..functions.common_functions import *
+from ..utils.import_utils import make_transfer_proxy_meshes
+from ..utils.vertex_ao_utils import HAS_NUMPY as HAS_VERTEX_AO_NUMPY
+from ..utils.vertex_ao_utils import VertexAOBakeError
+from ..utils.vertex_ao_utils import VertexAOSettings
+from ..utils.vertex_ao_utils import bake_vertex_ao
 
 
-def prep_wearmask_objects(selected_objects):
+def prep_wearmask_objects(selected_objects, timings=None):
     """
     处理 meshes 用于 wearmask 烘焙
 
+    先对全部 mesh 完成变换应用、属性与修改器清理，再只评估一次 depsgraph 批量生成代理模型，
+    最后统一添加修改器与代理属性。
+
     Args:
         selected_objects: 选中的对象列表
+        timings: 可选 dict，写入各阶段耗时（秒）
 
     Returns:
         proxy_collection: 创建的代理 Collection
     """
+    timings = {} if timings is None else timings
+    started_at = time.perf_counter()
     selected_meshes = filter_type(selected_objects, "MESH")
     selected_meshes = Object.filter_hst_type(selected_meshes, "PROXY", mode="EXCLUDE")
     rename_prop_meshes(selected_objects)
     target_collections = filter_collections_selection(selected_objects)
     for collection in target_collections:
         collection.hide_render = True
-    print(PRESET_FILE_PATH)
     import_node_group(PRESET_FILE_PATH, WEARMASK_NODE)  # 导入wearmask nodegroup
-    proxy_object_list = []
     proxy_collection = Collection.create(
         TRANSFER_PROXY_COLLECTION, type="PROXY", reuse_existing=True
     )
     set_visibility(proxy_collection, True)
+    timings["setup"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    Transform.apply_batch(selected_meshes, location=True, rotation=True, scale=True)
+    timings["transform_apply"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
     for mesh in selected_meshes:
-        Transform.apply(mesh, location=True, rotation=True, scale=True)
         cleanup_color_attributes(mesh)
         add_vertexcolor_attribute(mesh, WEARMASK_ATTR)
         mark_convex_edges(mesh)
@@ -45,19 +62,32 @@ def prep_wearmask_objects(selected_objects):
         Modifier.remove(mesh, COLOR_GNODE_MODIFIER)
         Modifier.remove(mesh, COLOR_TRANSFER_MODIFIER, has_subobject=True)
         Modifier.remove(mesh, TRIANGULAR_MODIFIER)
-        proxy_mesh = make_transfer_proxy_mesh(
-            mesh, TRANSFERPROXY_PREFIX, proxy_collection
-        )
-        proxy_object_list.append(proxy_mesh)
+    timings["prepare_sources"] = time.perf_counter() - started_at
+
+    # 一次 depsgraph 评估生成全部代理模型
+    started_at = time.perf_counter()
+    proxy_object_list = make_transfer_proxy_meshes(
+        selected_meshes, TRANSFERPROXY_PREFIX, proxy_collection
+    )
+    timings["build_proxies"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for mesh, proxy_mesh in zip(selected_meshes, proxy_object_list):
         add_color_transfer_modifier(mesh, proxy_mesh)
         add_gn_wearmask_modifier(mesh)
         add_triangulate_modifier(mesh)
         mesh.hide_render = True
+    timings["source_modifiers"] = time.perf_counter() - started_at
 
+    started_at = time.perf_counter()
     for proxy_object in proxy_object_list:  # 处理proxy模型
         cleanup_color_attributes(proxy_object)
         add_vertexcolor_attribute(proxy_object, WEARMASK_ATTR)
         set_active_color_attribute(proxy_object, WEARMASK_ATTR)
+    timings["proxy_attributes"] = time.perf_counter() - started_at
+
+    timing_text = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+    print(f"Wearmask prep timings ({len(selected_meshes)} meshes): {timing_text}")
     return proxy_collection
 
 
@@ -102,17 +132,20 @@ class HST_OT_CreateTransferVertColorProxy(bpy.types.Operator):
             )
             return {"CANCELLED"}
 
-        proxy_collection = prep_wearmask_objects(selected_objects)
+        timings = {}
+        proxy_collection = prep_wearmask_objects(selected_objects, timings)
 
         set_visibility(proxy_collection, False)
         for mesh in selected_meshes:
             mesh.select_set(True)
 
+        timing_text = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
         self.report(
             {"INFO"},
             "Created "
             + str(len(selected_meshes))
-            + " transfer vertex color proxy objects",
+            + " transfer vertex color proxy objects | "
+            + timing_text,
         )
 
         return {"FINISHED"}
@@ -126,6 +159,88 @@ class HST_OT_BakeProxyVertexColorAO(bpy.types.Operator):
         场景中如存在其它可渲染的物体会对AO造成影响\
         建议手动关闭其它物体的可渲染开关\
         如果遇到烘焙Crash，请尝试在注册表中修改TDRDelay"
+    bl_options = {"REGISTER", "UNDO"}
+
+    engine: bpy.props.EnumProperty(
+        name="Engine",
+        description="AO 烘焙引擎",
+        items=[
+            ("CYCLES", "Cycles", "使用 Cycles 烘焙到顶点色，受场景中其它可渲染物体影响"),
+            ("BVH", "CPU BVH", "使用 BVHTree 射线在 CPU 上计算顶点 AO，不切换渲染引擎，只考虑烘焙代理模型"),
+        ],
+        default="CYCLES",
+        options={"SKIP_SAVE"},
+    )
+    ao_samples: bpy.props.IntProperty(
+        name="Rays",
+        description="每个采样点的半球射线数",
+        default=64,
+        min=1,
+        max=1024,
+        options={"SKIP_SAVE"},
+    )
+    ao_distance: bpy.props.FloatProperty(
+        name="Distance",
+        description="遮挡检测距离，0 时使用 World AO 距离（与 Cycles 一致）",
+        default=0.0,
+        min=0.0,
+        subtype="DISTANCE",
+        options={"SKIP_SAVE"},
+    )
+    ao_seed: bpy.props.IntProperty(
+        name="Seed",
+        description="采样随机种子，相同种子结果一致",
+        default=0,
+        min=0,
+        options={"SKIP_SAVE"},
+    )
+    ao_domain: bpy.props.EnumProperty(
+        name="Sample Domain",
+        items=[
+            ("POINT", "Vertex", "每顶点按平滑法线采样，射线最少"),
+            ("CORNER", "Corner", "每 corner 按 split normal 采样，保留硬边两侧差异"),
+        ],
+        default="POINT",
+        options={"SKIP_SAVE"},
+    )
+    ao_occluders: bpy.props.EnumProperty(
+        name="Occluders",
+        items=[
+            ("ALL", "All Proxies", "全部烘焙代理合并为一棵遮挡 BVH"),
+            ("SELF", "Self", "每个代理只被自身遮挡"),
+        ],
+        default="ALL",
+        options={"SKIP_SAVE"},
+    )
+    ao_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="按对象分片的 headless Blender 进程数，1 为当前进程内执行，0 为自动",
+        default=1,
+        min=0,
+        max=64,
+        options={"SKIP_SAVE"},
+    )
+
+    def invoke(self, context, event):
+        # CPU 引擎先弹出参数对话框，射线数 / 距离 / 分片进程数可在 UI 中调整
+        if self.engine == "BVH":
+            return context.window_manager.invoke_props_dialog(self)
+        return self.execute(context)
+
+    def draw(self, context):
+        layout = self.layout
+        box = layout.box()
+        box_column = box.column()
+
+        box_column.prop(self, "engine")
+        if self.engine != "BVH":
+            return
+        box_column.prop(self, "ao_samples")
+        box_column.prop(self, "ao_distance")
+        box_column.prop(self, "ao_seed")
+        box_column.prop(self, "ao_domain")
+        box_column.prop(self, "ao_occluders")
+        box_column.prop(self, "ao_workers")
 
     def execute(self, context):
         selected_objects = bpy.context.selected_objects
@@ -164,7 +279,15 @@ class HST_OT_BakeProxyVertexColorAO(bpy.types.Operator):
 
         proxy_collection = prep_wearmask_objects(selected_objects)  # 处理proxy模型
 
-        bpy.context.scene.render.engine = "CYCLES"
+        engine = self.engine
+        if engine == "BVH" and not HAS_VERTEX_AO_NUMPY:
+            self.report(
+                {"WARNING"},
+                "NumPy unavailable, falling back to Cycles AO bake | NumPy 不可用，改用 Cycles 烘焙",
+            )
+            engine = "CYCLES"
+        if engine == "CYCLES":
+            bpy.context.scene.render.engine = "CYCLES"
         transfer_proxy_collection = proxy_collection
         set_visibility(transfer_proxy_collection, True)
         proxy_layer_coll = Collection.find_layer_collection(proxy_collection)
@@ -210,10 +333,35 @@ class HST_OT_BakeProxyVertexColorAO(bpy.types.Operator):
             set_active_color_attribute(proxy_bake_object, WEARMASK_ATTR)
 
         # 烘焙AO到顶点色
-        bpy.ops.object.bake(type="AO", target="VERTEX_COLORS")
-        self.report(
-            {"INFO"}, "Baked " + str(len(bake_list)) + " objects' AO to vertex color"
-        )
+        if engine == "BVH":
+            world = bpy.context.scene.world
+            distance = self.ao_distance
+            if distance <= 0.0:
+                distance = world.light_settings.distance if world is not None else 1.0
+            settings = VertexAOSettings(
+                samples=self.ao_samples,
+                distance=distance,
+                seed=self.ao_seed,
+                domain=self.ao_domain,
+                occluders=self.ao_occluders,
+            )
+            try:
+                stats = bake_vertex_ao(bake_list, WEARMASK_ATTR, settings, workers=self.ao_workers)
+            except VertexAOBakeError as error:
+                set_visibility(transfer_proxy_collection, False)
+                self.report({"ERROR"}, f"CPU AO bake failed | CPU AO 烘焙失败: {error}")
+                return {"CANCELLED"}
+            timing_text = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stats["timings"].items())
+            self.report(
+                {"INFO"},
+                f"Baked {len(bake_list)} objects' AO to vertex color (CPU BVH, "
+                f"{stats['rays']} rays, {stats['workers']} workers) | {timing_text}",
+            )
+        else:
+            bpy.ops.object.bake(type="AO", target="VERTEX_COLORS")
+            self.report(
+                {"INFO"}, "Baked " + str(len(bake_list)) + " objects' AO to vertex color"
+            )
         # 重置可见性和渲染引擎
         set_visibility(transfer_proxy_collection, False)
         bpy.context.scene.render.engine = current_render_engine
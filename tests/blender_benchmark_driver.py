@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+"""Blender-side headless performance benchmark driver."""
+
+import fnmatch
+import gc
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import bpy
+import bmesh
+import numpy as np
+
+
+REPO_ROOT = Path(os.environ["HST_ADDON_ROOT"])
+ARTIFACT_DIR = Path(os.environ["HST_BENCHMARK_ARTIFACT_DIR"])
+RESULTS_PATH = Path(os.environ["HST_BENCHMARK_RESULTS"])
+CONFIG = json.loads(os.environ.get("HST_BENCHMARK_CONFIG", "{}"))
+PACKAGE_NAME = "hst_benchmark_addon"
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures"
+
+# 与 tests/fixtures/README.md 的 Feature Chamfer 产品矩阵一致。
+FEATURE_CHAMFER_FIXTURES = (
+    ("feature-chamfer-product-simple.blend", ("Extruded.002", "Solid 44")),
+    ("feature-chamfer-product-tricky.blend", ("Solid.004", "Solid.016")),
+    ("feature-chamfer-product-tricky-b.blend", ("Extruded.003", "Extruded.002")),
+    ("feature-chamfer-topology-defect-mixed.blend", ("Extruded.002",)),
+)
+FEATURE_CHAMFER_RADIUS = 0.01
+DEFAULT_FACE_SCALES = (10_000, 100_000, 1_000_000)
+ALPHA_IMAGE_SIDES = (1024, 2048, 4096)
+# greeble 平板中被挤出的格子比例；每个挤出格子额外产生 4 个侧面。
+GREEBLE_DENSITY = 0.25
+SHARP_ANGLE = math.radians(30.0)
+RANDOM_SEED = 1729
+
+
+class BenchmarkCase:
+    """一个 benchmark case。
+
+    setup 在每次重复前调用且不计时，返回值传给 run；run 的返回值记录为 outcome。
+
+    Args:
+        name: 唯一 case 名称，也是 baseline 比较的 key。
+        run: 被计时的回调，签名 run(state)。
+        setup: 可选的未计时准备回调，返回 state。
+        group: case 所属功能分组。
+        scale: 合成输入的规模标签；fixture case 为 None。
+    """
+
+    def __init__(self, name: str, run, setup=None, group: str = "", scale=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.group = group
+        self.scale = scale
+
+
+def load_addon_module():
+    init_path = REPO_ROOT / "__init__.py"
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME,
+        init_path,
+        submodule_search_locations=[str(REPO_ROOT)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def reset_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    scene.render.engine = "BLENDER_EEVEE"
+
+
+# 返回进程生命周期内的峰值 RSS（字节）；平台不支持时返回 None。
+# 峰值只增不减，因此 case 按规模从小到大运行，并额外记录每个 case 期间的增量。
+def peak_rss_bytes():
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(
+                kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+            ):
+                return None
+            return int(counters.PeakWorkingSetSize)
+        except (AttributeError, OSError):
+            return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 以字节为单位，Linux 以 KiB 为单位。
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def format_scale(value: int) -> str:
+    if value >= 1_000_000 and value % 1_000_000 == 0:
+        return f"{value // 1_000_000}M"
+    if value >= 1_000 and value % 1_000 == 0:
+        return f"{value // 1_000}k"
+    return str(value)
+
+
+def summarize_samples(samples):
+    ordered = sorted(samples)
+    count = len(ordered)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) * 0.5
+    return {
+        "min": round(ordered[0], 6),
+        "median": round(median, 6),
+        "mean": round(sum(ordered) / count, 6),
+        "max": round(ordered[-1], 6),
+    }
+
+
+# 把 BMesh 写入新 Mesh Object 并链接到当前 Scene。
+# name: Object / Mesh 名称；bm: 已构建的 BMesh，调用后释放。
+def bmesh_to_object(name: str, bm):
+    mesh_data = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh_data)
+    bm.free()
+    mesh_data.update()
+    obj = bpy.data.objects.new(name, mesh_data)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+# 按二面角把 Edge 标记为 Sharp，并与 PrepCADMesh 一样把 Sharp 同步为 Seam。
+# bm: 目标 BMesh。
+def mark_sharp_and_seam(bm):
+    bm.normal_update()
+    for edge in bm.edges:
+        sharp = len(edge.link_faces) == 2 and edge.calc_face_angle(0.0) > SHARP_ANGLE
+        edge.smooth = not sharp
+        edge.seam = sharp
+
+
+# 构建约 face_count 个 quad 的细分立方体：6 * (cuts + 1)^2 个面。
+# name: Object 名称；face_count: 目标面数。
+def make_subdivided_cube(name: str, face_count: int):
+    cuts = max(0, round(math.sqrt(face_count / 6.0)) - 1)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=2.0)
+    if cuts:
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges[:], cuts=cuts, use_grid_fill=True)
+    mark_sharp_and_seam(bm)
+    return bmesh_to_object(name, bm)
+
+
+# 构建 greeble 平板：网格上按固定种子随机挤出独立方块，约 face_count 个面。
+# name: Object 名称；face_count: 目标面数。
+def make_greeble_plate(name: str, face_count: int):
+    segments = max(2, round(math.sqrt(face_count / (1.0 + 4.0 * GREEBLE_DENSITY))))
+    rng = random.Random(RANDOM_SEED)
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1.0)
+    cell_size = 2.0 / segments
+    raised_faces = [face for face in bm.faces if rng.random() < GREEBLE_DENSITY]
+    extruded = bmesh.ops.extrude_discrete_faces(bm, faces=raised_faces)
+    for face in extruded["faces"]:
+        height = rng.uniform(0.2, 1.0) * cell_size
+        for vertex in face.verts:
+            vertex.co.z += height
+    mark_sharp_and_seam(bm)
+    return bmesh_to_object(name, bm)
+
+
+# 生成带随机 alpha 矩形块的方形图像，块数量随边长增长。
+# name: Image 名称；side: 像素边长。
+def make_alpha_atlas_image(name: str, side: int):
+    rng = random.Random(RANDOM_SEED)
+    image = bpy.data.images.new(name, width=side, height=side, alpha=True, float_buffer=True)
+    pixels = np.zeros((side, side, 4), dtype=np.float32)
+    pixels[..., :3] = 1.0
+    block_count = max(4, side // 16)
+    for _ in range(block_count):
+        block_width = rng.randint(4, max(5, side // 16))
+        block_height = rng.randint(4, max(5, side // 16))
+        start_x = rng.randint(0, side - block_width)
+        start_y = rng.randint(0, side - block_height)
+        pixels[start_y:start_y + block_height, start_x:start_x + block_width, 3] = 1.0
+    image.pixels.foreach_set(pixels.ravel())
+    return image
+
+
+# 合成 Mesh case：同一 base Mesh 只构建一次，每次重复在未计时的 setup 中复制一份新 Object。
+# addon: 已注册 add-on 模块；scale: 目标面数。
+def synthetic_mesh_cases(addon, scale: int):
+    mesh_class = addon.utils.mesh_utils.Mesh
+    fbx_export = addon.utils.export_utils.FBXExport
+    export_dir = ARTIFACT_DIR / "benchmarks" / "fbx"
+    label = format_scale(scale)
+    cases = []
+    for shape, builder in (("subdivided_cube", make_subdivided_cube), ("greeble_plate", make_greeble_plate)):
+        base = {}
+
+        def fresh_copy(shape=shape, builder=builder, base=base):
+            if "object" not in base:
+                base["object"] = builder(f"Bench_{shape}_{label}", scale)
+                base["object"].hide_set(True)
+            previous = base.pop("copy", None)
+            if previous is not None:
+                previous_mesh = previous.data
+                bpy.data.objects.remove(previous)
+                bpy.data.meshes.remove(previous_mesh)
+            copy = base["object"].copy()
+            copy.data = base["object"].data.copy()
+            bpy.context.scene.collection.objects.link(copy)
+            base["copy"] = copy
+            return copy
+
+        def run_auto_seam(obj):
+            mesh_class.auto_seam(obj, mode="STANDARD")
+            return len(obj.data.polygons)
+
+        def run_curvature(obj):
+            stats = mesh_class.mark_curvature_corner_attributes(obj)
+            return stats["corners"]
+
+        def run_fbx_export(obj, shape=shape):
+            export_dir.mkdir(parents=True, exist_ok=True)
+            file_path = export_dir / f"{shape}_{label}.fbx"
+            fbx_export.staticmesh(obj, str(file_path))
+            return file_path.stat().st_size
+
+        cases.extend(
+            (
+                BenchmarkCase(f"mesh.auto_seam/{shape}/{label}", run_auto_seam, fresh_copy, "auto_seam", label),
+                BenchmarkCase(
+                    f"mesh.curvature_corner_attributes/{shape}/{label}",
+                    run_curvature,
+                    fresh_copy,
+                    "curvature_corner_attributes",
+                    label,
+                ),
+                BenchmarkCase(f"export.fbx/{shape}/{label}", run_fbx_export, fresh_copy, "fbx_export", label),
+            )
+        )
+    return cases
+
+
+# alpha rect split 的连通域分析；每次重复前清空内存缓存，测量完整的像素读取与标记。
+# addon: 已注册 add-on 模块；side: 图像边长。
+def alpha_region_cases(addon, side: int):
+    image_utils = addon.utils.image_utils
+    base = {}
+
+    def setup():
+        if "image" not in base:
+            base["image"] = make_alpha_atlas_image(f"BenchAlpha_{side}", side)
+        image_utils.clear_alpha_caches()
+        return base["image"]
+
+    def run(image):
+        analysis = image_utils.find_alpha_regions(image, alpha_threshold=0.1, min_region_pixels=16, padding_pixels=1)
+        return len(analysis["regions"])
+
+    return [BenchmarkCase(f"image.alpha_regions/{side}px", run, setup, "alpha_rect_split", f"{side}px")]
+
+
+# 打开 fixture 并只选中目标 source；open_mainfile 会使之前的 Python 引用失效，因此 fixture case 放在最后。
+# fixture_path/object_name: fixture 文件与 source Object 名称。
+def open_fixture_source(fixture_path: Path, object_name: str):
+    bpy.ops.wm.open_mainfile(filepath=str(fixture_path))
+    source = bpy.data.objects.get(object_name)
+    if source is None:
+        raise RuntimeError(f"{object_name} missing in {fixture_path.name}")
+    for obj in tuple(bpy.context.selected_objects):
+        obj.select_set(False)
+    source.hide_set(False)
+    source.select_set(True)
+    bpy.context.view_layer.objects.active = source
+    return source
+
+
+def run_feature_chamfer(source_name: str, action: str):
+    properties = {"radius": FEATURE_CHAMFER_RADIUS} if action == "PREVIEW" else {}
+    return sorted(
+        bpy.ops.hst.feature_chamfer_gn(
+            "EXEC_DEFAULT",
+            action=action,
+            source_object_name=source_name,
+            **properties,
+        )
+    )
+
+
+def feature_chamfer_cases():
+    cases = []
+    for fixture_name, object_names in FEATURE_CHAMFER_FIXTURES:
+        fixture_path = FIXTURE_DIR / fixture_name
+        for object_name in object_names:
+            def setup_preview(fixture_path=fixture_path, object_name=object_name):
+                return open_fixture_source(fixture_path, object_name).name
+
+            def setup_finalize(fixture_path=fixture_path, object_name=object_name):
+                source_name = open_fixture_source(fixture_path, object_name).name
+                run_feature_chamfer(source_name, "PREVIEW")
+                return source_name
+
+            case_suffix = f"{fixture_path.stem}/{object_name}"
+            cases.append(
+                BenchmarkCase(
+                    f"feature_chamfer.preview/{case_suffix}",
+                    lambda source_name: run_feature_chamfer(source_name, "PREVIEW"),
+                    setup_preview,
+                    "feature_chamfer_preview",
+                )
+            )
+            cases.append(
+                BenchmarkCase(
+                    f"feature_chamfer.finalize/{case_suffix}",
+                    lambda source_name: run_feature_chamfer(source_name, "FINALIZE"),
+                    setup_finalize,
+                    "feature_chamfer_finalize",
+                )
+            )
+    return cases
+
+
+# 执行 warm-up 与计时重复；每次计时前先 gc，避免上一轮垃圾回收落入本轮。
+# case: BenchmarkCase；warmup/repetitions: 不计入统计与计入统计的次数。
+def measure_case(case: BenchmarkCase, warmup: int, repetitions: int) -> dict:
+    record = {
+        "name": case.name,
+        "group": case.group,
+        "scale": case.scale,
+        "status": "passed",
+        "warmup": warmup,
+        "repetitions": repetitions,
+        "outcomes": [],
+        "error": None,
+    }
+    rss_before = peak_rss_bytes()
+    wall_samples = []
+    cpu_samples = []
+    try:
+        for index in range(warmup + repetitions):
+            state = case.setup() if case.setup is not None else None
+            gc.collect()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            outcome = case.run(state)
+            cpu_elapsed = time.process_time() - cpu_start
+            wall_elapsed = time.perf_counter() - wall_start
+            if index < warmup:
+                continue
+            wall_samples.append(wall_elapsed)
+            cpu_samples.append(cpu_elapsed)
+            if outcome not in record["outcomes"]:
+                record["outcomes"].append(outcome)
+    except Exception as error:
+        record["status"] = "failed"
+        record["error"] = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+    if wall_samples:
+        record["wall_seconds"] = summarize_samples(wall_samples)
+        record["cpu_seconds"] = summarize_samples(cpu_samples)
+        record["samples"] = {
+            "wall_seconds": [round(value, 6) for value in wall_samples],
+            "cpu_seconds": [round(value, 6) for value in cpu_samples],
+        }
+    rss_after = peak_rss_bytes()
+    record["peak_rss_bytes"] = rss_after
+    record["peak_rss_growth_bytes"] = (
+        rss_after - rss_before if rss_before is not None and rss_after is not None else None
+    )
+    return record
+
+
+def select_cases(cases, patterns):
+    if not patterns:
+        return cases
+    return [case for case in cases if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in patterns)]
+
+
+def main():
+    addon_module = load_addon_module()
+    addon_module.register()
+
+    warmup = max(0, int(CONFIG.get("warmup", 1)))
+    repetitions = max(1, int(CONFIG.get("repetitions", 5)))
+    face_scales = sorted(int(value) for value in CONFIG.get("scales", DEFAULT_FACE_SCALES))
+    patterns = CONFIG.get("cases") or []
+
+    # 每组 case 共享一次 reset_scene；合成规模从小到大，fixture case 最后运行。
+    case_groups = [lambda scale=scale: synthetic_mesh_cases(addon_module, scale) for scale in face_scales]
+    case_groups.extend(lambda side=side: alpha_region_cases(addon_module, side) for side in ALPHA_IMAGE_SIDES)
+    case_groups.append(feature_chamfer_cases)
+
+    records = []
+    for build_cases in case_groups:
+        cases = select_cases(build_cases(), patterns)
+        if not cases:
+            continue
+        reset_scene()
+        for case in cases:
+            print(f"[BENCH] {case.name}")
+            record = measure_case(case, warmup, repetitions)
+            records.append(record)
+            if record["status"] == "passed":
+                print(
+                    f"  wall median {record['wall_seconds']['median']:.4f}s, "
+                    f"cpu median {record['cpu_seconds']['median']:.4f}s"
+                )
+            else:
+                print(record["error"])
+
+    summary = {
+        "blender_version": bpy.app.version_string,
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "repo_root": str(REPO_ROOT),
+        "config": {
+            "warmup": warmup,
+            "repetitions": repetitions,
+            "scales": face_scales,
+            "alpha_image_sides": list(ALPHA_IMAGE_SIDES),
+            "cases": patterns,
+        },
+        "cases": records,
+    }
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    try:
+        addon_module.unregister()
+    except Exception:
+        traceback.print_exc()
+
+    if any(record["status"] != "passed" for record in records):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,20 +7,25 @@ import inspect
 import json
 import math
 import os
+import shutil
 import sys
 import tempfile
+import time
 import traceback
 from pathlib import Path
 
 import bpy
 import bmesh
 from mathutils import Vector
+from mathutils import geometry
 from mathutils.bvhtree import BVHTree
 
 
 REPO_ROOT = Path(os.environ["HST_ADDON_ROOT"])
 ARTIFACT_DIR = Path(os.environ["HST_TEST_ARTIFACT_DIR"])
 RESULTS_PATH = Path(os.environ["HST_TEST_RESULTS"])
+# 可选的 JSON case 名称列表；由 tools/run_blender_tests.py 分片时设置，只运行其中的 case。
+SELECTED_CASES_ENV = "HST_TEST_CASES"
 PACKAGE_NAME = "hst_test_addon"
 
 
@@ -34,6 +39,7 @@ class TestCaseResult:
         self.status = "passed"
         self.details = []
         self.error = None
+        self.seconds = 0.0
 
     def add_detail(self, message: str):
         self.details.append(message)
@@ -48,22 +54,28 @@ class TestCaseResult:
             "status": self.status,
             "details": self.details,
             "error": self.error,
+            "seconds": round(self.seconds, 4),
         }
 
 
 class TestContext:
-    def __init__(self, addon_module):
+    def __init__(self, addon_module, selected_cases=None):
         self.addon = addon_module
         self.const = addon_module.const
         self.results = []
+        self.selected_cases = selected_cases
 
     def run_case(self, name, callback):
+        if self.selected_cases is not None and name not in self.selected_cases:
+            return
         result = TestCaseResult(name)
+        started_at = time.perf_counter()
         try:
             reset_scene()
             callback(self, result)
         except Exception as error:
             result.fail(error)
+        result.seconds = time.perf_counter() - started_at
         self.results.append(result)
 
 
@@ -643,6 +655,179 @@ def test_pipe_chamfer_degree_four_strand_pairing_regression(test_context: TestCo
     result.add_detail("Degree-4 crossing preserved two opposite Feature strands")
 
 
+def test_pipe_chamfer_vertex_matching_dp_matches_enumeration_regression(
+    test_context: TestContext,
+    result: TestCaseResult,
+):
+    """验证 bitmask DP matching 与穷举枚举一致，且 degree-8 junction 不再走超指数枚举。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+
+    class MatchingEdge:
+        def __init__(self, index):
+            self.index = index
+
+    weights = (90.0, 120.0, 135.0, 180.0, 157.5)
+    checked = 0
+    for degree in range(1, 8):
+        edges = [MatchingEdge(index * 3 + 1) for index in range(degree)]
+        for variant in range(4):
+            edge_records = []
+            for index_a, edge_a in enumerate(edges):
+                for index_b in range(index_a + 1, degree):
+                    if (index_a * 7 + index_b * 5 + variant) % 4 == 0:
+                        continue
+                    edge_b = edges[index_b]
+                    edge_records.append(
+                        (
+                            edge_a,
+                            edge_b,
+                            {
+                                "edge_ids": (edge_a.index, edge_b.index),
+                                "weight": weights[(index_a + index_b + variant) % len(weights)],
+                            },
+                        )
+                    )
+            checked += utils._cross_check_vertex_matchings(edges, edge_records)
+
+    edges = [MatchingEdge(index) for index in range(12)]
+    edge_records = [
+        (
+            edge_a,
+            edge_b,
+            {"edge_ids": (edge_a.index, edge_b.index), "weight": 90.0 + edge_a.index + edge_b.index * 0.5},
+        )
+        for index_a, edge_a in enumerate(edges)
+        for edge_b in edges[index_a + 1:]
+    ]
+    top = utils._top_vertex_matchings(edges, edge_records, limit=2)
+    ensure(len(top[0]["selected"]) == 6, f"Degree-12 junction did not pair every Edge: {top[0]}")
+    ensure(top[0]["score"] >= top[1]["score"], "Runner-up matching scored above the best matching")
+    result.add_detail(f"Vertex matching DP cross-checked {checked} enumerated matchings")
+
+
+def test_pipe_chamfer_containment_oracle_matches_ray_parity_regression(
+    test_context: TestContext,
+    result: TestCaseResult,
+):
+    """验证体素化 containment oracle 与逐点 ray parity 一致，且远离表面的点走体素缓存。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=2.0)
+    source_bvh = BVHTree.FromBMesh(bm)
+    clearance = 0.05
+    oracle = utils.SourceContainmentOracle(source_bvh, [vertex.co for vertex in bm.verts], clearance, resolution=8)
+    tolerance = max(clearance * 0.02, 1.0e-6)
+    points = [
+        Vector((x * 0.173 - 1.3, y * 0.161 - 1.2, z * 0.149 - 1.15))
+        for x in range(16)
+        for y in range(16)
+        for z in range(16)
+    ]
+    mismatches = [
+        tuple(point)
+        for point, (inside, _) in zip(points, oracle.query_many(points))
+        if inside != utils._point_inside_closed_bvh(source_bvh, point, tolerance)
+    ]
+    bm.free()
+    ensure(not mismatches, f"Containment oracle disagrees with ray parity at {mismatches[:5]}")
+    ensure(oracle.stats["cell_hits"] > 0, f"Containment oracle never reused a voxel: {oracle.stats}")
+    ensure(
+        oracle.stats["ray_parity_points"] < len(points),
+        f"Containment oracle fell back to ray parity for every point: {oracle.stats}",
+    )
+    result.add_detail(f"Containment oracle stats: {oracle.stats}")
+
+
+def test_pipe_chamfer_polyline_index_matches_brute_force_regression(
+    test_context: TestContext,
+    result: TestCaseResult,
+):
+    """验证 PolylineIndex 的自交计数、最近距离、最近 segment 与参数查找和逐 segment 全量遍历一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    index_utils = test_context.addon.utils.polyline_index_utils
+    sample_count = 400
+    # 8 字形闭环：中心自交一次，叠加 z 起伏让 segment 分布在三维空间。
+    rail = [
+        Vector(
+            (
+                math.sin(2.0 * math.pi * index / sample_count),
+                math.sin(4.0 * math.pi * index / sample_count) * 0.5,
+                math.cos(6.0 * math.pi * index / sample_count) * 0.01,
+            )
+        )
+        for index in range(sample_count)
+    ]
+    tolerance = 0.02
+    polyline_index = index_utils.PolylineIndex(rail, True)
+
+    expected_intersections = 0
+    for first_index in range(sample_count):
+        for second_index in range(first_index + 2, sample_count):
+            if first_index == 0 and second_index == sample_count - 1:
+                continue
+            if index_utils._segments_intersect(
+                rail[first_index],
+                rail[(first_index + 1) % sample_count],
+                rail[second_index],
+                rail[(second_index + 1) % sample_count],
+                tolerance,
+            ):
+                expected_intersections += 1
+    intersection_count = polyline_index.self_intersection_count(tolerance)
+    ensure(
+        intersection_count == expected_intersections and intersection_count > 0,
+        f"PolylineIndex counted {intersection_count} self intersections, brute force {expected_intersections}",
+    )
+
+    mismatches = []
+    for query_index in range(97):
+        point = Vector(
+            (
+                math.cos(query_index * 0.37) * 1.3,
+                math.sin(query_index * 0.53) * 0.8,
+                (query_index % 7 - 3) * 0.05,
+            )
+        )
+        candidates = []
+        for segment_index in range(sample_count):
+            start = rail[segment_index]
+            end = rail[(segment_index + 1) % sample_count]
+            closest, factor = geometry.intersect_point_line(point, start, end)
+            factor = max(0.0, min(1.0, factor))
+            candidates.append(((point - start.lerp(end, factor)).length_squared, segment_index, factor))
+        expected = min(candidates)
+        nearest = polyline_index.nearest_segment(point)
+        if nearest[0] != expected[1] or nearest[2] != expected[2]:
+            mismatches.append((query_index, nearest, expected))
+        expected_distance = math.sqrt(expected[0])
+        if abs(polyline_index.distance(point) - expected_distance) > 1.0e-6:
+            mismatches.append((query_index, polyline_index.distance(point), expected_distance))
+    ensure(not mismatches, f"PolylineIndex nearest queries disagree with brute force: {mismatches[:5]}")
+
+    parameters = [0.0, 0.0, 0.1, 0.25, 0.25, 0.5, 0.75, 1.0]
+    for parameter in (-0.1, 0.0, 0.05, 0.175, 0.25, 0.3, 0.625, 0.9, 1.2):
+        expected = min(range(len(parameters)), key=lambda index: abs(parameters[index] - parameter))
+        actual = index_utils.nearest_parameter_index(parameters, parameter)
+        ensure(actual == expected, f"nearest_parameter_index({parameter}) returned {actual}, expected {expected}")
+    result.add_detail(
+        f"PolylineIndex matched brute force: {intersection_count} self intersections on {sample_count} segments"
+    )
+
+
 # 验证 degree-3 junction 选择最直主 strand，并留下单个 unmatched branch。
 # test_context/result: 已加载的 add-on 测试上下文与结果记录器。
 def test_pipe_chamfer_degree_three_strand_matching_regression(
@@ -880,6 +1065,87 @@ def test_ao_bake_operator_smoke(test_context: TestContext, result: TestCaseResul
     result.add_detail(f"Proxy color attributes: {list(proxy_obj.data.color_attributes.keys())}")
 
 
+def read_color_attribute_red(mesh_data, attribute_name):
+    """读取颜色属性每 corner 的 R 通道（AO 为灰度）。
+
+    Args:
+        mesh_data: 目标 Mesh 数据。
+        attribute_name: 颜色属性名称。
+
+    Returns:
+        每个颜色元素的 R 值列表。
+    """
+    attribute = mesh_data.color_attributes[attribute_name]
+    colors = [0.0] * (len(attribute.data) * 4)
+    attribute.data.foreach_get("color", colors)
+    return colors[0::4]
+
+
+def test_vertex_ao_bvh_engine_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 CPU BVH 顶点 AO：遮挡/开放区域、种子确定性、多进程分片与进程内一致、SELF 模式与 Operator 不切换渲染引擎。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    const = test_context.const
+    ao_utils = test_context.addon.utils.vertex_ao_utils
+    ensure(ao_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    collection = make_collection("VertexAOCase")
+    grid = [(x - 2.0, y - 2.0, 0.0) for y in range(5) for x in range(5)]
+    grid_faces = [(y * 5 + x, y * 5 + x + 1, (y + 1) * 5 + x + 1, (y + 1) * 5 + x) for y in range(4) for x in range(4)]
+    floor_data = bpy.data.meshes.new("VertexAOFloorMesh")
+    floor_data.from_pydata(grid, [], grid_faces)
+    floor = bpy.data.objects.new("VertexAOFloor", floor_data)
+    collection.objects.link(floor)
+    box = make_test_mesh("VertexAOBox", collection)
+    box.scale = (0.75, 0.75, 0.5)
+    box.location = (0.0, 0.0, 0.6)
+    bpy.context.view_layer.update()
+
+    settings = ao_utils.VertexAOSettings(samples=32, distance=0.5, seed=7)
+    stats = ao_utils.bake_vertex_ao([floor, box], const.WEARMASK_ATTR, settings)
+    ensure(stats["rays"] == (25 + len(box.data.vertices)) * 32, f"Unexpected ray count: {stats}")
+    attribute = floor_data.color_attributes[const.WEARMASK_ATTR]
+    ensure(attribute.domain == "CORNER" and attribute.data_type == "BYTE_COLOR", "AO attribute layout changed")
+    floor_ao = read_color_attribute_red(floor_data, const.WEARMASK_ATTR)
+    ao_by_vertex = {floor_data.loops[index].vertex_index: value for index, value in enumerate(floor_ao)}
+    ensure(ao_by_vertex[12] < 0.2, f"Vertex under the box is not occluded: {ao_by_vertex[12]}")
+    ensure(ao_by_vertex[0] == 1.0, f"Open floor corner is occluded: {ao_by_vertex[0]}")
+
+    ao_utils.bake_vertex_ao([floor, box], const.WEARMASK_ATTR, settings)
+    ensure(read_color_attribute_red(floor_data, const.WEARMASK_ATTR) == floor_ao, "Seeded AO bake is not deterministic")
+    sharded = ao_utils.bake_vertex_ao([floor, box], const.WEARMASK_ATTR, settings, workers=2)
+    ensure(sharded["workers"] == 2, f"Sharded bake did not use 2 workers: {sharded}")
+    ensure(read_color_attribute_red(floor_data, const.WEARMASK_ATTR) == floor_ao, "Sharded AO differs from in-process AO")
+
+    settings.occluders = "SELF"
+    ao_utils.bake_vertex_ao([floor, box], const.WEARMASK_ATTR, settings)
+    ensure(
+        min(read_color_attribute_red(floor_data, const.WEARMASK_ATTR)) == 1.0,
+        "Flat floor occluded itself in SELF mode",
+    )
+
+    operator_collection = make_collection("VertexAOOperatorCase")
+    obj = make_test_mesh("VertexAOOperatorMesh", operator_collection)
+    select_objects(obj, [obj])
+    render_engine = bpy.context.scene.render.engine
+    bake_result = bpy.ops.hst.hst_bakeproxyvertcolrao(engine="BVH", ao_samples=8)
+    ensure("FINISHED" in bake_result, "CPU AO bake operator did not finish")
+    ensure(bpy.context.scene.render.engine == render_engine, "CPU AO bake switched render engine")
+    operator_properties = bpy.types.HST_OT_BakeProxyVertexColorAO.bl_rna.properties
+    for property_name in ("engine", "ao_samples", "ao_distance", "ao_seed", "ao_domain", "ao_occluders", "ao_workers"):
+        ensure(
+            operator_properties[property_name].is_skip_save,
+            f"{property_name} is remembered across calls; the Cycles button would reuse the CPU engine",
+        )
+    proxy_obj = obj.modifiers.get(const.COLOR_TRANSFER_MODIFIER).object
+    ensure(
+        max(read_color_attribute_red(proxy_obj.data, const.WEARMASK_ATTR)) == 1.0,
+        "Convex proxy did not receive unoccluded AO",
+    )
+    result.add_detail(f"center AO={ao_by_vertex[12]:.3f}, timings={stats['timings']}")
+
 def test_wearmask_proxy_topology_matches_transfer_target(test_context: TestContext, result: TestCaseResult):
     const = test_context.const
     collection = make_collection("AOTopologyCase")
@@ -913,6 +1179,63 @@ def test_wearmask_proxy_topology_matches_transfer_target(test_context: TestConte
     result.add_detail(f"Proxy vertices/polys: {proxy_vertex_count}/{proxy_poly_count}")
 
 
+def test_wearmask_bulk_proxy_prep_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 wearmask 多对象批量建 proxy：父子与 Data Transfer 引用正确，NumPy convex_edge 与 BMesh is_convex 一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    const = test_context.const
+    collection = make_collection("WearmaskBulkCase")
+    meshes = [make_test_mesh(f"BulkMesh_{index}", collection, location=(index * 3.0, 0.0, 0.0)) for index in range(3)]
+    meshes[1].rotation_euler = (0.3, 0.0, 0.7)
+    meshes[2].scale = (2.0, 1.0, 1.0)
+    l_shape_data = bpy.data.meshes.new("BulkLShape")
+    l_shape_data.from_pydata(
+        [(0, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0), (1, 2, 0), (0, 2, 0),
+         (0, 0, 1), (2, 0, 1), (2, 1, 1), (1, 1, 1), (1, 2, 1), (0, 2, 1)],
+        [],
+        [(5, 4, 3, 2, 1, 0), (6, 7, 8, 9, 10, 11), (0, 1, 7, 6), (1, 2, 8, 7),
+         (2, 3, 9, 8), (3, 4, 10, 9), (4, 5, 11, 10), (5, 0, 6, 11)],
+    )
+    l_shape_data.update()
+    l_shape = bpy.data.objects.new("BulkLShape", l_shape_data)
+    collection.objects.link(l_shape)
+    l_shape.location = (0.0, 4.0, 0.0)
+    meshes.append(l_shape)
+    select_objects(meshes[0], meshes)
+
+    build_result = bpy.ops.hst.hst_addtransvertcolorproxy()
+    ensure("FINISHED" in build_result, "Bulk proxy build did not finish")
+
+    for obj in meshes:
+        ensure(tuple(obj.location) == (0.0, 0.0, 0.0), f"{obj.name} transform was not applied")
+        transfer_modifier = obj.modifiers.get(const.COLOR_TRANSFER_MODIFIER)
+        ensure(transfer_modifier is not None, f"{obj.name} missing color transfer modifier")
+        proxy_obj = transfer_modifier.object
+        ensure(proxy_obj is not None and proxy_obj.name.startswith(const.TRANSFERPROXY_PREFIX), f"{obj.name} proxy missing")
+        ensure(proxy_obj.parent == obj, f"{proxy_obj.name} is not parented to {obj.name}")
+        ensure(len(proxy_obj.data.vertices) == len(obj.data.vertices), f"{proxy_obj.name} vertex count mismatch")
+        ensure(const.WEARMASK_ATTR in proxy_obj.data.color_attributes, f"{proxy_obj.name} missing WearMask attribute")
+
+        convex_attr = obj.data.attributes.get("convex_edge")
+        ensure(convex_attr is not None, f"{obj.name} missing convex_edge attribute")
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        bm.edges.ensure_lookup_table()
+        expected = [1.0 if edge.is_convex else 0.0 for edge in bm.edges]
+        bm.free()
+        actual = [item.value for item in convex_attr.data]
+        ensure(actual == expected, f"{obj.name} convex_edge differs from BMesh is_convex")
+
+    concave_count = sum(1 for item in l_shape.data.attributes["convex_edge"].data if item.value == 0.0)
+    ensure(concave_count == 1, f"L shape should have exactly one concave edge, got {concave_count}")
+    proxies = [o for o in bpy.data.objects if o.name.startswith(const.TRANSFERPROXY_PREFIX)]
+    ensure(len(proxies) == len(meshes), f"Unexpected proxy count: {len(proxies)}")
+    result.add_detail(f"meshes={len(meshes)}, proxies={len(proxies)}")
+
+
 def test_set_bake_collection_smoke(test_context: TestContext, result: TestCaseResult):
     const = test_context.const
     collection = make_collection("BakeCollectionCase")
@@ -961,6 +1284,97 @@ def test_vertex_color_set_and_copy_smoke(test_context: TestContext, result: Test
     result.add_detail(f"Copied bake color: {source_color}")
 
 
+def test_vertex_color_numpy_api_regression(test_context: TestContext, result: TestCaseResult):
+    """验证顶点色 NumPy API：平均色、POINT/CORNER 转换与复制、多对象批量填色与编辑模式选择填色。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    const = test_context.const
+    color_utils = test_context.addon.utils.vertex_color_utils
+    ensure(color_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    collection = make_collection("VertexColorArrayCase")
+    meshes = [make_test_mesh(f"ColorArrayMesh_{index}", collection, location=(index * 3.0, 0.0, 0.0)) for index in range(4)]
+
+    source = meshes[0]
+    point_attr = source.data.color_attributes.new(name="PointColor", type="FLOAT_COLOR", domain="POINT")
+    point_colors = [(index / 8.0, 1.0 - index / 8.0, 0.5, 1.0) for index in range(len(source.data.vertices))]
+    for index, color in enumerate(point_colors):
+        point_attr.data[index].color = color
+    expected_average = [sum(color[channel] for color in point_colors) / len(point_colors) for channel in range(4)]
+    actual_average = color_utils.average_color(point_attr, srgb=False)
+    ensure(
+        all(abs(a - b) < 1e-5 for a, b in zip(actual_average, expected_average)),
+        f"Average color mismatch: {actual_average} != {expected_average}",
+    )
+
+    corner_attr = source.data.color_attributes.new(name="CornerColor", type="FLOAT_COLOR", domain="CORNER")
+    ensure(
+        color_utils.copy_color_attribute(point_attr, source.data, corner_attr, source.data, srgb=False),
+        "Point to corner copy rejected matching topology",
+    )
+    for loop in source.data.loops:
+        copied = tuple(corner_attr.data[loop.index].color)
+        expected = point_colors[loop.vertex_index]
+        ensure(all(abs(a - b) < 1e-5 for a, b in zip(copied, expected)), f"Corner {loop.index} copy mismatch")
+    point_back = color_utils.corner_to_point_colors(source.data, color_utils.read_color_array(corner_attr, srgb=False))
+    ensure(
+        all(abs(float(point_back[index][0]) - point_colors[index][0]) < 1e-5 for index in range(len(point_colors))),
+        "Corner to point round trip changed colors",
+    )
+
+    targets = meshes[1:]
+    batch_color = (0.25, 0.5, 0.75, 1.0)
+    updated_count = color_utils.batch_set_vertex_color(targets, batch_color, const.BAKECOLOR_ATTR)
+    ensure(updated_count == len(targets), f"Unexpected batch updated count: {updated_count}")
+    for obj in targets:
+        bake_attr = obj.data.color_attributes.get(const.BAKECOLOR_ATTR)
+        ensure(bake_attr is not None, f"{obj.name} missing bake color attribute")
+        ensure(obj.data.attributes.active_color.name == const.BAKECOLOR_ATTR, f"{obj.name} bake color is not active")
+        colors = color_utils.read_color_array(bake_attr)
+        ensure(abs(colors - colors[0]).max() < 1e-6, f"{obj.name} batch fill is not uniform")
+        ensure(abs(float(colors[0][0]) - batch_color[0]) < 0.01, f"{obj.name} batch fill color mismatch")
+
+    keep_active_obj = targets[1]
+    keep_active_obj.data.color_attributes.new(name="KeepActiveColor", type="BYTE_COLOR", domain="CORNER")
+    color_utils.set_active_color_attribute(keep_active_obj, "KeepActiveColor")
+    color_utils.batch_set_vertex_color([keep_active_obj], batch_color, const.BAKECOLOR_ATTR, use_active=False)
+    ensure(
+        keep_active_obj.data.attributes.active_color.name == "KeepActiveColor",
+        "Filling an existing attribute changed the active color attribute",
+    )
+
+    edit_obj = targets[0]
+    selected_polygon = 0
+    for polygon in edit_obj.data.polygons:
+        polygon.select = polygon.index == selected_polygon
+    for vertex in edit_obj.data.vertices:
+        vertex.select = vertex.index in edit_obj.data.polygons[selected_polygon].vertices
+    for edge in edit_obj.data.edges:
+        edge.select = all(vertex in edit_obj.data.polygons[selected_polygon].vertices for vertex in edge.vertices)
+    selected_loops = set(edit_obj.data.polygons[selected_polygon].loop_indices)
+    object_mode_color = (0.0, 1.0, 0.0, 1.0)
+    color_utils.batch_set_vertex_color([edit_obj], object_mode_color, const.BAKECOLOR_ATTR, selected_only=True)
+    colors = color_utils.read_color_array(edit_obj.data.color_attributes[const.BAKECOLOR_ATTR])
+    for loop_index, color in enumerate(colors):
+        expected_green = object_mode_color[1] if loop_index in selected_loops else batch_color[1]
+        ensure(abs(float(color[1]) - expected_green) < 0.01, f"Loop {loop_index} object mode selection fill mismatch")
+
+    select_objects(edit_obj, [edit_obj])
+    bpy.ops.object.mode_set(mode="EDIT")
+    edit_color = (1.0, 0.0, 0.0, 1.0)
+    color_utils.batch_set_vertex_color([edit_obj], edit_color, const.BAKECOLOR_ATTR)
+    ensure(edit_obj.mode == "EDIT", "Selection fill left Edit Mode")
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    bake_attr = edit_obj.data.color_attributes[const.BAKECOLOR_ATTR]
+    colors = color_utils.read_color_array(bake_attr)
+    for loop_index, color in enumerate(colors):
+        expected_red = edit_color[0] if loop_index in selected_loops else batch_color[0]
+        ensure(abs(float(color[0]) - expected_red) < 0.01, f"Loop {loop_index} selection fill mismatch")
+    result.add_detail(f"average={[round(value, 4) for value in actual_average]}, batch={updated_count}")
+
 
 def test_collision_and_extract_ucx_smoke(test_context: TestContext, result: TestCaseResult):
     collection = make_collection("CollisionCase")
@@ -1204,6 +1618,198 @@ def test_staticmeshexport_glb_smoke(test_context: TestContext, result: TestCaseR
     result.add_detail(f"GLB export: {export_file.name} ({export_file.stat().st_size} bytes)")
 
 
+def test_staticmeshexport_batch_workers_fbx(test_context: TestContext, result: TestCaseResult):
+    """验证 batch 模式按 worker 进程并行导出 FBX，并写出含字节数与耗时的 manifest。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    collections = [make_collection(f"BatchExportCase{index}") for index in range(3)]
+    for index, collection in enumerate(collections):
+        make_test_mesh(f"BatchExportMesh{index}", collection, location=(index * 3.0, 0.0, 0.0))
+
+    export_dir = ARTIFACT_DIR / "exports" / "batch_workers_fbx"
+    if export_dir.exists():
+        shutil.rmtree(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    params = bpy.context.scene.hst_params
+    params.export_path = str(export_dir)
+    params.export_format = "FBX"
+    params.file_prefix = ""
+    params.use_batch_export = True
+    params.batch_export_workers = 2
+    try:
+        op_result = bpy.ops.hst.staticmeshexport()
+    finally:
+        params.use_batch_export = False
+    ensure("FINISHED" in op_result, "Batch worker FBX export operator did not finish")
+
+    manifest_path = export_dir / test_context.addon.utils.batch_export_utils.BATCH_EXPORT_MANIFEST_NAME
+    ensure(manifest_path.exists(), f"Batch export manifest not found: {manifest_path}")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    ensure(manifest["worker_count"] == 2, f"Unexpected worker count: {manifest['worker_count']}")
+    ensure(manifest["failed_count"] == 0, f"Batch export failures: {manifest['files']}")
+    files_by_collection = {entry["collection_name"]: entry for entry in manifest["files"]}
+    for collection in collections:
+        export_file = export_dir / f"SM_{collection.name}.fbx"
+        ensure(export_file.exists(), f"Expected batch FBX export not found: {export_file}")
+        entry = files_by_collection.get(collection.name)
+        ensure(entry is not None, f"Manifest is missing {collection.name}")
+        ensure(entry["bytes"] == export_file.stat().st_size, f"Manifest byte size mismatch for {collection.name}")
+        ensure(entry["seconds"] >= 0.0, f"Manifest timing missing for {collection.name}")
+    result.add_detail(
+        f"Batch export: {len(manifest['files'])} files, workers={manifest['worker_count']}, "
+        f"total={manifest['total_seconds']}s"
+    )
+
+
+def test_staticmeshexport_incremental_cache_fbx(test_context: TestContext, result: TestCaseResult):
+    """验证增量导出缓存：未变化时跳过，transform / Mesh 修改后重导，force 时全部覆盖。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    changed_collection = make_collection("IncrementalExportChanged")
+    changed_mesh = make_test_mesh("IncrementalExportChangedMesh", changed_collection)
+    stable_collection = make_collection("IncrementalExportStable")
+    make_test_mesh("IncrementalExportStableMesh", stable_collection, location=(4.0, 0.0, 0.0))
+
+    export_dir = ARTIFACT_DIR / "exports" / "incremental_cache_fbx"
+    if export_dir.exists():
+        shutil.rmtree(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    params = bpy.context.scene.hst_params
+    params.export_path = str(export_dir)
+    params.export_format = "FBX"
+    params.file_prefix = ""
+
+    cache_path = export_dir / test_context.addon.utils.export_cache_utils.EXPORT_CACHE_NAME
+
+    def run_export(**kwargs):
+        op_result = bpy.ops.hst.staticmeshexport(**kwargs)
+        ensure("FINISHED" in op_result, "Incremental FBX export operator did not finish")
+        ensure(cache_path.exists(), f"Export cache not written: {cache_path}")
+        last_run = json.loads(cache_path.read_text(encoding="utf-8"))["last_run"]
+        return sorted(last_run["written"]), sorted(last_run["skipped"])
+
+    both = sorted([changed_collection.name, stable_collection.name])
+    written, skipped = run_export()
+    ensure(written == both and skipped == [], f"First export should write all: {written}, {skipped}")
+
+    written, skipped = run_export()
+    ensure(written == [] and skipped == both, f"Unchanged export should skip all: {written}, {skipped}")
+
+    changed_mesh.location.x += 1.0
+    bpy.context.view_layer.update()
+    written, skipped = run_export()
+    ensure(
+        written == [changed_collection.name] and skipped == [stable_collection.name],
+        f"Only the moved collection should be rewritten: {written}, {skipped}",
+    )
+
+    changed_mesh.data.vertices[0].co.z += 0.25
+    written, skipped = run_export()
+    ensure(written == [changed_collection.name], f"Mesh edit was not detected: {written}, {skipped}")
+
+    written, skipped = run_export(force=True)
+    ensure(written == both and skipped == [], f"Force export should write all: {written}, {skipped}")
+    result.add_detail(f"Incremental export cache: {cache_path.name}")
+
+
+def test_export_cache_hash_tracks_referenced_ids(test_context: TestContext, result: TestCaseResult):
+    """验证 modifier 引用的 cutter 几何、变换与节点组内容变化时导出哈希随之变化。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    cache_utils = test_context.addon.utils.export_cache_utils
+    collection = make_collection("ExportHashReferenceCase")
+    target = make_test_mesh("ExportHashTarget", collection)
+    cutter_collection = make_collection("_ExportHashCutters")
+    cutter = make_test_mesh("ExportHashCutter", cutter_collection, location=(0.5, 0.5, 0.5))
+    boolean_modifier = target.modifiers.new("HashBoolean", "BOOLEAN")
+    boolean_modifier.object = cutter
+
+    node_group = bpy.data.node_groups.new("ExportHashNodes", "GeometryNodeTree")
+    node_group.interface.new_socket("Geometry", in_out="INPUT", socket_type="NodeSocketGeometry")
+    node_group.interface.new_socket("Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry")
+    group_input = node_group.nodes.new("NodeGroupInput")
+    group_output = node_group.nodes.new("NodeGroupOutput")
+    transform_node = node_group.nodes.new("GeometryNodeTransform")
+    node_group.links.new(group_input.outputs[0], transform_node.inputs[0])
+    node_group.links.new(transform_node.outputs[0], group_output.inputs[0])
+    nodes_modifier = target.modifiers.new("HashNodes", "NODES")
+    nodes_modifier.node_group = node_group
+    bpy.context.view_layer.update()
+
+    def export_hash():
+        return cache_utils.collection_export_hash(collection, "ExportHashReferenceCase.fbx", {})
+
+    base_hash = export_hash()
+    ensure(base_hash == export_hash(), "Export hash is not deterministic")
+
+    cutter.data.vertices[0].co.z += 0.25
+    cutter.data.update()
+    bpy.context.view_layer.update()
+    cutter_edit_hash = export_hash()
+    ensure(cutter_edit_hash != base_hash, "Editing the Boolean cutter mesh did not change the export hash")
+
+    cutter.location.x += 0.1
+    bpy.context.view_layer.update()
+    cutter_move_hash = export_hash()
+    ensure(cutter_move_hash != cutter_edit_hash, "Moving the Boolean cutter did not change the export hash")
+
+    transform_node.inputs["Scale"].default_value[2] = 2.0
+    node_hash = export_hash()
+    ensure(node_hash != cutter_move_hash, "Editing the node group input did not change the export hash")
+
+    node_group.links.remove(node_group.links[0])
+    link_hash = export_hash()
+    ensure(link_hash != node_hash, "Removing a node group link did not change the export hash")
+    result.add_detail(f"hashes: {base_hash[:8]} -> {link_hash[:8]}")
+
+
+def test_staticmeshexport_preserves_selection_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 FBX/GLB 导出经 context override 完成，不改变用户选择与 active object。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    collection = make_collection("SelectionFreeExportCase")
+    export_mesh = make_test_mesh("SelectionFreeExportMesh", collection)
+    bystander_collection = make_collection("_SelectionFreeBystander")
+    bystander = make_test_mesh("SelectionFreeBystander", bystander_collection, location=(5.0, 0.0, 0.0))
+    select_objects(bystander, [bystander])
+
+    params = bpy.context.scene.hst_params
+    params.file_prefix = ""
+    for export_format, extension in (("FBX", "fbx"), ("GLB", "glb")):
+        export_dir = ARTIFACT_DIR / "exports" / f"selection_free_{extension}"
+        if export_dir.exists():
+            shutil.rmtree(export_dir)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        params.export_path = str(export_dir)
+        params.export_format = export_format
+
+        op_result = bpy.ops.hst.staticmeshexport()
+        ensure("FINISHED" in op_result, f"{export_format} export operator did not finish")
+        export_file = export_dir / f"SM_{collection.name}.{extension}"
+        ensure(export_file.exists(), f"Expected {export_format} export not found: {export_file}")
+        ensure(
+            set(bpy.context.selected_objects) == {bystander},
+            f"{export_format} export changed selection: {[obj.name for obj in bpy.context.selected_objects]}",
+        )
+        ensure(not export_mesh.select_get(), f"{export_format} export left the exported mesh selected")
+        ensure(bpy.context.view_layer.objects.active == bystander, f"{export_format} export changed active object")
+    result.add_detail("FBX/GLB export kept user selection and active object")
+
+
 def test_rename_bones_smoke(test_context: TestContext, result: TestCaseResult):
     collection = make_collection("RenameBonesCase")
     armature = make_armature("RenameRig", collection)
@@ -1336,6 +1942,455 @@ def test_prepare_cad_mesh_sets_ue_centimeter_units(test_context: TestContext, re
     result.add_detail(f"Scene units: {scene_units.system}, {scene_units.length_unit}, scale={scene_units.scale_length}")
 
 
+def test_vectorized_sharp_edge_engine_matches_bmesh_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 NumPy 锐边判定与 BMesh 回退路径在 fixture 与 smooth cylinder 上完全一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    mesh_utils = test_context.addon.utils.mesh_utils
+    ensure(test_context.addon.utils.mesh_array_utils.HAS_NUMPY, "NumPy is not available in Blender")
+
+    load_fixture_blend("pipe-chamfer-test-tricky_b.blend")
+    fixture_source = bpy.data.objects.get("Extruded.002")
+    ensure(fixture_source is not None, "Extruded.002 not found in fixture")
+
+    collection = make_collection("VectorizedSharpEdgeCase")
+    bpy.ops.mesh.primitive_cylinder_add(vertices=24, radius=1.0, depth=2.0)
+    cylinder = ensure_object_in_collection(bpy.context.active_object, collection)
+    cylinder.name = "VectorizedSharpEdgeCylinder"
+    select_objects(cylinder, [cylinder])
+    bpy.ops.object.shade_smooth_by_angle(angle=math.radians(30.0))
+
+    for source in (fixture_source, cylinder):
+        array_split = mesh_utils.get_sharp_edge_indices_by_split_normal(source)
+        bmesh_split = mesh_utils._get_sharp_edge_indices_by_split_normal_bmesh(source)
+        ensure(
+            array_split == bmesh_split,
+            f"{source.name} split-normal mismatch: {sorted(array_split ^ bmesh_split)}",
+        )
+        array_angle = mesh_utils.get_sharp_edge_indices_by_angle(source, sharp_angle=0.08)
+        bmesh_angle = mesh_utils._get_sharp_edge_indices_by_angle_bmesh(source, sharp_angle=0.08)
+        ensure(
+            array_angle == bmesh_angle,
+            f"{source.name} face-angle mismatch: {sorted(array_angle ^ bmesh_angle)}",
+        )
+        result.add_detail(f"{source.name}: split={len(array_split)}, angle={len(array_angle)}")
+
+    rim_edges = mesh_utils.get_sharp_edge_indices_by_split_normal(cylinder)
+    ensure(len(rim_edges) == 48, f"Cylinder rims should be split edges: {len(rim_edges)}")
+    for edge in cylinder.data.edges:
+        edge.use_seam = False
+    mesh_utils.mark_sharp_edges_by_split_normal(cylinder)
+    marked = {edge.index for edge in cylinder.data.edges if edge.use_edge_sharp and edge.use_seam}
+    ensure(marked == rim_edges, f"Marked sharp/seam edges differ from classifier: {sorted(marked ^ rim_edges)}")
+
+
+def make_l_prism(name: str, collection):
+    """构造带一条凹边的 L 形棱柱，用于 curvature 凸/凹信号断言。
+
+    Args:
+        name: Object 与 Mesh 名称。
+        collection: 目标 Collection。
+    """
+    outline = [(0.0, 0.0), (2.0, 0.0), (2.0, 1.0), (1.0, 1.0), (1.0, 2.0), (0.0, 2.0)]
+    count = len(outline)
+    vertices = [(x, y, 0.0) for x, y in outline] + [(x, y, 1.0) for x, y in outline]
+    faces = [tuple(reversed(range(count))), tuple(range(count, count * 2))]
+    for index in range(count):
+        next_index = (index + 1) % count
+        faces.append((index, next_index, next_index + count, index + count))
+    mesh_data = bpy.data.meshes.new(name)
+    mesh_data.from_pydata(vertices, [], faces)
+    mesh_data.update()
+    obj = bpy.data.objects.new(name, mesh_data)
+    collection.objects.link(obj)
+    return obj
+
+
+def read_curvature_corner_values(test_context: TestContext, obj):
+    """读取全部 curvature corner attributes，返回 name -> list。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        obj: 已写入 curvature attributes 的 Mesh Object。
+    """
+    values = {}
+    for attribute_name in test_context.addon.utils.mesh_utils.CURVATURE_CORNER_ATTRIBUTES:
+        attribute = obj.data.attributes[attribute_name]
+        buffer = [0.0] * len(attribute.data)
+        attribute.data.foreach_get("value", buffer)
+        values[attribute_name] = buffer
+    return values
+
+
+def test_curvature_corner_array_path_matches_bmesh_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 curvature corner signal 的数组路径与 BMesh 路径一致，且拓扑缓存只在纯顶点移动后命中。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    mesh_class = test_context.addon.utils.mesh_utils.Mesh
+    test_context.addon.utils.mesh_array_utils.clear_corner_signal_cache()
+    collection = make_collection("CurvatureArrayCase")
+    source = make_l_prism("CurvatureArraySource", collection)
+
+    def assert_paths_match(label):
+        stats = mesh_class.mark_curvature_corner_attributes(source, use_adjacency_cache=True)
+        array_values = read_curvature_corner_values(test_context, source)
+        bmesh_stats = mesh_class._mark_curvature_corner_attributes_bmesh(source, dict(stats, edge_samples=0))
+        bmesh_values = read_curvature_corner_values(test_context, source)
+        for attribute_name, expected in bmesh_values.items():
+            max_error = max(abs(a - b) for a, b in zip(array_values[attribute_name], expected))
+            ensure(max_error < 1e-5, f"{label}: {attribute_name} differs from BMesh path by {max_error}")
+        ensure(
+            stats["edge_samples"] == bmesh_stats["edge_samples"],
+            f"{label}: edge sample count {stats['edge_samples']} != {bmesh_stats['edge_samples']}",
+        )
+        return stats
+
+    first_stats = assert_paths_match("initial")
+    ensure(not first_stats["adjacency_cache_hit"], "First run unexpectedly hit the adjacency cache")
+    ensure(first_stats["concave_corners"] > 0, "L prism inner edge produced no concave corners")
+
+    source.data.vertices[0].co.z -= 0.25
+    source.data.update()
+    moved_stats = assert_paths_match("vertex moved")
+    ensure(moved_stats["adjacency_cache_hit"], "Pure vertex move did not reuse the cached adjacency")
+    result.add_detail(
+        f"corners={moved_stats['corners']}, samples={moved_stats['edge_samples']}, "
+        f"concave={moved_stats['concave_corners']}"
+    )
+
+
+def test_texel_density_numpy_matches_bmesh_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 Texel Density 的 foreach_get/reduceat 路径与 BMesh 逐面路径一致，并检查批量报告的共享直方图。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    uv_utils = test_context.addon.utils.uv_utils
+    ensure(uv_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    collection = make_collection("TexelDensityCase")
+    vertices = [
+        (0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (2.0, 1.0, 0.0), (0.0, 1.0, 0.0),
+        (3.0, 0.0, 0.0), (4.0, 0.5, 0.0), (3.5, 1.5, 0.0), (2.5, 1.5, 0.0),
+        (5.0, 0.0, 0.0), (6.0, 0.0, 0.0), (5.0, 1.0, 0.0),
+        (7.0, 0.0, 0.0), (8.0, 0.0, 0.0), (9.0, 0.0, 0.0),
+    ]
+    faces = [(0, 1, 2, 3), (4, 5, 6, 7, 1), (8, 9, 10), (11, 12, 13)]
+    objects = []
+    for index, uv_scale in enumerate((1.0, 0.25)):
+        mesh_data = bpy.data.meshes.new(f"TexelDensityMesh{index}")
+        mesh_data.from_pydata(vertices, [], faces)
+        mesh_data.update()
+        uv_layer = mesh_data.uv_layers.new(name="UV0_Base")
+        for loop in mesh_data.loops:
+            co = mesh_data.vertices[loop.vertex_index].co
+            uv_layer.data[loop.index].uv = (co.x * 0.1 * uv_scale, co.y * (1.0 + 0.2 * co.x) * 0.2 * uv_scale)
+        obj = bpy.data.objects.new(f"TexelDensity{index}", mesh_data)
+        collection.objects.link(obj)
+        objects.append(obj)
+
+    for obj in objects:
+        numpy_td, numpy_areas = uv_utils._texel_density_samples_numpy(obj, 1024, 512)
+        bmesh_td, bmesh_areas = uv_utils._texel_density_samples_bmesh(obj, 1024, 512)
+        # 共线三角形 3D 面积为 0，两条路径都应跳过。
+        ensure(len(numpy_td) == len(bmesh_td) == 3, f"Valid face count mismatch: {len(numpy_td)} != {len(bmesh_td)}")
+        max_error = max(abs(a - b) / b for a, b in zip(numpy_td.tolist(), bmesh_td))
+        ensure(max_error < 1e-5, f"{obj.name}: NumPy TD differs from BMesh path by {max_error}")
+        expected_mean = sum(bmesh_td) / len(bmesh_td)
+        mean = uv_utils.get_texel_density(obj, 1024, 512)
+        ensure(abs(mean - expected_mean) / expected_mean < 1e-5, f"{obj.name}: mean {mean} != {expected_mean}")
+        expected_weighted = sum(td * area for td, area in zip(bmesh_td, bmesh_areas)) / sum(bmesh_areas)
+        weighted = uv_utils.get_texel_density(obj, 1024, 512, area_weighted=True)
+        ensure(
+            abs(weighted - expected_weighted) / expected_weighted < 1e-5,
+            f"{obj.name}: weighted mean {weighted} != {expected_weighted}",
+        )
+
+    reports = uv_utils.batch_texel_density(objects, 1024, 512, percentiles=(0, 50, 100), bins=8)
+    ensure(set(reports) == {obj.name for obj in objects}, f"Unexpected batch keys: {sorted(reports)}")
+    edges = reports[objects[0].name]["histogram"]["edges"]
+    for obj in objects:
+        report = reports[obj.name]
+        ensure(report["histogram"]["edges"] == edges, "Batch histograms do not share bin edges")
+        ensure(sum(report["histogram"]["face_counts"]) == report["faces"], "Histogram lost faces")
+        ensure(
+            report["percentiles"]["p0"] == report["min"] and report["percentiles"]["p100"] == report["max"],
+            f"Percentile bounds mismatch: {report['percentiles']}",
+        )
+    ratio = reports[objects[0].name]["mean"] / reports[objects[1].name]["mean"]
+    ensure(abs(ratio - 4.0) < 1e-4, f"UV scale 0.25 should give 1/4 texel density, ratio {ratio}")
+    result.add_detail(
+        f"TD mean={reports[objects[0].name]['mean']:.2f}, weighted={reports[objects[0].name]['weighted_mean']:.2f}"
+    )
+
+
+def polygon_uv_areas(mesh_data, uv_layer):
+    """计算对象各面在 UV 层上的面积（鞋带公式），供 UV 岛缩放断言使用。
+
+    Args:
+        mesh_data: 目标 Mesh 数据。
+        uv_layer: 要测量的 UV 层。
+
+    Returns:
+        按面索引排列的 UV 面积列表。
+    """
+    areas = []
+    for polygon in mesh_data.polygons:
+        points = [uv_layer.data[loop_index].uv.copy() for loop_index in polygon.loop_indices]
+        twice_area = 0.0
+        for index, point in enumerate(points):
+            following = points[(index + 1) % len(points)]
+            twice_area += point.x * following.y - following.x * point.y
+        areas.append(abs(twice_area) / 2.0)
+    return areas
+
+
+def test_uv_average_islands_scale_arrays_regression(test_context: TestContext, result: TestCaseResult):
+    """验证数组化 UV 岛平均缩放：各岛 UV/3D 面积比一致，且同一岛内共享 UV 的顶点不被拆开。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    uv_utils = test_context.addon.utils.uv_utils
+    ensure(uv_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    collection = make_collection("UVAverageScaleCase")
+    vertices = [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0), (2.0, 1.0, 0.0),
+        (3.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 1.0, 0.0), (3.0, 1.0, 0.0),
+    ]
+    # 前两个面共享边 1-2 且 UV 连续，构成一个岛；第三个面独立成岛且 UV 密度不同。
+    faces = [(0, 1, 2, 3), (1, 4, 5, 2), (6, 7, 8, 9)]
+    mesh_data = bpy.data.meshes.new("UVAverageScaleMesh")
+    mesh_data.from_pydata(vertices, [], faces)
+    mesh_data.update()
+    uv_layer = mesh_data.uv_layers.new(name="UV0_Base")
+    for loop in mesh_data.loops:
+        co = mesh_data.vertices[loop.vertex_index].co
+        if loop.vertex_index < 6:
+            uv_layer.data[loop.index].uv = (co.x * 0.1, co.y * 0.1)
+        else:
+            uv_layer.data[loop.index].uv = ((co.x - 3.0) * 0.2 + 0.5, co.y * 0.2 + 0.5)
+    obj = bpy.data.objects.new("UVAverageScale", mesh_data)
+    collection.objects.link(obj)
+
+    uvs = uv_utils._read_uv_array(uv_layer)
+    _, island_count = uv_utils.uv_island_labels(mesh_data, uvs)
+    ensure(island_count == 2, f"Expected 2 UV islands, got {island_count}")
+    shared_edge = next(edge for edge in mesh_data.edges if set(edge.vertices) == {1, 2})
+    shared_edge.use_seam = True
+    _, seam_island_count = uv_utils.uv_island_labels(mesh_data, uvs)
+    ensure(seam_island_count == 3, f"Seam should split the first island, got {seam_island_count}")
+    shared_edge.use_seam = False
+
+    total_before = sum(polygon_uv_areas(mesh_data, uv_layer))
+    stats = uv_utils.average_islands_scale(obj, "UV0_Base")
+    ensure(stats == {"islands": 2, "scaled_islands": 2}, f"Unexpected stats: {stats}")
+    areas = polygon_uv_areas(mesh_data, uv_layer)
+    ensure(abs(sum(areas) - total_before) < 1e-6, f"Total UV area changed: {total_before} -> {sum(areas)}")
+    first_ratio = 2.0 / (areas[0] + areas[1])
+    second_ratio = 1.0 / areas[2]
+    ensure(
+        abs(first_ratio - second_ratio) / second_ratio < 1e-4,
+        f"Island 3D/UV ratios not equalized: {first_ratio} vs {second_ratio}",
+    )
+    first_uv = uv_layer.data[mesh_data.polygons[0].loop_indices[1]].uv
+    second_uv = uv_layer.data[mesh_data.polygons[1].loop_indices[0]].uv
+    ensure((first_uv - second_uv).length < 1e-6, "Connected island was torn apart by scaling")
+    result.add_detail(f"islands=2, ratio={second_ratio:.2f}, total_uv_area={sum(areas):.4f}")
+
+
+def make_trimsheet_alpha_image(name: str, width: int = 64, height: int = 48):
+    """构造带若干 8 连通 alpha 块（含对角相接、阈值边界值）的测试图像。
+
+    Args:
+        name: 图像名称。
+        width: 图像宽度（像素）。
+        height: 图像高度（像素）。
+
+    Returns:
+        float buffer 的 bpy.types.Image。
+    """
+    image = bpy.data.images.new(name, width=width, height=height, alpha=True, float_buffer=True)
+    alpha = [0.0] * (width * height)
+    blocks = ((2, 3, 10, 6), (20, 4, 5, 20), (30, 30, 12, 8), (50, 2, 6, 6))
+    for start_x, start_y, block_width, block_height in blocks:
+        for y in range(start_y, start_y + block_height):
+            for x in range(start_x, start_x + block_width):
+                alpha[y * width + x] = 1.0
+    for step in range(6):
+        alpha[(40 + step) * width + 2 + step] = 0.75
+    alpha[10 * width + 40] = 0.1
+    pixels = []
+    for value in alpha:
+        pixels.extend((1.0, 1.0, 1.0, value))
+    image.pixels.foreach_set(pixels)
+    return image
+
+
+def test_trimsheet_alpha_regions_numpy_matches_python_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 NumPy alpha 连通区域与纯 Python row-run 路径在多个阈值下结果一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    image_utils = test_context.addon.utils.image_utils
+    ensure(image_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    image = make_trimsheet_alpha_image("TrimsheetAlphaRegions")
+    width, height, alpha_values, _, _ = image_utils.read_image_alpha(image)
+
+    for alpha_threshold in (0.0, 0.1, 0.5):
+        python_alpha = [float(value) for value in alpha_values]
+        row_runs, python_found = image_utils._build_row_runs(python_alpha, width, height, alpha_threshold)
+        python_regions = image_utils._extract_region_bounds_from_row_runs(row_runs)
+        numpy_regions, numpy_found = image_utils._extract_region_bounds_numpy(
+            alpha_values, width, height, alpha_threshold
+        )
+        ensure(python_found == numpy_found, f"found_solid mismatch at threshold {alpha_threshold}")
+        ensure(
+            python_regions == numpy_regions,
+            f"Region mismatch at threshold {alpha_threshold}: {python_regions} != {numpy_regions}",
+        )
+
+    analysis = image_utils.find_alpha_regions(image, alpha_threshold=0.1, min_region_pixels=1, padding_pixels=0)
+    # float32(0.1) 略大于 double 0.1，单像素也算实体：4 个块 + 对角链 + 阈值边界像素。
+    ensure(len(analysis["regions"]) == 6, f"Unexpected region count: {analysis['regions']}")
+    result.add_detail(f"Trimsheet alpha regions: {len(analysis['regions'])}")
+
+
+def test_trimsheet_alpha_disk_cache_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 trimsheet alpha 磁盘缓存：生成图像不落盘，文件图像写入 .alpha.npy / .regions.json 且命中结果一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    image_utils = test_context.addon.utils.image_utils
+    ensure(image_utils.HAS_NUMPY, "NumPy is not available in Blender")
+    cache_dir = ARTIFACT_DIR / "alpha_cache"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    previous_cache_dir = os.environ.get("HST_ALPHA_CACHE_DIR")
+    os.environ["HST_ALPHA_CACHE_DIR"] = str(cache_dir)
+    try:
+        generated = make_trimsheet_alpha_image("TrimsheetAlphaDiskCacheGenerated")
+        image_utils.clear_alpha_caches()
+        image_utils.find_alpha_regions(generated, alpha_threshold=0.1, min_region_pixels=1, padding_pixels=0)
+        ensure(not cache_dir.exists() or not any(cache_dir.iterdir()), "Generated image must not be cached on disk")
+
+        image_path = ARTIFACT_DIR / "trimsheet_alpha_disk_cache.png"
+        generated.filepath_raw = str(image_path)
+        generated.file_format = "PNG"
+        generated.save()
+        image = bpy.data.images.load(str(image_path), check_existing=False)
+
+        image_utils.clear_alpha_caches()
+        first = image_utils.find_alpha_regions(image, alpha_threshold=0.1, min_region_pixels=1, padding_pixels=0)
+        cache_files = sorted(path.name for path in cache_dir.iterdir())
+        ensure(
+            any(name.endswith(".alpha.npy") for name in cache_files)
+            and any(name.endswith(".regions.json") for name in cache_files),
+            f"Disk cache files missing: {cache_files}",
+        )
+
+        image_utils.clear_alpha_caches()
+        second = image_utils.find_alpha_regions(image, alpha_threshold=0.1, min_region_pixels=1, padding_pixels=0)
+        ensure(first["regions"] == second["regions"], "Disk cached regions differ from decoded regions")
+        ensure(
+            first["transparent_pixel_count"] == second["transparent_pixel_count"],
+            "Disk cached transparent pixel count differs",
+        )
+
+        image_utils.clear_alpha_caches()
+        reloaded_alpha = image_utils.find_alpha_regions(
+            image, alpha_threshold=0.5, min_region_pixels=1, padding_pixels=0
+        )
+        ensure(reloaded_alpha["regions"], "Alpha plane loaded from disk produced no regions")
+
+        image_utils.clear_alpha_caches(include_disk=True)
+        ensure(not any(cache_dir.iterdir()), "clear_alpha_caches(include_disk=True) left files behind")
+    finally:
+        if previous_cache_dir is None:
+            os.environ.pop("HST_ALPHA_CACHE_DIR", None)
+        else:
+            os.environ["HST_ALPHA_CACHE_DIR"] = previous_cache_dir
+        image_utils.clear_alpha_caches()
+    result.add_detail(f"Trimsheet alpha disk cache regions: {len(first['regions'])}")
+
+
+class CountingStat:
+    """统计 os.stat 调用次数的包装，用于断言预设库全部命中时不访问磁盘。"""
+    def __init__(self, module):
+        self.module = module
+        self.calls = 0
+
+    def stat(self, path):
+        self.calls += 1
+        return self.module.stat(path)
+
+
+def test_preset_library_batch_loader_regression(test_context: TestContext, result: TestCaseResult):
+    """验证预设库批量加载：一次 libraries.load 导入多个 datablock，命中索引时不再访问磁盘。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    const = test_context.const
+    import_utils = test_context.addon.utils.import_utils
+    requests = {
+        "node_groups": [const.VERTEXCOLORBLUR_NODE],
+        "materials": [const.SWATCH_MATERIAL],
+        "worlds": [const.LOOKDEV_HDR],
+        "objects": [const.AXIS_ARROW],
+    }
+    for data_attr, names in requests.items():
+        data_collection = getattr(bpy.data, data_attr)
+        for name in names:
+            if data_collection.get(name) is not None:
+                data_collection.remove(data_collection[name])
+    import_utils.clear_preset_library_cache()
+
+    loaded = import_utils.load_library_datablocks(const.PRESET_FILE_PATH, requests)
+    for data_attr, names in requests.items():
+        for name in names:
+            datablock = loaded[data_attr][name]
+            ensure(datablock is not None, f"{data_attr}/{name} was not appended")
+            ensure(datablock.name == name and datablock.library is None, f"{data_attr}/{name} not appended locally")
+    arrow = loaded["objects"][const.AXIS_ARROW]
+    ensure(len(arrow.users_collection) > 0, "Appended object was not linked to a collection")
+    ensure(arrow.parent is None or len(arrow.parent.users_collection) > 0, "Appended parent was not linked")
+
+    counting_stat = CountingStat(import_utils.os)
+    import_utils.os = counting_stat
+    try:
+        again = import_utils.load_library_datablocks(const.PRESET_FILE_PATH, requests)
+        ensure(
+            import_utils.import_material(const.PRESET_FILE_PATH, const.SWATCH_MATERIAL)
+            == loaded["materials"][const.SWATCH_MATERIAL],
+            "import_material did not reuse the indexed material",
+        )
+        ensure(counting_stat.calls == 0, f"Cached preset lookup touched disk {counting_stat.calls} times")
+        missing = import_utils.load_library_datablock(const.PRESET_FILE_PATH, "node_groups", "HST_NoSuchPreset")
+        ensure(missing is None, "Unknown preset name returned a datablock")
+        ensure(counting_stat.calls == 1, "Unknown preset should be rejected from memoized library contents")
+    finally:
+        import_utils.os = counting_stat.module
+    ensure(again == loaded, "Repeated batch load returned different datablocks")
+
+    bpy.data.materials.remove(loaded["materials"][const.SWATCH_MATERIAL])
+    reloaded = import_utils.import_material(const.PRESET_FILE_PATH, const.SWATCH_MATERIAL)
+    ensure(reloaded is not None and reloaded.name == const.SWATCH_MATERIAL, "Removed preset was not appended again")
+    result.add_detail(f"loaded={sum(len(names) for names in requests.values())} datablocks in one library open")
+
+
 def test_collection_get_selected_outliner_precedence(test_context: TestContext, result: TestCaseResult):
     const = test_context.const
     outliner_collection = make_collection("OutlinerPropMarkerCase")
@@ -2308,6 +3363,245 @@ def test_experimental_pipe_chamfer_union_difference_smoke(test_context: TestCont
     result.add_detail("BOOLEAN_CUT kept one editable Exact Collection Boolean Modifier")
 
 
+def test_experimental_pipe_chamfer_stage_cache_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 Stage Cache 在 redo 调参时只重算变化参数的下游阶段，且命中结果与重算一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    collection = make_collection("PipeChamferStageCacheCase")
+    source = make_test_mesh("PipeChamferStageCacheSource", collection)
+    mark_edge_indices_sharp(source, cube_top_loop_edge_indices(source))
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+    utils.clear_pipe_chamfer_stage_cache()
+
+    def run(pipe_resolution):
+        stats = utils.build_pipe_chamfer(
+            source_object=source,
+            radius=0.08,
+            pipe_resolution=pipe_resolution,
+            chain_turn_threshold_degrees=35.0,
+            chain_turn_spike_ratio=3.0,
+            junction_margin=1.5,
+            debug_stage="OPEN_BOUNDARY",
+            keep_debug_objects=True,
+        )
+        output = bpy.data.objects.get(stats["output_object_name"])
+        ensure(output is not None, "OPEN_BOUNDARY output is missing")
+        return stats, mesh_topology_hash(output)
+
+    first_stats, first_hash = run(8)
+    ensure(
+        first_stats["stage_cache"] == {"feature_graph": "MISS", "pipes": "MISS", "boolean": "MISS"},
+        f"Cold run unexpectedly hit the Stage Cache: {first_stats['stage_cache']}",
+    )
+    repeat_stats, repeat_hash = run(8)
+    ensure(
+        repeat_stats["stage_cache"] == {"feature_graph": "HIT", "pipes": "HIT", "boolean": "HIT"},
+        f"Unchanged redo did not reuse every stage: {repeat_stats['stage_cache']}",
+    )
+    ensure(repeat_hash == first_hash, "Stage Cache hit produced a different OPEN_BOUNDARY Mesh")
+    for key in ("pipe_group_count", "pipe_overlap_pairs", "cutter_face_count", "boundary_edge_count_after"):
+        ensure(repeat_stats[key] == first_stats[key], f"Stage Cache hit changed {key}")
+
+    resolution_stats, _ = run(10)
+    ensure(
+        resolution_stats["stage_cache"] == {"feature_graph": "HIT", "pipes": "MISS", "boolean": "MISS"},
+        f"pipe_resolution change did not invalidate only downstream stages: {resolution_stats['stage_cache']}",
+    )
+    utils.clear_pipe_chamfer_stage_cache()
+    result.add_detail(
+        f"Stage Cache reused FeatureGraph/Pipes/Boolean; cold total={first_stats['timings']['total']:.3f}s, "
+        f"cached total={repeat_stats['timings']['total']:.3f}s"
+    )
+
+
+def test_experimental_pipe_chamfer_profile_spans_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 Pipe Chamfer 输出分层 profile span、BMesh 峰值与可选 cProfile 文件，且嵌套 session 由外层汇总。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    import pstats
+
+    collection = make_collection("PipeChamferProfileCase")
+    source = make_test_mesh("PipeChamferProfileSource", collection)
+    mark_edge_indices_sharp(source, cube_top_loop_edge_indices(source))
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+    profiling_utils = test_context.addon.utils.profiling_utils
+    utils.clear_pipe_chamfer_stage_cache()
+
+    def run():
+        return utils.build_pipe_chamfer(
+            source_object=source,
+            radius=0.08,
+            pipe_resolution=8,
+            chain_turn_threshold_degrees=35.0,
+            chain_turn_spike_ratio=3.0,
+            junction_margin=1.5,
+            debug_stage="OPEN_BOUNDARY",
+            keep_debug_objects=False,
+        )
+
+    profile_dir = Path(tempfile.mkdtemp(prefix="hst_pipe_chamfer_profile_"))
+    previous_profile_dir = os.environ.get(profiling_utils.PROFILE_DIR_ENV)
+    os.environ[profiling_utils.PROFILE_DIR_ENV] = str(profile_dir)
+    try:
+        stats = run()
+    finally:
+        if previous_profile_dir is None:
+            os.environ.pop(profiling_utils.PROFILE_DIR_ENV, None)
+        else:
+            os.environ[profiling_utils.PROFILE_DIR_ENV] = previous_profile_dir
+    profile = stats.get("profile")
+    ensure(profile is not None, "build_pipe_chamfer did not attach a profile summary")
+    spans = profile["spans"]
+    for path in (
+        "pipe_chamfer",
+        "pipe_chamfer/feature_graph",
+        "pipe_chamfer/pipes",
+        "pipe_chamfer/cutter_set",
+        "pipe_chamfer/boolean_apply",
+        "pipe_chamfer/open_boundary",
+        "pipe_chamfer/boundary_rails",
+        "pipe_chamfer/rail_pairs",
+    ):
+        ensure(path in spans and spans[path]["calls"] >= 1, f"Profile span {path} is missing: {sorted(spans)}")
+    ensure(
+        spans["pipe_chamfer"]["seconds"] >= spans["pipe_chamfer/open_boundary"]["seconds"],
+        "Child span took longer than the root span",
+    )
+    ensure(
+        spans["pipe_chamfer/open_boundary"].get("peak_bmesh", {}).get("faces", 0) > 0,
+        f"open_boundary span did not sample BMesh peaks: {spans['pipe_chamfer/open_boundary']}",
+    )
+    ensure(
+        profile["counters"].get("pipe_chamfer/boundary_edges", 0) == stats["boundary_edge_count_after"],
+        f"Boundary edge counter disagrees with stats: {profile['counters']}",
+    )
+    profile_path = profile["profile_path"]
+    ensure(profile_path and Path(profile_path).exists(), f"cProfile file was not written: {profile}")
+    function_count = len(pstats.Stats(profile_path).stats)
+    ensure(function_count > 0, "cProfile file contains no functions")
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+    with profiling_utils.profiling_session("outer") as outer_profiler:
+        nested_stats = run()
+    ensure("profile" not in nested_stats, "Nested build_pipe_chamfer attached its own profile")
+    ensure(
+        "outer/pipe_chamfer/open_boundary" in outer_profiler.summary()["spans"],
+        "Nested build_pipe_chamfer spans were not recorded under the outer session",
+    )
+    ensure(profiling_utils.active_profiler() is None, "Profiling session leaked an active profiler")
+    utils.clear_pipe_chamfer_stage_cache()
+    result.add_detail(
+        f"Profile recorded {len(spans)} spans and {function_count} cProfile functions"
+    )
+
+
+def test_experimental_pipe_chamfer_cutter_broadphase_regression(test_context: TestContext, result: TestCaseResult):
+    """验证 sweep-and-prune broadphase 与逐对 bounds 测试一致，并写入 Cutter Set 分阶段耗时。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+    pipe_bounds = []
+    for index in range(48):
+        minimum = Vector(((index * 7) % 11 * 0.5, (index * 5) % 7 * 0.5, (index * 3) % 5 * 0.5))
+        extent = Vector((0.5 + index % 3 * 0.25, 0.5, 0.25 + index % 2 * 0.5))
+        pipe_bounds.append((minimum, minimum + extent))
+    brute_pairs = [
+        (index_a, index_b)
+        for index_a in range(len(pipe_bounds))
+        for index_b in range(index_a + 1, len(pipe_bounds))
+        if utils._bounds_overlap(pipe_bounds[index_a], pipe_bounds[index_b])
+    ]
+    broadphase_pairs = utils._broadphase_overlap_pairs(pipe_bounds)
+    ensure(broadphase_pairs == brute_pairs, "Broadphase candidate pairs differ from pairwise bounds test")
+
+    collection = make_collection("PipeChamferBroadphaseCase")
+    source = make_test_mesh("PipeChamferBroadphaseSource", collection)
+    mark_edge_indices_sharp(source, cube_top_loop_edge_indices(source))
+    utils.clear_pipe_chamfer_stage_cache()
+    stats = utils.build_pipe_chamfer(
+        source_object=source,
+        radius=0.08,
+        pipe_resolution=8,
+        chain_turn_threshold_degrees=35.0,
+        chain_turn_spike_ratio=3.0,
+        junction_margin=1.5,
+        debug_stage="CUTTER_UNION",
+        keep_debug_objects=True,
+    )
+    for key in (
+        "cutter_set.bounds",
+        "cutter_set.bvh_build",
+        "cutter_set.broadphase",
+        "cutter_set.narrowphase",
+        "cutter_set.join",
+    ):
+        ensure(key in stats["timings"], f"Missing Cutter Set timing: {key}")
+    ensure(stats["timings"]["cutter_pack"] >= 0.0, f"Negative cutter_pack timing: {stats['timings']}")
+    result.add_detail(
+        f"Broadphase pairs={len(broadphase_pairs)}; "
+        f"candidates={stats['timings']['cutter_set.candidate_pair_count']}, "
+        f"overlaps={len(stats['pipe_overlap_pairs'])}"
+    )
+
+
+def test_experimental_pipe_chamfer_merged_pipe_bvh_owner_regression(test_context: TestContext, result: TestCaseResult):
+    """验证合并 Pipe BVH 的 owner 查询与逐 Pipe find_nearest 完全一致。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    collection = make_collection("PipeChamferMergedBVHCase")
+    source = make_test_mesh("PipeChamferMergedBVHSource", collection)
+    top_edges = cube_top_loop_edge_indices(source)
+    branch_edge = next(
+        edge.index
+        for edge in source.data.edges
+        if edge.index not in top_edges and any(source.data.vertices[index].co.z > 0.0 for index in edge.vertices)
+    )
+    mark_edge_indices_sharp(source, top_edges + [branch_edge])
+    utils = test_context.addon.utils.experimental_pipe_chamfer_utils
+    utils.clear_pipe_chamfer_stage_cache()
+    stats = utils.build_pipe_chamfer(
+        source_object=source,
+        radius=0.08,
+        pipe_resolution=8,
+        chain_turn_threshold_degrees=35.0,
+        chain_turn_spike_ratio=3.0,
+        junction_margin=1.5,
+        debug_stage="PIPES",
+        keep_debug_objects=True,
+    )
+    pipes = [bpy.data.objects[name] for name in stats["debug_object_names"]]
+    ensure(len(pipes) >= 2, f"Expected several Pipes, got {len(pipes)}")
+    trees, _, _ = utils._pipe_overlap_index(pipes)
+    ensure(trees.merged_tree is not None, "Merged Pipe BVH was not built")
+    per_pipe_trees = list(trees)
+    sample_points = [
+        vertex.co + Vector((0.013, -0.021, 0.017)) * scale
+        for pipe in pipes
+        for vertex in pipe.data.vertices[::3]
+        for scale in (0.0, 1.0, 4.0)
+    ]
+    compared = 0
+    for point in sample_points:
+        for max_distance in (0.0096, 0.028, 0.1):
+            merged = utils._pipe_distances_within(trees, point, max_distance)
+            expected = utils._pipe_distances_within(per_pipe_trees, point, max_distance)
+            ensure(merged == expected, f"Merged BVH owners differ at {tuple(point)}: {merged} != {expected}")
+            compared += 1
+    result.add_detail(f"Merged Pipe BVH matched per-Pipe queries at {compared} samples")
+
+
 def test_experimental_pipe_chamfer_open_boundary_preserves_original_faces(test_context: TestContext, result: TestCaseResult):
     """验证 Apply 后只删除 Boolean 新生成的槽面，不删除原模型表面。
 
@@ -2391,7 +3685,7 @@ def test_experimental_pipe_chamfer_bridge_then_fill_smoke(test_context: TestCont
     )
     ensure(len(bridge.get("faces", [])) == 2, "Bridge Edge Loops did not create the strip")
     boundary_edges = {edge for edge in bm.edges if len(edge.link_faces) == 1}
-    boundary_loops = test_context.addon.utils.experimental_pipe_chamfer_utils._ordered_edge_chains(
+    boundary_loops = test_context.addon.utils.edge_chain_utils.ordered_edge_chains(
         boundary_edges
     )
     ensure(len(boundary_loops) == 1 and boundary_loops[0]["is_cyclic"], "Bridge did not leave one Fill hole")
@@ -2410,6 +3704,58 @@ def test_experimental_pipe_chamfer_bridge_then_fill_smoke(test_context: TestCont
     result.add_detail("Bridge Edge Loops + Fill produced a watertight strip")
 
 
+def test_edge_chain_utils_ordering_contract_regression(test_context: TestContext, result: TestCaseResult):
+    """验证共享 edge chain 提取的组件顺序、起点与行走方向契约。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    chain_utils = test_context.addon.utils.edge_chain_utils
+    bm = bmesh.new()
+    ring_count = 2000
+    # Y 分叉先创建，占据最小 edge index；它只出现在组件里，不产生 chain。
+    hub = bm.verts.new((0.0, 0.0, 5.0))
+    for direction in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (-1.0, 0.0, 0.0)):
+        bm.edges.new((hub, bm.verts.new(Vector((0.0, 0.0, 5.0)) + Vector(direction))))
+    path = [bm.verts.new((index * 0.1, 0.0, 3.0)) for index in range(6)]
+    for index in reversed(range(5)):
+        bm.edges.new((path[index], path[index + 1]))
+    ring = [
+        bm.verts.new((math.cos(2.0 * math.pi * index / ring_count), math.sin(2.0 * math.pi * index / ring_count), 0.0))
+        for index in range(ring_count)
+    ]
+    for index in range(ring_count):
+        bm.edges.new((ring[index], ring[(index + 1) % ring_count]))
+    bm.verts.index_update()
+    bm.edges.index_update()
+    edges = set(bm.edges)
+
+    components = chain_utils.edge_components(edges)
+    ensure(
+        [len(component["edges"]) for component in components] == [3, 5, ring_count],
+        f"Components are not ordered by minimum edge index: {[len(component['edges']) for component in components]}",
+    )
+    ensure(max(components[0]["vertex_degrees"]) == 3, "Y component lost its branch vertex degree")
+
+    chains = chain_utils.ordered_edge_chains(edges)
+    ensure(len(chains) == 2, f"Expected open path and ring chains, got {len(chains)}")
+    open_chain, ring_chain = chains
+    ensure(not open_chain["is_cyclic"] and open_chain["vertices"] == path, "Open chain did not start at its lowest-index endpoint")
+    ensure(ring_chain["is_cyclic"] and ring_chain["vertices"] == ring, "Cyclic chain did not start at its lowest-index Vertex")
+    ensure(ring_chain["edges"][0].index < ring_chain["edges"][-1].index, "Cyclic chain did not leave through its lowest-index Edge")
+    for chain in chains:
+        ensure(
+            all(
+                set(edge.verts) & set(next_edge.verts)
+                for edge, next_edge in zip(chain["edges"], chain["edges"][1:])
+            ),
+            "Ordered chain contains a non-adjacent Edge step",
+        )
+    bm.free()
+    result.add_detail(f"Edge chain ordering contract held on a {ring_count}-edge ring")
+
+
 def test_experimental_pipe_chamfer_postprocess_smoke(test_context: TestContext, result: TestCaseResult):
     """验证 PATCHED 后处理会 dissolve 共面三角、标记 chamfer Faces，并传递原 Mesh 法线。
 
@@ -3409,6 +4755,46 @@ def test_gn_finalize_rejects_stale_preview(test_context: TestContext, result: Te
     )
 
 
+def test_mesh_fingerprint_service_memo_and_invalidation(test_context: TestContext, result: TestCaseResult):
+    """验证共享 Mesh 指纹服务：未变化时复用记忆，depsgraph 更新后分别刷新位置/拓扑/Sharp 摘要。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    fingerprint_utils = test_context.addon.utils.mesh_fingerprint_utils
+    collection = make_collection("MeshFingerprintService")
+    source = make_test_mesh("MeshFingerprintSource", collection)
+    mark_all_edges_sharp(source)
+    bpy.context.view_layer.update()
+    mesh = source.data
+
+    first = fingerprint_utils.mesh_fingerprint(mesh)
+    ensure(fingerprint_utils.mesh_fingerprint(mesh) is first, "Unchanged Mesh did not reuse memoized fingerprint")
+    ensure(first == fingerprint_utils.compute_mesh_fingerprint(mesh), "Memoized fingerprint differs from fresh hash")
+    ensure(first.sharp_edge_count == 12, f"Expected 12 Sharp Edges, got {first.sharp_edge_count}")
+
+    mesh.vertices[0].co.x += 0.01
+    mesh.update()
+    bpy.context.view_layer.update()
+    moved = fingerprint_utils.mesh_fingerprint(mesh)
+    ensure(moved.digest != first.digest, "Vertex move did not invalidate memoized fingerprint")
+    ensure(moved.topology == first.topology, "Pure vertex move changed topology digest")
+    ensure(moved.positions != first.positions, "Vertex move kept position digest")
+
+    mesh.attributes["sharp_edge"].data[0].value = False
+    mesh.update()
+    bpy.context.view_layer.update()
+    unsharp = fingerprint_utils.mesh_fingerprint(mesh)
+    ensure(unsharp.sharp_edges != moved.sharp_edges, "Sharp edit kept Sharp digest")
+    ensure(unsharp.sharp_edge_count == 11, f"Expected 11 Sharp Edges, got {unsharp.sharp_edge_count}")
+    ensure(
+        test_context.addon.utils.feature_chamfer_gn_utils.source_fingerprint(source) == unsharp.digest,
+        "source_fingerprint does not use the shared fingerprint service",
+    )
+    result.add_detail(f"topology={unsharp.topology[:12]}, positions={unsharp.positions[:12]}")
+
+
 # 验证用户直接修改 Modifier socket 后 Preview 变 stale，必须重新 Preview。
 # test_context/result: 测试上下文与结果记录器。
 def test_gn_preview_modifier_parameter_change_marks_stale(test_context: TestContext, result: TestCaseResult):
@@ -3997,6 +5383,78 @@ def test_gn_preview_finalize_undo_steps(test_context: TestContext, result: TestC
     result.add_detail("Preview and Finalize each produced a reversible Undo step")
 
 
+def test_feature_chamfer_preview_state_tracker_events(test_context: TestContext, result: TestCaseResult):
+    """验证事件驱动 Preview 状态缓存：未变化时命中，纯 transform 不失效，Mesh 编辑经 depsgraph 失效。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    utils = test_context.addon.utils.feature_chamfer_gn_utils
+    collection = make_collection("GNStateTracker")
+    source = make_test_mesh("GNStateTrackerSource", collection)
+    mark_all_edges_sharp(source)
+    preview_result, _ = run_feature_chamfer_gn(source)
+    ensure(preview_result == {"FINISHED"}, f"Preview failed: {preview_result}")
+
+    utils.clear_preview_state_cache()
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_VALID", "Tracker did not report valid Preview")
+    misses = utils.preview_state_tracker_stats()["misses"]
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_VALID", "Cached state changed without edits")
+    source.location.x += 1.0
+    bpy.context.view_layer.update()
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_VALID", "Transform edit changed tracked state")
+    ensure(
+        utils.preview_state_tracker_stats()["misses"] == misses,
+        "Unchanged source or pure transform update recomputed Preview state",
+    )
+
+    source.data.vertices[0].co.x += 0.01
+    source.data.update()
+    bpy.context.view_layer.update()
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_STALE", "Mesh edit did not invalidate tracked state")
+    ensure(
+        source.get(test_context.const.FEATURE_CHAMFER_GN_STATE_TAG) == "PREVIEW_VALID",
+        "Tracker wrote source state tag",
+    )
+    ensure(utils.tracked_preview_state(source) == utils.preview_state(source), "Tracker disagrees with preview_state")
+
+    rebuild_result, _ = run_feature_chamfer_gn(source, action="AUTO")
+    ensure(rebuild_result == {"FINISHED"}, "AUTO did not rebuild stale Preview")
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_VALID", "Rebuilt Preview not reflected by tracker")
+    result.add_detail(f"tracker stats={utils.preview_state_tracker_stats()}")
+
+
+def test_feature_chamfer_preview_state_tracker_curve_deleted(test_context: TestContext, result: TestCaseResult):
+    """验证删除 owned Preview Curve 后，缓存的 Preview 状态不再返回 VALID。
+
+    Args:
+        test_context: 已注册 add-on 的测试上下文。
+        result: 当前测试结果记录器。
+    """
+    utils = test_context.addon.utils.feature_chamfer_gn_utils
+    collection = make_collection("GNStateTrackerCurveDeleted")
+    source = make_test_mesh("GNStateTrackerCurveDeletedSource", collection)
+    mark_all_edges_sharp(source)
+    preview_result, _ = run_feature_chamfer_gn(source)
+    ensure(preview_result == {"FINISHED"}, f"Preview failed: {preview_result}")
+
+    utils.clear_preview_state_cache()
+    ensure(utils.tracked_preview_state(source) == "PREVIEW_VALID", "Tracker did not report valid Preview")
+    curve_object = utils.owned_preview_curve(source)
+    ensure(curve_object is not None, "Preview did not create an owned Curve")
+    bpy.data.objects.remove(curve_object, do_unlink=True)
+    bpy.context.view_layer.update()
+
+    tracked_state = utils.tracked_preview_state(source)
+    ensure(tracked_state != "PREVIEW_VALID", "Tracker kept VALID after the owned Curve was deleted")
+    ensure(
+        tracked_state == utils.preview_state(source),
+        f"Tracker disagrees with preview_state after Curve deletion: {tracked_state}",
+    )
+    result.add_detail(f"state after Curve deletion={tracked_state}")
+
+
 # 验证 HST Panel 动态 label 和 Cancel 辅助按钮的 RNA 路径。
 # test_context/result: 测试上下文与结果记录器。
 def test_feature_chamfer_panel_dynamic_label_and_cancel(test_context: TestContext, result: TestCaseResult):
@@ -4026,11 +5484,15 @@ def main():
     addon_module = load_addon_module()
     addon_module.register()
 
-    context = TestContext(addon_module)
+    selected_cases = os.environ.get(SELECTED_CASES_ENV)
+    context = TestContext(addon_module, set(json.loads(selected_cases)) if selected_cases else None)
     context.run_case("addon_registers", test_addon_registers)
     context.run_case("scene_params_stale_pointer_recovery_regression", test_scene_params_stale_pointer_recovery_regression)
     context.run_case("pipe_chamfer_tricky_b_extruded002_regression", test_pipe_chamfer_tricky_b_extruded002_regression)
     context.run_case("pipe_chamfer_degree_four_strand_pairing_regression", test_pipe_chamfer_degree_four_strand_pairing_regression)
+    context.run_case("pipe_chamfer_vertex_matching_dp_matches_enumeration_regression", test_pipe_chamfer_vertex_matching_dp_matches_enumeration_regression)
+    context.run_case("pipe_chamfer_containment_oracle_matches_ray_parity_regression", test_pipe_chamfer_containment_oracle_matches_ray_parity_regression)
+    context.run_case("pipe_chamfer_polyline_index_matches_brute_force_regression", test_pipe_chamfer_polyline_index_matches_brute_force_regression)
     context.run_case("pipe_chamfer_failure_keeps_redo_panel_regression", test_pipe_chamfer_failure_keeps_redo_panel_regression)
     context.run_case("pipe_chamfer_writes_diagnostic_regression", test_pipe_chamfer_writes_diagnostic_regression)
     context.run_case("transfer_proxy_reuse", test_transfer_proxy_reuse)
@@ -4039,6 +5501,7 @@ def main():
     context.run_case("quickweight_smoke", test_quickweight_smoke)
     context.run_case("set_bake_collection_smoke", test_set_bake_collection_smoke)
     context.run_case("vertex_color_set_and_copy_smoke", test_vertex_color_set_and_copy_smoke)
+    context.run_case("vertex_color_numpy_api_regression", test_vertex_color_numpy_api_regression)
     context.run_case("collision_and_extract_ucx_smoke", test_collision_and_extract_ucx_smoke)
     context.run_case("safe_bevel_weight_smoke", test_safe_bevel_weight_smoke)
     context.run_case("safe_bevel_weight_selected_only_regression", test_safe_bevel_weight_selected_only_regression)
@@ -4047,6 +5510,8 @@ def main():
     context.run_case("modifier_ops_smoke", test_modifier_ops_smoke)
     context.run_case("ao_bake_operator_smoke", test_ao_bake_operator_smoke)
     context.run_case("wearmask_proxy_topology_matches_transfer_target", test_wearmask_proxy_topology_matches_transfer_target)
+    context.run_case("wearmask_bulk_proxy_prep_regression", test_wearmask_bulk_proxy_prep_regression)
+    context.run_case("vertex_ao_bvh_engine_regression", test_vertex_ao_bvh_engine_regression)
     context.run_case("origin_and_transform_smoke", test_origin_and_transform_smoke)
     context.run_case("collection_markers_smoke", test_collection_markers_smoke)
     context.run_case("collection_get_selected_outliner_precedence", test_collection_get_selected_outliner_precedence)
@@ -4055,11 +5520,22 @@ def main():
     context.run_case("staticmeshexport_current_scene_only_fbx", test_staticmeshexport_current_scene_only_fbx)
     context.run_case("staticmeshexport_cat_meshgroup_instance_fbx", test_staticmeshexport_cat_meshgroup_instance_fbx)
     context.run_case("prepare_cad_mesh_sets_ue_centimeter_units", test_prepare_cad_mesh_sets_ue_centimeter_units)
+    context.run_case("vectorized_sharp_edge_engine_matches_bmesh_regression", test_vectorized_sharp_edge_engine_matches_bmesh_regression)
+    context.run_case("curvature_corner_array_path_matches_bmesh_regression", test_curvature_corner_array_path_matches_bmesh_regression)
+    context.run_case("texel_density_numpy_matches_bmesh_regression", test_texel_density_numpy_matches_bmesh_regression)
+    context.run_case("uv_average_islands_scale_arrays_regression", test_uv_average_islands_scale_arrays_regression)
+    context.run_case("trimsheet_alpha_regions_numpy_matches_python_regression", test_trimsheet_alpha_regions_numpy_matches_python_regression)
+    context.run_case("trimsheet_alpha_disk_cache_regression", test_trimsheet_alpha_disk_cache_regression)
+    context.run_case("preset_library_batch_loader_regression", test_preset_library_batch_loader_regression)
     context.run_case("bake_collection_export_fbx_smoke", test_bake_collection_export_fbx_smoke)
     context.run_case("marmoset_bake_pairing_smoke", test_marmoset_bake_pairing_smoke)
     context.run_case("marmoset_bake_pairing_missing_side_regression", test_marmoset_bake_pairing_missing_side_regression)
     context.run_case("marmoset_loader_generation_smoke", test_marmoset_loader_generation_smoke)
     context.run_case("staticmeshexport_glb_smoke", test_staticmeshexport_glb_smoke)
+    context.run_case("staticmeshexport_batch_workers_fbx", test_staticmeshexport_batch_workers_fbx)
+    context.run_case("staticmeshexport_incremental_cache_fbx", test_staticmeshexport_incremental_cache_fbx)
+    context.run_case("export_cache_hash_tracks_referenced_ids", test_export_cache_hash_tracks_referenced_ids)
+    context.run_case("staticmeshexport_preserves_selection_regression", test_staticmeshexport_preserves_selection_regression)
     context.run_case("rename_bones_smoke", test_rename_bones_smoke)
     context.run_case("cleanup_ue_skm_smoke", test_cleanup_ue_skm_smoke)
     context.run_case("sharp_feature_graph_object_smoke", test_sharp_feature_graph_object_smoke)
@@ -4094,8 +5570,13 @@ def main():
     context.run_case("experimental_pipe_chamfer_two_pipe_junction_regular_patched_regression", test_experimental_pipe_chamfer_two_pipe_junction_regular_patched_regression)
     context.run_case("experimental_pipe_chamfer_union_difference_smoke", test_experimental_pipe_chamfer_union_difference_smoke)
     context.run_case("experimental_pipe_chamfer_open_boundary_preserves_original_faces", test_experimental_pipe_chamfer_open_boundary_preserves_original_faces)
+    context.run_case("experimental_pipe_chamfer_cutter_broadphase_regression", test_experimental_pipe_chamfer_cutter_broadphase_regression)
+    context.run_case("experimental_pipe_chamfer_merged_pipe_bvh_owner_regression", test_experimental_pipe_chamfer_merged_pipe_bvh_owner_regression)
+    context.run_case("experimental_pipe_chamfer_stage_cache_regression", test_experimental_pipe_chamfer_stage_cache_regression)
+    context.run_case("experimental_pipe_chamfer_profile_spans_regression", test_experimental_pipe_chamfer_profile_spans_regression)
     context.run_case("experimental_pipe_chamfer_first_run_after_preview_regression", test_experimental_pipe_chamfer_first_run_after_preview_regression)
     context.run_case("experimental_pipe_chamfer_bridge_then_fill_smoke", test_experimental_pipe_chamfer_bridge_then_fill_smoke)
+    context.run_case("edge_chain_utils_ordering_contract_regression", test_edge_chain_utils_ordering_contract_regression)
     context.run_case("experimental_pipe_chamfer_postprocess_smoke", test_experimental_pipe_chamfer_postprocess_smoke)
     context.run_case("experimental_pipe_chamfer_endpoint_extension_regression", test_experimental_pipe_chamfer_endpoint_extension_regression)
     context.run_case("grouping_curved_chain_regression", test_grouping_curved_chain_regression)
@@ -4147,6 +5628,7 @@ def main():
         test_gn_preview_operator_builds_coplanar_bracket_strands,
     )
     context.run_case("gn_finalize_rejects_stale_preview", test_gn_finalize_rejects_stale_preview)
+    context.run_case("mesh_fingerprint_service_memo_and_invalidation", test_mesh_fingerprint_service_memo_and_invalidation)
     context.run_case("gn_preview_modifier_parameter_change_marks_stale", test_gn_preview_modifier_parameter_change_marks_stale)
     context.run_case(
         "gn_preview_radius_rebuilds_owned_curve_without_orphans",
@@ -4170,6 +5652,11 @@ def main():
         test_gn_finalize_unsupported_complex_fixture_fails_closed,
     )
     context.run_case("gn_preview_finalize_undo_steps", test_gn_preview_finalize_undo_steps)
+    context.run_case("feature_chamfer_preview_state_tracker_events", test_feature_chamfer_preview_state_tracker_events)
+    context.run_case(
+        "feature_chamfer_preview_state_tracker_curve_deleted",
+        test_feature_chamfer_preview_state_tracker_curve_deleted,
+    )
     context.run_case("feature_chamfer_panel_dynamic_label_and_cancel", test_feature_chamfer_panel_dynamic_label_and_cancel)
     context.run_case("feature_chamfer_single_operator_action_dispatch", test_feature_chamfer_single_operator_action_dispatch)
 
@@ -4184,7 +5671,7 @@ def main():
     failed = [result for result in context.results if result.status != "passed"]
     print("\n=== HST Blender Regression Summary ===")
     for result in context.results:
-        print(f"[{result.status.upper()}] {result.name}")
+        print(f"[{result.status.upper()}] {result.name} ({result.seconds:.2f}s)")
         for detail in result.details:
             print(f"  - {detail}")
         if result.error:
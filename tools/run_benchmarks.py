@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Headless Blender performance benchmark runner for HardsurfaceGameAssetToolkit."""
+
+import argparse
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from run_blender_tests import find_blender
+
+
+DEFAULT_SCALES = "10000,100000,1000000"
+# 中位耗时差值低于该秒数时视为噪声，不判定为回归或改进。
+NOISE_FLOOR_SECONDS = 0.005
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list[dict]:
+    # 按 case 名称比较 wall time 中位数。
+    # 参数 results / baseline：benchmark driver 输出的 JSON；threshold：允许的相对变慢比例，例如 0.15 表示 15%。
+    baseline_cases = {
+        case["name"]: case
+        for case in baseline.get("cases", [])
+        if case.get("status") == "passed" and "wall_seconds" in case
+    }
+    rows = []
+    for case in results.get("cases", []):
+        row = {"name": case["name"], "status": "failed", "current": None, "baseline": None, "ratio": None}
+        if case.get("status") != "passed" or "wall_seconds" not in case:
+            rows.append(row)
+            continue
+        current = case["wall_seconds"]["median"]
+        row["current"] = current
+        reference = baseline_cases.get(case["name"])
+        if reference is None:
+            row["status"] = "new"
+            rows.append(row)
+            continue
+        previous = reference["wall_seconds"]["median"]
+        row["baseline"] = previous
+        row["ratio"] = round(current / previous, 4) if previous > 0.0 else None
+        if current - previous > NOISE_FLOOR_SECONDS and current > previous * (1.0 + threshold):
+            row["status"] = "regressed"
+        elif previous - current > NOISE_FLOOR_SECONDS and current < previous * (1.0 - threshold):
+            row["status"] = "improved"
+        else:
+            row["status"] = "unchanged"
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows: list[dict]):
+    # 打印比较表；无 baseline 的 case 只显示当前耗时。
+    # 参数 rows：compare_with_baseline 的返回值。
+    print("\n=== HST Blender Benchmark Summary ===")
+    for row in rows:
+        current = f"{row['current']:.4f}s" if row["current"] is not None else "-"
+        baseline = f"{row['baseline']:.4f}s" if row["baseline"] is not None else "-"
+        ratio = f"x{row['ratio']:.3f}" if row["ratio"] is not None else ""
+        print(f"[{row['status'].upper()}] {row['name']}: {current} (baseline {baseline}) {ratio}")
+
+
+def run() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blender", help="Path to blender.exe")
+    parser.add_argument("--artifact-dir", help="Artifact output directory")
+    parser.add_argument("--repetitions", type=int, default=5, help="Timed repetitions per case")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warm-up runs per case")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="Comma separated synthetic face counts")
+    parser.add_argument("--case", action="append", default=[], help="fnmatch pattern of case names; repeatable")
+    parser.add_argument("--baseline", help="Baseline JSON path")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative wall time slowdown")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    blender_exe = find_blender(args.blender)
+    if blender_exe is None:
+        print("ERROR: Blender executable not found. Set BLENDER_EXE or pass --blender.")
+        return 2
+
+    artifact_dir = Path(args.artifact_dir) if args.artifact_dir else repo_root / "tests" / "artifacts"
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    baseline_path = Path(args.baseline) if args.baseline else repo_root / "tests" / "benchmark_baseline.json"
+
+    benchmark_driver = repo_root / "tests" / "blender_benchmark_driver.py"
+    results_path = artifact_dir / "benchmarks.json"
+    config = {
+        "warmup": args.warmup,
+        "repetitions": args.repetitions,
+        "scales": [int(value) for value in args.scales.split(",") if value.strip()],
+        "cases": args.case,
+    }
+    env = os.environ.copy()
+    env["HST_ADDON_ROOT"] = str(repo_root)
+    env["HST_BENCHMARK_ARTIFACT_DIR"] = str(artifact_dir)
+    env["HST_BENCHMARK_RESULTS"] = str(results_path)
+    env["HST_BENCHMARK_CONFIG"] = json.dumps(config)
+
+    command = [
+        str(blender_exe),
+        "--background",
+        "--factory-startup",
+        "--disable-autoexec",
+        "--python",
+        str(benchmark_driver),
+    ]
+
+    print(f"Using Blender: {blender_exe}")
+    print("Running headless benchmarks...")
+    results_path.unlink(missing_ok=True)
+    completed = subprocess.run(command, cwd=repo_root, env=env)
+    if not results_path.exists():
+        print(f"ERROR: Benchmark results not written: {results_path}")
+        return completed.returncode or 1
+
+    results = json.loads(results_path.read_text(encoding="utf-8"))
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if baseline.get("blender_version") != results.get("blender_version"):
+            print(
+                f"WARNING: baseline Blender {baseline.get('blender_version')} "
+                f"differs from current {results.get('blender_version')}"
+            )
+    else:
+        print(f"No baseline at {baseline_path}; all cases are reported as new.")
+
+    rows = compare_with_baseline(results, baseline, args.threshold)
+    print_comparison(rows)
+    results["comparison"] = {
+        "baseline_path": str(baseline_path),
+        "threshold": args.threshold,
+        "rows": rows,
+    }
+    results_path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.update_baseline:
+        baseline = {key: value for key, value in results.items() if key != "comparison"}
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(baseline, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+        return completed.returncode
+
+    if completed.returncode != 0:
+        return completed.returncode
+    return 1 if any(row["status"] == "regressed" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
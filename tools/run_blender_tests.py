@@ -2,14 +2,22 @@
 """Headless Blender regression test runner for HardsurfaceGameAssetToolkit."""
 
 import argparse
+import ast
+import heapq
 import json
 import os
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 
+DURATIONS_NAME = "test_durations.json"
+# 没有历史耗时的 case 按该秒数估计，保证新 case 不会全部挤到同一个分片。
+DEFAULT_CASE_SECONDS = 5.0
+
+
 def find_blender(cli_value: str | None) -> Path | None:
     # 定位 Blender 可执行文件。
     # 参数 cli_value：命令行 --blender 传入的显式路径；为 None 时依次检查环境变量、PATH 和各平台常见安装位置。
@@ -41,10 +49,186 @@ def find_blender(cli_value: str | None) -> Path | None:
     return None
 
 
+def list_test_cases(test_driver: Path) -> list[str]:
+    # 静态解析 driver main() 中的 context.run_case("name", ...) 调用，按注册顺序返回 case 名称。
+    # 参数 test_driver：tests/blender_test_driver.py 路径；不需要启动 Blender。
+    tree = ast.parse(test_driver.read_text(encoding="utf-8"))
+    main_function = next(
+        node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == "main"
+    )
+    names = []
+    for node in ast.walk(main_function):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "run_case"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            names.append((node.lineno, node.args[0].value))
+    return [name for _, name in sorted(names)]
+
+
+def load_durations(artifact_dir: Path) -> dict:
+    # 读取历史 case 耗时；缺失或损坏时返回空 dict。
+    # 参数 artifact_dir：测试 artifact 根目录。
+    durations_path = artifact_dir / DURATIONS_NAME
+    if not durations_path.exists():
+        return {}
+    try:
+        durations = json.loads(durations_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as error:
+        print(f"ignore unreadable test durations {durations_path}: {error}")
+        return {}
+    return durations if isinstance(durations, dict) else {}
+
+
+def save_durations(artifact_dir: Path, durations: dict, results: list[dict]):
+    # 用本次运行的 case 耗时更新历史记录；只覆盖本次实际运行的 case。
+    # 参数 artifact_dir：测试 artifact 根目录；durations：已有记录；results：results.json 中的 case 列表。
+    for record in results:
+        if record.get("seconds") is not None:
+            durations[record["name"]] = record["seconds"]
+    (artifact_dir / DURATIONS_NAME).write_text(
+        json.dumps(durations, indent=2, ensure_ascii=False, sort_keys=True),
+        encoding="utf-8",
+    )
+
+
+def plan_shards(case_names: list[str], durations: dict, jobs: int) -> list[list[str]]:
+    # Longest-processing-time-first：按历史耗时降序，每个 case 放进当前总耗时最小的分片。
+    # 参数 case_names：全部 case；durations：历史耗时；jobs：分片数。返回 (cases, 估计秒数)，分片内保持 driver 注册顺序。
+    known = [durations[name] for name in case_names if name in durations]
+    fallback = sorted(known)[len(known) // 2] if known else DEFAULT_CASE_SECONDS
+    order = {name: index for index, name in enumerate(case_names)}
+    estimated = sorted(
+        case_names,
+        key=lambda name: (-durations.get(name, fallback), order[name]),
+    )
+    loads = [(0.0, index) for index in range(jobs)]
+    shards = [[] for _ in range(jobs)]
+    estimates = [0.0] * jobs
+    for name in estimated:
+        load, index = heapq.heappop(loads)
+        shards[index].append(name)
+        estimates[index] = load + durations.get(name, fallback)
+        heapq.heappush(loads, (estimates[index], index))
+    return [
+        (sorted(shard, key=order.get), estimate)
+        for shard, estimate in zip(shards, estimates)
+        if shard
+    ]
+
+
+def blender_command(blender_exe: Path, test_driver: Path) -> list[str]:
+    return [
+        str(blender_exe),
+        "--background",
+        "--factory-startup",
+        "--disable-autoexec",
+        "--python",
+        str(test_driver),
+    ]
+
+
+def run_sharded(blender_exe: Path, repo_root: Path, artifact_dir: Path, test_driver: Path, jobs: int) -> int:
+    # 把 case 按 LPT 分到多个 Blender 进程，各自使用独立 artifact 目录，结束后合并 results.json。
+    # 参数 jobs：并行 Blender 进程数。
+    case_names = list_test_cases(test_driver)
+    durations = load_durations(artifact_dir)
+    shards = plan_shards(case_names, durations, jobs)
+    shard_root = artifact_dir / "shards"
+    shutil.rmtree(shard_root, ignore_errors=True)
+
+    processes = []
+    for index, (shard_cases, estimate) in enumerate(shards):
+        shard_dir = shard_root / f"shard_{index}"
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        env = os.environ.copy()
+        env["HST_ADDON_ROOT"] = str(repo_root)
+        env["HST_TEST_ARTIFACT_DIR"] = str(shard_dir)
+        env["HST_TEST_RESULTS"] = str(shard_dir / "results.json")
+        env["HST_TEST_CASES"] = json.dumps(shard_cases)
+        log_path = shard_dir / "blender.log"
+        log_file = log_path.open("w", encoding="utf-8")
+        print(f"Shard {index}: {len(shard_cases)} cases, estimated {estimate:.1f}s, log {log_path}")
+        process = subprocess.Popen(
+            blender_command(blender_exe, test_driver),
+            cwd=repo_root,
+            env=env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+        processes.append((index, shard_cases, shard_dir, log_file, process, time.perf_counter()))
+
+    records = {}
+    shard_summaries = []
+    blender_version = None
+    for index, shard_cases, shard_dir, log_file, process, started_at in processes:
+        returncode = process.wait()
+        elapsed = time.perf_counter() - started_at
+        log_file.close()
+        results_path = shard_dir / "results.json"
+        shard_records = []
+        if results_path.exists():
+            shard_summary = json.loads(results_path.read_text(encoding="utf-8"))
+            blender_version = blender_version or shard_summary.get("blender_version")
+            shard_records = shard_summary.get("results", [])
+        for record in shard_records:
+            records[record["name"]] = record
+        # Blender 崩溃时分片不会写出结果；未返回的 case 记为失败，避免被静默漏测。
+        for name in shard_cases:
+            if name not in records:
+                records[name] = {
+                    "name": name,
+                    "status": "failed",
+                    "details": [],
+                    "error": f"Shard {index} exited with code {returncode} before reporting this case; see {shard_dir / 'blender.log'}",
+                    "seconds": None,
+                }
+        shard_summaries.append(
+            {
+                "index": index,
+                "cases": shard_cases,
+                "returncode": returncode,
+                "seconds": round(elapsed, 2),
+                "artifact_dir": str(shard_dir),
+            }
+        )
+
+    results = [records[name] for name in case_names if name in records]
+    summary = {
+        "blender_version": blender_version,
+        "repo_root": str(repo_root),
+        "artifact_dir": str(artifact_dir),
+        "shards": shard_summaries,
+        "results": results,
+    }
+    (artifact_dir / "results.json").write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    save_durations(artifact_dir, durations, results)
+
+    print("\n=== HST Blender Regression Summary ===")
+    for record in results:
+        seconds = f" ({record['seconds']:.2f}s)" if record.get("seconds") is not None else ""
+        print(f"[{record['status'].upper()}] {record['name']}{seconds}")
+        for detail in record.get("details", []):
+            print(f"  - {detail}")
+        if record.get("error"):
+            print(record["error"])
+    for shard in shard_summaries:
+        print(f"Shard {shard['index']}: {len(shard['cases'])} cases in {shard['seconds']:.1f}s (exit {shard['returncode']})")
+
+    failed = any(record["status"] != "passed" for record in results)
+    crashed = any(shard["returncode"] != 0 for shard in shard_summaries)
+    return 1 if failed or crashed else 0
+
+
 def run() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--blender", help="Path to blender.exe")
     parser.add_argument("--artifact-dir", help="Artifact output directory")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of parallel Blender processes")
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
@@ -57,24 +241,22 @@ def run() -> int:
     artifact_dir.mkdir(parents=True, exist_ok=True)
 
     test_driver = repo_root / "tests" / "blender_test_driver.py"
+    print(f"Using Blender: {blender_exe}")
+    if args.jobs > 1:
+        print(f"Running headless regression tests in {args.jobs} shards...")
+        return run_sharded(blender_exe, repo_root, artifact_dir, test_driver, args.jobs)
+
     results_path = artifact_dir / "results.json"
     env = os.environ.copy()
     env["HST_ADDON_ROOT"] = str(repo_root)
     env["HST_TEST_ARTIFACT_DIR"] = str(artifact_dir)
     env["HST_TEST_RESULTS"] = str(results_path)
 
-    command = [
-        str(blender_exe),
-        "--background",
-        "--factory-startup",
-        "--disable-autoexec",
-        "--python",
-        str(test_driver),
-    ]
-
-    print(f"Using Blender: {blender_exe}")
     print("Running headless regression tests...")
-    completed = subprocess.run(command, cwd=repo_root, env=env)
+    completed = subprocess.run(blender_command(blender_exe, test_driver), cwd=repo_root, env=env)
+    if results_path.exists():
+        summary = json.loads(results_path.read_text(encoding="utf-8"))
+        save_durations(artifact_dir, load_durations(artifact_dir), summary.get("results", []))
     return completed.returncode
 
 
@@ -10,7 +10,7 @@ from bpy.props import (
 )
 from bpy.types import PropertyGroup
 from .const import *
-from .utils.feature_chamfer_gn_utils import preview_state
+from .utils.feature_chamfer_gn_utils import tracked_preview_state
 
 
 # 返回 HST 面板动态 Feature Chamfer 主按钮的 label。
@@ -23,7 +23,7 @@ def feature_chamfer_gn_button_label(context):
     if linked_source_name:
         source_object = bpy.data.objects.get(linked_source_name) or source_object
     try:
-        state = preview_state(source_object)
+        state = tracked_preview_state(source_object)
     except Exception as error:
         print(f"[HST_FEATURE_CHAMFER_UI_STATE_ERROR] object={source_object.name}: {error}")
         state = FEATURE_CHAMFER_PREVIEW_STALE
@@ -153,6 +153,20 @@ class UIParams(PropertyGroup):
         default=True,
     )
 
+    use_batch_export: BoolProperty(
+        name="Parallel Export",
+        description="使用多个后台 Blender 进程并行导出 StaticMesh Collection，并在导出目录写入 manifest",
+        default=False,
+    )
+
+    batch_export_workers: IntProperty(
+        name="Workers",
+        description="并行导出的后台 Blender 进程数，0 为自动（CPU 核数的一半）",
+        default=0,
+        min=0,
+        max=32,
+    )
+
     marmoset_output_bits: IntProperty(
         name="Bits",
         description="Marmoset bake output bit depth",
@@ -309,7 +323,12 @@ class HST_PT_MainPanel(bpy.types.Panel):
             "hst.hst_bakeproxyvertcolrao",
             text="Bake Vertex Color AO",
             icon="RESTRICT_RENDER_OFF",
-        )
+        ).engine = "CYCLES"
+        box_column.operator(
+            "hst.hst_bakeproxyvertcolrao",
+            text="Bake Vertex Color AO (CPU)",
+            icon="MOD_VERTEX_WEIGHT",
+        ).engine = "BVH"
 
 
         box_column.separator()
@@ -444,13 +463,22 @@ class HST_PT_Export(bpy.types.Panel):
         box_column = box.column()
 
 
-        box_column.operator(
+        export_row = box_column.row(align=True)
+        export_row.operator(
             "hst.staticmeshexport", text="Export StaticMesh", icon="EXPORT"
         )
+        export_row.operator(
+            "hst.staticmeshexport", text="", icon="FILE_REFRESH"
+        ).force = True
         box_column.prop(parameters, "export_path", text="Path")
         box_column.prop(parameters, "export_format", text="Format")
         box_column.prop(parameters, "file_prefix", text="Prefix")
         box_column.prop(parameters, "use_armature_as_root")
+        batch_row = box_column.row(align=True)
+        batch_row.prop(parameters, "use_batch_export")
+        batch_workers = batch_row.row(align=True)
+        batch_workers.enabled = parameters.use_batch_export
+        batch_workers.prop(parameters, "batch_export_workers")
         box_column.operator(
             "hst.open_file_explorer", icon="FILEBROWSER"
         )
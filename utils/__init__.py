@@ -35,5 +35,14 @@ __all__ = [
     'export_utils',
     'marmoset_bake_utils',
     'mesh_utils',
+    'mesh_array_utils',
+    'mesh_fingerprint_utils',
+    'batch_export_utils',
+    'diagnostic_utils',
+    'export_cache_utils',
+    'polyline_index_utils',
+    'edge_chain_utils',
+    'profiling_utils',
+    'vertex_ao_utils',
     'misc_utils',
 ]
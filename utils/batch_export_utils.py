@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""StaticMesh 多进程批量导出：快照导出计划，分片给 headless Blender worker 并汇总 manifest。"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+import bpy
+
+BATCH_EXPORT_MANIFEST_NAME = "hst_export_manifest.json"
+BATCH_EXPORT_LOG_PREFIX = "[HST_BATCH_EXPORT]"
+WORKER_SCRIPT_PATH = Path(__file__).with_name("batch_export_worker.py")
+ADDON_ROOT = Path(__file__).resolve().parent.parent
+PROGRESS_POLL_SECONDS = 0.2
+
+
+@dataclass
+class ExportPlanEntry:
+    collection_name: str
+    file_path: str
+    estimated_cost: int = 0
+
+
+@dataclass
+class ExportPlan:
+    blend_path: str
+    scene_name: str
+    export_format: str
+    addon_root: str
+    entries: list = field(default_factory=list)
+    # [{"object_name": str, "matrix": 4x4 list}]，worker 导出前统一应用，与串行路径一致。
+    origin_transforms: list = field(default_factory=list)
+
+
+# 估算 Collection 导出开销，用于最长优先分片；以 Mesh 面数为主，空 Collection 记为 1。
+# collection: 待导出的 bpy.types.Collection；返回非负整数。
+def estimate_collection_cost(collection):
+    cost = 1
+    for obj in collection.all_objects:
+        if obj.type == "MESH" and obj.data is not None:
+            cost += len(obj.data.polygons)
+    return cost
+
+
+# 将 origin 目标矩阵序列化为 JSON 友好的嵌套列表。
+# origin_objects: {origin Object: 目标 matrix_world}；返回 origin_transforms 列表。
+def serialize_origin_transforms(origin_objects):
+    return [
+        {
+            "object_name": origin_object.name,
+            "matrix": [list(row) for row in matrix],
+        }
+        for origin_object, matrix in origin_objects.items()
+    ]
+
+
+# 解析 worker 数量；requested <= 0 时按 CPU 核数的一半自动选择，且不超过导出条目数。
+# requested: 用户设置；entry_count: 导出条目数；返回 >= 1 的整数。
+def resolve_worker_count(requested, entry_count):
+    if requested <= 0:
+        requested = max(1, (os.cpu_count() or 2) // 2)
+    return max(1, min(requested, entry_count))
+
+
+# 最长优先（LPT）贪心分片：按估算开销从大到小分配给当前负载最小的 worker。
+# entries: ExportPlanEntry 列表；worker_count: 分片数；返回非空分片列表。
+def split_export_plan(entries, worker_count):
+    shards = [[] for _ in range(max(1, worker_count))]
+    loads = [0] * len(shards)
+    for entry in sorted(entries, key=lambda item: item.estimated_cost, reverse=True):
+        shard_index = loads.index(min(loads))
+        shards[shard_index].append(entry)
+        loads[shard_index] += entry.estimated_cost
+    return [shard for shard in shards if shard]
+
+
+# 把当前 Blender 状态另存为副本，不改变当前文件路径与 dirty 状态。
+# snapshot_dir: 输出目录；返回快照 .blend 路径。
+def save_blend_snapshot(snapshot_dir):
+    snapshot_path = Path(snapshot_dir) / "export_snapshot.blend"
+    bpy.ops.wm.save_as_mainfile(
+        filepath=str(snapshot_path),
+        copy=True,
+        check_existing=False,
+    )
+    return snapshot_path
+
+
+# 写入一个 worker 分片的计划文件。
+# plan: ExportPlan；entries: 本分片条目；shard_path: 输出 JSON 路径。
+def write_plan_shard(plan, entries, shard_path):
+    shard = asdict(plan)
+    shard["entries"] = [asdict(entry) for entry in entries]
+    Path(shard_path).write_text(json.dumps(shard, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+# 启动一个 headless Blender worker；stdout/stderr 写入独立日志文件。
+# blend_path/shard_path/results_path/log_path: 快照、分片计划、结果 JSONL、日志路径；返回 (Popen, log_file)。
+def launch_export_worker(blend_path, shard_path, results_path, log_path):
+    command = [
+        bpy.app.binary_path,
+        "--background",
+        "--factory-startup",
+        str(blend_path),
+        "--python",
+        str(WORKER_SCRIPT_PATH),
+        "--",
+        str(shard_path),
+        str(results_path),
+    ]
+    log_file = open(log_path, "w", encoding="utf-8")
+    process = subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT)
+    return process, log_file
+
+
+# 读取 worker 追加写入的结果 JSONL；未写完的最后一行会在下次轮询时再读。
+# results_path: 结果文件路径；返回结果 dict 列表。
+def read_worker_results(results_path):
+    results_path = Path(results_path)
+    if not results_path.exists():
+        return []
+    results = []
+    for line in results_path.read_text(encoding="utf-8").splitlines():
+        try:
+            results.append(json.loads(line))
+        except json.JSONDecodeError:
+            break
+    return results
+
+
+# 执行批量导出：快照、分片、启动 worker、轮询进度并回收结果。
+# plan: 不含 blend_path 的 ExportPlan；worker_count: 分片数；progress_callback(done, total, result) 可选。
+# 返回 (results, work_dir)；全部成功时删除临时目录并返回 work_dir=None，否则保留日志用于排查。
+def run_batch_export(plan, worker_count, progress_callback=None):
+    work_dir = Path(tempfile.mkdtemp(prefix="hst_batch_export_"))
+    plan.blend_path = str(save_blend_snapshot(work_dir))
+    shards = split_export_plan(plan.entries, worker_count)
+
+    workers = []
+    for worker_index, entries in enumerate(shards):
+        shard_path = work_dir / f"shard_{worker_index}.json"
+        results_path = work_dir / f"shard_{worker_index}.results.jsonl"
+        log_path = work_dir / f"shard_{worker_index}.log"
+        write_plan_shard(plan, entries, shard_path)
+        process, log_file = launch_export_worker(plan.blend_path, shard_path, results_path, log_path)
+        workers.append(
+            {
+                "index": worker_index,
+                "entries": entries,
+                "process": process,
+                "log_file": log_file,
+                "log_path": log_path,
+                "results_path": results_path,
+                "reported": 0,
+            }
+        )
+
+    total = len(plan.entries)
+    done = 0
+    try:
+        while True:
+            running = False
+            for worker in workers:
+                if worker["process"].poll() is None:
+                    running = True
+                worker_results = read_worker_results(worker["results_path"])
+                for result in worker_results[worker["reported"]:]:
+                    done += 1
+                    if progress_callback is not None:
+                        progress_callback(done, total, result)
+                worker["reported"] = len(worker_results)
+            if not running:
+                break
+            time.sleep(PROGRESS_POLL_SECONDS)
+    finally:
+        for worker in workers:
+            if worker["process"].poll() is None:
+                worker["process"].kill()
+                worker["process"].wait()
+            worker["log_file"].close()
+
+    results = []
+    for worker in workers:
+        worker_results = {
+            result["collection_name"]: result
+            for result in read_worker_results(worker["results_path"])
+        }
+        for entry in worker["entries"]:
+            result = worker_results.get(entry.collection_name)
+            if result is None:
+                result = {
+                    "collection_name": entry.collection_name,
+                    "file_path": entry.file_path,
+                    "status": "failed",
+                    "seconds": 0.0,
+                    "bytes": 0,
+                    "error": (
+                        f"worker {worker['index']} exited with code {worker['process'].returncode} "
+                        f"before exporting; see {worker['log_path']}"
+                    ),
+                }
+            result["worker"] = worker["index"]
+            results.append(result)
+
+    if all(result["status"] == "written" for result in results):
+        shutil.rmtree(work_dir, ignore_errors=True)
+        work_dir = None
+    return results, work_dir
+
+
+# 在导出目录写入 manifest，记录每个文件的耗时、字节数与 worker。
+# export_path: 导出目录；plan: ExportPlan；results: run_batch_export 结果；返回 manifest 路径。
+def write_export_manifest(export_path, plan, results, worker_count, total_seconds):
+    manifest_path = Path(export_path) / BATCH_EXPORT_MANIFEST_NAME
+    manifest = {
+        "blend_file": bpy.data.filepath,
+        "scene": plan.scene_name,
+        "export_format": plan.export_format,
+        "worker_count": worker_count,
+        "total_seconds": round(total_seconds, 4),
+        "written_count": sum(1 for result in results if result["status"] == "written"),
+        "failed_count": sum(1 for result in results if result["status"] != "written"),
+        "files": results,
+    }
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest_path
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""批量导出 worker：在 headless Blender 中加载快照 .blend，按分片计划导出 StaticMesh。
+
+由 batch_export_utils.launch_export_worker 以
+``blender --background snapshot.blend --python batch_export_worker.py -- shard.json results.jsonl`` 启动。
+作为插件子模块被 auto_load 导入时不执行任何操作。
+"""
+
+import importlib
+import importlib.util
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import bpy
+
+WORKER_PACKAGE_NAME = "hst_batch_export_addon"
+
+
+# 以独立包名加载插件源码（不注册 UI/Operator），只用于访问导出器。
+# addon_root: 插件根目录；返回 export 模块。
+def load_export_module(addon_root):
+    spec = importlib.util.spec_from_file_location(
+        WORKER_PACKAGE_NAME,
+        Path(addon_root) / "__init__.py",
+        submodule_search_locations=[str(addon_root)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[WORKER_PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return importlib.import_module(f"{WORKER_PACKAGE_NAME}.export")
+
+
+# 切换到计划记录的 Scene，并按计划把 origin Object 移到目标矩阵。
+# plan: 分片计划 dict。
+def prepare_scene(plan):
+    from mathutils import Matrix
+
+    scene = bpy.data.scenes.get(plan["scene_name"])
+    if scene is None:
+        raise RuntimeError(f"Scene not found in snapshot: {plan['scene_name']}")
+    if bpy.context.window is not None:
+        bpy.context.window.scene = scene
+    for origin in plan["origin_transforms"]:
+        origin_object = bpy.data.objects.get(origin["object_name"])
+        if origin_object is None:
+            raise RuntimeError(f"Origin object not found in snapshot: {origin['object_name']}")
+        origin_object.matrix_world = Matrix(origin["matrix"])
+    bpy.context.view_layer.update()
+
+
+def main(argv):
+    shard_path, results_path = argv[argv.index("--") + 1:][:2]
+    plan = json.loads(Path(shard_path).read_text(encoding="utf-8"))
+    export_module = load_export_module(plan["addon_root"])
+    _, _, staticmesh_exporter, _ = export_module.resolve_export_targets(plan["export_format"])
+    prepare_scene(plan)
+
+    failed = 0
+    with open(results_path, "a", encoding="utf-8") as results_file:
+        for entry in plan["entries"]:
+            result = {
+                "collection_name": entry["collection_name"],
+                "file_path": entry["file_path"],
+                "status": "written",
+                "seconds": 0.0,
+                "bytes": 0,
+                "error": None,
+            }
+            start_time = time.perf_counter()
+            try:
+                collection = bpy.data.collections.get(entry["collection_name"])
+                if collection is None:
+                    raise RuntimeError(f"Collection not found in snapshot: {entry['collection_name']}")
+                print(f"exporting {collection.name} to {entry['file_path']}")
+                staticmesh_exporter(collection, entry["file_path"])
+                result["bytes"] = Path(entry["file_path"]).stat().st_size
+            except Exception:
+                failed += 1
+                result["status"] = "failed"
+                result["error"] = traceback.format_exc()
+            result["seconds"] = round(time.perf_counter() - start_time, 4)
+            results_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+            results_file.flush()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Feature Chamfer 诊断日志：以 JSON Lines 追加到临时目录，供 Operator 记录参数、输入指纹与阶段统计。"""
+
+from datetime import datetime
+import json
+from pathlib import Path
+import sys
+import tempfile
+
+import bpy
+
+from .experimental_pipe_chamfer_utils import build_pipe_chamfer
+
+
+DIAGNOSTIC_LOG_PATH = Path(tempfile.gettempdir()) / "hst_feature_chamfer_diagnostic.jsonl"
+
+
+# 追加一次 Feature Chamfer 诊断事件；写入失败时输出明确上下文但不改变几何流程。
+# event: 事件名称；payload: 参数、代码来源、Mesh 指纹或阶段统计；operator_module: 调用方 Operator 模块文件。
+def write_diagnostic_event(event, payload, operator_module=None):
+    record = {
+        "time": datetime.now().astimezone().isoformat(timespec="milliseconds"),
+        "event": event,
+        "blender_version": bpy.app.version_string,
+        "operator_module": operator_module,
+        "utils_module": sys.modules[build_pipe_chamfer.__module__].__file__,
+        **payload,
+    }
+    try:
+        with DIAGNOSTIC_LOG_PATH.open("a", encoding="utf-8") as log_file:
+            log_file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    except OSError as error:
+        print(f"[HST_PIPE_CHAMFER_DIAGNOSTIC_ERROR] path={DIAGNOSTIC_LOG_PATH}: {error}")
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Boundary / Rail Edge 集合的连通组件与有序 chain 提取，基于一次构建的局部整数邻接数组。"""
+
+
+# 把 BMEdge 集合压成局部整数数组；局部 edge id 按 edge.index 升序，邻接表因此天然有序。
+# edges: BMEdge 可迭代对象；返回 (edge_list, vertices, edge_vertices, vertex_edges)。
+def _edge_index_arrays(edges):
+    edge_list = sorted(edges, key=lambda edge: edge.index)
+    vertex_ids = {}
+    vertices = []
+    edge_vertices = []
+    vertex_edges = []
+    for edge_id, edge in enumerate(edge_list):
+        pair = []
+        for vertex in edge.verts:
+            vertex_id = vertex_ids.get(vertex)
+            if vertex_id is None:
+                vertex_id = len(vertices)
+                vertex_ids[vertex] = vertex_id
+                vertices.append(vertex)
+                vertex_edges.append([])
+            vertex_edges[vertex_id].append(edge_id)
+            pair.append(vertex_id)
+        edge_vertices.append(tuple(pair))
+    return edge_list, vertices, edge_vertices, vertex_edges
+
+
+# 按共享 Vertex 做 flood fill；组件按最小 edge.index 排序，组件内 edge id 升序。
+# edge_vertices/vertex_edges: _edge_index_arrays 的局部数组；返回 (edge ids, vertex ids) 列表。
+def _connected_components(edge_vertices, vertex_edges):
+    edge_component = [-1] * len(edge_vertices)
+    components = []
+    for seed in range(len(edge_vertices)):
+        if edge_component[seed] >= 0:
+            continue
+        component_id = len(components)
+        edge_component[seed] = component_id
+        component_edges = [seed]
+        component_vertices = []
+        seen_vertices = set()
+        stack = [seed]
+        while stack:
+            edge_id = stack.pop()
+            for vertex_id in edge_vertices[edge_id]:
+                if vertex_id in seen_vertices:
+                    continue
+                seen_vertices.add(vertex_id)
+                component_vertices.append(vertex_id)
+                for neighbor in vertex_edges[vertex_id]:
+                    if edge_component[neighbor] < 0:
+                        edge_component[neighbor] = component_id
+                        component_edges.append(neighbor)
+                        stack.append(neighbor)
+        component_edges.sort()
+        components.append((component_edges, component_vertices))
+    return components
+
+
+# 把 Edges 拆成按共享 Vertex 连通的组件，O(E)（不含一次按 index 排序）。
+# edges: BMEdge 集合；返回 {"edges", "vertices", "vertex_degrees"} 列表，edges 按 index 升序。
+def edge_components(edges):
+    edge_list, vertices, edge_vertices, vertex_edges = _edge_index_arrays(edges)
+    return [
+        {
+            "edges": [edge_list[edge_id] for edge_id in component_edges],
+            "vertices": [vertices[vertex_id] for vertex_id in component_vertices],
+            "vertex_degrees": [len(vertex_edges[vertex_id]) for vertex_id in component_vertices],
+        }
+        for component_edges, component_vertices in _connected_components(edge_vertices, vertex_edges)
+    ]
+
+
+# 把 degree-2/degree-1 Edges 拆成有序 open/cyclic chains，跳过含分叉或无法一次走完的组件。
+# 组件按最小 edge.index 输出；open chain 从 index 较小的端点出发，cyclic chain 从 index 最小的 Vertex 出发，
+# 每步沿 index 最小的未使用 Edge 前进。每个 Vertex 的邻接游标只前进不回退，整体 O(E)。
+# edges: BMEdge 集合；返回 {"edges", "vertices", "is_cyclic"} chain records。
+def ordered_edge_chains(edges):
+    edge_list, vertices, edge_vertices, vertex_edges = _edge_index_arrays(edges)
+    used = bytearray(len(edge_list))
+    cursors = [0] * len(vertices)
+    chains = []
+    for component_edges, component_vertices in _connected_components(edge_vertices, vertex_edges):
+        endpoints = [
+            vertex_id for vertex_id in component_vertices
+            if len(vertex_edges[vertex_id]) == 1
+        ]
+        cyclic = not endpoints and all(
+            len(vertex_edges[vertex_id]) == 2 for vertex_id in component_vertices
+        )
+        if not cyclic and len(endpoints) != 2:
+            continue
+        start = min(
+            endpoints or component_vertices,
+            key=lambda vertex_id: vertices[vertex_id].index,
+        )
+        ordered_edges = []
+        ordered_vertices = [start]
+        current = start
+        while len(ordered_edges) < len(component_edges):
+            linked = vertex_edges[current]
+            cursor = cursors[current]
+            while cursor < len(linked) and used[linked[cursor]]:
+                cursor += 1
+            cursors[current] = cursor
+            if cursor == len(linked):
+                break
+            edge_id = linked[cursor]
+            used[edge_id] = 1
+            ordered_edges.append(edge_id)
+            first, second = edge_vertices[edge_id]
+            current = second if current == first else first
+            if current == start:
+                break
+            ordered_vertices.append(current)
+        if len(ordered_edges) == len(component_edges):
+            chains.append(
+                {
+                    "edges": [edge_list[edge_id] for edge_id in ordered_edges],
+                    "vertices": [vertices[vertex_id] for vertex_id in ordered_vertices],
+                    "is_cyclic": cyclic,
+                }
+            )
+    return chains
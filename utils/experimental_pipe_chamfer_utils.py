@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """实验性 Sharp FeatureGraph → 多 Pipe → Boolean → Patch 实现。"""
 
+from collections import OrderedDict
+import copy
 import itertools
 import math
 import time
@@ -21,7 +23,19 @@ from mathutils import Matrix
 from mathutils import Vector
 from mathutils import geometry
 from mathutils.bvhtree import BVHTree
+from .edge_chain_utils import ordered_edge_chains
 from .feature_chamfer_patch_utils import patch_boolean_result
+from .mesh_array_utils import HAS_NUMPY
+from .mesh_array_utils import np
+from .mesh_array_utils import read_vertex_positions
+from .mesh_fingerprint_utils import compute_mesh_data_digest
+from .polyline_index_utils import PolylineIndex
+from .polyline_index_utils import nearest_parameter_index
+from .profiling_utils import active_profiler
+from .profiling_utils import profiled
+from .profiling_utils import profile_count
+from .profiling_utils import profile_span
+from .profiling_utils import profiling_session
 
 
 COLLECTION_NAME = "HST_Experimental_PipeChamfer"
@@ -63,6 +77,24 @@ class PipeChamferError(RuntimeError):
         self.stats.update(status="failed", error_code=error_code, error_message=message)
 
 
+class PipeTreeList(list):
+    """逐 Pipe BVH 列表，附带合并全部 Pipe 三角形的 BVH。
+
+    仍按 pipe_id 下标访问单根 Pipe 的 BVH；需要“某点附近有哪些 Pipe”时用
+    merged_tree 做一次 find_nearest_range，再经 triangle_owners 映射回 pipe_id。
+
+    Args:
+        trees: 按 pipe_id 排列的单 Pipe BVHTree。
+        merged_tree: 全部 Pipe 三角形的 BVHTree。
+        triangle_owners: merged_tree 三角形 index -> pipe_id。
+    """
+
+    def __init__(self, trees, merged_tree=None, triangle_owners=()):
+        super().__init__(trees)
+        self.merged_tree = merged_tree
+        self.triangle_owners = triangle_owners
+
+
 # 创建 handoff 规定的结构化统计，所有分支都补齐同一组字段。
 # source_object: 输入 Mesh Object；其余参数为 Operator 的公开参数。
 def _base_stats(
@@ -301,6 +333,7 @@ def _half_edge_pair_is_compatible(metadata_a, metadata_b):
 
 
 # 枚举一个 Sharp vertex 的所有 matching，并按总权重、配对数与稳定 Edge ID 决定顺序。
+# matching 数随 degree 超指数增长，正常流程使用 bitmask DP；这里只保留给 _cross_check_vertex_matchings。
 # edge_records: 每项为 (edge_a, edge_b, candidate_record)；返回排序后的 matching records。
 def _enumerate_vertex_matchings(edges, edge_records):
     candidates_by_edge = {edge: [] for edge in edges}
@@ -342,6 +375,158 @@ def _enumerate_vertex_matchings(edges, edge_records):
     return matchings
 
 
+# matching 的完整排序键：总权重降序、配对数降序、稳定 Edge ID 升序；与枚举排序一致。
+# selected: 按 edge_ids 排序的 candidate tuple；返回可直接比较的 tuple。
+def _matching_sort_key(selected):
+    return (
+        -sum(item["weight"] for item in selected),
+        -len(selected),
+        tuple(candidate["edge_ids"] for candidate in selected),
+    )
+
+
+# 建立 bitmask DP 需要的邻接表：按 incident Edge 顺序编号，candidate 挂在较小编号的一端。
+# edges/edge_records: 同 _enumerate_vertex_matchings；返回 (edge bit 表, 每位的 (partner bit, candidate) 列表)。
+def _matching_bit_candidates(edges, edge_records):
+    ordered_edges = sorted(edges, key=lambda item: item.index)
+    edge_bits = {edge: bit for bit, edge in enumerate(ordered_edges)}
+    candidates_by_bit = [[] for _ in ordered_edges]
+    for edge_a, edge_b, candidate in edge_records:
+        bit_a = edge_bits[edge_a]
+        bit_b = edge_bits[edge_b]
+        if bit_a > bit_b:
+            bit_a, bit_b = bit_b, bit_a
+        candidates_by_bit[bit_a].append((bit_b, candidate))
+    return edge_bits, candidates_by_bit
+
+
+# 用 bitmask DP 求 matching 排序中的前 limit 项，等价于 _enumerate_vertex_matchings(...)[:limit]。
+# 剩余 Edge 集合中编号最小的 Edge 要么不配对、要么与某个 partner 配对；该 pair 的 edge_ids
+# 必然排在子问题所有 pair 之前，因此排序键可由子问题最优解拼接，复杂度 O(2^d · d · limit)。
+# edges/edge_records: 同 _enumerate_vertex_matchings；limit: 返回的 matching 数。
+def _top_vertex_matchings(edges, edge_records, limit=2):
+    edge_bits, candidates_by_bit = _matching_bit_candidates(edges, edge_records)
+    memo = {0: [()]}
+
+    def solve(mask):
+        cached = memo.get(mask)
+        if cached is not None:
+            return cached
+        bit = (mask & -mask).bit_length() - 1
+        next_mask = mask & ~(1 << bit)
+        options = list(solve(next_mask))
+        for partner_bit, candidate in candidates_by_bit[bit]:
+            if not next_mask & (1 << partner_bit):
+                continue
+            for selected in solve(next_mask & ~(1 << partner_bit)):
+                options.append((candidate,) + selected)
+        options.sort(key=_matching_sort_key)
+        memo[mask] = options[:limit]
+        return memo[mask]
+
+    full_mask = (1 << len(edge_bits)) - 1
+    return [
+        {
+            "selected": selected,
+            "score": sum(item["weight"] for item in selected),
+        }
+        for selected in solve(full_mask)
+    ]
+
+
+# 求配对数最多、且总权重与最优值相差不超过 tolerance 的全部 matching，按枚举排序返回。
+# 先用 bitmask DP 求每个剩余集合的 (最大配对数, 该配对数下的最大权重)，再只沿可达最优的分支回溯。
+# edges/edge_records: 同 _enumerate_vertex_matchings；tolerance: 权重并列容差。
+def _maximum_cardinality_vertex_matchings(edges, edge_records, tolerance=1.0e-7):
+    edge_bits, candidates_by_bit = _matching_bit_candidates(edges, edge_records)
+    memo = {0: (0, 0.0)}
+
+    def solve(mask):
+        cached = memo.get(mask)
+        if cached is not None:
+            return cached
+        bit = (mask & -mask).bit_length() - 1
+        next_mask = mask & ~(1 << bit)
+        best = solve(next_mask)
+        for partner_bit, candidate in candidates_by_bit[bit]:
+            if not next_mask & (1 << partner_bit):
+                continue
+            count, score = solve(next_mask & ~(1 << partner_bit))
+            option = (count + 1, score + candidate["weight"])
+            if option > best:
+                best = option
+        memo[mask] = best
+        return best
+
+    full_mask = (1 << len(edge_bits)) - 1
+    target_count, target_score = solve(full_mask)
+    # 浮点求和顺序不同带来的误差不应剪掉真正并列的分支。
+    bound_slack = tolerance + 1.0e-9 * max(1.0, abs(target_score))
+    matchings = []
+
+    def visit(mask, count, score, selected):
+        best_count, best_score = solve(mask)
+        if count + best_count != target_count or score + best_score < target_score - bound_slack:
+            return
+        if not mask:
+            ordered = tuple(sorted(selected, key=lambda item: item["edge_ids"]))
+            total = sum(item["weight"] for item in ordered)
+            if abs(total - target_score) <= tolerance:
+                matchings.append({"selected": ordered, "score": total})
+            return
+        bit = (mask & -mask).bit_length() - 1
+        next_mask = mask & ~(1 << bit)
+        visit(next_mask, count, score, selected)
+        for partner_bit, candidate in candidates_by_bit[bit]:
+            if next_mask & (1 << partner_bit):
+                visit(
+                    next_mask & ~(1 << partner_bit),
+                    count + 1,
+                    score + candidate["weight"],
+                    selected + [candidate],
+                )
+
+    visit(full_mask, 0, 0.0, [])
+    matchings.sort(key=lambda item: _matching_sort_key(item["selected"]))
+    return matchings
+
+
+# Debug 交叉校验：DP 结果必须与穷举枚举一致；只用于测试与问题复现，不在正常流程中调用。
+# edges/edge_records: 同 _enumerate_vertex_matchings；返回穷举得到的 matching 数。
+def _cross_check_vertex_matchings(edges, edge_records, tolerance=1.0e-7):
+    enumerated = _enumerate_vertex_matchings(edges, edge_records)
+    top = _top_vertex_matchings(edges, edge_records, limit=2)
+    expected_top = enumerated[:2]
+    if [item["selected"] for item in top] != [item["selected"] for item in expected_top]:
+        raise RuntimeError(
+            "Vertex matching DP disagrees with enumeration: "
+            f"dp={[item['selected'] for item in top]}, "
+            f"enumerated={[item['selected'] for item in expected_top]}"
+        )
+    maximum_pair_count = max(len(option["selected"]) for option in enumerated)
+    maximum_score = max(
+        option["score"]
+        for option in enumerated
+        if len(option["selected"]) == maximum_pair_count
+    )
+    expected_optimal = [
+        option["selected"]
+        for option in enumerated
+        if len(option["selected"]) == maximum_pair_count
+        and abs(option["score"] - maximum_score) <= tolerance
+    ]
+    optimal = [
+        option["selected"]
+        for option in _maximum_cardinality_vertex_matchings(edges, edge_records, tolerance)
+    ]
+    if optimal != expected_optimal:
+        raise RuntimeError(
+            "Maximum-cardinality vertex matching DP disagrees with enumeration: "
+            f"dp={optimal}, enumerated={expected_optimal}"
+        )
+    return len(enumerated)
+
+
 # 对任意连接数的 Sharp vertex 求确定性的 maximum-weight strand matching。
 # vertex/edges: junction Vertex 与 incident Sharp Edges；metadata: Surface Patch 上下文。
 # miter_scale_limit: Even-Thickness profile 膨胀上限；返回 pair mapping 与 VertexMatchingRecord。
@@ -376,7 +561,7 @@ def _maximum_weight_strand_pairs(vertex, edges, metadata, miter_scale_limit=1.25
             if candidate["allowed"]:
                 allowed_candidates.append((edge_a, edge_b, candidate))
 
-    matchings = _enumerate_vertex_matchings(edges, allowed_candidates)
+    matchings = _top_vertex_matchings(edges, allowed_candidates, limit=2)
     best = matchings[0]
     runner_up_score = matchings[1]["score"] if len(matchings) > 1 else 0.0
     selected_pairs = [candidate["edge_ids"] for candidate in best["selected"]]
@@ -520,14 +705,118 @@ def _point_inside_closed_bvh(source_bvh, point, tolerance):
     return inside_votes >= 2
 
 
+class SourceContainmentOracle:
+    """closed source Mesh 的 inside/outside 查询，一次 FeatureGraph 构建内复用。
+
+    bounds 内划分惰性体素：体素中心到表面的距离大于半对角线时整格同侧，
+    只需一次 ray parity 即可回答格内全部点；靠近表面的格子回退到逐点 ray parity。
+    每个查询点的 (inside, surface distance) 都会记忆，全局 junction 组合反复评分时不再重复 ray cast。
+
+    Args:
+        source_bvh: source Mesh BVHTree。
+        positions: source 顶点坐标，用于求 bounds。
+        clearance: endpoint 采样距离；ray parity 推进容差与 _strand_endpoint_containment_score 一致。
+        resolution: bounds 最长边上的体素数。
+    """
+
+    def __init__(self, source_bvh, positions, clearance, resolution=32):
+        self.source_bvh = source_bvh
+        self.tolerance = max(clearance * 0.02, 1.0e-6)
+        positions = [Vector(position) for position in positions]
+        if positions:
+            self.minimum = Vector(tuple(min(point[axis] for point in positions) for axis in range(3)))
+            self.maximum = Vector(tuple(max(point[axis] for point in positions) for axis in range(3)))
+        else:
+            self.minimum = Vector((0.0, 0.0, 0.0))
+            self.maximum = Vector((0.0, 0.0, 0.0))
+        extent = max(max(self.maximum - self.minimum), 1.0e-6)
+        self.cell_size = extent / max(int(resolution), 1)
+        self.cell_half_diagonal = self.cell_size * math.sqrt(3.0) * 0.5
+        self._cell_states = {}
+        self._point_results = {}
+        self.stats = {"queries": 0, "cell_hits": 0, "ray_parity_points": 0, "ray_parity_cells": 0}
+
+    # bounds 外的点在 closed Mesh 外侧；返回体素 key 或 None。
+    def _cell_key(self, point):
+        if any(
+            point[axis] < self.minimum[axis] or point[axis] > self.maximum[axis]
+            for axis in range(3)
+        ):
+            return None
+        return tuple(
+            int((point[axis] - self.minimum[axis]) // self.cell_size)
+            for axis in range(3)
+        )
+
+    # 返回体素状态：True/False 为整格 inside/outside，None 表示格内有表面需逐点判断。
+    def _cell_state(self, cell_key):
+        if cell_key in self._cell_states:
+            return self._cell_states[cell_key]
+        center = Vector(
+            tuple(
+                self.minimum[axis] + (cell_key[axis] + 0.5) * self.cell_size
+                for axis in range(3)
+            )
+        )
+        nearest = self.source_bvh.find_nearest(center)
+        state = None
+        if nearest is not None and nearest[3] is not None and nearest[3] > self.cell_half_diagonal + self.tolerance:
+            self.stats["ray_parity_cells"] += 1
+            state = _point_inside_closed_bvh(self.source_bvh, center, self.tolerance)
+        self._cell_states[cell_key] = state
+        return state
+
+    # 查询单点；返回 (inside, surface_distance)，nearest 缺失时 surface_distance 为 None。
+    def query(self, point):
+        point = Vector(point)
+        point_key = tuple(point)
+        cached = self._point_results.get(point_key)
+        if cached is not None:
+            return cached
+        self.stats["queries"] += 1
+        nearest = self.source_bvh.find_nearest(point)
+        surface_distance = (
+            (point - Vector(nearest[0])).length
+            if nearest is not None
+            else None
+        )
+        cell_key = self._cell_key(point)
+        inside = False if cell_key is None else self._cell_state(cell_key)
+        if inside is None:
+            self.stats["ray_parity_points"] += 1
+            inside = _point_inside_closed_bvh(self.source_bvh, point, self.tolerance)
+        elif cell_key is not None:
+            self.stats["cell_hits"] += 1
+        result = (inside, surface_distance)
+        self._point_results[point_key] = result
+        return result
+
+    # 批量查询；points 为 (N, 3) 数组或坐标序列，返回 query 结果列表。
+    def query_many(self, points):
+        return [self.query(point) for point in points]
+
+
 # 统计 open Strand endpoint 的 source-solid containment，优先让圆形端盖埋入 attachment body。
-# strand_records/source_bvh/clearance: 候选 strands、source Mesh BVH 与 endpoint 采样距离；返回 exposed 数和 margin。
-def _strand_endpoint_containment_score(strand_records, source_bvh, clearance):
+# strand_records/source_bvh/clearance: 候选 strands、source Mesh BVH 与 endpoint 采样距离；
+# containment_oracle: 可选 SourceContainmentOracle，提供时复用其体素与逐点记忆。返回 exposed 数和 margin。
+def _strand_endpoint_containment_score(strand_records, source_bvh, clearance, containment_oracle=None):
     if source_bvh is None or clearance <= 0.0:
         return 0, 0.0
     tolerance = max(clearance * 0.02, 1.0e-6)
     exposed_endpoint_count = 0
     containment_margin = 0.0
+    if containment_oracle is not None:
+        samples = [
+            sample
+            for record in strand_records
+            for sample in record.get("endpoint_samples", ())
+        ]
+        for inside, surface_distance in containment_oracle.query_many(samples):
+            if surface_distance is None or not inside:
+                exposed_endpoint_count += 1
+            else:
+                containment_margin += surface_distance
+        return exposed_endpoint_count, containment_margin
     for record in strand_records:
         for sample in record.get("endpoint_samples", ()):
             sample = Vector(sample)
@@ -552,6 +841,7 @@ def _global_surface_patch_strand_pairs(
     fixed_strand_pairs=None,
     source_bvh=None,
     endpoint_clearance=0.0,
+    containment_oracle=None,
 ):
     fixed_strand_pairs = fixed_strand_pairs or {}
     vertex_options = []
@@ -591,19 +881,7 @@ def _global_surface_patch_strand_pairs(
                 pair_candidates.append(candidate)
                 if candidate["allowed"]:
                     allowed_candidates.append((edge_a, edge_b, candidate))
-        options = _enumerate_vertex_matchings(edges, allowed_candidates)
-        maximum_pair_count = max(len(option["selected"]) for option in options)
-        maximum_score = max(
-            option["score"]
-            for option in options
-            if len(option["selected"]) == maximum_pair_count
-        )
-        options = [
-            option
-            for option in options
-            if len(option["selected"]) == maximum_pair_count
-            and abs(option["score"] - maximum_score) <= 1.0e-7
-        ]
+        options = _maximum_cardinality_vertex_matchings(edges, allowed_candidates, tolerance=1.0e-7)
         for option in options:
             option["vertex"] = vertex
             option["geometry_signature"] = _matching_geometry_signature(option, edge_by_id)
@@ -711,6 +989,7 @@ def _global_surface_patch_strand_pairs(
                 strand_records,
                 source_bvh,
                 endpoint_clearance,
+                containment_oracle=containment_oracle,
             )
         )
         score = (
@@ -773,6 +1052,7 @@ def _global_surface_patch_strand_pairs(
 
 # 从 Sharp Edge 建 FeatureGraph，并按 patch pair、convexity、degree 与 turn spike 分 Pipe Groups。
 # source_object: 输入 Mesh；threshold/spike: tangent continuity 参数；stats: 机器统计；miter_scale_limit: 允许的 profile 膨胀上限。
+@profiled("feature_graph")
 def _build_feature_graph(
     source_object,
     chain_turn_threshold_degrees,
@@ -835,6 +1115,11 @@ def _build_feature_graph(
     # Preview 的 global solver 只处理真实 junction；degree-2 topology pairing 必须保留。
     if global_surface_patch_matching:
         source_bvh = BVHTree.FromBMesh(bm)
+        containment_oracle = SourceContainmentOracle(
+            source_bvh,
+            [vertex.co for vertex in bm.verts],
+            endpoint_clearance,
+        )
         global_pairs, global_records = _global_surface_patch_strand_pairs(
             {
                 vertex: edges
@@ -850,7 +1135,9 @@ def _build_feature_graph(
             },
             source_bvh=source_bvh,
             endpoint_clearance=endpoint_clearance,
+            containment_oracle=containment_oracle,
         )
+        stats["containment_oracle"] = dict(containment_oracle.stats)
         records_by_vertex = {
             record["vertex_index"]: record
             for record in vertex_matching_records
@@ -1016,6 +1303,7 @@ def _build_feature_graph(
 
 # 使用正式 GN Preview 的唯一 FeatureGraph 参数合同。
 # source_object/radius/stats: source Mesh、Chamfer radius 与诊断字典；返回正式 Preview groups。
+@profiled("preview_feature_graph")
 def _build_preview_feature_graph(source_object, radius, stats):
     stats["feature_graph_contract"] = "GN_PREVIEW_V1"
     return _build_feature_graph(
@@ -1125,6 +1413,7 @@ def _pipe_endpoint_extensions(source_object, group, radius):
 
 # 一次性为全部 Pipe Group 分类端点，并保存延长量供 Mesh 构建与诊断复用。
 # source_object: source Mesh；groups: 全部 Pipe Groups；radius: Pipe 半径。
+@profiled("endpoint_classification")
 def _classify_pipe_endpoints(source_object, groups, radius):
     bm = bmesh.new()
     bm.from_mesh(source_object.data)
@@ -1459,22 +1748,103 @@ def _non_overlapping_pipe_batches(pipe_count, spatial_pairs):
     return batches
 
 
-# 创建 overlap-safe 的 join-only Cutter Mesh batches，并用 Pipe BVH overlap 为空间 Junction 提供统计。
-# pipes: 独立 Pipe Objects；source_object/stats: 输出上下文。
-def _build_cutter_set(pipes, source_object, stats):
-    spatial_pairs = set()
+# Sweep-and-prune broadphase：按 min.x 排序，每个 box 只与 min.x 落在自身 x 区间内的后继比较 y/z。
+# 比较使用与 _bounds_overlap 相同的闭区间语义，因此候选集合是其精确超集（实际相等）。
+# pipe_bounds: (minimum, maximum) 列表；返回升序 (index_a, index_b) 列表。
+def _broadphase_overlap_pairs(pipe_bounds):
+    if len(pipe_bounds) < 2:
+        return []
+    if not HAS_NUMPY:
+        return [
+            (index_a, index_b)
+            for index_a in range(len(pipe_bounds))
+            for index_b in range(index_a + 1, len(pipe_bounds))
+            if _bounds_overlap(pipe_bounds[index_a], pipe_bounds[index_b])
+        ]
+    minimum = np.array([tuple(bounds[0]) for bounds in pipe_bounds], dtype=np.float64)
+    maximum = np.array([tuple(bounds[1]) for bounds in pipe_bounds], dtype=np.float64)
+    order = np.argsort(minimum[:, 0], kind="stable")
+    sorted_min_x = minimum[order, 0]
+    sweep_end = np.searchsorted(sorted_min_x, maximum[order, 0], side="right")
+    pairs = []
+    for position, index_a in enumerate(order):
+        candidates = order[position + 1:sweep_end[position]]
+        if not len(candidates):
+            continue
+        overlaps = np.all(
+            (maximum[index_a, 1:] >= minimum[candidates, 1:])
+            & (maximum[candidates, 1:] >= minimum[index_a, 1:]),
+            axis=1,
+        )
+        for index_b in candidates[overlaps]:
+            pairs.append((min(int(index_a), int(index_b)), max(int(index_a), int(index_b))))
+    return sorted(pairs)
+
+
+# 为每根 Pipe 建 BVH 与 bounds，并对 broadphase 候选做精确 BVH overlap。
+# pipes: 独立 Pipe Objects；timings: 可选 dict，写入 bounds/BVH/broadphase/narrowphase 耗时。
+# 返回 (trees, bounds, spatial_pairs)，均不引用 Blender ID，可跨 Undo 复用。
+@profiled("pipe_overlap_index")
+def _pipe_overlap_index(pipes, timings=None):
+    phase_started_at = time.perf_counter()
+    pipe_bounds = [_pipe_bounds(pipe) for pipe in pipes]
+    bounds_seconds = time.perf_counter() - phase_started_at
+
+    phase_started_at = time.perf_counter()
     trees = []
-    pipe_bounds = []
-    for pipe in pipes:
+    merged_vertices = []
+    merged_triangles = []
+    triangle_owners = []
+    for pipe_id, pipe in enumerate(pipes):
         bm = bmesh.new()
         bm.from_mesh(pipe.data)
         trees.append(BVHTree.FromBMesh(bm))
+        # 与 FromBMesh 使用同一 BMesh tessellation，合并 BVH 的距离与单 Pipe BVH 逐位一致。
+        vertex_offset = len(merged_vertices)
+        merged_vertices.extend(vertex.co.copy() for vertex in bm.verts)
+        for loop_triangle in bm.calc_loop_triangles():
+            merged_triangles.append(
+                tuple(vertex_offset + loop.vert.index for loop in loop_triangle)
+            )
+            triangle_owners.append(pipe_id)
         bm.free()
-        pipe_bounds.append(_pipe_bounds(pipe))
-    for index_a, tree_a in enumerate(trees):
-        for index_b in range(index_a + 1, len(trees)):
-            if _bounds_overlap(pipe_bounds[index_a], pipe_bounds[index_b]) and tree_a.overlap(trees[index_b]):
-                spatial_pairs.add((index_a, index_b))
+    merged_tree = (
+        BVHTree.FromPolygons(merged_vertices, merged_triangles, all_triangles=True)
+        if merged_triangles
+        else None
+    )
+    trees = PipeTreeList(trees, merged_tree, triangle_owners)
+    bvh_seconds = time.perf_counter() - phase_started_at
+
+    phase_started_at = time.perf_counter()
+    candidate_pairs = _broadphase_overlap_pairs(pipe_bounds)
+    broadphase_seconds = time.perf_counter() - phase_started_at
+
+    phase_started_at = time.perf_counter()
+    spatial_pairs = {
+        (index_a, index_b)
+        for index_a, index_b in candidate_pairs
+        if trees[index_a].overlap(trees[index_b])
+    }
+    narrowphase_seconds = time.perf_counter() - phase_started_at
+    if timings is not None:
+        timings["cutter_set.bounds"] = bounds_seconds
+        timings["cutter_set.bvh_build"] = bvh_seconds
+        timings["cutter_set.broadphase"] = broadphase_seconds
+        timings["cutter_set.narrowphase"] = narrowphase_seconds
+        timings["cutter_set.candidate_pair_count"] = len(candidate_pairs)
+    return trees, pipe_bounds, spatial_pairs
+
+
+# 创建 overlap-safe 的 join-only Cutter Mesh batches，并用 Pipe BVH overlap 为空间 Junction 提供统计。
+# pipes: 独立 Pipe Objects；source_object/stats: 输出上下文；overlap_index: Stage Cache 命中时复用的
+# (trees, bounds, spatial_pairs)。返回 (cutter_collection, trees, bounds)。
+@profiled("cutter_set")
+def _build_cutter_set(pipes, source_object, stats, overlap_index=None):
+    if overlap_index is None:
+        overlap_index = _pipe_overlap_index(pipes, stats["timings"])
+    trees, pipe_bounds, spatial_pairs = overlap_index
+    join_started_at = time.perf_counter()
     cutter_collection = bpy.data.collections.new(f"{source_object.name}{CUTTER_COLLECTION_SUFFIX}")
     bpy.context.scene.collection.children.link(cutter_collection)
     pipe_batches = _non_overlapping_pipe_batches(len(pipes), spatial_pairs)
@@ -1487,6 +1857,7 @@ def _build_cutter_set(pipes, source_object, stats):
         )
         for cutter_index, batch in enumerate(pipe_batches)
     ]
+    stats["timings"]["cutter_set.join"] = time.perf_counter() - join_started_at
     stats["spatial_junction_count"] = len(spatial_pairs)
     stats["pipe_overlap_pairs"] = [list(pair) for pair in sorted(spatial_pairs)]
     stats["cutter_set_object_count"] = len(pipes)
@@ -1540,6 +1911,21 @@ def _mark_original_faces(output, source_patch_ids):
 # output: source duplicate；cutter_collection: 独立 Pipe 集合；source_patch_ids: 原面 Patch IDs。
 def _apply_difference(output, cutter_collection, source_patch_ids):
     _mark_original_faces(output, source_patch_ids)
+    marker_index = _assign_difference_materials(output, cutter_collection)
+    modifier = _add_difference_modifier(output, cutter_collection)
+    with bpy.context.temp_override(
+        object=output,
+        active_object=output,
+        selected_objects=[output],
+        selected_editable_objects=[output],
+    ):
+        bpy.ops.object.modifier_apply(modifier=modifier.name)
+    return marker_index
+
+
+# 给 output 追加 marker material 并把 cutter 全部 Face 指向它，Boolean 后据此追踪 cutter Face。
+# output: source duplicate；cutter_collection: 独立 Pipe 集合；返回 marker material index。
+def _assign_difference_materials(output, cutter_collection):
     base_material = bpy.data.materials.get(BASE_MATERIAL_NAME) or bpy.data.materials.new(BASE_MATERIAL_NAME)
     if len(output.data.materials) == 0:
         output.data.materials.append(base_material)
@@ -1552,14 +1938,6 @@ def _apply_difference(output, cutter_collection, source_patch_ids):
         pipe.data.materials.append(marker)
         for polygon in pipe.data.polygons:
             polygon.material_index = 0
-    modifier = _add_difference_modifier(output, cutter_collection)
-    with bpy.context.temp_override(
-        object=output,
-        active_object=output,
-        selected_objects=[output],
-        selected_editable_objects=[output],
-    ):
-        bpy.ops.object.modifier_apply(modifier=modifier.name)
     return marker_index
 
 
@@ -1572,11 +1950,7 @@ def _classify_cutter_faces(output, marker_index, pipe_trees, radius):
     for polygon in output.data.polygons:
         material_marked = polygon.material_index == marker_index
         center = output.matrix_world @ polygon.center
-        owners = set()
-        for pipe_id, tree in enumerate(pipe_trees):
-            nearest = tree.find_nearest(center)
-            if nearest is not None and nearest[3] is not None and nearest[3] <= tolerance:
-                owners.add(pipe_id)
+        owners = set(_pipe_distances_within(pipe_trees, center, tolerance))
         if material_marked and not owners:
             ambiguous.append(polygon.index)
         if material_marked or owners:
@@ -1586,6 +1960,7 @@ def _classify_cutter_faces(output, marker_index, pipe_trees, radius):
 
 # 按 Boolean 传播的 original-face attribute 区分槽面与原表面。
 # output: Apply 后 Mesh；stats: 结构化统计；返回应删除的 groove Face indices。
+@profiled("groove_faces")
 def _groove_face_indices(output, stats):
     attribute = output.data.attributes.get(ORIGINAL_FACE_ATTRIBUTE)
     if attribute is None or attribute.domain != "FACE":
@@ -1614,6 +1989,7 @@ def _groove_face_indices(output, stats):
 
 # 合并 Boolean 生成的重合 Boundary vertices，删除零长度 Edge 且保留 Face custom data。
 # bm/radius: 已删除槽面的 BMesh 与 Chamfer radius；返回清理前后统计。
+@profiled("open_boundary_dissolve")
 def _clean_open_boundary_degenerates(bm, radius):
     distance = max(radius * 1.0e-7, 1.0e-9)
     zero_edges_before = [
@@ -1650,6 +2026,7 @@ def _clean_open_boundary_degenerates(bm, radius):
 
 # 删除 cutter Faces 并把 BoundaryGraph 的连通边界环提取为有序 BMVert 序列。
 # output: Difference 结果；cutter_face_indices: 待删除 Face 索引；stats: 机器统计。
+@profiled("open_boundary")
 def _open_boundary(
     output,
     cutter_face_indices,
@@ -1734,7 +2111,7 @@ def _align_loops(loop_a, loop_b):
             parameters_b = _normalized_loop_parameters(rotated)
             cost = 0.0
             for index_a, parameter in enumerate(parameters_a):
-                index_b = min(range(len(rotated)), key=lambda index: abs(parameters_b[index] - parameter))
+                index_b = nearest_parameter_index(parameters_b, parameter)
                 cost += (loop_a[index_a].co - rotated[index_b].co).length_squared
             if best is None or cost < best[0]:
                 best = (cost, rotated)
@@ -1743,6 +2120,7 @@ def _align_loops(loop_a, loop_b):
 
 # 以 normalized arc-length zipper 在两条 rail 间生成单 span Regular Strip。
 # bm: 目标 BMesh；loop_a/loop_b: rail loops；返回新 Face 列表。
+@profiled("zipper_bridge")
 def _zipper_bridge(bm, loop_a, loop_b):
     loop_b = _align_loops(loop_a, loop_b)
     count_a = len(loop_a)
@@ -2042,71 +2420,12 @@ def _triangulate_junction_loop(bm, loop):
     return new_faces
 
 
-# 把一组 degree-2/degree-1 Boundary Edges 拆成有序的 open/cyclic edge chains。
-# edges: 同一 Pipe、同一 source Surface Patch 上的 Boundary Edges；返回 chain records。
-def _ordered_edge_chains(edges):
-    remaining = set(edges)
-    chains = []
-    while remaining:
-        seed = min(remaining, key=lambda edge: edge.index)
-        component = {seed}
-        stack = [seed]
-        remaining.remove(seed)
-        while stack:
-            edge = stack.pop()
-            for vertex in edge.verts:
-                for neighbor in vertex.link_edges:
-                    if neighbor in remaining:
-                        remaining.remove(neighbor)
-                        component.add(neighbor)
-                        stack.append(neighbor)
-        adjacency = {}
-        for edge in component:
-            for vertex in edge.verts:
-                adjacency.setdefault(vertex, []).append(edge)
-        endpoints = sorted(
-            (vertex for vertex, linked in adjacency.items() if len(linked) == 1),
-            key=lambda vertex: vertex.index,
-        )
-        cyclic = not endpoints and all(len(linked) == 2 for linked in adjacency.values())
-        if not cyclic and len(endpoints) != 2:
-            continue
-        start = endpoints[0] if endpoints else min(adjacency, key=lambda vertex: vertex.index)
-        ordered_edges = []
-        ordered_vertices = [start]
-        current = start
-        previous = None
-        while len(ordered_edges) < len(component):
-            next_edge = next(
-                (
-                    edge
-                    for edge in sorted(adjacency[current], key=lambda item: item.index)
-                    if edge is not previous and edge not in ordered_edges
-                ),
-                None,
-            )
-            if next_edge is None:
-                break
-            ordered_edges.append(next_edge)
-            current = next_edge.other_vert(current)
-            previous = next_edge
-            if current is start:
-                break
-            ordered_vertices.append(current)
-        if len(ordered_edges) == len(component):
-            chains.append(
-                {
-                    "edges": ordered_edges,
-                    "vertices": ordered_vertices,
-                    "is_cyclic": cyclic,
-                }
-            )
-    return chains
-
-
 # 返回 Pipe Mesh 的 local-space axis-aligned bounds，供空间查询 broad phase 使用。
 # pipe: Pipe Mesh Object；返回 (minimum, maximum)。
 def _pipe_bounds(pipe):
+    if HAS_NUMPY and len(pipe.data.vertices):
+        positions = read_vertex_positions(pipe.data)
+        return Vector(positions.min(axis=0)), Vector(positions.max(axis=0))
     points = [vertex.co for vertex in pipe.data.vertices]
     return (
         Vector((min(point.x for point in points), min(point.y for point in points), min(point.z for point in points))),
@@ -2126,30 +2445,54 @@ def _bounds_overlap(bounds_a, bounds_b, margin=0.0):
     )
 
 
+# 返回距离 point 不超过 max_distance 的 Pipe 及其最近距离。
+# 有合并 BVH 时只做一次 find_nearest_range，否则逐 Pipe find_nearest。
+# pipe_trees: PipeTreeList 或普通 BVH 列表；返回 {pipe_id: distance}。
+def _pipe_distances_within(pipe_trees, point, max_distance):
+    merged_tree = getattr(pipe_trees, "merged_tree", None)
+    distances = {}
+    if merged_tree is None:
+        for pipe_id, tree in enumerate(pipe_trees):
+            nearest = tree.find_nearest(point)
+            if nearest is not None and nearest[3] is not None and nearest[3] <= max_distance:
+                distances[pipe_id] = nearest[3]
+        return distances
+    triangle_owners = pipe_trees.triangle_owners
+    # range query 使用严格小于，略放宽半径后再按闭区间过滤。
+    query_distance = max_distance * (1.0 + 1.0e-6) + 1.0e-12
+    for _, _, triangle_index, distance in merged_tree.find_nearest_range(point, query_distance):
+        if distance > max_distance:
+            continue
+        pipe_id = triangle_owners[triangle_index]
+        if distance < distances.get(pipe_id, float("inf")):
+            distances[pipe_id] = distance
+    return distances
+
+
 # 返回 Boundary Edge 落在 Pipe surface tolerance 内的候选 owner，按最近距离排序。
 # edge/pipe_trees/bounds/radius: 洞口边、Pipe BVH/bounds 与 Chamfer radius；返回 (distance, pipe_id)。
 def _boundary_edge_pipe_candidates(edge, pipe_trees, pipe_bounds, radius):
     center = (edge.verts[0].co + edge.verts[1].co) * 0.5
     distances = []
     surface_tolerance = max(radius * 0.12, 1.0e-6)
-    for pipe_id, (tree, bounds) in enumerate(zip(pipe_trees, pipe_bounds)):
-        minimum, maximum = bounds
+    owner_tolerance = max(radius * 0.025, 1.0e-7)
+    # 超出 surface + owner tolerance 的 Pipe 既不可能是最近 owner，也不会通过并列过滤。
+    nearby = _pipe_distances_within(pipe_trees, center, surface_tolerance + owner_tolerance)
+    for pipe_id, distance in nearby.items():
+        minimum, maximum = pipe_bounds[pipe_id]
         if any(
             center[axis] < minimum[axis] - surface_tolerance
             or center[axis] > maximum[axis] + surface_tolerance
             for axis in range(3)
         ):
             continue
-        nearest = tree.find_nearest(center)
-        if nearest is not None and nearest[3] is not None:
-            distances.append((nearest[3], pipe_id))
+        distances.append((distance, pipe_id))
     if not distances:
         return []
     distances.sort()
     minimum_distance = distances[0][0]
     if minimum_distance > surface_tolerance:
         return []
-    owner_tolerance = max(radius * 0.025, 1.0e-7)
     return [
         (distance, pipe_id)
         for distance, pipe_id in distances
@@ -2197,6 +2540,7 @@ def _serialize_boundary_rail_chain(chain, pipe_id, patch_id):
 
 # 只沿最终 Boolean 洞口的原始 Boundary Edge adjacency 提取 Rail，不排序或插值坐标。
 # bm/groups/pipe_trees/bounds/radius: OPEN_BOUNDARY BMesh、Feature groups 与 Cutter Pipe spatial index。
+@profiled("boundary_rails")
 def _final_boolean_boundary_rails(bm, groups, pipe_trees, pipe_bounds, radius):
     patch_layer = bm.faces.layers.int.get(SOURCE_PATCH_ID_ATTRIBUTE)
     group_by_pipe = {group["pipe_id"]: group for group in groups}
@@ -2364,7 +2708,7 @@ def _final_boolean_boundary_rails(bm, groups, pipe_trees, pipe_bounds, radius):
     owned_chains = []
     owned_edges = set()
     for (pipe_id, patch_id), edges in sorted(edges_by_key.items()):
-        chains = _ordered_edge_chains(edges)
+        chains = ordered_edge_chains(edges)
         rails.setdefault(pipe_id, {})[patch_id] = chains
         chained_edges = set()
         for chain in chains:
@@ -2540,7 +2884,7 @@ def _cutter_intersection_rails(source_object, groups, pipes, radius):
                         "coordinates": [vertex.co.copy() for vertex in chain["vertices"]],
                         "is_cyclic": chain["is_cyclic"],
                     }
-                    for chain in _ordered_edge_chains(edges)
+                    for chain in ordered_edge_chains(edges)
                 ]
             diagnostics.append(
                 {
@@ -2612,22 +2956,14 @@ def _rail_parameters(vertices, cyclic):
     )
 
 
-# 返回点到 CutterStrand polyline 的最短距离。
-# point/group: 查询点与含 ordered points/cyclic 的 Feature group。
-def _point_to_feature_group_distance(point, group):
-    points = group["points"]
-    segment_count = len(points) if group["is_cyclic"] else len(points) - 1
-    distances = []
-    for index in range(segment_count):
-        start = points[index]
-        end = points[(index + 1) % len(points)]
-        closest, factor = geometry.intersect_point_line(point, start, end)
-        if factor < 0.0:
-            closest = start
-        elif factor > 1.0:
-            closest = end
-        distances.append((point - closest).length)
-    return min(distances)
+# 为 CutterStrand polyline 建立 segment 网格索引，供逐点距离与最近 Feature Edge 查询复用。
+# group: 含 ordered points/cyclic/edge_indices 的 Feature group；返回 PolylineIndex。
+def _feature_group_index(group):
+    return PolylineIndex(
+        group["points"],
+        group["is_cyclic"],
+        segment_count=len(group["edge_indices"]),
+    )
 
 
 # 统计 3D polyline 的非相邻 segment 自交数量。
@@ -2635,47 +2971,12 @@ def _point_to_feature_group_distance(point, group):
 def _polyline_self_intersection_count(coordinates, cyclic, tolerance):
     if len(coordinates) < 4:
         return 0
-    segment_count = len(coordinates) if cyclic else len(coordinates) - 1
-    intersection_count = 0
-    for first_index in range(segment_count):
-        first_start = coordinates[first_index]
-        first_end = coordinates[(first_index + 1) % len(coordinates)]
-        for second_index in range(first_index + 1, segment_count):
-            if second_index == first_index + 1:
-                continue
-            if cyclic and first_index == 0 and second_index == segment_count - 1:
-                continue
-            second_start = coordinates[second_index]
-            second_end = coordinates[(second_index + 1) % len(coordinates)]
-            closest = geometry.intersect_line_line(
-                first_start,
-                first_end,
-                second_start,
-                second_end,
-            )
-            if closest is None or (closest[0] - closest[1]).length > tolerance:
-                continue
-            midpoint = (closest[0] + closest[1]) * 0.5
-            _, first_factor = geometry.intersect_point_line(
-                midpoint,
-                first_start,
-                first_end,
-            )
-            _, second_factor = geometry.intersect_point_line(
-                midpoint,
-                second_start,
-                second_end,
-            )
-            if (
-                -1.0e-6 <= first_factor <= 1.0 + 1.0e-6
-                and -1.0e-6 <= second_factor <= 1.0 + 1.0e-6
-            ):
-                intersection_count += 1
-    return intersection_count
+    return PolylineIndex(coordinates, cyclic).self_intersection_count(tolerance)
 
 
 # 为 RailPairRecord 计算 Phase 2 的距离、顺序、自交和采样密度 guard。
 # record/group/span/radius: rail record、owner Feature、ownership span 与 Chamfer radius。
+@profiled("rail_geometry_guard")
 def _rail_pair_geometry_guard(record, group, span, radius):
     left = [Vector(point) for point in record["rail_left"]]
     right = [Vector(point) for point in record["rail_right"]]
@@ -2715,13 +3016,10 @@ def _rail_pair_geometry_guard(record, group, span, radius):
     correspondence_widths = record.get("correspondence_width", [])
     expected_correspondence_width = radius * math.sqrt(2.0)
     correspondence_tolerance = max(radius * 0.60, 1.0e-5)
+    right_index = PolylineIndex(right, right_cyclic)
     correspondence_errors = sorted(
         abs(
-            _point_to_rail_distance(
-                left_coordinate,
-                right,
-                right_cyclic,
-            )
+            right_index.distance(left_coordinate)
             - expected_correspondence_width
         )
         for left_coordinate in left
@@ -2798,35 +3096,7 @@ def _rail_pair_geometry_guard(record, group, span, radius):
 # 按 normalized u 返回目标 rail 上与 parameter 对应的 Vertex。
 # vertices/parameters/parameter: rail points、u 数组与查询参数。
 def _rail_vertex_at_parameter(vertices, parameters, parameter):
-    return vertices[
-        min(
-            range(len(parameters)),
-            key=lambda index: abs(parameters[index] - parameter),
-        )
-    ]
-
-
-# 返回 point 到 polyline 的最短距离，完全基于现有 vertices，不创建新坐标。
-# point/vertices/cyclic: 查询点、目标 Rail vertices 与闭环标记。
-def _point_to_rail_distance(point, vertices, cyclic):
-    coordinates = [
-        vertex.co if hasattr(vertex, "co") else vertex
-        for vertex in vertices
-    ]
-    segment_count = len(coordinates) if cyclic else len(coordinates) - 1
-    if segment_count <= 0:
-        return float("inf")
-    distances = []
-    for index in range(segment_count):
-        start = coordinates[index]
-        end = coordinates[(index + 1) % len(coordinates)]
-        closest, factor = geometry.intersect_point_line(point, start, end)
-        if factor < 0.0:
-            closest = start
-        elif factor > 1.0:
-            closest = end
-        distances.append((point - closest).length)
-    return min(distances)
+    return vertices[nearest_parameter_index(parameters, parameter)]
 
 
 # 对齐 open/cyclic rail B 的方向和 cyclic offset，避免端点或 seam 错配。
@@ -2882,13 +3152,11 @@ def _boolean_rail_pair_record(
         chain_right,
     )
     left_u = _rail_parameters(left_vertices, chain_left["is_cyclic"])
+    group_index = _feature_group_index(group)
     radial_error_samples = []
     correspondence_widths = []
     for index, parameter in enumerate(left_u):
-        nearest_index = min(
-            range(len(right_u)),
-            key=lambda candidate: abs(right_u[candidate] - parameter),
-        )
+        nearest_index = nearest_parameter_index(right_u, parameter)
         left_coordinate = (
             left_vertices[index].co
             if hasattr(left_vertices[index], "co")
@@ -2905,16 +3173,14 @@ def _boolean_rail_pair_record(
         radial_error_samples.append(
             max(
                 abs(
-                    _point_to_feature_group_distance(
+                    group_index.distance(
                         left_vertices[index].co if hasattr(left_vertices[index], "co") else left_vertices[index],
-                        group,
                     )
                     - radius
                 ),
                 abs(
-                    _point_to_feature_group_distance(
+                    group_index.distance(
                         right_vertices[nearest_index].co if hasattr(right_vertices[nearest_index], "co") else right_vertices[nearest_index],
-                        group,
                     )
                     - radius
                 ),
@@ -3005,23 +3271,6 @@ def _group_patch_pair_spans(group):
     return spans
 
 
-# 返回交线点最近的 Feature Edge offset 与距离。
-# point/group: Cutter 交线坐标与含 ordered points/cyclic 的 Feature group。
-def _nearest_feature_edge_offset(point, group):
-    best = None
-    point_count = len(group["points"])
-    for edge_offset in range(len(group["edge_indices"])):
-        start = group["points"][edge_offset]
-        end = group["points"][(edge_offset + 1) % point_count]
-        closest, factor = geometry.intersect_point_line(point, start, end)
-        factor = max(0.0, min(1.0, factor))
-        closest = start.lerp(end, factor)
-        candidate = ((point - closest).length_squared, edge_offset, factor)
-        if best is None or candidate < best:
-            best = candidate
-    return best[1], math.sqrt(best[0]), best[2]
-
-
 # 把有序 Cutter 交线按最近 Feature Edge owner 切成当前 span 的连续 runs。
 # chain/group/span: 原始交线、Feature group 与目标 ownership span；返回局部 chain records。
 def _clip_intersection_chain_to_span(chain, group, span):
@@ -3029,8 +3278,9 @@ def _clip_intersection_chain_to_span(chain, group, span):
     if not coordinates:
         return []
     owned_offsets = set(span["edge_offsets"])
+    group_index = _feature_group_index(group)
     ownership = [
-        _nearest_feature_edge_offset(point, group)[0] in owned_offsets
+        group_index.nearest_segment(point)[0] in owned_offsets
         for point in coordinates
     ]
     if all(ownership):
@@ -3099,10 +3349,10 @@ def _slice_boundary_chain_to_span(chain, group, span):
     if not edges:
         return []
     owned_offsets = set(span["edge_offsets"])
+    group_index = _feature_group_index(group)
     edge_ownership = [
-        _nearest_feature_edge_offset(
+        group_index.nearest_segment(
             (edge.verts[0].co + edge.verts[1].co) * 0.5,
-            group,
         )[0]
         in owned_offsets
         for edge in edges
@@ -3155,18 +3405,13 @@ def _trim_rail_pair_to_width_core(chain_left, chain_right, radius):
     expected_width = radius * math.sqrt(2.0)
     tolerance = max(radius * 0.60, 1.0e-5)
 
-    def inlier(vertex, opposite_vertices):
-        return abs(
-            _point_to_rail_distance(
-                vertex.co,
-                opposite_vertices,
-                False,
-            )
-            - expected_width
-        ) <= tolerance
+    def inlier(vertex, opposite_index):
+        return abs(opposite_index.distance(vertex.co) - expected_width) <= tolerance
 
-    left_inliers = [inlier(vertex, right_vertices) for vertex in left_vertices]
-    right_inliers = [inlier(vertex, left_vertices) for vertex in right_vertices]
+    left_index = PolylineIndex(left_vertices, False)
+    right_index = PolylineIndex(right_vertices, False)
+    left_inliers = [inlier(vertex, right_index) for vertex in left_vertices]
+    right_inliers = [inlier(vertex, left_index) for vertex in right_vertices]
     if not any(left_inliers) or not any(right_inliers):
         return None
     left_start = left_inliers.index(True)
@@ -3399,6 +3644,7 @@ def _occluded_rail_span_record(group, span, chains_left, chains_right, evidence)
 
 # 从 Boolean open boundary 提取同 owner、两 Surface Patch 的 RailPairRecords。
 # bm/groups/pipe_trees/bounds/radius: OPEN_BOUNDARY 上下文；返回 records 与 coverage summary。
+@profiled("rail_pairs")
 def _extract_boolean_rail_pair_records(
     bm,
     groups,
@@ -3908,6 +4154,7 @@ def _sample_tangents(samples, cyclic):
 
 # 直接在 source Surface Patch 上按 radius 构造结构化 offset rails。
 # source_object/groups/radius: 原 Mesh、CutterStrands 与 Chamfer radius；返回 records/summary。
+@profiled("surface_offset_rails")
 def _extract_source_surface_offset_rail_records(source_object, groups, radius):
     bm = bmesh.new()
     bm.from_mesh(source_object.data)
@@ -4097,6 +4344,7 @@ def _extract_source_surface_offset_rail_records(source_object, groups, radius):
 
 # 模拟手工流程：同一 Pipe 两侧 rail 执行 Bridge Edge Loops，之后 Fill 剩余闭合洞。
 # bm/loops: 删除槽面后的 BoundaryGraph；groups/pipe_trees/radius: rail ownership 上下文；stats: 统计。
+@profiled("bridge_fill")
 def _bridge_then_fill(bm, loops, groups, pipe_trees, pipe_bounds, radius, stats):
     """模拟手工流程：同一 Pipe 两侧 rail 执行 Bridge Edge Loops，之后 Fill 剩余真实 holes。
 
@@ -4170,7 +4418,7 @@ def _bridge_then_fill(bm, loops, groups, pipe_trees, pipe_bounds, radius, stats)
             stats["regular_patch_face_count"] = len(regular_faces)
 
     remaining_edges = {edge for edge in bm.edges if len(edge.link_faces) == 1}
-    remaining_loops = _ordered_edge_chains(remaining_edges)
+    remaining_loops = ordered_edge_chains(remaining_edges)
     stats["remaining_boundary_loop_count"] = len(remaining_loops)
 
     occupied_cycles = []
@@ -4233,7 +4481,7 @@ def _bridge_then_fill(bm, loops, groups, pipe_trees, pipe_bounds, radius, stats)
 
 
 # 验证两条待 Bridge 的 rail chain 在当前 BMesh 中仍然是合法边界环。
-# chain_a/chain_b: _ordered_edge_chains 返回的 chain record。
+# chain_a/chain_b: ordered_edge_chains 返回的 chain record。
 def _rail_pair_is_valid(chain_a, chain_b):
     """验证两条 rail chain 当前仍为独立、有效的 boundary 环。"""
     edges_a = set(chain_a["edges"])
@@ -4267,8 +4515,8 @@ def _rail_pair_chains_from_record(bm, record, boundary_edge_by_source_index):
         raise ValueError("RailPairRecord references a missing Boundary Edge") from error
     if any(len(edge.link_faces) != 1 for edge in left_edges + right_edges):
         raise ValueError("RailPairRecord contains an Edge that is no longer Boundary")
-    left_chains = _ordered_edge_chains(left_edges)
-    right_chains = _ordered_edge_chains(right_edges)
+    left_chains = ordered_edge_chains(left_edges)
+    right_chains = ordered_edge_chains(right_edges)
     if len(left_chains) != 1 or len(right_chains) != 1:
         raise ValueError(
             f"RailPairRecord did not resolve to one chain per side: {len(left_chains)}/{len(right_chains)}"
@@ -4278,6 +4526,7 @@ def _rail_pair_chains_from_record(bm, record, boundary_edge_by_source_index):
 
 # 消费 Phase 2 RailPairRecords，逐 span 生成只跨两侧真实 Boundary Rails 的 Chamfer strips。
 # bm/rail_pairs/stats: open BMesh、已验收 records 与统计；返回新 Faces。
+@profiled("regular_rail_patch")
 def _patch_regular_rail_records(bm, rail_pairs, stats, radius):
     regular_faces = []
     patched_records = []
@@ -4423,6 +4672,7 @@ def _patch_regular_rail_records(bm, rail_pairs, stats, radius):
 
 # 为 Phase 3 regular strip 保留局部 Junction holes，并验证剩余 Boundary 全在 Phase 2 ledger 内。
 # bm/summary/topology/stats: Patch 后 BMesh、Rail summary、Boundary topology 与统计。
+@profiled("port_validation")
 def _validate_regular_patch_ports(bm, summary, topology, stats):
     del topology
     remaining_edges = {edge for edge in bm.edges if len(edge.link_faces) == 1}
@@ -4446,7 +4696,7 @@ def _validate_regular_patch_ports(bm, summary, topology, stats):
         | set(stats.get("regular_patch_skipped_degenerate_edge_indices", []))
     )
     unexpected = sorted(remaining_original_indices - allowed_indices)
-    ports = _ordered_edge_chains(remaining_edges)
+    ports = ordered_edge_chains(remaining_edges)
     port_records = []
     for port_index, port in enumerate(ports):
         center = (
@@ -4498,12 +4748,13 @@ def _validate_regular_patch_ports(bm, summary, topology, stats):
 
 # 折叠 zipper 在 Boolean 重合端点留下的近零面积三角小环，不跨越正常 Junction。
 # bm/radius/stats: 当前 BMesh、Chamfer radius 与统计。
+@profiled("strip_port_cleanup")
 def _clean_degenerate_strip_ports(bm, radius, stats):
     collapsed = []
     while True:
         boundary_edges = {edge for edge in bm.edges if len(edge.link_faces) == 1}
         candidates = []
-        for chain in _ordered_edge_chains(boundary_edges):
+        for chain in ordered_edge_chains(boundary_edges):
             if not chain["is_cyclic"] or len(chain["edges"]) != 3:
                 continue
             center = sum((vertex.co for vertex in chain["vertices"]), Vector()) / 3.0
@@ -4535,6 +4786,7 @@ def _clean_degenerate_strip_ports(bm, radius, stats):
 
 # 仅填充 regular strips 后形成的局部 simple cyclic holes；拒绝开放或分支 Boundary。
 # bm/ports/stats: 当前 BMesh、Phase 3 local ports 与机器统计；返回新 Junction Faces。
+@profiled("junction_patch")
 def _patch_local_junction_ports(bm, ports, stats):
     open_ports = [port for port in ports if not port["is_cyclic"]]
     if open_ports:
@@ -4591,6 +4843,7 @@ def _patch_local_junction_ports(bm, ports, stats):
 
 # 删除 Patch 后沿 Boundary 重叠产生的多余非 original Faces，暴露单一待补 loop。
 # bm/stats: 当前 BMesh 与统计；返回删除的 Face 数。
+@profiled("overconnected_face_cleanup")
 def _remove_overconnected_patch_faces(bm, stats):
     original_layer = bm.faces.layers.int.get(ORIGINAL_FACE_ATTRIBUTE)
     removed_faces = set()
@@ -4619,6 +4872,7 @@ def _remove_overconnected_patch_faces(bm, stats):
     return len(removed_faces)
 
 
+@profiled("patch")
 def _patch_boundaries(
     bm,
     loops,
@@ -4705,11 +4959,12 @@ def _patch_boundaries(
             stats,
         )
         chamfer_faces = set(regular_faces + junction_faces)
-        bmesh.ops.dissolve_degenerate(
-            bm,
-            dist=max(radius * 1.0e-6, 1.0e-9),
-            edges=list(bm.edges),
-        )
+        with profile_span("dissolve_degenerate", bm):
+            bmesh.ops.dissolve_degenerate(
+                bm,
+                dist=max(radius * 1.0e-6, 1.0e-9),
+                edges=list(bm.edges),
+            )
         stats["_chamfer_faces"] = chamfer_faces
         stats["regular_patch_face_count"] = len(chamfer_faces)
         stats["junction_patch_face_count"] = 0
@@ -4790,6 +5045,7 @@ def _dissolve_chamfer_faces(bm, chamfer_faces, radius):
 
 # 在最终 Mesh 上创建 FACE Boolean attribute，标记自动补出的 chamfer 区域。
 # output: 最终输出 Object；chamfer_face_indices: BMesh 写回后对应的 polygon indices。
+@profiled("chamfer_attribute")
 def _mark_chamfer_attribute(output, chamfer_face_indices):
     attribute = output.data.attributes.get(CHAMFER_FACE_ATTRIBUTE)
     if attribute is not None:
@@ -4807,6 +5063,7 @@ def _mark_chamfer_attribute(output, chamfer_face_indices):
 
 # 按 Bevel & Transfer Normal 的既有方式从 source 传递 custom normals，修正输出 shading。
 # output: PATCHED 输出；source_object: 原始 Mesh。
+@profiled("normal_transfer")
 def _add_source_normal_transfer(output, source_object):
     modifier = output.modifiers.get(NORMAL_TRANSFER_MODIFIER)
     if modifier is None:
@@ -4820,6 +5077,166 @@ def _add_source_normal_transfer(output, source_object):
 
 # 构建 Sharp FeatureGraph、多独立 Pipe、Collection Difference、Regular/Junction Patch。
 # 参数与 Operator interface 一一对应；返回 handoff 规定的机器可读 dict。
+# Redo 面板每次调参都会 Undo 后重跑；Stage Cache 只保存不引用 Blender ID 的数据
+# （groups 深拷贝、独立 BMesh 副本、BVHTree），Undo 替换数据块后仍然有效。
+# 键按阶段逐级扩展：feature_graph → pipes(+pipe_resolution) → boolean，上游参数变化只使下游失效。
+_STAGE_CACHE_MAX_ENTRIES = 4
+_STAGE_CACHE: dict[str, OrderedDict] = {
+    "feature_graph": OrderedDict(),
+    "pipes": OrderedDict(),
+    "boolean": OrderedDict(),
+}
+
+
+# 读取阶段缓存并刷新 LRU 顺序；未命中返回 None。
+# stage/key: 阶段名与阶段键。
+def _stage_cache_get(stage, key):
+    cache = _STAGE_CACHE[stage]
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+# 写入阶段缓存并淘汰最久未用的条目。
+# stage/key/value: 阶段名、阶段键与缓存值。
+def _stage_cache_put(stage, key, value):
+    cache = _STAGE_CACHE[stage]
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _STAGE_CACHE_MAX_ENTRIES:
+        _, evicted = cache.popitem(last=False)
+        for bm in evicted.get("bmeshes", ()):
+            bm.free()
+
+
+# 清空全部 Pipe Chamfer Stage Cache 并释放缓存的 BMesh；测试或排查缓存问题时使用。
+def clear_pipe_chamfer_stage_cache():
+    for cache in _STAGE_CACHE.values():
+        for entry in cache.values():
+            for bm in entry.get("bmeshes", ()):
+                bm.free()
+        cache.clear()
+
+
+# 返回阶段执行后新增或改变的 stats 字段，命中缓存时原样回放；timings 不回放。
+# before/after: 阶段前的 stats 深拷贝与阶段后的 stats。
+def _stats_delta(before, after):
+    return {
+        key: copy.deepcopy(value)
+        for key, value in after.items()
+        if key != "timings" and (key not in before or before[key] != value)
+    }
+
+
+# 把独立 BMesh 副本还原为 Pipe Object，属性与 _build_pipe_mesh_curve 的输出一致。
+# source_object/collection: transform 来源与输出位置；cached_pipe: {"bmesh", "properties"}。
+def _restore_cached_pipe(source_object, cached_pipe, collection):
+    properties = cached_pipe["properties"]
+    pipe_mesh = bpy.data.meshes.new(f"{source_object.name}_Pipe_{properties[PIPE_ID_TAG]}_TEST")
+    cached_pipe["bmesh"].to_mesh(pipe_mesh)
+    pipe_mesh.update()
+    pipe = bpy.data.objects.new(pipe_mesh.name, pipe_mesh)
+    pipe.matrix_world = source_object.matrix_world.copy()
+    collection.objects.link(pipe)
+    for key, value in properties.items():
+        pipe[key] = value
+    pipe[OUTPUT_TAG] = source_object.name
+    return pipe
+
+
+# 生成或复用 Pipe Objects；pipes 阶段键 = feature 键 + pipe_resolution。
+# 返回 (pipes, overlap_index)；overlap_index 为 None 表示需要重新计算。
+@profiled("pipes")
+def _build_or_restore_pipes(source_object, groups, radius, pipe_resolution, collection, stage_key, stats):
+    cached = _stage_cache_get("pipes", stage_key)
+    if cached is not None:
+        stats["stage_cache"]["pipes"] = "HIT"
+        pipes = [
+            _restore_cached_pipe(source_object, cached_pipe, collection)
+            for cached_pipe in cached["pipes"]
+        ]
+        return pipes, cached["overlap_index"]
+
+    stats["stage_cache"]["pipes"] = "MISS"
+    pipes = [
+        _build_pipe_mesh(source_object, group, radius, pipe_resolution, collection)
+        for group in groups
+    ]
+    cached_pipes = []
+    for pipe in pipes:
+        bm = bmesh.new()
+        bm.from_mesh(pipe.data)
+        cached_pipes.append(
+            {
+                "bmesh": bm,
+                "properties": {key: pipe[key] for key in pipe.keys()},
+            }
+        )
+    overlap_index = _pipe_overlap_index(pipes, stats["timings"])
+    _stage_cache_put(
+        "pipes",
+        stage_key,
+        {
+            "pipes": cached_pipes,
+            "overlap_index": overlap_index,
+            "bmeshes": [cached_pipe["bmesh"] for cached_pipe in cached_pipes],
+        },
+    )
+    return pipes, overlap_index
+
+
+# 返回 _assign_difference_materials 之后 output 应有的 material 槽名称。
+# output: 尚未追加 marker 的 source duplicate。
+def _expected_difference_material_names(output):
+    names = [
+        material.name if material is not None else None
+        for material in output.data.materials
+    ]
+    return (names or [BASE_MATERIAL_NAME]) + [MARKER_MATERIAL_NAME]
+
+
+# 应用或复用 EXACT Difference 结果；boolean 阶段键与 pipes 阶段相同，另需 material 槽一致。
+# output/cutter_collection/source_object: Boolean 上下文；返回 marker material index。
+@profiled("boolean_apply")
+def _apply_or_restore_difference(output, cutter_collection, source_object, stage_key, stats):
+    cached = _stage_cache_get("boolean", stage_key)
+    if cached is not None and cached["material_names"] == _expected_difference_material_names(output):
+        stats["stage_cache"]["boolean"] = "HIT"
+        marker_index = _assign_difference_materials(output, cutter_collection)
+        cached["bmesh"].to_mesh(output.data)
+        output.data.update()
+        return marker_index
+
+    stats["stage_cache"]["boolean"] = "MISS"
+    material_names = _expected_difference_material_names(output)
+    marker_index = _apply_difference(
+        output,
+        cutter_collection,
+        _source_face_patch_ids(source_object),
+    )
+    bm = bmesh.new()
+    bm.from_mesh(output.data)
+    _stage_cache_put(
+        "boolean",
+        stage_key,
+        {
+            "bmesh": bm,
+            "material_names": material_names,
+            "bmeshes": [bm],
+        },
+    )
+    return marker_index
+
+
+# 返回自上一顶层阶段结束以来的耗时；带 "." 的子阶段键与计数不参与累加。
+# stats/started_at: 当前统计与整次运行的起始时间。
+def _elapsed_since_previous_stage(stats, started_at):
+    return time.perf_counter() - started_at - sum(
+        value for key, value in stats["timings"].items() if "." not in key
+    )
+
+
 def _build_pipe_chamfer_impl(
     source_object,
     radius,
@@ -4857,33 +5274,64 @@ def _build_pipe_chamfer_impl(
     if source_risks["non_manifold"]:
         _fail("source_not_closed_manifold", "Source Mesh must be closed manifold", stats)
 
-    if feature_graph_contract == "GN_PREVIEW_V1":
-        groups = _build_preview_feature_graph(source_object, radius, stats)
-    elif feature_graph_contract == "EXPERIMENTAL":
-        stats["feature_graph_contract"] = "EXPERIMENTAL"
-        groups = _build_feature_graph(
-            source_object,
-            chain_turn_threshold_degrees,
-            chain_turn_spike_ratio,
-            stats,
-        )
+    stats["stage_cache"] = {}
+    # GN Preview 合同固定 turn 参数，只有 radius 影响 FeatureGraph 与端点分类。
+    feature_key = (
+        compute_mesh_data_digest(source_object.data),
+        feature_graph_contract,
+        radius,
+        None if feature_graph_contract == "GN_PREVIEW_V1" else chain_turn_threshold_degrees,
+        None if feature_graph_contract == "GN_PREVIEW_V1" else chain_turn_spike_ratio,
+    )
+    cached_feature_graph = _stage_cache_get("feature_graph", feature_key)
+    if cached_feature_graph is not None:
+        stats["stage_cache"]["feature_graph"] = "HIT"
+        groups = copy.deepcopy(cached_feature_graph["groups"])
+        stats.update(copy.deepcopy(cached_feature_graph["stats"]))
     else:
-        _fail(
-            "invalid_context",
-            f"Unsupported FeatureGraph contract: {feature_graph_contract}",
-            stats,
+        stats["stage_cache"]["feature_graph"] = "MISS"
+        stats_before = copy.deepcopy(stats)
+        if feature_graph_contract == "GN_PREVIEW_V1":
+            groups = _build_preview_feature_graph(source_object, radius, stats)
+        elif feature_graph_contract == "EXPERIMENTAL":
+            stats["feature_graph_contract"] = "EXPERIMENTAL"
+            groups = _build_feature_graph(
+                source_object,
+                chain_turn_threshold_degrees,
+                chain_turn_spike_ratio,
+                stats,
+            )
+        else:
+            _fail(
+                "invalid_context",
+                f"Unsupported FeatureGraph contract: {feature_graph_contract}",
+                stats,
+            )
+        _classify_pipe_endpoints(source_object, groups, radius)
+        _stage_cache_put(
+            "feature_graph",
+            feature_key,
+            {
+                "groups": copy.deepcopy(groups),
+                "stats": _stats_delta(stats_before, stats),
+            },
         )
     stats["timings"]["feature_graph"] = time.perf_counter() - started_at
-    _classify_pipe_endpoints(source_object, groups, radius)
     collection = _get_collection()
     if debug_stage == "FEATURE_GRAPH":
         stats["status"] = "finished"
         return stats
 
-    pipes = [
-        _build_pipe_mesh(source_object, group, radius, pipe_resolution, collection)
-        for group in groups
-    ]
+    pipe_key = feature_key + (pipe_resolution,)
+    pipes, overlap_index = _build_or_restore_pipes(
+        source_object,
+        groups,
+        radius,
+        pipe_resolution,
+        collection,
+        pipe_key,
+        stats,
+    )
     pipes_by_id = {int(pipe[PIPE_ID_TAG]): pipe for pipe in pipes}
     for strand_record in stats["cutter_strands"]:
         pipe = pipes_by_id[strand_record["strand_id"]]
@@ -4902,7 +5350,7 @@ def _build_pipe_chamfer_impl(
             "vertex_count": len(pipe.data.vertices),
             "face_count": len(pipe.data.polygons),
         }
-    stats["timings"]["pipe_build"] = time.perf_counter() - started_at - sum(stats["timings"].values())
+    stats["timings"]["pipe_build"] = _elapsed_since_previous_stage(stats, started_at)
     stats["debug_object_names"] = [pipe.name for pipe in pipes]
     stats["pipe_endpoint_extensions"] = [
         {
@@ -4939,8 +5387,13 @@ def _build_pipe_chamfer_impl(
         stats["status"] = "finished"
         return stats
 
-    cutter_collection, pipe_trees, pipe_bounds = _build_cutter_set(pipes, source_object, stats)
-    stats["timings"]["cutter_pack"] = time.perf_counter() - started_at - sum(stats["timings"].values())
+    cutter_collection, pipe_trees, pipe_bounds = _build_cutter_set(
+        pipes,
+        source_object,
+        stats,
+        overlap_index=overlap_index,
+    )
+    stats["timings"]["cutter_pack"] = _elapsed_since_previous_stage(stats, started_at)
     if debug_stage == "CUTTER_UNION":
         if not preserve_source_visibility:
             _hide_source_object(source_object, stats)
@@ -4968,12 +5421,14 @@ def _build_pipe_chamfer_impl(
         _activate_object(output)
         return stats
 
-    marker_index = _apply_difference(
+    marker_index = _apply_or_restore_difference(
         output,
         cutter_collection,
-        _source_face_patch_ids(source_object),
+        source_object,
+        pipe_key,
+        stats,
     )
-    stats["timings"]["boolean_apply"] = time.perf_counter() - started_at - sum(stats["timings"].values())
+    stats["timings"]["boolean_apply"] = _elapsed_since_previous_stage(stats, started_at)
     cutter_face_indices = _groove_face_indices(output, stats)
     stats["cutter_face_count"] = len(cutter_face_indices)
     if not cutter_face_indices:
@@ -5128,6 +5583,9 @@ def _build_pipe_chamfer_impl(
             radius,
         )
     )
+    profile_count("boundary_edges", len(unique_boundary_edge_indices))
+    profile_count("boolean_rail_pairs", len(boolean_rail_pairs))
+    profile_count("surface_offset_rail_pairs", len(surface_rail_pairs))
     stats["boolean_rail_pairs"] = boolean_rail_pairs
     stats["boundary_rail_topology"] = boundary_rail_topology
     stats["surface_offset_rail_pairs"] = surface_rail_pairs
@@ -5348,20 +5806,26 @@ def build_pipe_chamfer(
         if collection.name.startswith(f"{source_object.name}{CUTTER_COLLECTION_SUFFIX}")
     }
     source_was_hidden = source_object.hide_get()
+    # 外层（如 GN Finalize）已开启 profiling 时只嵌套 span，由外层负责汇总与写日志。
+    owns_profile = active_profiler() is None
+    profiler = None
     try:
-        stats = _build_pipe_chamfer_impl(
-            source_object=source_object,
-            radius=radius,
-            pipe_resolution=pipe_resolution,
-            chain_turn_threshold_degrees=chain_turn_threshold_degrees,
-            chain_turn_spike_ratio=chain_turn_spike_ratio,
-            junction_margin=junction_margin,
-            debug_stage=debug_stage,
-            keep_debug_objects=keep_debug_objects,
-            feature_graph_contract=feature_graph_contract,
-            preserve_source_visibility=preserve_source_visibility,
-        )
-    except Exception:
+        with profiling_session("pipe_chamfer") as profiler:
+            stats = _build_pipe_chamfer_impl(
+                source_object=source_object,
+                radius=radius,
+                pipe_resolution=pipe_resolution,
+                chain_turn_threshold_degrees=chain_turn_threshold_degrees,
+                chain_turn_spike_ratio=chain_turn_spike_ratio,
+                junction_margin=junction_margin,
+                debug_stage=debug_stage,
+                keep_debug_objects=keep_debug_objects,
+                feature_graph_contract=feature_graph_contract,
+                preserve_source_visibility=preserve_source_visibility,
+            )
+    except Exception as error:
+        if owns_profile and profiler is not None and isinstance(error, PipeChamferError):
+            error.stats["profile"] = profiler.summary()
         source_object.hide_set(source_was_hidden)
         for obj in list(bpy.data.objects):
             if obj not in previous_objects:
@@ -5398,4 +5862,6 @@ def build_pipe_chamfer(
         cutter_collection.name = f"{source_object.name}{CUTTER_COLLECTION_SUFFIX}"
         stats["cutter_collection_name"] = cutter_collection.name
     bpy.context.view_layer.update()
+    if owns_profile:
+        stats["profile"] = profiler.summary()
     return stats
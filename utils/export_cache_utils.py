@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""增量导出缓存：按 Collection 记录导出内容哈希，未变化且文件完好时跳过导出。"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+import bpy
+
+from ..const import TRIANGULAR_MODIFIER
+from .mesh_fingerprint_utils import compute_mesh_data_digest
+
+EXPORT_CACHE_NAME = "hst_export_cache.json"
+EXPORT_CACHE_VERSION = 2
+
+# 纯 UI / 运行时状态，不影响导出结果。
+_MODIFIER_IGNORED_PROPERTIES = {"rna_type", "show_expanded", "is_active", "is_override_data"}
+_NODE_IGNORED_PROPERTIES = {
+    "rna_type", "name", "label", "location", "location_absolute", "width", "height",
+    "select", "hide", "mute", "show_options", "show_preview", "show_texture",
+    "use_custom_color", "color", "color_tag", "parent", "warning_propagation",
+}
+# 可以转换为 Mesh 的 Object 类型，引用时按评估后的几何内容签名。
+_MESH_CONVERTIBLE_TYPES = {"MESH", "CURVE", "SURFACE", "FONT", "META", "CURVES"}
+
+
+# 把 RNA / IDProperty 值转换为稳定的 JSON 友好值；ID 引用按内容签名（见 _id_signature）。
+# value: 任意 RNA 属性值；references: 本次哈希共享的 ID 签名记忆表；返回 JSON 可序列化对象。
+def _signature_value(value, references=None):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bpy.types.ID):
+        return _id_signature(value, {} if references is None else references)
+    if isinstance(value, (set, frozenset)):
+        return sorted(_signature_value(item, references) for item in value)
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    try:
+        return [_signature_value(item, references) for item in value]
+    except TypeError:
+        return repr(value)
+
+
+# 被 modifier / 节点引用的 ID 签名：只记名称时，改动 Boolean cutter、Data Transfer proxy 或节点组内容
+# 而不改名会让哈希不变，增量导出误判为未变化。这里按内容签名：
+# Object 记录 matrix_world 与评估后几何摘要，NodeTree 记录节点、连线与输入值，Collection 递归其对象。
+# references 以 pointer 记忆已签名的 ID，同时打断循环引用。
+def _id_signature(id_data, references):
+    key = id_data.as_pointer()
+    if key in references:
+        return references[key]
+    # 先占位，循环引用时退化为名称。
+    references[key] = {"id": id_data.name_full}
+    if isinstance(id_data, bpy.types.Object):
+        signature = _object_reference_signature(id_data, references)
+    elif isinstance(id_data, bpy.types.NodeTree):
+        signature = _node_tree_signature(id_data, references)
+    elif isinstance(id_data, bpy.types.Collection):
+        signature = {
+            "id": id_data.name_full,
+            "objects": [
+                _id_signature(obj, references)
+                for obj in sorted(id_data.all_objects, key=lambda item: item.name_full)
+            ],
+        }
+    elif isinstance(id_data, bpy.types.Image):
+        signature = {"id": id_data.name_full, "filepath": id_data.filepath}
+    else:
+        signature = {"id": id_data.name_full}
+    references[key] = signature
+    return signature
+
+
+# 被引用 Object 的签名：matrix_world + 评估后（含其自身 modifier）的 Mesh 数据摘要。
+def _object_reference_signature(obj, references):
+    signature = {
+        "id": obj.name_full,
+        "type": obj.type,
+        "matrix_world": [list(row) for row in obj.matrix_world],
+    }
+    if obj.type in _MESH_CONVERTIBLE_TYPES:
+        evaluated_object = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        try:
+            evaluated_mesh = evaluated_object.to_mesh()
+        except RuntimeError:
+            evaluated_mesh = None
+        if evaluated_mesh is not None:
+            signature["mesh"] = compute_mesh_data_digest(evaluated_mesh)
+            evaluated_object.to_mesh_clear()
+    elif obj.instance_collection is not None:
+        signature["instance_collection"] = _id_signature(obj.instance_collection, references)
+    return signature
+
+
+# NodeTree 签名：节点类型、可写属性、未连接输入的默认值、连线；节点组经 node_tree 属性递归展开。
+def _node_tree_signature(node_tree, references):
+    nodes = []
+    for node in sorted(node_tree.nodes, key=lambda item: item.name):
+        properties = {}
+        for rna_property in node.bl_rna.properties:
+            identifier = rna_property.identifier
+            if (
+                identifier in _NODE_IGNORED_PROPERTIES
+                or identifier.startswith("show_")
+                or rna_property.is_readonly
+                or rna_property.type == "COLLECTION"
+            ):
+                continue
+            properties[identifier] = _signature_value(getattr(node, identifier), references)
+        inputs = {}
+        for index, socket in enumerate(node.inputs):
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            inputs[f"{index}:{socket.identifier}"] = _signature_value(socket.default_value, references)
+        nodes.append({"name": node.name, "type": node.bl_idname, "properties": properties, "inputs": inputs})
+    links = sorted(
+        [
+            link.from_node.name,
+            link.from_socket.identifier,
+            link.to_node.name,
+            link.to_socket.identifier,
+            link.is_muted,
+        ]
+        for link in node_tree.links
+    )
+    interface = []
+    if hasattr(node_tree, "interface"):
+        for item in node_tree.interface.items_tree:
+            if getattr(item, "item_type", None) != "SOCKET":
+                continue
+            interface.append(
+                [
+                    item.in_out,
+                    item.identifier,
+                    item.socket_type,
+                    _signature_value(getattr(item, "default_value", None), references),
+                ]
+            )
+    return {"id": node_tree.name_full, "nodes": nodes, "links": links, "interface": interface}
+
+
+# 生成 modifier stack 签名：类型、名称与全部可写 RNA 属性，Geometry Nodes 额外记录输入 IDProperty。
+# 引用的 Object / NodeTree 等按内容签名，cutter、proxy 或节点组改动后哈希随之变化。
+# 导出器自动添加的 Triangulate modifier 参数固定，视为导出设置而非内容，不参与签名。
+# obj: 目标 Object；references: 可选的 ID 签名记忆表；返回列表。
+def modifier_stack_signature(obj, references=None):
+    references = {} if references is None else references
+    signature = []
+    for modifier in obj.modifiers:
+        if modifier.type == "TRIANGULATE" and modifier.name == TRIANGULAR_MODIFIER:
+            continue
+        properties = {}
+        for rna_property in modifier.bl_rna.properties:
+            identifier = rna_property.identifier
+            if (
+                identifier in _MODIFIER_IGNORED_PROPERTIES
+                or rna_property.is_readonly
+                or rna_property.type == "COLLECTION"
+            ):
+                continue
+            properties[identifier] = _signature_value(getattr(modifier, identifier), references)
+        if modifier.type == "NODES":
+            properties["inputs"] = {
+                key: _signature_value(modifier[key], references) for key in modifier.keys()
+            }
+        signature.append({"type": modifier.type, "properties": properties})
+    return signature
+
+
+# 生成材质签名：slot link、材质名、基础颜色参数与贴图路径。
+# obj: 目标 Object；返回列表。
+def material_signature(obj):
+    signature = []
+    for slot in obj.material_slots:
+        material = slot.material
+        if material is None:
+            signature.append({"link": slot.link, "material": None})
+            continue
+        image_paths = []
+        if material.use_nodes and material.node_tree is not None:
+            image_paths = sorted(
+                node.image.filepath
+                for node in material.node_tree.nodes
+                if node.type == "TEX_IMAGE" and node.image is not None
+            )
+        signature.append(
+            {
+                "link": slot.link,
+                "material": material.name_full,
+                "diffuse_color": list(material.diffuse_color),
+                "metallic": material.metallic,
+                "roughness": material.roughness,
+                "images": image_paths,
+            }
+        )
+    return signature
+
+
+# 计算 Collection 的导出内容哈希，应在导出时的场景状态（origin 已移到世界原点）下调用。
+# collection: 待导出 Collection；file_path: 导出路径；exporter_settings: 导出器参数 dict。
+# 返回十六进制 SHA-256。
+def collection_export_hash(collection, file_path, exporter_settings):
+    mesh_digests = {}
+    references = {}
+    objects = []
+    for obj in sorted(collection.all_objects, key=lambda item: item.name_full):
+        entry = {
+            "name": obj.name_full,
+            "type": obj.type,
+            "parent": obj.parent.name_full if obj.parent is not None else None,
+            "matrix_world": [list(row) for row in obj.matrix_world],
+            "modifiers": modifier_stack_signature(obj, references),
+            "materials": material_signature(obj),
+        }
+        if obj.type == "MESH" and obj.data is not None:
+            mesh_key = obj.data.as_pointer()
+            if mesh_key not in mesh_digests:
+                mesh_digests[mesh_key] = compute_mesh_data_digest(obj.data)
+            entry["mesh"] = mesh_digests[mesh_key]
+        elif obj.instance_collection is not None:
+            entry["instance_collection"] = obj.instance_collection.name_full
+        objects.append(entry)
+
+    payload = {
+        "file_path": file_path,
+        "exporter_settings": {
+            key: _signature_value(value, references) for key, value in exporter_settings.items()
+        },
+        "objects": objects,
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+# 读取导出目录中的缓存；缺失、损坏或版本不符时返回空缓存。
+# export_path: 导出目录；返回缓存 dict。
+def load_export_cache(export_path):
+    cache_path = Path(export_path) / EXPORT_CACHE_NAME
+    empty_cache = {"version": EXPORT_CACHE_VERSION, "collections": {}}
+    if not cache_path.exists():
+        return empty_cache
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as error:
+        print(f"ignore unreadable export cache {cache_path}: {error}")
+        return empty_cache
+    if cache.get("version") != EXPORT_CACHE_VERSION or not isinstance(cache.get("collections"), dict):
+        return empty_cache
+    return cache
+
+
+# 判断 Collection 是否可跳过：哈希一致，且上次写出的文件仍存在、字节数未被外部改动。
+# cache: load_export_cache 结果；collection_name/file_path/content_hash: 本次导出信息。
+def is_export_current(cache, collection_name, file_path, content_hash):
+    entry = cache["collections"].get(collection_name)
+    if entry is None or entry.get("hash") != content_hash or entry.get("file_path") != file_path:
+        return False
+    exported_file = Path(file_path)
+    return exported_file.exists() and exported_file.stat().st_size == entry.get("bytes")
+
+
+# 记录一个已写出的 Collection。
+# cache: 缓存 dict；collection_name/file_path/content_hash: 导出信息。
+def record_export(cache, collection_name, file_path, content_hash):
+    cache["collections"][collection_name] = {
+        "file_path": file_path,
+        "hash": content_hash,
+        "bytes": Path(file_path).stat().st_size,
+        "exported_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+    }
+
+
+# 写回缓存，并记录本次运行写出 / 跳过的 Collection。
+# export_path: 导出目录；cache: 缓存 dict；written/skipped: Collection 名称列表；返回缓存路径。
+def save_export_cache(export_path, cache, written, skipped):
+    cache_path = Path(export_path) / EXPORT_CACHE_NAME
+    cache["last_run"] = {
+        "time": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "written": written,
+        "skipped": skipped,
+    }
+    cache_path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    return cache_path
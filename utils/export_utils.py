@@ -6,10 +6,59 @@
 包含 FBX 导出和相关功能。
 """
 
+from contextlib import contextmanager
+
 import bpy
 from ..const import HST_PROP
 
 
+@contextmanager
+def export_selection_context(objects, active_object=None, sync_object_selection=False):
+    """
+    以 context override 向导出器提供显式的对象集合，不执行 select_all，不改动场景选择。
+
+    FBX 导出器通过 context.selected_objects 读取 use_selection 的对象，override 即可生效；
+    glTF 导出器逐个调用 Object.select_get() 过滤，需要 sync_object_selection=True：
+    只在导出期间把当前已选对象与导出对象的选择状态临时替换，退出时恢复，
+    开销与已选对象数 + 导出对象数成正比，而不是场景对象数。
+
+    Args:
+        objects: 要导出的对象列表
+        active_object: override 中的 active object，默认取 objects 的第一个
+        sync_object_selection: 导出器依赖 select_get() 时为 True
+    """
+    objects = list(objects)
+    if active_object is None and objects:
+        active_object = objects[0]
+
+    previous_selection = []
+    if sync_object_selection:
+        export_set = set(objects)
+        previous_selection = list(bpy.context.view_layer.objects.selected)
+        for obj in previous_selection:
+            if obj not in export_set:
+                obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+
+    try:
+        with bpy.context.temp_override(
+            selected_objects=objects,
+            selected_editable_objects=objects,
+            active_object=active_object,
+            object=active_object,
+        ):
+            yield
+    finally:
+        if sync_object_selection:
+            previous_set = set(previous_selection)
+            for obj in objects:
+                if obj not in previous_set:
+                    obj.select_set(False)
+            for obj in previous_selection:
+                obj.select_set(True)
+
+
 def filter_static_meshes(collection):
     """
     筛选 collection 中的 mesh
@@ -107,12 +156,6 @@ class FBXExport:
             file_path: 导出路径
             reset_transform: 是否重置变换
         """
-        # 保存当前选择
-        original_selection = bpy.context.selected_objects.copy()
-        original_active = bpy.context.active_object
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        
         # 获取要导出的对象
         objects_to_export = []
         if hasattr(target, 'all_objects'):
@@ -120,30 +163,19 @@ class FBXExport:
         else:
             objects_to_export = [target] if target.type == 'MESH' else []
         
-        for obj in objects_to_export:
-            obj.select_set(True)
-        
         if objects_to_export:
-            bpy.context.view_layer.objects.active = objects_to_export[0]
-            
-            bpy.ops.export_scene.fbx(
-                filepath=file_path,
-                use_selection=True,
-                object_types={'MESH'},
-                mesh_smooth_type='FACE',
-                use_mesh_modifiers=True,
-                use_triangles=False,
-                axis_forward='-Y',
-                axis_up='Z',
-                colors_type='LINEAR',
-            )
-        
-        # 恢复选择
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            obj.select_set(True)
-        if original_active:
-            bpy.context.view_layer.objects.active = original_active
+            with export_selection_context(objects_to_export):
+                bpy.ops.export_scene.fbx(
+                    filepath=file_path,
+                    use_selection=True,
+                    object_types={'MESH'},
+                    mesh_smooth_type='FACE',
+                    use_mesh_modifiers=True,
+                    use_triangles=False,
+                    axis_forward='-Y',
+                    axis_up='Z',
+                    colors_type='LINEAR',
+                )
 
     @staticmethod
     def staticmesh(target, file_path: str, reset_transform: bool = False):
@@ -155,12 +187,6 @@ class FBXExport:
             file_path: 导出路径
             reset_transform: 是否重置变换
         """
-        # 保存当前选择
-        original_selection = bpy.context.selected_objects.copy()
-        original_active = bpy.context.active_object
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        
         # 获取要导出的对象
         objects_to_export = []
         if hasattr(target, 'all_objects'):
@@ -168,30 +194,19 @@ class FBXExport:
         else:
             objects_to_export = [target]
         
-        for obj in objects_to_export:
-            obj.select_set(True)
-        
         if objects_to_export:
-            bpy.context.view_layer.objects.active = objects_to_export[0]
-            
-            bpy.ops.export_scene.fbx(
-                filepath=file_path,
-                use_selection=True,
-                object_types={'MESH', 'EMPTY'},
-                mesh_smooth_type='FACE',
-                use_mesh_modifiers=True,
-                use_triangles=False,
-                axis_forward='-Y',
-                axis_up='Z',
-                colors_type='LINEAR',
-            )
-        
-        # 恢复选择
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            obj.select_set(True)
-        if original_active:
-            bpy.context.view_layer.objects.active = original_active
+            with export_selection_context(objects_to_export):
+                bpy.ops.export_scene.fbx(
+                    filepath=file_path,
+                    use_selection=True,
+                    object_types={'MESH', 'EMPTY'},
+                    mesh_smooth_type='FACE',
+                    use_mesh_modifiers=True,
+                    use_triangles=False,
+                    axis_forward='-Y',
+                    axis_up='Z',
+                    colors_type='LINEAR',
+                )
 
     @staticmethod
     def skeletal(target, file_path: str, armature_as_root: bool = False):
@@ -203,12 +218,6 @@ class FBXExport:
             file_path: 导出路径
             armature_as_root: 是否使用 Armature 作为根骨骼
         """
-        # 保存当前选择
-        original_selection = bpy.context.selected_objects.copy()
-        original_active = bpy.context.active_object
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        
         # 获取要导出的对象
         objects_to_export = []
         armature = None
@@ -229,29 +238,18 @@ class FBXExport:
                     if child.type == 'MESH':
                         objects_to_export.append(child)
         
-        for obj in objects_to_export:
-            obj.select_set(True)
-        
         if objects_to_export and armature:
-            bpy.context.view_layer.objects.active = armature
-            
-            bpy.ops.export_scene.fbx(
-                filepath=file_path,
-                use_selection=True,
-                object_types={'ARMATURE', 'MESH'},
-                mesh_smooth_type='FACE',
-                use_mesh_modifiers=True,
-                add_leaf_bones=False,
-                primary_bone_axis='Y',
-                secondary_bone_axis='X',
-                axis_forward='-Y',
-                axis_up='Z',
-                armature_nodetype='NULL' if armature_as_root else 'ROOT',
-            )
-        
-        # 恢复选择
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            obj.select_set(True)
-        if original_active:
-            bpy.context.view_layer.objects.active = original_active
+            with export_selection_context(objects_to_export, active_object=armature):
+                bpy.ops.export_scene.fbx(
+                    filepath=file_path,
+                    use_selection=True,
+                    object_types={'ARMATURE', 'MESH'},
+                    mesh_smooth_type='FACE',
+                    use_mesh_modifiers=True,
+                    add_leaf_bones=False,
+                    primary_bone_axis='Y',
+                    secondary_bone_axis='X',
+                    axis_forward='-Y',
+                    axis_up='Z',
+                    armature_nodetype='NULL' if armature_as_root else 'ROOT',
+                )
@@ -14,6 +14,7 @@ from ..const import FEATURE_CHAMFER_GN_FINGERPRINT_TAG
 from ..const import FEATURE_CHAMFER_GN_PARAMETERS_TAG
 from ..const import FEATURE_CHAMFER_ORIGINAL_FACE_ATTRIBUTE
 from ..const import FEATURE_CHAMFER_SOURCE_PATCH_ATTRIBUTE
+from .edge_chain_utils import edge_components
 from .experimental_pipe_chamfer_utils import _base_stats
 from .experimental_pipe_chamfer_utils import _build_feature_graph
 from .experimental_pipe_chamfer_utils import _classify_pipe_endpoints
@@ -23,6 +24,7 @@ from .feature_chamfer_gn_utils import live_preview_parameters
 from .feature_chamfer_gn_utils import owned_preview_modifier
 from .feature_chamfer_gn_utils import preview_state
 from .feature_chamfer_gn_utils import source_fingerprint
+from .profiling_utils import profiled
 
 
 ENDPOINT_CLASSES = {
@@ -188,6 +190,7 @@ def _validate_terminal_extension_geometry(
 
 # 在内部 source duplicate 上评估延长后的 SDF cutter，不改变用户可见 Preview 状态。
 # source_object/preview_modifier: 有效 Preview；feature_groups/endpoints: FeatureGraph metadata。
+@profiled("evaluate_cutter")
 def evaluate_feature_chamfer_cutter(
     source_object,
     preview_modifier,
@@ -310,6 +313,7 @@ def evaluate_feature_chamfer_cutter(
 
 # 复用 source Sharp FeatureGraph，生成与 SDF cutter 对应的 endpoint/region ownership metadata。
 # source_object: Preview source；radius: live GN Radius；返回 groups 与可序列化端点记录。
+@profiled("endpoint_context")
 def build_feature_chamfer_endpoint_context(source_object, radius):
     stats = _base_stats(source_object, radius, 8, 35.0, 3.0, 1.5, "FEATURE_GRAPH")
     groups = _build_feature_graph(source_object, 35.0, 3.0, stats)
@@ -404,6 +408,7 @@ def _mark_tracked_boolean_source(mesh, source_patch_ids):
 
 # 对 source duplicate 与 evaluated GN cutter 执行 Exact Difference，并保留 Face provenance。
 # source_object/cutter_mesh/source_patch_ids: 不可修改的 source、临时 cutter 与 Surface Patch IDs。
+@profiled("tracked_boolean")
 def tracked_boolean_difference(source_object, cutter_mesh, source_patch_ids):
     collection = source_object.users_collection[0]
     boolean_object = source_object.copy()
@@ -510,28 +515,12 @@ def tracked_boolean_difference(source_object, cutter_mesh, source_patch_ids):
 
 # 把 Boundary Edges 拆成按共享 Vertex 连通的组件，并读取两侧原面 Patch ownership。
 # bm/boundary_edges/patch_layer: 已删除 groove Faces 的 BMesh、Boundary Edge 集合与 Face Patch layer。
+@profiled("boundary_components")
 def _boundary_components(bm, boundary_edges, patch_layer):
-    remaining = set(boundary_edges)
     components = []
-    while remaining:
-        seed = min(remaining, key=lambda edge: edge.index)
-        component_edges = {seed}
-        component_vertices = set(seed.verts)
-        stack = [seed]
-        remaining.remove(seed)
-        while stack:
-            edge = stack.pop()
-            for vertex in edge.verts:
-                linked = [candidate for candidate in vertex.link_edges if candidate in remaining]
-                for candidate in linked:
-                    remaining.remove(candidate)
-                    component_edges.add(candidate)
-                    component_vertices.update(candidate.verts)
-                    stack.append(candidate)
-        degrees = {
-            vertex.index: sum(1 for edge in vertex.link_edges if edge in component_edges)
-            for vertex in component_vertices
-        }
+    for component in edge_components(boundary_edges):
+        component_edges = component["edges"]
+        degrees = component["vertex_degrees"]
         adjacent_patch_ids = sorted(
             {
                 int(face[patch_layer])
@@ -542,16 +531,16 @@ def _boundary_components(bm, boundary_edges, patch_layer):
         components.append(
             {
                 "edge_indices": sorted(edge.index for edge in component_edges),
-                "vertex_indices": sorted(vertex.index for vertex in component_vertices),
+                "vertex_indices": sorted(vertex.index for vertex in component["vertices"]),
                 "edge_count": len(component_edges),
-                "vertex_count": len(component_vertices),
-                "endpoint_count": sum(1 for degree in degrees.values() if degree == 1),
-                "branch_vertex_count": sum(1 for degree in degrees.values() if degree > 2),
-                "is_cyclic": bool(degrees) and all(degree == 2 for degree in degrees.values()),
+                "vertex_count": len(component["vertices"]),
+                "endpoint_count": sum(1 for degree in degrees if degree == 1),
+                "branch_vertex_count": sum(1 for degree in degrees if degree > 2),
+                "is_cyclic": bool(degrees) and all(degree == 2 for degree in degrees),
                 "adjacent_patch_ids": adjacent_patch_ids,
                 "_points": [
                     vertex.co.copy()
-                    for vertex in sorted(component_vertices, key=lambda item: item.index)
+                    for vertex in sorted(component["vertices"], key=lambda item: item.index)
                 ],
             }
         )
@@ -635,6 +624,7 @@ def _groups_form_junction_region(group_ids, group_by_id):
 
 # 根据明确的 Surface Patch pair 和 Feature endpoint metadata 给 Boundary components 分配 owner。
 # components/feature_groups/endpoints/radius: Boundary、FeatureGraph metadata 与当前 Radius。
+@profiled("boundary_regions")
 def _classify_boundary_regions(components, feature_groups, endpoints, radius):
     endpoint_by_group = {}
     for endpoint in endpoints:
@@ -717,6 +707,7 @@ def _classify_boundary_regions(components, feature_groups, endpoints, radius):
 
 # 删除 tracked Boolean groove Faces 并构建显式 Boundary region records。
 # boolean_mesh/groove_faces/feature_groups/endpoints: tracked Boolean 与 Feature ownership metadata。
+@profiled("tracked_boundary_regions")
 def build_tracked_boolean_boundary_regions(
     boolean_mesh,
     groove_faces,
@@ -787,6 +778,7 @@ def build_tracked_boolean_boundary_regions(
 
 # 提取 Phase 2B Finalize context；失败时释放临时 Mesh 并保持 source/Preview 不变。
 # source_object: 有效 Preview source；返回 cutter_mesh、FeatureGraph metadata 与诊断。
+@profiled("finalize_context")
 def extract_feature_chamfer_finalize_context(source_object):
     modifier = owned_preview_modifier(source_object)
     diagnostics = {
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 """Feature Chamfer Geometry Nodes 预览资产、状态与生命周期。"""
 
-import hashlib
 import json
 
 import bpy
+from bpy.app.handlers import persistent
 
 from ..const import FEATURE_CHAMFER_GN_ASSET_VERSION
 from ..const import FEATURE_CHAMFER_GN_ASSET_VERSION_TAG
@@ -29,6 +29,8 @@ from ..const import PRESET_FILE_PATH
 from .experimental_pipe_chamfer_utils import _base_stats
 from .experimental_pipe_chamfer_utils import _build_preview_feature_graph
 from .experimental_pipe_chamfer_utils import ensure_feature_chamfer_curve_pipe_asset
+from .mesh_fingerprint_utils import mesh_fingerprint
+from .profiling_utils import profiled
 
 
 PREVIEW_NONE = FEATURE_CHAMFER_PREVIEW_NONE
@@ -102,23 +104,10 @@ def ensure_feature_chamfer_preview_node_group():
 
 
 # 计算 source Mesh topology、位置和 Sharp Edge 的稳定指纹。
-# source_object: 单个 Mesh Object；返回 SHA-256 字符串。
-def source_fingerprint(source_object):
-    mesh = source_object.data
-    sharp_attribute = mesh.attributes.get("sharp_edge")
-    payload = {
-        "vertices": [tuple(round(value, 8) for value in vertex.co) for vertex in mesh.vertices],
-        "edges": [tuple(edge.vertices) for edge in mesh.edges],
-        "polygons": [tuple(polygon.vertices) for polygon in mesh.polygons],
-        "sharp_edges": [
-            edge.index
-            for edge in mesh.edges
-            if sharp_attribute is not None and bool(sharp_attribute.data[edge.index].value)
-        ],
-    }
-    return hashlib.sha256(
-        json.dumps(payload, separators=(",", ":")).encode("utf-8")
-    ).hexdigest()
+# source_object: 单个 Mesh Object；use_cache: 是否使用 depsgraph 代数记忆；返回 SHA-256 字符串。
+@profiled("source_fingerprint")
+def source_fingerprint(source_object, use_cache=False):
+    return mesh_fingerprint(source_object.data, use_cache=use_cache).digest
 
 
 # 查找本工具拥有且名称稳定的 Geometry Nodes modifier。
@@ -180,6 +169,7 @@ def _remove_preview_curve_object(curve_object):
 
 # 从 FeatureGraph 的有序 strands 重建一个由 Operator 管理的多 spline Curve。
 # source_object/radius: source Mesh 与 endpoint cap containment 的采样距离；返回 Curve 与 stats。
+@profiled("preview_curve")
 def _rebuild_owned_preview_curve(source_object, radius):
     stats = _base_stats(source_object, 0.0, 8, 35.0, 3.0, 1.5, "PREVIEW")
     groups = _build_preview_feature_graph(source_object, radius, stats)
@@ -207,6 +197,7 @@ def _rebuild_owned_preview_curve(source_object, radius):
 
 # 构建正式 Preview wrapper：复制受控资产，仅把 cutter seam 改为 Python Curve Pipe。
 # curve_object/radius/show_cutter: owned Curve、倒角半径与 cutter 显示开关。
+@profiled("preview_node_group")
 def _build_curve_preview_node_group(curve_object, radius, show_cutter):
     base_group = ensure_feature_chamfer_preview_node_group()
     curve_pipe_asset = ensure_feature_chamfer_curve_pipe_asset()
@@ -284,32 +275,176 @@ def live_preview_parameters(modifier):
     }
 
 
-# 读取当前 Preview 状态，并把 source 或资产不一致归类为 stale。
-# source_object: Preview 所属 Mesh；Modifier sockets 是 live 参数真源。
-def preview_state(source_object):
+# 计算当前 Preview 状态但不写回 source tags，可在 Panel draw 等禁止写 ID 的上下文中调用。
+# source_object: Preview 所属 Mesh；use_cache: 是否复用 Mesh 指纹记忆；返回状态字符串。
+def _evaluate_preview_state(source_object, use_cache=False):
     if source_object.get(FEATURE_CHAMFER_GN_STATE_TAG) == FEATURE_CHAMFER_PATCHED:
         return FEATURE_CHAMFER_PATCHED
     modifier = owned_preview_modifier(source_object)
     if modifier is None:
         return PREVIEW_NONE
     node_group = modifier.node_group
+    curve_object = owned_preview_curve(source_object)
+    fingerprint = source_fingerprint(source_object, use_cache=use_cache)
     stale = (
         node_group is None
         or node_group.get("hst_feature_chamfer_preview_backend") != CURVE_PREVIEW_BACKEND
         or node_group.get(FEATURE_CHAMFER_GN_ASSET_VERSION_TAG) != FEATURE_CHAMFER_GN_ASSET_VERSION
         or modifier.get(FEATURE_CHAMFER_GN_ASSET_VERSION_TAG) != FEATURE_CHAMFER_GN_ASSET_VERSION
-        or modifier.get(FEATURE_CHAMFER_GN_FINGERPRINT_TAG) != source_fingerprint(source_object)
+        or modifier.get(FEATURE_CHAMFER_GN_FINGERPRINT_TAG) != fingerprint
         or modifier.get(FEATURE_CHAMFER_GN_PARAMETERS_TAG)
         != json.dumps(live_preview_parameters(modifier), sort_keys=True)
-        or owned_preview_curve(source_object) is None
-        or owned_preview_curve(source_object).get(FEATURE_CHAMFER_CURVE_FINGERPRINT_TAG)
-        != source_fingerprint(source_object)
+        or curve_object is None
+        or curve_object.get(FEATURE_CHAMFER_CURVE_FINGERPRINT_TAG) != fingerprint
     )
-    state = PREVIEW_STALE if stale else PREVIEW_VALID
-    source_object[FEATURE_CHAMFER_GN_STATE_TAG] = state
+    return PREVIEW_STALE if stale else PREVIEW_VALID
+
+
+# 读取当前 Preview 状态，并把 source 或资产不一致归类为 stale。
+# source_object: Preview 所属 Mesh；Modifier sockets 是 live 参数真源。
+# use_cache: 是否复用 Mesh 指纹记忆；Operator 校验保持默认重新哈希。
+def preview_state(source_object, use_cache=False):
+    state = _evaluate_preview_state(source_object, use_cache=use_cache)
+    if state in {PREVIEW_VALID, PREVIEW_STALE}:
+        source_object[FEATURE_CHAMFER_GN_STATE_TAG] = state
     return state
 
 
+# source Object pointer -> (缓存键, Mesh pointer, 状态)；由 depsgraph / msgbus 事件逐个失效。
+_PREVIEW_STATE_CACHE: dict[int, tuple[tuple, int, str]] = {}
+_PREVIEW_STATE_STATS = {"hits": 0, "misses": 0}
+# msgbus 订阅 owner；文件加载会清空全部订阅，需要在 load_post 重新订阅。
+_MSGBUS_OWNER = object()
+
+
+# 组合只需 O(1) 读取的状态相关字段；Python 直接改写 tags 或替换 modifier / Curve 时键随之变化。
+# owned Curve 按解析后的 pointer 记录：删除 Object 不会出现在 depsgraph.updates 中，只能靠键变化发现。
+# source_object: Preview 所属 Mesh；返回可比较的 tuple。
+def _preview_state_cache_key(source_object):
+    modifier = source_object.modifiers.get(FEATURE_CHAMFER_GN_MODIFIER)
+    node_group = modifier.node_group if modifier is not None and modifier.type == "NODES" else None
+    curve_name = source_object.get(FEATURE_CHAMFER_CURVE_OBJECT_TAG)
+    curve_object = bpy.data.objects.get(curve_name) if curve_name else None
+    return (
+        source_object.data.as_pointer(),
+        source_object.get(FEATURE_CHAMFER_GN_STATE_TAG) == FEATURE_CHAMFER_PATCHED,
+        curve_name,
+        curve_object.as_pointer() if curve_object is not None else 0,
+        modifier.as_pointer() if modifier is not None else 0,
+        node_group.as_pointer() if node_group is not None else 0,
+        modifier.get(FEATURE_CHAMFER_GN_OWNER_TAG) if modifier is not None else None,
+        modifier.get(FEATURE_CHAMFER_GN_FINGERPRINT_TAG) if modifier is not None else None,
+        modifier.get(FEATURE_CHAMFER_GN_PARAMETERS_TAG) if modifier is not None else None,
+    )
+
+
+# 返回事件驱动缓存中的 Preview 状态；未失效时 O(1)，不写 source tags。
+# source_object: Preview 所属 Mesh；Panel 绘制与 AUTO 动作解析使用，Finalize 仍走 preview_state 完整校验。
+def tracked_preview_state(source_object):
+    pointer = source_object.as_pointer()
+    key = _preview_state_cache_key(source_object)
+    cached = _PREVIEW_STATE_CACHE.get(pointer)
+    if cached is not None and cached[0] == key:
+        _PREVIEW_STATE_STATS["hits"] += 1
+        return cached[2]
+    _PREVIEW_STATE_STATS["misses"] += 1
+    state = _evaluate_preview_state(source_object, use_cache=True)
+    _PREVIEW_STATE_CACHE[pointer] = (key, source_object.data.as_pointer(), state)
+    return state
+
+
+# 让单个 source 的缓存状态失效；直接修改 source 数据且未触发 depsgraph 的调用方可显式使用。
+# source_object: Preview 所属 Mesh；无返回值。
+def invalidate_preview_state(source_object):
+    _PREVIEW_STATE_CACHE.pop(source_object.as_pointer(), None)
+
+
+# 清空全部缓存状态。
+# 无参数；无返回值。
+def clear_preview_state_cache():
+    _PREVIEW_STATE_CACHE.clear()
+
+
+# 返回缓存命中统计副本，供测试与 benchmark 诊断。
+# 无参数；返回 {"hits", "misses", "entries"}。
+def preview_state_tracker_stats():
+    return {**_PREVIEW_STATE_STATS, "entries": len(_PREVIEW_STATE_CACHE)}
+
+
+# 按 Mesh pointer 失效所有引用该 Mesh 的 source。
+# mesh_pointer: bpy.types.Mesh.as_pointer()；无返回值。
+def _invalidate_mesh_sources(mesh_pointer):
+    for pointer in [
+        pointer for pointer, cached in _PREVIEW_STATE_CACHE.items() if cached[1] == mesh_pointer
+    ]:
+        del _PREVIEW_STATE_CACHE[pointer]
+
+
+# 根据 depsgraph 更新只失效真正变化的 source：几何/modifier 更新、Mesh 数据、owned Curve 与 Node Group。
+# 纯 transform 更新不影响指纹与参数，保留缓存。scene/depsgraph: Blender handler 参数。
+@persistent
+def _on_preview_depsgraph_update_post(scene, depsgraph):
+    del scene
+    if not _PREVIEW_STATE_CACHE:
+        return
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.NodeTree):
+            _PREVIEW_STATE_CACHE.clear()
+            return
+        if isinstance(id_data, bpy.types.Mesh):
+            _invalidate_mesh_sources(id_data.as_pointer())
+            continue
+        if not isinstance(id_data, bpy.types.Object):
+            continue
+        if update.is_updated_transform and not update.is_updated_geometry:
+            continue
+        _PREVIEW_STATE_CACHE.pop(id_data.as_pointer(), None)
+        owner_name = id_data.get(FEATURE_CHAMFER_CURVE_OWNER_TAG)
+        owner = bpy.data.objects.get(owner_name) if owner_name else None
+        if owner is not None:
+            _PREVIEW_STATE_CACHE.pop(owner.as_pointer(), None)
+
+
+# Modifier socket / 属性通过 RNA 修改时的 msgbus 回调；无法定位具体 source，整体失效。
+# 无参数；无返回值。
+def _on_nodes_modifier_changed(*args):
+    del args
+    _PREVIEW_STATE_CACHE.clear()
+
+
+# 订阅全部 NodesModifier 的 RNA 变化（socket 值、显示开关、node_group 替换）。
+# 无参数；重复调用会先清除旧订阅。
+def _subscribe_preview_msgbus():
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    bpy.msgbus.subscribe_rna(
+        key=bpy.types.NodesModifier,
+        owner=_MSGBUS_OWNER,
+        args=(),
+        notify=_on_nodes_modifier_changed,
+    )
+
+
+# Undo、Redo 后数据块整体替换，清空缓存。
+# dummy: Blender handler 兼容参数。
+@persistent
+def _on_preview_data_replaced(*dummy):
+    del dummy
+    clear_preview_state_cache()
+
+
+# 文件加载后清空缓存，并重新订阅被清空的 msgbus。
+# dummy: Blender handler 兼容参数。
+@persistent
+def _on_preview_load_post(*dummy):
+    del dummy
+    clear_preview_state_cache()
+    _subscribe_preview_msgbus()
+
+
+_PREVIEW_DATA_REPLACED_HANDLERS = ("undo_post", "redo_post")
+
+
 # 创建或幂等更新一个 procedural Feature Chamfer GN Preview。
 # source_object: source Mesh；radius/sample_length/voxel_size/adaptivity: GN 参数；show_cutter: 是否显示 cutter。
 def ensure_gn_feature_chamfer_preview(
@@ -382,6 +517,7 @@ def ensure_gn_feature_chamfer_preview(
     modifier[FEATURE_CHAMFER_GN_LAST_ACTION_TAG] = "PREVIEW"
     source_object[FEATURE_CHAMFER_GN_STATE_TAG] = PREVIEW_VALID
     source_object[FEATURE_CHAMFER_GN_LAST_ACTION_TAG] = "PREVIEW"
+    invalidate_preview_state(source_object)
     bpy.context.view_layer.update()
     return {
         "modifier": modifier,
@@ -405,4 +541,30 @@ def cancel_gn_feature_chamfer_preview(source_object):
     for key in (FEATURE_CHAMFER_GN_STATE_TAG, FEATURE_CHAMFER_GN_LAST_ACTION_TAG):
         if key in source_object:
             del source_object[key]
+    invalidate_preview_state(source_object)
     return removed
+
+
+def register():
+    if _on_preview_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_preview_depsgraph_update_post)
+    for handler_name in _PREVIEW_DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_preview_data_replaced not in handlers:
+            handlers.append(_on_preview_data_replaced)
+    if _on_preview_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_preview_load_post)
+    _subscribe_preview_msgbus()
+
+
+def unregister():
+    if _on_preview_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_preview_depsgraph_update_post)
+    for handler_name in _PREVIEW_DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_preview_data_replaced in handlers:
+            handlers.remove(_on_preview_data_replaced)
+    if _on_preview_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_preview_load_post)
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    clear_preview_state_cache()
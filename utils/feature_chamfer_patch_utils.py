@@ -5,58 +5,9 @@ import bpy
 import bmesh
 from mathutils import Vector
 from mathutils import geometry
-
-
-# 把 degree-2/degree-1 Boundary Edges 拆成有序 open/cyclic chains。
-# edges: 同一 Boundary component 的 Edges；返回 chain records。
-def _ordered_edge_chains(edges):
-    remaining = set(edges)
-    chains = []
-    while remaining:
-        seed = min(remaining, key=lambda edge: edge.index)
-        component = {seed}
-        stack = [seed]
-        remaining.remove(seed)
-        while stack:
-            edge = stack.pop()
-            for vertex in edge.verts:
-                for neighbor in vertex.link_edges:
-                    if neighbor in remaining:
-                        remaining.remove(neighbor)
-                        component.add(neighbor)
-                        stack.append(neighbor)
-        adjacency = {}
-        for edge in component:
-            for vertex in edge.verts:
-                adjacency.setdefault(vertex, []).append(edge)
-        endpoints = [vertex for vertex, linked in adjacency.items() if len(linked) == 1]
-        cyclic = not endpoints and all(len(linked) == 2 for linked in adjacency.values())
-        if not cyclic and len(endpoints) != 2:
-            continue
-        start = min(endpoints or adjacency.keys(), key=lambda vertex: vertex.index)
-        ordered_edges = []
-        ordered_vertices = [start]
-        current = start
-        previous = None
-        while len(ordered_edges) < len(component):
-            next_edge = next(
-                (
-                    edge for edge in sorted(adjacency[current], key=lambda item: item.index)
-                    if edge is not previous and edge not in ordered_edges
-                ),
-                None,
-            )
-            if next_edge is None:
-                break
-            ordered_edges.append(next_edge)
-            current = next_edge.other_vert(current)
-            previous = next_edge
-            if current is start:
-                break
-            ordered_vertices.append(current)
-        if len(ordered_edges) == len(component):
-            chains.append({"edges": ordered_edges, "vertices": ordered_vertices, "is_cyclic": cyclic})
-    return chains
+from .edge_chain_utils import ordered_edge_chains
+from .polyline_index_utils import nearest_parameter_index
+from .profiling_utils import profiled
 
 
 # 验证两条 rail chains 是互不相交的有效 Boundary。
@@ -94,7 +45,7 @@ def _align_loops(loop_a, loop_b):
             cost = sum(
                 (
                     loop_a[index_a].co
-                    - rotated[min(range(len(rotated)), key=lambda index: abs(parameters_b[index] - parameter))].co
+                    - rotated[nearest_parameter_index(parameters_b, parameter)].co
                 ).length_squared
                 for index_a, parameter in enumerate(parameters_a)
             )
@@ -105,6 +56,7 @@ def _align_loops(loop_a, loop_b):
 
 # 以 normalized arc-length zipper bridge 两个 closed rails。
 # bm/loop_a/loop_b: 目标 BMesh 与 rails；返回新 Faces。
+@profiled("zipper_bridge")
 def _zipper_bridge(bm, loop_a, loop_b):
     loop_b = _align_loops(loop_a, loop_b)
     parameters_a = _normalized_loop_parameters(loop_a) + [1.0]
@@ -135,6 +87,7 @@ def _zipper_bridge(bm, loop_a, loop_b):
 
 # 用 constrained Delaunay triangulation 填充单个 cyclic boundary。
 # bm/loop: 目标 BMesh 与 Boundary loop。
+@profiled("triangulate_loop")
 def _triangulate_loop(bm, loop):
     center = sum((vertex.co for vertex in loop), Vector()) / len(loop)
     normal = Vector()
@@ -183,7 +136,7 @@ def _component_chain(bm, vertex_indices):
         for edge in vertex.link_edges
         if len(edge.link_faces) == 1 and all(endpoint in vertices for endpoint in edge.verts)
     }
-    chains = _ordered_edge_chains(edges)
+    chains = ordered_edge_chains(edges)
     if len(chains) != 1:
         raise FeatureChamferPatchError(
             "boundary_component_invalid",
@@ -194,6 +147,7 @@ def _component_chain(bm, vertex_indices):
 
 # 用 boundary centroid fan 填充强非平面 END_CAP/JUNCTION loop。
 # bm/vertices: Patch BMesh 与有序 cyclic Boundary vertices；返回新 Faces。
+@profiled("centroid_fan_fill")
 def _centroid_fan_fill(bm, vertices):
     center = sum((vertex.co for vertex in vertices), vertices[0].co.copy() * 0.0) / len(vertices)
     center_vertex = bm.verts.new(center)
@@ -229,6 +183,7 @@ def _preserve_tracked_boolean_surface(donor_mesh, groove_face_indices, regions):
 # 使用统一入口生成 Patch；GN 路径消费显式 regions，旧 Operator 通过 legacy_context Adapter 保持行为。
 # open_mesh/regions/components: Phase 2B 输出；donor_mesh/groove_face_indices: 复杂 region 的安全曲面 donor。
 # legacy_context: 旧 Operator 的兼容 Patch 上下文。
+@profiled("patch_boolean_result")
 def patch_boolean_result(
     open_mesh=None,
     regions=None,
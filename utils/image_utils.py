@@ -4,14 +4,22 @@
 ===============
 
 包含材质贴图提取、alpha 读取和连通域分析功能。
+NumPy 可用时 alpha 读取与连通域分析走数组路径，否则回退到逐像素 Python 路径，两者输出一致。
 """
 
 from array import array
 from collections import OrderedDict
+import hashlib
+import json
 import os
+from pathlib import Path
+import sys
 
 import bpy
 
+from .mesh_array_utils import HAS_NUMPY
+from .mesh_array_utils import np
+
 RunSpan = tuple[int, int, int]
 RegionBounds = dict[str, int]
 ImageCacheStamp = tuple[object, ...]
@@ -21,6 +29,13 @@ _ALPHA_THRESHOLD_CACHE_MAX = 8
 _ALPHA_IMAGE_CACHE: OrderedDict[ImageCacheStamp, dict] = OrderedDict()
 _ALPHA_THRESHOLD_CACHE: OrderedDict[tuple[ImageCacheStamp, float], dict] = OrderedDict()
 
+# 磁盘缓存：跨 Blender 会话复用 alpha 平面（.npy，可 mmap）与各阈值的连通域结果（.json）。
+_ALPHA_DISK_CACHE_VERSION = 1
+_ALPHA_DISK_CACHE_MAX_BYTES = 1 << 30
+_ALPHA_DISK_CACHE_ENV = "HST_ALPHA_CACHE_DIR"
+_ALPHA_PLANE_SUFFIX = ".alpha.npy"
+_ALPHA_REGIONS_SUFFIX = ".regions.json"
+
 
 def _collect_upstream_image_nodes(node, visited, image_nodes) -> None:
     """递归收集连接到当前节点上游的图片节点。"""
@@ -166,6 +181,198 @@ def _get_image_cache_context(
     return width, height, channels, cache_stamp
 
 
+def get_alpha_disk_cache_dir() -> Path:
+    """返回 alpha 磁盘缓存目录：优先环境变量，其次各平台的用户缓存目录。"""
+    override = os.environ.get(_ALPHA_DISK_CACHE_ENV)
+    if override:
+        return Path(override)
+    if os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "HardsurfaceGameAssetToolkit" / "alpha_cache"
+
+
+def _build_disk_cache_key(image: bpy.types.Image, cache_stamp: ImageCacheStamp | None) -> str | None:
+    """
+    由 _build_image_cache_stamp 构造跨会话的磁盘缓存键。
+
+    去掉进程内的 image 指针，只保留尺寸、通道与源文件 (path, mtime, size)；
+    dirty、packed、生成图像等没有稳定源文件戳的图像返回 None，不写入磁盘。
+    """
+    if cache_stamp is None:
+        return None
+    _, width, height, channels, source_stamp = cache_stamp
+    if len(source_stamp) != 3 or source_stamp[1] is None:
+        return None
+    key_source = (
+        _ALPHA_DISK_CACHE_VERSION,
+        width,
+        height,
+        channels,
+        source_stamp,
+        getattr(image, "alpha_mode", ""),
+        getattr(getattr(image, "colorspace_settings", None), "name", ""),
+    )
+    return hashlib.sha1(repr(key_source).encode("utf-8")).hexdigest()
+
+
+def _touch_disk_cache_file(path: Path) -> None:
+    """刷新磁盘缓存文件的 LRU 时间戳。"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _write_disk_cache_file(path: Path, writer) -> None:
+    """先写临时文件再替换，避免中断时留下半截缓存。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as cache_file:
+        writer(cache_file)
+    os.replace(temp_path, path)
+
+
+def _trim_alpha_disk_cache(max_bytes: int = _ALPHA_DISK_CACHE_MAX_BYTES) -> None:
+    """按访问时间淘汰最旧的缓存文件，使总字节数不超过预算。"""
+    cache_dir = get_alpha_disk_cache_dir()
+    if not cache_dir.exists():
+        return
+
+    entries = []
+    total_bytes = 0
+    for path in cache_dir.iterdir():
+        if not path.name.endswith((_ALPHA_PLANE_SUFFIX, _ALPHA_REGIONS_SUFFIX)):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total_bytes += stat.st_size
+
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total_bytes -= size
+
+
+def _load_disk_alpha_plane(disk_key: str | None, pixel_count: int):
+    """读取磁盘上的 alpha 平面（只读 mmap）；缺失或尺寸不符时返回 None。"""
+    if disk_key is None or not HAS_NUMPY:
+        return None
+    path = get_alpha_disk_cache_dir() / (disk_key + _ALPHA_PLANE_SUFFIX)
+    if not path.exists():
+        return None
+    try:
+        alpha_values = np.load(path, mmap_mode="r")
+    except (OSError, ValueError) as error:
+        print(f"ignore unreadable alpha cache {path}: {error}")
+        return None
+    if alpha_values.dtype != np.float32 or alpha_values.shape != (pixel_count,):
+        return None
+    _touch_disk_cache_file(path)
+    return alpha_values
+
+
+def _store_disk_alpha_plane(disk_key: str | None, alpha_values) -> None:
+    """把 alpha 平面写入磁盘缓存。"""
+    if disk_key is None or not HAS_NUMPY:
+        return
+    path = get_alpha_disk_cache_dir() / (disk_key + _ALPHA_PLANE_SUFFIX)
+    try:
+        _write_disk_cache_file(path, lambda cache_file: np.save(cache_file, alpha_values))
+        _trim_alpha_disk_cache()
+    except OSError as error:
+        print(f"failed to write alpha cache {path}: {error}")
+
+
+def _load_disk_regions(disk_key: str | None) -> dict:
+    """读取磁盘上的各阈值连通域结果；返回 {"transparent_pixel_count", "thresholds"}。"""
+    empty = {"transparent_pixel_count": None, "thresholds": {}}
+    if disk_key is None:
+        return empty
+    path = get_alpha_disk_cache_dir() / (disk_key + _ALPHA_REGIONS_SUFFIX)
+    if not path.exists():
+        return empty
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        print(f"ignore unreadable alpha region cache {path}: {error}")
+        return empty
+    if cached.get("version") != _ALPHA_DISK_CACHE_VERSION:
+        return empty
+    _touch_disk_cache_file(path)
+    return cached
+
+
+def _store_disk_regions(
+    disk_key: str | None,
+    transparent_pixel_count: int,
+    alpha_threshold: float,
+    region_bounds: list[RegionBounds],
+) -> None:
+    """把某个阈值的连通域结果合并写入磁盘缓存。"""
+    if disk_key is None:
+        return
+    cached = _load_disk_regions(disk_key)
+    thresholds = dict(cached.get("thresholds") or {})
+    thresholds[_format_disk_threshold(alpha_threshold)] = region_bounds
+    payload = {
+        "version": _ALPHA_DISK_CACHE_VERSION,
+        "transparent_pixel_count": transparent_pixel_count,
+        "thresholds": thresholds,
+    }
+    path = get_alpha_disk_cache_dir() / (disk_key + _ALPHA_REGIONS_SUFFIX)
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    try:
+        _write_disk_cache_file(path, lambda cache_file: cache_file.write(data))
+        _trim_alpha_disk_cache()
+    except OSError as error:
+        print(f"failed to write alpha region cache {path}: {error}")
+
+
+def _format_disk_threshold(alpha_threshold: float) -> str:
+    """与内存阈值缓存相同的归一化（6 位小数）。"""
+    return f"{round(float(alpha_threshold), 6):.6f}"
+
+
+def clear_alpha_caches(include_disk: bool = False) -> None:
+    """清空内存中的 alpha / 阈值缓存；include_disk 时同时删除磁盘缓存文件。"""
+    _ALPHA_IMAGE_CACHE.clear()
+    _ALPHA_THRESHOLD_CACHE.clear()
+    if include_disk:
+        _trim_alpha_disk_cache(max_bytes=0)
+
+
+def _float32_floor(value: float):
+    """
+    返回不大于 value 的最大 float32。
+
+    float32 像素 x 满足 x <= value 当且仅当 x <= _float32_floor(value)，
+    因此数组比较可以留在 float32 中，又与 Python 路径的 double 比较逐像素一致。
+    """
+    floor = np.float32(value)
+    if float(floor) > value:
+        floor = np.nextafter(floor, np.float32(-np.inf))
+    return floor
+
+
+def _float32_ceil(value: float):
+    """返回不小于 value 的最小 float32；float32 像素 x < value 当且仅当 x < _float32_ceil(value)。"""
+    ceil = np.float32(value)
+    if float(ceil) < value:
+        ceil = np.nextafter(ceil, np.float32(np.inf))
+    return ceil
+
+
 def read_image_alpha(
     image: bpy.types.Image,
 ) -> tuple[int, int, array, int, ImageCacheStamp | None]:
@@ -173,6 +380,13 @@ def read_image_alpha(
     width, height, channels, cache_stamp = _get_image_cache_context(image)
 
     pixel_count = width * height
+    if HAS_NUMPY:
+        pixels = np.empty(pixel_count * channels, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        alpha_values = np.ascontiguousarray(pixels[3::channels])
+        transparent_pixel_count = int(np.count_nonzero(alpha_values < _float32_ceil(0.999)))
+        return width, height, alpha_values, transparent_pixel_count, cache_stamp
+
     pixels = array("f", [0.0]) * (pixel_count * channels)
     image.pixels.foreach_get(pixels)
     alpha_values = pixels[3::channels]
@@ -181,7 +395,7 @@ def read_image_alpha(
 
 
 def _get_alpha_data(image: bpy.types.Image) -> dict:
-    """读取或复用图像 alpha 数据。"""
+    """读取或复用图像 alpha 数据：内存 LRU → 磁盘缓存 → 解码图像。"""
     width, height, channels, cache_stamp = _get_image_cache_context(image)
 
     if cache_stamp is not None:
@@ -189,13 +403,21 @@ def _get_alpha_data(image: bpy.types.Image) -> dict:
         if cached is not None:
             return cached
 
-    width, height, alpha_values, transparent_pixel_count, cache_stamp = read_image_alpha(image)
+    disk_key = _build_disk_cache_key(image, cache_stamp)
+    alpha_values = _load_disk_alpha_plane(disk_key, width * height)
+    if alpha_values is not None:
+        transparent_pixel_count = int(np.count_nonzero(alpha_values < _float32_ceil(0.999)))
+    else:
+        width, height, alpha_values, transparent_pixel_count, cache_stamp = read_image_alpha(image)
+        _store_disk_alpha_plane(disk_key, alpha_values)
+
     alpha_data = {
         "width": width,
         "height": height,
         "alpha_values": alpha_values,
         "transparent_pixel_count": transparent_pixel_count,
         "cache_stamp": cache_stamp,
+        "disk_key": disk_key,
     }
     if cache_stamp is not None:
         _store_cache_entry(
@@ -385,14 +607,95 @@ def _extract_region_bounds_from_row_runs(row_runs: list[list[RunSpan]]) -> list[
 
         previous_runs = current_runs
 
-    region_bounds = []
-    for region_index, region in enumerate(region_stats):
-        if _find_root(parents, region_index) != region_index:
-            continue
+    # 按连通域首个 run 的扫描顺序输出，与数组路径的 root 顺序一致。
+    root_order: dict[int, None] = {}
+    for region_index in range(len(region_stats)):
+        root_order.setdefault(_find_root(parents, region_index), None)
+
+    return [dict(region_stats[root]) for root in root_order]
 
-        region_bounds.append(dict(region))
 
-    return region_bounds
+def _extract_region_bounds_numpy(
+    alpha_values,
+    width: int,
+    height: int,
+    alpha_threshold: float,
+) -> tuple[list[RegionBounds], bool]:
+    """
+    数组版 8 连通域包围盒：np.diff 求每行 run，searchsorted 找相邻行重叠 run，
+    再以 hook + pointer jumping 的并查集合并，输出与 Python 路径逐项一致。
+    """
+    alpha_plane = np.asarray(alpha_values, dtype=np.float32).reshape(height, width)
+    solid = ~(alpha_plane <= _float32_floor(alpha_threshold))
+
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = solid
+    transitions = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(transitions == 1)
+    _, run_stops = np.nonzero(transitions == -1)
+    run_count = len(run_rows)
+    if run_count == 0:
+        return [], False
+
+    run_rows = run_rows.astype(np.int64)
+    run_starts = run_starts.astype(np.int64)
+    run_ends = run_stops.astype(np.int64) - 1
+
+    # 行优先编码，使 start / end key 全局有序；相邻行 run 重叠区间在有序数组中连续。
+    stride = width + 2
+    start_keys = run_rows * stride + run_starts
+    end_keys = run_rows * stride + run_ends
+    previous_row_base = (run_rows - 1) * stride
+    overlap_lo = np.searchsorted(end_keys, previous_row_base + run_starts - 1, side="left")
+    overlap_hi = np.searchsorted(start_keys, previous_row_base + run_ends + 1, side="right")
+    overlap_counts = np.maximum(overlap_hi - overlap_lo, 0)
+
+    edge_count = int(overlap_counts.sum())
+    parents = np.arange(run_count, dtype=np.int64)
+    if edge_count:
+        edge_sources = np.repeat(np.arange(run_count, dtype=np.int64), overlap_counts)
+        edge_offsets = np.arange(edge_count, dtype=np.int64) - np.repeat(
+            np.cumsum(overlap_counts) - overlap_counts,
+            overlap_counts,
+        )
+        edge_targets = np.repeat(overlap_lo, overlap_counts) + edge_offsets
+
+        while True:
+            source_roots = parents[edge_sources]
+            target_roots = parents[edge_targets]
+            pending = source_roots != target_roots
+            if not pending.any():
+                break
+            low_roots = np.minimum(source_roots[pending], target_roots[pending])
+            high_roots = np.maximum(source_roots[pending], target_roots[pending])
+            np.minimum.at(parents, high_roots, low_roots)
+            while True:
+                compressed = parents[parents]
+                if np.array_equal(compressed, parents):
+                    break
+                parents = compressed
+
+    # root 为连通域内最小 run 序号，即扫描顺序中的首个 run。
+    roots, labels = np.unique(parents, return_inverse=True)
+    order = np.argsort(labels, kind="stable")
+    group_starts = np.searchsorted(labels[order], np.arange(len(roots)))
+    min_x = np.minimum.reduceat(run_starts[order], group_starts)
+    max_x = np.maximum.reduceat(run_ends[order], group_starts)
+    max_y = np.maximum.reduceat(run_rows[order], group_starts)
+    pixel_counts = np.add.reduceat((run_ends - run_starts + 1)[order], group_starts)
+    min_y = run_rows[roots]
+
+    region_bounds = [
+        {
+            "min_x": int(min_x[index]),
+            "min_y": int(min_y[index]),
+            "max_x": int(max_x[index]),
+            "max_y": int(max_y[index]),
+            "pixel_count": int(pixel_counts[index]),
+        }
+        for index in range(len(roots))
+    ]
+    return region_bounds, True
 
 
 def _get_threshold_cache_key(cache_stamp: ImageCacheStamp | None, alpha_threshold: float):
@@ -404,26 +707,52 @@ def _get_threshold_cache_key(cache_stamp: ImageCacheStamp | None, alpha_threshol
 
 def _get_prepared_alpha_regions(image: bpy.types.Image, alpha_threshold: float) -> dict:
     """准备阈值相关的基础连通域，供多次参数调整复用。"""
-    alpha_data = _get_alpha_data(image)
-    transparent_pixel_count = alpha_data["transparent_pixel_count"]
-    if transparent_pixel_count == 0:
-        raise ValueError("Image alpha is fully opaque")
-
-    threshold_cache_key = _get_threshold_cache_key(
-        alpha_data["cache_stamp"],
-        alpha_threshold,
-    )
+    width, height, _, cache_stamp = _get_image_cache_context(image)
+    threshold_cache_key = _get_threshold_cache_key(cache_stamp, alpha_threshold)
     if threshold_cache_key is not None:
         cached = _touch_cache_entry(_ALPHA_THRESHOLD_CACHE, threshold_cache_key)
         if cached is not None:
             return cached
 
-    row_runs, found_solid = _build_row_runs(
-        alpha_values=alpha_data["alpha_values"],
-        width=alpha_data["width"],
-        height=alpha_data["height"],
-        alpha_threshold=alpha_threshold,
-    )
+    # 磁盘上已有该阈值结果时无需解码像素
+    disk_key = _build_disk_cache_key(image, cache_stamp)
+    disk_regions = _load_disk_regions(disk_key)
+    disk_region_bounds = disk_regions["thresholds"].get(_format_disk_threshold(alpha_threshold))
+    if disk_region_bounds and disk_regions["transparent_pixel_count"]:
+        prepared = {
+            "width": width,
+            "height": height,
+            "transparent_pixel_count": disk_regions["transparent_pixel_count"],
+            "region_bounds": disk_region_bounds,
+        }
+        _store_cache_entry(
+            _ALPHA_THRESHOLD_CACHE,
+            threshold_cache_key,
+            prepared,
+            _ALPHA_THRESHOLD_CACHE_MAX,
+        )
+        return prepared
+
+    alpha_data = _get_alpha_data(image)
+    transparent_pixel_count = alpha_data["transparent_pixel_count"]
+    if transparent_pixel_count == 0:
+        raise ValueError("Image alpha is fully opaque")
+
+    if HAS_NUMPY:
+        region_bounds, found_solid = _extract_region_bounds_numpy(
+            alpha_values=alpha_data["alpha_values"],
+            width=alpha_data["width"],
+            height=alpha_data["height"],
+            alpha_threshold=alpha_threshold,
+        )
+    else:
+        row_runs, found_solid = _build_row_runs(
+            alpha_values=alpha_data["alpha_values"],
+            width=alpha_data["width"],
+            height=alpha_data["height"],
+            alpha_threshold=alpha_threshold,
+        )
+        region_bounds = _extract_region_bounds_from_row_runs(row_runs) if found_solid else []
     if not found_solid:
         raise ValueError("No alpha region is above the current threshold")
 
@@ -431,8 +760,14 @@ def _get_prepared_alpha_regions(image: bpy.types.Image, alpha_threshold: float)
         "width": alpha_data["width"],
         "height": alpha_data["height"],
         "transparent_pixel_count": transparent_pixel_count,
-        "region_bounds": _extract_region_bounds_from_row_runs(row_runs),
+        "region_bounds": region_bounds,
     }
+    _store_disk_regions(
+        alpha_data["disk_key"],
+        transparent_pixel_count,
+        alpha_threshold,
+        region_bounds,
+    )
     if threshold_cache_key is not None:
         _store_cache_entry(
             _ALPHA_THRESHOLD_CACHE,
@@ -6,7 +6,10 @@
 包含从文件导入各种数据块的功能。
 """
 
+import os
+
 import bpy
+from bpy.app.handlers import persistent
 
 
 def remove_node(name: str):
@@ -31,6 +34,142 @@ def remove_node(name: str):
         bpy.data.node_groups.remove(node_import)
 
 
+# 预设库文件路径 -> (mtime_ns, {bpy.data 集合名: 库内 datablock 名集合})；mtime 未变时无需重新打开文件。
+_LIBRARY_CONTENTS: dict[str, tuple[int, dict[str, frozenset]]] = {}
+# (库文件路径, bpy.data 集合名, 请求名) -> 已导入 datablock；导入时因重名被改名的 datablock 也能按请求名精确找到。
+_PRESET_INDEX: dict[tuple[str, str, str], bpy.types.ID] = {}
+
+
+def _indexed_datablock(key: tuple[str, str, str]):
+    """
+    读取索引中的 datablock，已被删除或失效时移除索引项
+
+    Args:
+        key: (库文件路径, bpy.data 集合名, 请求名)
+
+    Returns:
+        仍然有效的 datablock，或 None
+    """
+    datablock = _PRESET_INDEX.get(key)
+    if datablock is None:
+        return None
+    try:
+        if getattr(bpy.data, key[1]).get(datablock.name) == datablock:
+            return datablock
+    except ReferenceError:
+        pass
+    del _PRESET_INDEX[key]
+    return None
+
+
+def _link_appended_object(object):
+    """
+    与 bpy.ops.wm.append 一致，把追加的 Object 及其未链接的父级放入当前 Collection
+
+    Args:
+        object: 追加得到的 Object
+    """
+    collection = bpy.context.collection or bpy.context.scene.collection
+    while object is not None:
+        if len(object.users_collection) == 0:
+            collection.objects.link(object)
+        object = object.parent
+
+
+def load_library_datablocks(file_path, requests: dict) -> dict:
+    """
+    从预设 .blend 批量追加 datablock：已存在的按名称精确命中，缺失的在一次 bpy.data.libraries.load 中全部追加
+
+    库内容按 mtime 记忆，请求全部命中时不访问磁盘。
+
+    Args:
+        file_path: 预设 .blend 路径
+        requests: {bpy.data 集合名（node_groups / worlds / objects / materials 等）: 名称列表}
+
+    Returns:
+        {bpy.data 集合名: {请求名: datablock 或 None}}
+    """
+    library_path = str(file_path)
+    results = {data_attr: {} for data_attr in requests}
+    missing = {}
+    for data_attr, names in requests.items():
+        data_collection = getattr(bpy.data, data_attr)
+        for name in dict.fromkeys(names):
+            key = (library_path, data_attr, name)
+            datablock = _indexed_datablock(key)
+            if datablock is None:
+                datablock = data_collection.get(name)
+            if datablock is None:
+                missing.setdefault(data_attr, []).append(name)
+            else:
+                _PRESET_INDEX[key] = datablock
+            results[data_attr][name] = datablock
+    if not missing:
+        return results
+
+    try:
+        mtime_ns = os.stat(library_path).st_mtime_ns
+    except OSError:
+        print(f"Preset library not found: {library_path}")
+        return results
+
+    cached = _LIBRARY_CONTENTS.get(library_path)
+    if cached is not None and cached[0] == mtime_ns:
+        contents = cached[1]
+        missing = {
+            data_attr: [name for name in names if name in contents.get(data_attr, ())]
+            for data_attr, names in missing.items()
+        }
+        if not any(missing.values()):
+            return results
+
+    with bpy.data.libraries.load(library_path, link=False) as (data_from, data_to):
+        if cached is None or cached[0] != mtime_ns:
+            contents = {
+                data_attr: frozenset(getattr(data_from, data_attr))
+                for data_attr in dir(data_from)
+                if isinstance(getattr(data_from, data_attr, None), list)
+            }
+            _LIBRARY_CONTENTS[library_path] = (mtime_ns, contents)
+            missing = {
+                data_attr: [name for name in names if name in contents.get(data_attr, ())]
+                for data_attr, names in missing.items()
+            }
+        for data_attr, names in missing.items():
+            setattr(data_to, data_attr, list(names))
+
+    for data_attr, names in missing.items():
+        for name, datablock in zip(names, getattr(data_to, data_attr)):
+            if datablock is None:
+                continue
+            if data_attr == "objects":
+                _link_appended_object(datablock)
+            _PRESET_INDEX[(library_path, data_attr, name)] = datablock
+            results[data_attr][name] = datablock
+    return results
+
+
+def load_library_datablock(file_path, data_attr: str, name: str):
+    """
+    从预设 .blend 追加单个 datablock，已存在时直接返回
+
+    Args:
+        file_path: 预设 .blend 路径
+        data_attr: bpy.data 集合名
+        name: datablock 名称
+
+    Returns:
+        datablock，库中不存在时返回 None
+    """
+    return load_library_datablocks(file_path, {data_attr: [name]})[data_attr][name]
+
+
+def clear_preset_library_cache():
+    """清空预设库内容记忆与名称索引"""
+    _LIBRARY_CONTENTS.clear()
+    _PRESET_INDEX.clear()
+
+
 def import_node_group(file_path, node_name: str) -> bpy.types.NodeGroup:
     """
     从文件载入 NodeGroup
@@ -42,31 +181,7 @@ def import_node_group(file_path, node_name: str) -> bpy.types.NodeGroup:
     Returns:
         导入的节点组
     """
-    INNER_PATH = "NodeTree"
-    node_exist = False
-    node_import = None
-    
-    for node in bpy.data.node_groups:
-        if node_name not in node.name:
-            node_exist = False
-        else:
-            node_exist = True
-            node_import = node
-            break
-
-    if node_exist is False:
-        bpy.ops.wm.append(
-            filepath=str(file_path),
-            directory=str(file_path / INNER_PATH),
-            filename=node_name,
-        )
-
-    for node in bpy.data.node_groups:
-        if node.name == node_name:
-            node_import = node
-            break
-
-    return node_import
+    return load_library_datablock(file_path, "node_groups", node_name)
 
 
 def import_world(file_path, world_name: str) -> bpy.types.World:
@@ -80,31 +195,7 @@ def import_world(file_path, world_name: str) -> bpy.types.World:
     Returns:
         导入的 World
     """
-    INNER_PATH = "World"
-    world_exist = False
-    world_import = None
-    
-    for world in bpy.data.worlds:
-        if world_name not in world.name:
-            world_exist = False
-        else:
-            world_exist = True
-            world_import = world
-            break
-
-    if world_exist is False:
-        bpy.ops.wm.append(
-            filepath=str(file_path),
-            directory=str(file_path / INNER_PATH),
-            filename=world_name,
-        )
-
-    for world in bpy.data.worlds:
-        if world.name == world_name:
-            world_import = world
-            break
-
-    return world_import
+    return load_library_datablock(file_path, "worlds", world_name)
 
 
 def import_object(file_path, object_name: str):
@@ -118,31 +209,32 @@ def import_object(file_path, object_name: str):
     Returns:
         导入的对象
     """
-    INNER_PATH = "Object"
-    object_exist = False
-    object_import = None
-    
-    for object in bpy.data.objects:
-        if object_name not in object.name:
-            object_exist = False
-        else:
-            object_exist = True
-            object_import = object
-            break
+    return load_library_datablock(file_path, "objects", object_name)
 
-    if object_exist is False:
-        bpy.ops.wm.append(
-            filepath=str(file_path),
-            directory=str(file_path / INNER_PATH),
-            filename=object_name,
-        )
 
-    for object in bpy.data.objects:
-        if object.name == object_name:
-            object_import = object
-            break
+@persistent
+def _on_data_replaced(*dummy):
+    """文件加载、Undo、Redo 后 datablock 整体替换，清空名称索引（库内容记忆按 mtime 仍然有效）"""
+    del dummy
+    _PRESET_INDEX.clear()
+
+
+_DATA_REPLACED_HANDLERS = ("load_post", "undo_post", "redo_post")
+
 
-    return object_import
+def register():
+    for handler_name in _DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_data_replaced not in handlers:
+            handlers.append(_on_data_replaced)
+
+
+def unregister():
+    for handler_name in _DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_data_replaced in handlers:
+            handlers.remove(_on_data_replaced)
+    clear_preset_library_cache()
 
 
 def make_transfer_proxy_mesh(mesh, proxy_prefix: str, proxy_collection) -> bpy.types.Object:
@@ -157,30 +249,48 @@ def make_transfer_proxy_mesh(mesh, proxy_prefix: str, proxy_collection) -> bpy.t
     Returns:
         创建的代理 mesh 对象
     """
-    from .object_utils import Object
+    return make_transfer_proxy_meshes([mesh], proxy_prefix, proxy_collection)[0]
+
 
-    proxy_name = proxy_prefix + mesh.name
-    proxy_mesh = bpy.data.objects.get(proxy_name)
+def make_transfer_proxy_meshes(meshes, proxy_prefix: str, proxy_collection) -> list:
+    """
+    批量建立传递模型：删除旧代理后只评估一次 depsgraph，并从同一次评估结果生成全部代理 Mesh。
+
+    Args:
+        meshes: 源 mesh 对象列表
+        proxy_prefix: 代理前缀
+        proxy_collection: 代理所在的 Collection
+
+    Returns:
+        与 meshes 一一对应的代理 mesh 对象列表
+    """
+    from .object_utils import Object
 
-    if proxy_mesh is not None:
-        old_mesh_data = proxy_mesh.data
-        bpy.data.objects.remove(proxy_mesh)
-        if old_mesh_data is not None and old_mesh_data.users == 0:
-            bpy.data.meshes.remove(old_mesh_data)
+    for mesh in meshes:
+        proxy_mesh = bpy.data.objects.get(proxy_prefix + mesh.name)
+        if proxy_mesh is not None:
+            old_mesh_data = proxy_mesh.data
+            bpy.data.objects.remove(proxy_mesh)
+            if old_mesh_data is not None and old_mesh_data.users == 0:
+                bpy.data.meshes.remove(old_mesh_data)
 
     deps_graph = bpy.context.evaluated_depsgraph_get()
     deps_graph.update()
-    mesh_evaluated = bpy.data.meshes.new_from_object(
-        mesh.evaluated_get(deps_graph), depsgraph=deps_graph
-    )
-
-    proxy_mesh = bpy.data.objects.new(proxy_name, mesh_evaluated)
-    proxy_mesh.parent = mesh
-    proxy_collection.objects.link(proxy_mesh)
-    proxy_mesh.hide_render = True
-    Object.mark_hst_type(proxy_mesh, "PROXY")
-
-    proxy_mesh.hide_viewport = True
-    proxy_mesh.hide_render = True
-    proxy_mesh.select_set(False)
-    return proxy_mesh
+    # 先从同一次评估结果复制全部 Mesh，再新建 / 链接 Object，避免中途改动场景使评估结果失效
+    evaluated_meshes = [
+        bpy.data.meshes.new_from_object(mesh.evaluated_get(deps_graph), depsgraph=deps_graph)
+        for mesh in meshes
+    ]
+
+    proxy_meshes = []
+    for mesh, mesh_evaluated in zip(meshes, evaluated_meshes):
+        proxy_mesh = bpy.data.objects.new(proxy_prefix + mesh.name, mesh_evaluated)
+        proxy_mesh.parent = mesh
+        proxy_collection.objects.link(proxy_mesh)
+        Object.mark_hst_type(proxy_mesh, "PROXY")
+
+        proxy_mesh.hide_viewport = True
+        proxy_mesh.hide_render = True
+        proxy_mesh.select_set(False)
+        proxy_meshes.append(proxy_mesh)
+    return proxy_meshes
@@ -8,6 +8,8 @@
 
 import bpy
 
+from .import_utils import load_library_datablock
+
 
 def get_materials(target_object: bpy.types.Object) -> list:
     """
@@ -127,31 +129,7 @@ def import_material(file_path, material_name: str) -> bpy.types.Material:
     Returns:
         导入的材质对象
     """
-    INNER_PATH = "Material"
-    exist = False
-    material_import = None
-    
-    for mat in bpy.data.materials:
-        if material_name not in mat.name:
-            exist = False
-        else:
-            exist = True
-            material_import = mat
-            break
-
-    if exist is False:
-        bpy.ops.wm.append(
-            filepath=str(file_path),
-            directory=str(file_path / INNER_PATH),
-            filename=material_name,
-        )
-
-    for mat in bpy.data.materials:
-        if mat.name == material_name:
-            material_import = mat
-            break
-
-    return material_import
+    return load_library_datablock(file_path, "materials", material_name)
 
 
 class Material:
@@ -0,0 +1,628 @@
+# -*- coding: utf-8 -*-
+"""
+Mesh 数组批量读写工具函数
+=======================
+
+通过 foreach_get / foreach_set 一次性读取 Mesh 拓扑与属性，
+供锐边判定等逐元素 Python 循环较慢的流程使用。
+Blender 自带 NumPy；缺失时 HAS_NUMPY 为 False，调用方应回退到 BMesh 路径。
+"""
+
+from collections import OrderedDict
+import hashlib
+import math
+
+import bpy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+# BFS 深度 0-3 的 corner signal 衰减权重，与 Mesh._accumulate_corner_channel 一致。
+CORNER_RING_DEPTH_WEIGHTS = (1.0, 0.75, 0.5, 0.3)
+_CORNER_RING_CHUNK_SIZE = 65536
+_CORNER_RING_CACHE_MAX = 4
+_CORNER_RING_CACHE: OrderedDict[str, dict] = OrderedDict()
+
+
+def read_loop_arrays(mesh_data: bpy.types.Mesh):
+    """
+    读取每个 corner 的顶点与边索引。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        (loop_vertices, loop_edges) 两个 int32 数组
+    """
+    loop_count = len(mesh_data.loops)
+    loop_vertices = np.empty(loop_count, dtype=np.int32)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh_data.loops.foreach_get("vertex_index", loop_vertices)
+    mesh_data.loops.foreach_get("edge_index", loop_edges)
+    return loop_vertices, loop_edges
+
+
+def read_polygon_loop_ranges(mesh_data: bpy.types.Mesh):
+    """
+    读取每个面的 loop 起点与 corner 数量。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        (loop_starts, loop_totals) 两个 int32 数组
+    """
+    polygon_count = len(mesh_data.polygons)
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    mesh_data.polygons.foreach_get("loop_start", loop_starts)
+    mesh_data.polygons.foreach_get("loop_total", loop_totals)
+    return loop_starts, loop_totals
+
+
+def read_edge_vertices(mesh_data: bpy.types.Mesh):
+    """
+    读取每条边的两个顶点索引。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        形状为 (edge_count, 2) 的 int32 数组
+    """
+    edge_vertices = np.empty(len(mesh_data.edges) * 2, dtype=np.int32)
+    mesh_data.edges.foreach_get("vertices", edge_vertices)
+    return edge_vertices.reshape(-1, 2)
+
+
+def read_corner_normals(mesh_data: bpy.types.Mesh):
+    """
+    读取 corner（split）法线，兼容 4.1 前的 MeshLoop.normal。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        形状为 (loop_count, 3) 的 float64 数组
+    """
+    normals = np.empty(len(mesh_data.loops) * 3, dtype=np.float32)
+    corner_normals = getattr(mesh_data, "corner_normals", None)
+    if corner_normals is not None:
+        corner_normals.foreach_get("vector", normals)
+    else:
+        mesh_data.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3).astype(np.float64)
+
+
+def read_polygon_normals(mesh_data: bpy.types.Mesh):
+    """
+    读取面法线。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        形状为 (polygon_count, 3) 的 float64 数组
+    """
+    normals = np.empty(len(mesh_data.polygons) * 3, dtype=np.float32)
+    mesh_data.polygons.foreach_get("normal", normals)
+    return normals.reshape(-1, 3).astype(np.float64)
+
+
+def loop_polygon_indices(loop_starts, loop_totals):
+    """
+    展开每个 corner 所属的面索引。
+
+    Args:
+        loop_starts: 面 loop 起点数组
+        loop_totals: 面 corner 数量数组
+
+    Returns:
+        与 loop 等长的 int32 面索引数组
+    """
+    return np.repeat(np.arange(len(loop_starts), dtype=np.int32), loop_totals)
+
+
+def next_loop_indices(loop_starts, loop_totals, loop_count: int):
+    """
+    计算每个 corner 在所属面内的下一个 corner。
+
+    Args:
+        loop_starts: 面 loop 起点数组
+        loop_totals: 面 corner 数量数组
+        loop_count: corner 总数
+
+    Returns:
+        与 loop 等长的 int32 数组
+    """
+    next_loops = np.arange(1, loop_count + 1, dtype=np.int32)
+    if len(loop_starts):
+        next_loops[loop_starts + loop_totals - 1] = loop_starts
+    return next_loops
+
+
+def read_vertex_positions(mesh_data: bpy.types.Mesh):
+    """
+    读取顶点坐标。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        形状为 (vertex_count, 3) 的 float64 数组
+    """
+    positions = np.empty(len(mesh_data.vertices) * 3, dtype=np.float32)
+    mesh_data.vertices.foreach_get("co", positions)
+    return positions.reshape(-1, 3).astype(np.float64)
+
+
+def read_corner_topology(mesh_data: bpy.types.Mesh) -> dict:
+    """
+    一次性读取 corner 相关拓扑数组，供多个派生计算复用。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        包含 loop_vertices、loop_edges、loop_starts、loop_totals、edge_vertices 的字典
+    """
+    loop_vertices, loop_edges = read_loop_arrays(mesh_data)
+    loop_starts, loop_totals = read_polygon_loop_ranges(mesh_data)
+    return {
+        "loop_vertices": loop_vertices,
+        "loop_edges": loop_edges,
+        "loop_starts": loop_starts,
+        "loop_totals": loop_totals,
+        "edge_vertices": read_edge_vertices(mesh_data),
+    }
+
+
+def corner_topology_key(topology: dict) -> str:
+    """
+    计算只依赖拓扑（不含坐标）的摘要，纯顶点移动后保持不变。
+
+    Args:
+        topology: read_corner_topology 返回的字典
+
+    Returns:
+        十六进制摘要字符串
+    """
+    digest = hashlib.sha1()
+    for name in ("loop_vertices", "loop_edges", "loop_totals", "edge_vertices"):
+        array = np.ascontiguousarray(topology[name])
+        digest.update(name.encode("ascii"))
+        digest.update(str(array.shape).encode("ascii"))
+        digest.update(memoryview(array).cast("B"))
+    return digest.hexdigest()
+
+
+def manifold_edge_corners(mesh_data: bpy.types.Mesh, topology: dict | None = None) -> dict:
+    """
+    找出恰好连接两个不同面的边，并给出两侧面在边两端的 corner。
+
+    每个面里 edge_index 等于该边的 corner 位于边的一端，
+    其下一个 corner 位于另一端；按边的 vertices[0]/[1] 对齐后可直接比较两侧。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        topology: 可选的 read_corner_topology 结果，避免重复读取
+
+    Returns:
+        包含 edges、polygons_a/b、loops_a、corners_a0/a1/b0/b1 数组的字典
+    """
+    if topology is None:
+        topology = read_corner_topology(mesh_data)
+    loop_vertices = topology["loop_vertices"]
+    loop_edges = topology["loop_edges"]
+    loop_starts = topology["loop_starts"]
+    loop_totals = topology["loop_totals"]
+    edge_vertices = topology["edge_vertices"]
+    loop_count = len(loop_vertices)
+
+    empty = np.empty(0, dtype=np.int32)
+    if loop_count == 0:
+        return {
+            "edges": empty,
+            "polygons_a": empty,
+            "polygons_b": empty,
+            "loops_a": empty,
+            "corners_a0": empty,
+            "corners_a1": empty,
+            "corners_b0": empty,
+            "corners_b1": empty,
+        }
+
+    loop_polygons = loop_polygon_indices(loop_starts, loop_totals)
+    next_loops = next_loop_indices(loop_starts, loop_totals, loop_count)
+
+    face_counts = np.bincount(loop_edges, minlength=len(edge_vertices))
+    sorted_loops = np.argsort(loop_edges, kind="stable").astype(np.int32)
+    sorted_edges = loop_edges[sorted_loops]
+    candidate_edges = np.flatnonzero(face_counts == 2).astype(np.int32)
+    first_positions = np.searchsorted(sorted_edges, candidate_edges, side="left")
+    loops_a = sorted_loops[first_positions]
+    loops_b = sorted_loops[first_positions + 1]
+    polygons_a = loop_polygons[loops_a]
+    polygons_b = loop_polygons[loops_b]
+
+    distinct = polygons_a != polygons_b
+    edges = candidate_edges[distinct]
+    loops_a = loops_a[distinct]
+    loops_b = loops_b[distinct]
+
+    first_vertices = edge_vertices[edges, 0]
+    a_starts_at_first = loop_vertices[loops_a] == first_vertices
+    b_starts_at_first = loop_vertices[loops_b] == first_vertices
+    return {
+        "edges": edges,
+        "polygons_a": polygons_a[distinct],
+        "polygons_b": polygons_b[distinct],
+        "loops_a": loops_a,
+        "corners_a0": np.where(a_starts_at_first, loops_a, next_loops[loops_a]),
+        "corners_a1": np.where(a_starts_at_first, next_loops[loops_a], loops_a),
+        "corners_b0": np.where(b_starts_at_first, loops_b, next_loops[loops_b]),
+        "corners_b1": np.where(b_starts_at_first, next_loops[loops_b], loops_b),
+    }
+
+
+def normalized_vector_angles(vectors_a, vectors_b):
+    """
+    逐行计算单位向量夹角，公式与 angle_normalized_v3v3 相同。
+
+    用 asin 代替 acos，避免夹角接近 0/π 时的精度损失。
+
+    Args:
+        vectors_a: 形状为 (n, 3) 的单位向量数组
+        vectors_b: 形状为 (n, 3) 的单位向量数组
+
+    Returns:
+        长度为 n 的弧度数组
+    """
+    dots = np.einsum("ij,ij->i", vectors_a, vectors_b)
+    same_side = 2.0 * np.arcsin(
+        np.clip(np.linalg.norm(vectors_a - vectors_b, axis=1) / 2.0, 0.0, 1.0)
+    )
+    opposite_side = math.pi - 2.0 * np.arcsin(
+        np.clip(np.linalg.norm(vectors_a + vectors_b, axis=1) / 2.0, 0.0, 1.0)
+    )
+    return np.where(dots >= 0.0, same_side, opposite_side)
+
+
+def sharp_edge_mask_by_split_normal(
+    mesh_data: bpy.types.Mesh, threshold_angle_degrees: float = 5.0
+):
+    """
+    按 split normal 判定锐边：任一端点两侧 corner 法线夹角超过阈值即为锐边。
+
+    与 BMesh 路径 get_sharp_edge_indices_by_split_normal 判定一致。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        threshold_angle_degrees: 阈值角度（度）
+
+    Returns:
+        与边等长的 bool 数组
+    """
+    sharp_mask = np.zeros(len(mesh_data.edges), dtype=bool)
+    corners = manifold_edge_corners(mesh_data)
+    if len(corners["edges"]) == 0:
+        return sharp_mask
+
+    normals = read_corner_normals(mesh_data)
+    threshold_cosine = math.cos(math.radians(threshold_angle_degrees))
+    dot_first = np.einsum(
+        "ij,ij->i", normals[corners["corners_a0"]], normals[corners["corners_b0"]]
+    )
+    dot_second = np.einsum(
+        "ij,ij->i", normals[corners["corners_a1"]], normals[corners["corners_b1"]]
+    )
+    sharp_mask[corners["edges"]] = (dot_first < threshold_cosine) | (
+        dot_second < threshold_cosine
+    )
+    return sharp_mask
+
+
+def sharp_edge_mask_by_angle(mesh_data: bpy.types.Mesh, sharp_angle: float = 0.08):
+    """
+    按两侧面法线夹角判定锐边，角度公式与 BMEdge.calc_face_angle 相同。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        sharp_angle: 锐边角度阈值（弧度）
+
+    Returns:
+        与边等长的 bool 数组
+    """
+    sharp_mask = np.zeros(len(mesh_data.edges), dtype=bool)
+    corners = manifold_edge_corners(mesh_data)
+    if len(corners["edges"]) == 0:
+        return sharp_mask
+
+    polygon_normals = read_polygon_normals(mesh_data)
+    angles = normalized_vector_angles(
+        polygon_normals[corners["polygons_a"]], polygon_normals[corners["polygons_b"]]
+    )
+    sharp_mask[corners["edges"]] = angles >= sharp_angle
+    return sharp_mask
+
+
+def convex_edge_mask(mesh_data: bpy.types.Mesh):
+    """
+    按 BMEdge.is_convex 的规则判定凸边：非 manifold 边与两侧面法线完全相同的边视为凸边，
+    否则看两侧面法线叉积是否与所在 corner 的边方向同向。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        与边等长的 bool 数组
+    """
+    convex_mask = np.ones(len(mesh_data.edges), dtype=bool)
+    topology = read_corner_topology(mesh_data)
+    corners = manifold_edge_corners(mesh_data, topology)
+    if len(corners["edges"]) == 0:
+        return convex_mask
+
+    polygon_normals = read_polygon_normals(mesh_data)
+    normals_a = polygon_normals[corners["polygons_a"]]
+    normals_b = polygon_normals[corners["polygons_b"]]
+    loop_vertices = topology["loop_vertices"]
+    loops_a = corners["loops_a"]
+    next_loops = next_loop_indices(topology["loop_starts"], topology["loop_totals"], len(loop_vertices))
+    positions = read_vertex_positions(mesh_data)
+    edge_directions = positions[loop_vertices[next_loops[loops_a]]] - positions[loop_vertices[loops_a]]
+    dots = np.einsum("ij,ij->i", edge_directions, np.cross(normals_a, normals_b))
+    convex_mask[corners["edges"]] = np.all(normals_a == normals_b, axis=1) | (dots > 0.0)
+    return convex_mask
+
+
+def read_edge_flags(mesh_data: bpy.types.Mesh, property_name: str):
+    """
+    批量读取 MeshEdge 的布尔属性（use_edge_sharp、use_seam 等）。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        property_name: MeshEdge 属性名称
+
+    Returns:
+        与边等长的 bool 数组
+    """
+    flags = np.zeros(len(mesh_data.edges), dtype=bool)
+    mesh_data.edges.foreach_get(property_name, flags)
+    return flags
+
+
+def write_edge_flags(mesh_data: bpy.types.Mesh, property_name: str, flags) -> None:
+    """
+    批量写入 MeshEdge 的布尔属性。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        property_name: MeshEdge 属性名称
+        flags: 与边等长的 bool 数组
+    """
+    mesh_data.edges.foreach_set(property_name, np.ascontiguousarray(flags, dtype=bool))
+
+
+def connected_component_labels(count: int, pairs_a, pairs_b):
+    """
+    按连接对计算连通分量，hook + pointer jumping，全程数组运算。
+
+    Args:
+        count: 元素数量
+        pairs_a: 连接对的一端索引数组
+        pairs_b: 连接对的另一端索引数组
+
+    Returns:
+        (labels, component_count)：labels 为 0 起始的紧凑分量编号，按分量内最小元素索引排序
+    """
+    labels = np.arange(count, dtype=np.int64)
+    pairs_a = np.asarray(pairs_a, dtype=np.int64)
+    pairs_b = np.asarray(pairs_b, dtype=np.int64)
+    while len(pairs_a):
+        roots_a = labels[pairs_a]
+        roots_b = labels[pairs_b]
+        pending = roots_a != roots_b
+        if not pending.any():
+            break
+        pairs_a = pairs_a[pending]
+        pairs_b = pairs_b[pending]
+        low = np.minimum(roots_a[pending], roots_b[pending])
+        high = np.maximum(roots_a[pending], roots_b[pending])
+        # 把较大的根挂到较小的根下，再压缩路径直到每个元素直接指向根
+        np.minimum.at(labels, high, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    roots, compact = np.unique(labels, return_inverse=True)
+    return compact.astype(np.int32), len(roots)
+
+
+def mask_to_indices(mask) -> set[int]:
+    """
+    把 bool 数组转换为索引集合，保持与 BMesh 路径相同的返回类型。
+
+    Args:
+        mask: bool 数组
+
+    Returns:
+        为 True 的索引集合
+    """
+    return set(np.flatnonzero(mask).tolist())
+
+
+def build_corner_adjacency_csr(topology: dict, corners: dict):
+    """
+    构建 corner signal 邻接图的 CSR 表示。
+
+    邻接规则与 Mesh._build_corner_signal_adjacency 相同：
+    面内前后相邻 corner，以及 manifold 边两侧同一顶点的 corner。
+
+    Args:
+        topology: read_corner_topology 返回的字典
+        corners: manifold_edge_corners 返回的字典
+
+    Returns:
+        (indptr, indices) 两个 int64 数组
+    """
+    loop_count = len(topology["loop_vertices"])
+    next_loops = next_loop_indices(topology["loop_starts"], topology["loop_totals"], loop_count)
+    loop_ids = np.arange(loop_count, dtype=np.int64)
+
+    sources = np.concatenate(
+        (loop_ids, corners["corners_a0"], corners["corners_a1"])
+    ).astype(np.int64)
+    targets = np.concatenate(
+        (next_loops, corners["corners_b0"], corners["corners_b1"])
+    ).astype(np.int64)
+    keep = sources != targets
+    sources = sources[keep]
+    targets = targets[keep]
+
+    keys = np.unique(
+        np.concatenate((sources * loop_count + targets, targets * loop_count + sources))
+    )
+    rows = keys // loop_count
+    indices = keys % loop_count
+    indptr = np.zeros(loop_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=loop_count), out=indptr[1:])
+    return indptr, indices
+
+
+def build_corner_ring_operator(indptr, indices, max_depth: int = 3) -> dict:
+    """
+    把 CSR 邻接图展开为按 BFS 深度分层的稀疏 ring 算子。
+
+    等价于对 (A + I) 逐次求幂，只保留每个 (target, corner) 首次可达的深度；
+    按 target 分块展开以限制峰值内存。
+
+    Args:
+        indptr: CSR 行指针
+        indices: CSR 列索引
+        max_depth: 最大 BFS 深度
+
+    Returns:
+        包含 rows、cols、depths 与 corner_count 的字典
+    """
+    corner_count = len(indptr) - 1
+    degrees = np.diff(indptr)
+    row_parts = []
+    col_parts = []
+    depth_parts = []
+
+    for chunk_start in range(0, corner_count, _CORNER_RING_CHUNK_SIZE):
+        chunk_stop = min(corner_count, chunk_start + _CORNER_RING_CHUNK_SIZE)
+        frontier_rows = np.arange(chunk_start, chunk_stop, dtype=np.int64)
+        frontier_cols = frontier_rows
+        visited = frontier_rows * corner_count + frontier_cols
+        row_parts.append(frontier_rows)
+        col_parts.append(frontier_cols)
+        depth_parts.append(np.zeros(len(frontier_rows), dtype=np.uint8))
+
+        for depth in range(1, max_depth + 1):
+            counts = degrees[frontier_cols]
+            total = int(counts.sum())
+            if total == 0:
+                break
+
+            segment_starts = np.cumsum(counts) - counts
+            offsets = np.repeat(indptr[frontier_cols] - segment_starts, counts)
+            offsets += np.arange(total, dtype=np.int64)
+            candidate_rows = np.repeat(frontier_rows, counts)
+            candidate_keys = np.unique(candidate_rows * corner_count + indices[offsets])
+
+            positions = np.searchsorted(visited, candidate_keys)
+            positions = np.minimum(positions, len(visited) - 1)
+            new_keys = candidate_keys[visited[positions] != candidate_keys]
+            if len(new_keys) == 0:
+                break
+
+            visited = np.union1d(visited, new_keys)
+            frontier_rows = new_keys // corner_count
+            frontier_cols = new_keys % corner_count
+            row_parts.append(frontier_rows)
+            col_parts.append(frontier_cols)
+            depth_parts.append(np.full(len(new_keys), depth, dtype=np.uint8))
+
+    if not row_parts:
+        empty = np.empty(0, dtype=np.int32)
+        return {"rows": empty, "cols": empty, "depths": empty.astype(np.uint8), "corner_count": 0}
+
+    return {
+        "rows": np.concatenate(row_parts).astype(np.int32),
+        "cols": np.concatenate(col_parts).astype(np.int32),
+        "depths": np.concatenate(depth_parts),
+        "corner_count": corner_count,
+    }
+
+
+def accumulate_corner_ring(ring_operator: dict, values, depth_weights=CORNER_RING_DEPTH_WEIGHTS):
+    """
+    用 ring 算子对 corner 信号做深度加权平均。
+
+    Args:
+        ring_operator: build_corner_ring_operator 返回的字典
+        values: 与 corner 等长的信号数组
+        depth_weights: 每个 BFS 深度的权重
+
+    Returns:
+        与 corner 等长的 float64 数组
+    """
+    corner_count = ring_operator["corner_count"]
+    rows = ring_operator["rows"]
+    pair_weights = np.asarray(depth_weights, dtype=np.float64)[ring_operator["depths"]]
+    totals = np.bincount(rows, weights=pair_weights * np.asarray(values)[ring_operator["cols"]], minlength=corner_count)
+    weight_totals = np.bincount(rows, weights=pair_weights, minlength=corner_count)
+    accumulated = np.zeros(corner_count, dtype=np.float64)
+    valid = weight_totals > 1e-8
+    accumulated[valid] = totals[valid] / weight_totals[valid]
+    return accumulated
+
+
+def get_corner_signal_topology(mesh_data: bpy.types.Mesh, use_cache: bool = False) -> tuple[dict, bool]:
+    """
+    读取 corner signal 所需的拓扑派生数据（manifold corners 与 3-ring 算子）。
+
+    use_cache 为 True 时按拓扑摘要缓存结果，纯顶点移动后重跑直接复用。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        use_cache: 是否读写拓扑缓存
+
+    Returns:
+        (拓扑派生数据字典, 是否命中缓存)
+    """
+    topology = read_corner_topology(mesh_data)
+    cache_key = corner_topology_key(topology) if use_cache else None
+    if cache_key is not None:
+        cached = _CORNER_RING_CACHE.get(cache_key)
+        if cached is not None:
+            _CORNER_RING_CACHE.move_to_end(cache_key)
+            return cached, True
+
+    corners = manifold_edge_corners(mesh_data, topology=topology)
+    indptr, indices = build_corner_adjacency_csr(topology, corners)
+    signal_topology = {
+        "topology": topology,
+        "corners": corners,
+        "ring": build_corner_ring_operator(indptr, indices, max_depth=len(CORNER_RING_DEPTH_WEIGHTS) - 1),
+    }
+
+    if cache_key is not None:
+        _CORNER_RING_CACHE[cache_key] = signal_topology
+        _CORNER_RING_CACHE.move_to_end(cache_key)
+        while len(_CORNER_RING_CACHE) > _CORNER_RING_CACHE_MAX:
+            _CORNER_RING_CACHE.popitem(last=False)
+    return signal_topology, False
+
+
+def clear_corner_signal_cache() -> None:
+    """清空 corner signal 拓扑缓存。"""
+    _CORNER_RING_CACHE.clear()
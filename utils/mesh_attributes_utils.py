@@ -129,6 +129,33 @@ class MeshAttributes:
         attribute.data.foreach_set("value", values)
         mesh.data.update()
 
+    @staticmethod
+    def write_values_batch(mesh: bpy.types.Object, values_by_name: dict):
+        """
+        批量写入多个标量属性数组，全部写完后只 update 一次。
+
+        Args:
+            mesh: 目标 mesh 对象
+            values_by_name: 属性名称 -> 与 attribute.data 等长的标量数组
+        """
+        if mesh.type != "MESH":
+            return
+
+        attributes = mesh.data.attributes
+        for attribute_name, values in values_by_name.items():
+            attribute = attributes.get(attribute_name)
+            if attribute is None:
+                raise ValueError(f"Target attribute not found: {attribute_name}")
+
+            data_len = len(attribute.data)
+            if data_len != len(values):
+                raise ValueError(
+                    f"Attribute value count mismatch: expected {data_len}, got {len(values)}"
+                )
+            attribute.data.foreach_set("value", values)
+
+        mesh.data.update()
+
     @staticmethod
     def set_indices(
         mesh: bpy.types.Object,
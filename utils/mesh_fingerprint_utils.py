@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Mesh 拓扑/位置/Sharp 指纹服务：直接哈希 foreach_get 缓冲区，并按 depsgraph 更新代数记忆化。"""
+
+from array import array
+from dataclasses import dataclass
+import hashlib
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .mesh_array_utils import HAS_NUMPY
+from .mesh_array_utils import np
+
+
+@dataclass(frozen=True)
+class MeshFingerprint:
+    topology: str
+    positions: str
+    sharp_edges: str
+    sharp_edge_count: int
+    digest: str
+
+
+# mesh pointer -> 该 Mesh 最近一次几何更新的代数；由 depsgraph_update_post 递增。
+_MESH_GENERATIONS: dict[int, int] = {}
+# 文件加载与 Undo/Redo 会整体替换数据块内容，递增全局代数让全部记忆失效。
+_GLOBAL_GENERATION = 0
+_FINGERPRINT_MEMO: dict[int, tuple[tuple, MeshFingerprint]] = {}
+
+
+# 读取 RNA collection 的数值属性到原生缓冲区，避免逐元素 Python 对象。
+# collection/property_name/typecode/count: foreach_get 目标、属性、array typecode 与元素数。
+def _read_buffer(collection, property_name, typecode, count):
+    buffer = array(typecode, bytes(array(typecode).itemsize * count))
+    if count:
+        collection.foreach_get(property_name, buffer)
+    return buffer
+
+
+# 读取布尔属性为 bytes；NumPy 缺失时走 RNA 序列回退路径。
+# collection/property_name/count: foreach_get 目标、属性与元素数。
+def _read_bool_bytes(collection, property_name, count):
+    if HAS_NUMPY:
+        values = np.zeros(count, dtype=bool)
+        if count:
+            collection.foreach_get(property_name, values)
+        return values.tobytes()
+    values = [False] * count
+    if count:
+        collection.foreach_get(property_name, values)
+    return bytes(values)
+
+
+# 把若干带标签的缓冲区写入同一个 SHA-256，返回十六进制摘要。
+# parts: (label, buffer) 序列；buffer 需支持 memoryview。
+def _hash_buffers(parts):
+    digest = hashlib.sha256()
+    for label, buffer in parts:
+        view = memoryview(buffer).cast("B")
+        digest.update(label.encode("utf-8"))
+        digest.update(len(view).to_bytes(8, "little"))
+        digest.update(view)
+    return digest.hexdigest()
+
+
+# 直接从 Mesh 缓冲区计算指纹，不做任何记忆化。
+# mesh: bpy.types.Mesh；返回 MeshFingerprint。
+def compute_mesh_fingerprint(mesh):
+    vertex_count = len(mesh.vertices)
+    edge_count = len(mesh.edges)
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+
+    topology = _hash_buffers(
+        (
+            ("edge_vertices", _read_buffer(mesh.edges, "vertices", "i", edge_count * 2)),
+            ("loop_vertices", _read_buffer(mesh.loops, "vertex_index", "i", loop_count)),
+            ("loop_totals", _read_buffer(mesh.polygons, "loop_total", "i", polygon_count)),
+            ("vertex_count", array("i", [vertex_count])),
+        )
+    )
+    positions = _hash_buffers(
+        (("positions", _read_buffer(mesh.vertices, "co", "f", vertex_count * 3)),)
+    )
+
+    sharp_attribute = mesh.attributes.get("sharp_edge")
+    if sharp_attribute is not None and sharp_attribute.domain == "EDGE":
+        sharp_bytes = _read_bool_bytes(sharp_attribute.data, "value", len(sharp_attribute.data))
+    else:
+        sharp_bytes = b""
+    sharp_edges = _hash_buffers((("sharp_edges", sharp_bytes),))
+
+    combined = hashlib.sha256(
+        f"{topology}:{positions}:{sharp_edges}".encode("ascii")
+    ).hexdigest()
+    return MeshFingerprint(
+        topology=topology,
+        positions=positions,
+        sharp_edges=sharp_edges,
+        sharp_edge_count=sum(sharp_bytes),
+        digest=combined,
+    )
+
+
+# 属性 data_type -> (foreach 属性名, 每元素分量数, array typecode)；BOOLEAN 走 bytes 路径。
+_ATTRIBUTE_BUFFER_LAYOUTS = {
+    "FLOAT": ("value", 1, "f"),
+    "INT": ("value", 1, "i"),
+    "INT8": ("value", 1, "i"),
+    "INT32_2D": ("value", 2, "i"),
+    "FLOAT2": ("vector", 2, "f"),
+    "FLOAT_VECTOR": ("vector", 3, "f"),
+    "FLOAT_COLOR": ("color", 4, "f"),
+    "BYTE_COLOR": ("color", 4, "f"),
+    "QUATERNION": ("value", 4, "f"),
+    "FLOAT4X4": ("value", 16, "f"),
+}
+
+
+# 计算覆盖导出内容的 Mesh 数据摘要：拓扑/位置/Sharp 指纹 + 全部公开属性（UV、颜色、材质索引等）+ 自定义法线。
+# 以 "." 开头的内部属性（选择、隐藏状态）不参与，避免编辑器状态导致误判变化。
+# mesh: bpy.types.Mesh；返回十六进制摘要。
+def compute_mesh_data_digest(mesh):
+    parts = [("fingerprint", compute_mesh_fingerprint(mesh).digest.encode("ascii"))]
+    for attribute in sorted(mesh.attributes, key=lambda item: item.name):
+        if attribute.name.startswith("."):
+            continue
+        label = f"{attribute.name}:{attribute.domain}:{attribute.data_type}"
+        count = len(attribute.data)
+        if attribute.data_type == "BOOLEAN":
+            buffer = _read_bool_bytes(attribute.data, "value", count)
+        elif attribute.data_type in _ATTRIBUTE_BUFFER_LAYOUTS:
+            property_name, components, typecode = _ATTRIBUTE_BUFFER_LAYOUTS[attribute.data_type]
+            buffer = _read_buffer(attribute.data, property_name, typecode, count * components)
+        else:
+            buffer = b""
+        parts.append((label, buffer))
+
+    if mesh.has_custom_normals:
+        if hasattr(mesh, "corner_normals"):
+            normals = _read_buffer(mesh.corner_normals, "vector", "f", len(mesh.corner_normals) * 3)
+        else:
+            mesh.calc_normals_split()
+            normals = _read_buffer(mesh.loops, "normal", "f", len(mesh.loops) * 3)
+        parts.append(("custom_normals", normals))
+    return _hash_buffers(parts)
+
+
+# 返回 Mesh 指纹；use_cache 时按 pointer + 几何更新代数记忆化，未变化时 O(1)。
+# mesh: bpy.types.Mesh；use_cache: 直接 Python 写入后尚未经过 depsgraph 评估时应传 False。
+def mesh_fingerprint(mesh, use_cache=True):
+    if not use_cache:
+        return compute_mesh_fingerprint(mesh)
+
+    pointer = mesh.as_pointer()
+    memo_key = (
+        _GLOBAL_GENERATION,
+        _MESH_GENERATIONS.get(pointer, 0),
+        len(mesh.vertices),
+        len(mesh.edges),
+        len(mesh.loops),
+    )
+    cached = _FINGERPRINT_MEMO.get(pointer)
+    if cached is not None and cached[0] == memo_key:
+        return cached[1]
+
+    fingerprint = compute_mesh_fingerprint(mesh)
+    _FINGERPRINT_MEMO[pointer] = (memo_key, fingerprint)
+    return fingerprint
+
+
+# 让指定 Mesh 的记忆失效；直接修改 Mesh 数据的调用方可显式使用。
+# mesh: bpy.types.Mesh；无返回值。
+def invalidate_mesh_fingerprint(mesh):
+    pointer = mesh.as_pointer()
+    _MESH_GENERATIONS[pointer] = _MESH_GENERATIONS.get(pointer, 0) + 1
+    _FINGERPRINT_MEMO.pop(pointer, None)
+
+
+# 清空全部记忆并递增全局代数。
+# 无参数；无返回值。
+def clear_mesh_fingerprint_cache():
+    global _GLOBAL_GENERATION
+    _GLOBAL_GENERATION += 1
+    _FINGERPRINT_MEMO.clear()
+    _MESH_GENERATIONS.clear()
+
+
+# 根据 depsgraph 更新递增受影响 Mesh 的代数；Object 几何更新同时覆盖其 Mesh 数据。
+# scene/depsgraph: Blender handler 参数。
+@persistent
+def _on_depsgraph_update_post(scene, depsgraph):
+    del scene
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Mesh):
+            mesh = id_data
+        elif (
+            isinstance(id_data, bpy.types.Object)
+            and update.is_updated_geometry
+            and isinstance(id_data.data, bpy.types.Mesh)
+        ):
+            mesh = id_data.data
+        else:
+            continue
+        pointer = mesh.as_pointer()
+        _MESH_GENERATIONS[pointer] = _MESH_GENERATIONS.get(pointer, 0) + 1
+
+
+# 文件加载、Undo、Redo 后数据块内容整体替换，清空记忆。
+# dummy: Blender handler 兼容参数。
+@persistent
+def _on_data_replaced(*dummy):
+    del dummy
+    clear_mesh_fingerprint_cache()
+
+
+_DATA_REPLACED_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+
+def register():
+    if _on_depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update_post)
+    for handler_name in _DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_data_replaced not in handlers:
+            handlers.append(_on_data_replaced)
+
+
+def unregister():
+    if _on_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update_post)
+    for handler_name in _DATA_REPLACED_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _on_data_replaced in handlers:
+            handlers.remove(_on_data_replaced)
+    clear_mesh_fingerprint_cache()
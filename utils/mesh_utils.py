@@ -22,12 +22,64 @@ from ..const import (
     CURVATURE_SIGNED_ACCUM_RAW_ATTR,
     CURVATURE_SIGNED_RAW_ATTR,
 )
+from .mesh_array_utils import (
+    HAS_NUMPY,
+    accumulate_corner_ring,
+    convex_edge_mask,
+    get_corner_signal_topology,
+    mask_to_indices,
+    next_loop_indices,
+    normalized_vector_angles,
+    np,
+    read_corner_normals,
+    read_edge_flags,
+    read_polygon_normals,
+    read_vertex_positions,
+    sharp_edge_mask_by_angle,
+    sharp_edge_mask_by_split_normal,
+    write_edge_flags,
+)
+
+
+CURVATURE_CORNER_ATTRIBUTES = (
+    CURVATURE_SIGNED_RAW_ATTR,
+    CURVATURE_MAGNITUDE_RAW_ATTR,
+    CURVATURE_CONVEX_RAW_ATTR,
+    CURVATURE_CONCAVE_RAW_ATTR,
+    CURVATURE_SIGNED_ACCUM_RAW_ATTR,
+    CURVATURE_MAGNITUDE_ACCUM_RAW_ATTR,
+    CURVATURE_CONVEX_ACCUM_RAW_ATTR,
+    CURVATURE_CONCAVE_ACCUM_RAW_ATTR,
+)
 
 
 def mark_sharp_edges_by_split_normal(obj) -> None:
     """
     根据 SplitNormal 标记锐边
 
+    有 NumPy 时批量判定并用 foreach_set 写回，否则回退到 BMesh 逐顶点遍历。
+
+    Args:
+        obj: 目标 mesh 对象
+    """
+    if not HAS_NUMPY:
+        _mark_sharp_edges_by_split_normal_bmesh(obj)
+        return
+
+    mesh = obj.data
+    split_mask = sharp_edge_mask_by_split_normal(mesh)
+    if not split_mask.any():
+        return
+
+    write_edge_flags(mesh, "use_edge_sharp", read_edge_flags(mesh, "use_edge_sharp") | split_mask)
+    write_edge_flags(mesh, "use_seam", read_edge_flags(mesh, "use_seam") | split_mask)
+    mesh.update()
+
+
+def _mark_sharp_edges_by_split_normal_bmesh(obj) -> None:
+    """
+    根据 SplitNormal 标记锐边（BMesh 回退路径）
+
     Args:
         obj: 目标 mesh 对象
     """
@@ -86,6 +138,13 @@ def are_normals_different(normal_a, normal_b, threshold_angle_degrees: float = 5
 
 def get_sharp_edge_indices_by_split_normal(obj) -> set[int]:
     """Collect sharp edge indices from split normals without mutating shading."""
+    if HAS_NUMPY:
+        return mask_to_indices(sharp_edge_mask_by_split_normal(obj.data))
+    return _get_sharp_edge_indices_by_split_normal_bmesh(obj)
+
+
+def _get_sharp_edge_indices_by_split_normal_bmesh(obj) -> set[int]:
+    """BMesh fallback for get_sharp_edge_indices_by_split_normal."""
     bm = bmesh.new()
     mesh = obj.data
     bm.from_mesh(mesh)
@@ -120,6 +179,13 @@ def get_sharp_edge_indices_by_split_normal(obj) -> set[int]:
 
 def get_sharp_edge_indices_by_angle(mesh, sharp_angle: float = 0.08) -> set[int]:
     """Collect sharp edge indices by face angle without writing edge flags."""
+    if HAS_NUMPY:
+        return mask_to_indices(sharp_edge_mask_by_angle(mesh.data, sharp_angle=sharp_angle))
+    return _get_sharp_edge_indices_by_angle_bmesh(mesh, sharp_angle=sharp_angle)
+
+
+def _get_sharp_edge_indices_by_angle_bmesh(mesh, sharp_angle: float = 0.08) -> set[int]:
+    """BMesh fallback for get_sharp_edge_indices_by_angle."""
     bm = bmesh.new()
     mesh_data = mesh.data
     bm.from_mesh(mesh_data)
@@ -148,7 +214,6 @@ def mark_sharp_edge_by_angle(mesh, sharp_angle: float = 0.08) -> None:
         sharp_angle: 锐边角度阈值（弧度）
     """
     mesh_data = mesh.data
-    to_mark_sharp = get_sharp_edge_indices_by_angle(mesh, sharp_angle=sharp_angle)
     has_sharp_edge = False
 
     for attributes in mesh_data.attributes:
@@ -159,6 +224,14 @@ def mark_sharp_edge_by_angle(mesh, sharp_angle: float = 0.08) -> None:
     if has_sharp_edge is False:
         mesh_data.attributes.new("sharp_edge", type="BOOLEAN", domain="EDGE")
 
+    if HAS_NUMPY:
+        write_edge_flags(
+            mesh_data, "use_edge_sharp", sharp_edge_mask_by_angle(mesh_data, sharp_angle=sharp_angle)
+        )
+        mesh_data.update()
+        return
+
+    to_mark_sharp = _get_sharp_edge_indices_by_angle_bmesh(mesh, sharp_angle=sharp_angle)
     for edge in mesh_data.edges:
         edge.use_edge_sharp = edge.index in to_mark_sharp
 
@@ -175,6 +248,13 @@ def mark_convex_edges(mesh) -> None:
     
     convex_attribute_name = "convex_edge"
     convex_attr = MeshAttributes.add(mesh, attribute_name=convex_attribute_name, data_type="FLOAT", domain="EDGE")
+    if HAS_NUMPY:
+        convex_values = convex_edge_mask(mesh.data).astype(np.float32)
+        if len(convex_values):
+            convex_attr.data.foreach_set("value", convex_values)
+        mesh.data.update()
+        return
+
     bm = BMeshUtils.init(mesh, mode="OBJECT")
 
     convex_layer = bm.edges.layers.float[convex_attr.name]
@@ -594,15 +674,19 @@ class Mesh:
         return accumulated
 
     @staticmethod
-    def mark_curvature_corner_attributes(mesh: bpy.types.Object) -> dict:
+    def mark_curvature_corner_attributes(
+        mesh: bpy.types.Object, use_adjacency_cache: bool = False
+    ) -> dict:
         """
         为 mesh 生成 CORNER 域的 raw curvature signal attributes。
 
         原始信号使用 split/custom normals 的 corner normal 差值作为强度，
         并使用 edge 的凸凹方向作为 signed curvature 的正负号来源。
+        有 NumPy 时走数组路径，否则回退到 BMesh 逐边遍历。
 
         Args:
             mesh: 目标 mesh 对象
+            use_adjacency_cache: 按拓扑缓存 corner 邻接与 3-ring 算子，纯顶点移动后重跑可跳过重建
 
         Returns:
             dict: 统计信息
@@ -619,6 +703,7 @@ class Mesh:
             "max_magnitude": 0.0,
             "nonzero_accum_corners": 0,
             "max_accum_magnitude": 0.0,
+            "adjacency_cache_hit": False,
         }
 
         if mesh.type != "MESH":
@@ -630,17 +715,8 @@ class Mesh:
 
         MeshAttributes.ensure_float_corner_attributes(
             mesh,
-            [
-                CURVATURE_SIGNED_RAW_ATTR,
-                CURVATURE_MAGNITUDE_RAW_ATTR,
-                CURVATURE_CONVEX_RAW_ATTR,
-                CURVATURE_CONCAVE_RAW_ATTR,
-                CURVATURE_SIGNED_ACCUM_RAW_ATTR,
-                CURVATURE_MAGNITUDE_ACCUM_RAW_ATTR,
-                CURVATURE_CONVEX_ACCUM_RAW_ATTR,
-                CURVATURE_CONCAVE_ACCUM_RAW_ATTR,
-            ],
-            default_value=0.0,
+            CURVATURE_CORNER_ATTRIBUTES,
+            default_value=None if HAS_NUMPY else 0.0,
         )
 
         if loop_count == 0 or len(mesh_data.polygons) == 0:
@@ -652,6 +728,147 @@ class Mesh:
             except Exception:
                 pass
 
+        if HAS_NUMPY:
+            return Mesh._mark_curvature_corner_attributes_array(
+                mesh, stats, use_adjacency_cache=use_adjacency_cache
+            )
+        return Mesh._mark_curvature_corner_attributes_bmesh(mesh, stats)
+
+    @staticmethod
+    def _mark_curvature_corner_attributes_array(
+        mesh: bpy.types.Object, stats: dict, use_adjacency_cache: bool = False
+    ) -> dict:
+        """
+        mark_curvature_corner_attributes 的 NumPy 路径。
+
+        逐边采样、3-ring 累积与 8 个 attribute 写回全部以数组批量完成，
+        结果与 BMesh 路径一致。
+
+        Args:
+            mesh: 目标 mesh 对象
+            stats: 已初始化的统计字典
+            use_adjacency_cache: 是否复用拓扑缓存
+
+        Returns:
+            dict: 统计信息
+        """
+        from .mesh_attributes_utils import MeshAttributes
+
+        mesh_data = mesh.data
+        loop_count = len(mesh_data.loops)
+        signal_topology, cache_hit = get_corner_signal_topology(
+            mesh_data, use_cache=use_adjacency_cache
+        )
+        stats["adjacency_cache_hit"] = cache_hit
+        corners = signal_topology["corners"]
+        loop_vertices = signal_topology["topology"]["loop_vertices"]
+        next_loops = next_loop_indices(
+            signal_topology["topology"]["loop_starts"],
+            signal_topology["topology"]["loop_totals"],
+            loop_count,
+        )
+
+        positions = read_vertex_positions(mesh_data)
+        polygon_normals = read_polygon_normals(mesh_data)
+        corner_normals = read_corner_normals(mesh_data)
+
+        # BMEdge.is_convex / calc_face_angle_signed 的数组版本。
+        normals_a = polygon_normals[corners["polygons_a"]]
+        normals_b = polygon_normals[corners["polygons_b"]]
+        face_angles = normalized_vector_angles(normals_a, normals_b)
+        loops_a = corners["loops_a"]
+        edge_directions = positions[loop_vertices[next_loops[loops_a]]] - positions[loop_vertices[loops_a]]
+        is_convex = np.all(normals_a == normals_b, axis=1) | (
+            np.einsum("ij,ij->i", np.cross(normals_a, normals_b), edge_directions) > 0.0
+        )
+        signs = np.where(is_convex, 1.0, np.where(face_angles > 1e-6, -1.0, 0.0))
+        edge_weights = np.maximum(np.linalg.norm(edge_directions, axis=1), 1e-8)
+
+        positive_sums = np.zeros(loop_count, dtype=np.float64)
+        negative_sums = np.zeros(loop_count, dtype=np.float64)
+        weight_sums = np.zeros(loop_count, dtype=np.float64)
+
+        for corner_key_a, corner_key_b in (("corners_a0", "corners_b0"), ("corners_a1", "corners_b1")):
+            corner_a = corners[corner_key_a]
+            corner_b = corners[corner_key_b]
+            normal_a = corner_normals[corner_a]
+            normal_b = corner_normals[corner_b]
+            length_a = np.linalg.norm(normal_a, axis=1)
+            length_b = np.linalg.norm(normal_b, axis=1)
+            valid_length = (length_a >= 1e-8) & (length_b >= 1e-8)
+            safe_a = np.where(valid_length, length_a, 1.0)[:, None]
+            safe_b = np.where(valid_length, length_b, 1.0)[:, None]
+            dots = np.clip(np.einsum("ij,ij->i", normal_a / safe_a, normal_b / safe_b), -1.0, 1.0)
+            normal_angles = np.where(valid_length, np.arccos(dots), 0.0)
+
+            sampled = (signs != 0.0) & (normal_angles > 1e-8)
+            stats["edge_samples"] += int(np.count_nonzero(sampled))
+            sample_corners = np.concatenate((corner_a[sampled], corner_b[sampled]))
+            sample_weights = np.tile(edge_weights[sampled], 2)
+            contributions = np.tile(normal_angles[sampled] * edge_weights[sampled], 2)
+            is_positive = np.tile(signs[sampled] > 0.0, 2)
+
+            weight_sums += np.bincount(sample_corners, weights=sample_weights, minlength=loop_count)
+            positive_sums += np.bincount(
+                sample_corners[is_positive], weights=contributions[is_positive], minlength=loop_count
+            )
+            negative_sums += np.bincount(
+                sample_corners[~is_positive], weights=contributions[~is_positive], minlength=loop_count
+            )
+
+        convex_values = np.zeros(loop_count, dtype=np.float64)
+        concave_values = np.zeros(loop_count, dtype=np.float64)
+        weighted = weight_sums > 1e-8
+        convex_values[weighted] = positive_sums[weighted] / weight_sums[weighted]
+        concave_values[weighted] = negative_sums[weighted] / weight_sums[weighted]
+        signed_values = convex_values - concave_values
+        magnitude_values = convex_values + concave_values
+
+        stats["nonzero_corners"] = int(np.count_nonzero(magnitude_values > 1e-8))
+        stats["convex_corners"] = int(np.count_nonzero(convex_values > 1e-8))
+        stats["concave_corners"] = int(np.count_nonzero(concave_values > 1e-8))
+        stats["max_magnitude"] = max(0.0, float(magnitude_values.max(initial=0.0)))
+
+        convex_accum_values = accumulate_corner_ring(signal_topology["ring"], convex_values)
+        concave_accum_values = accumulate_corner_ring(signal_topology["ring"], concave_values)
+        signed_accum_values = convex_accum_values - concave_accum_values
+        magnitude_accum_values = convex_accum_values + concave_accum_values
+
+        stats["nonzero_accum_corners"] = int(np.count_nonzero(magnitude_accum_values > 1e-8))
+        stats["max_accum_magnitude"] = max(0.0, float(magnitude_accum_values.max(initial=0.0)))
+
+        MeshAttributes.write_values_batch(
+            mesh,
+            {
+                CURVATURE_SIGNED_RAW_ATTR: signed_values.astype(np.float32),
+                CURVATURE_MAGNITUDE_RAW_ATTR: magnitude_values.astype(np.float32),
+                CURVATURE_CONVEX_RAW_ATTR: convex_values.astype(np.float32),
+                CURVATURE_CONCAVE_RAW_ATTR: concave_values.astype(np.float32),
+                CURVATURE_SIGNED_ACCUM_RAW_ATTR: signed_accum_values.astype(np.float32),
+                CURVATURE_MAGNITUDE_ACCUM_RAW_ATTR: magnitude_accum_values.astype(np.float32),
+                CURVATURE_CONVEX_ACCUM_RAW_ATTR: convex_accum_values.astype(np.float32),
+                CURVATURE_CONCAVE_ACCUM_RAW_ATTR: concave_accum_values.astype(np.float32),
+            },
+        )
+        return stats
+
+    @staticmethod
+    def _mark_curvature_corner_attributes_bmesh(mesh: bpy.types.Object, stats: dict) -> dict:
+        """
+        mark_curvature_corner_attributes 的 BMesh 回退路径。
+
+        Args:
+            mesh: 目标 mesh 对象
+            stats: 已初始化的统计字典
+
+        Returns:
+            dict: 统计信息
+        """
+        from .mesh_attributes_utils import MeshAttributes
+
+        mesh_data = mesh.data
+        loop_count = len(mesh_data.loops)
+
         positive_sums = [0.0] * loop_count
         negative_sums = [0.0] * loop_count
         weight_sums = [0.0] * loop_count
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""Rail / Feature polyline 的 segment AABB 树索引：最近距离、最近 segment、自交计数与参数查找。"""
+
+import math
+
+from mathutils import geometry
+
+
+# 自交测试中 segment 参数允许越过端点的比例，与原全对比较保持一致。
+SEGMENT_FACTOR_EPSILON = 1.0e-6
+# AABB 树叶子最多容纳的 segment 数。
+LEAF_SEGMENT_COUNT = 4
+
+
+# 返回 parameters 中与 parameter 最接近的下标，等价于
+# min(range(len(parameters)), key=lambda index: abs(parameters[index] - parameter))，含并列时取最小下标。
+# parameters: 非递减的 normalized arc-length 参数；parameter: 查询值；空序列返回 None。
+def nearest_parameter_index(parameters, parameter):
+    count = len(parameters)
+    if count == 0:
+        return None
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if parameters[middle] < parameter:
+            low = middle + 1
+        else:
+            high = middle
+    right_index = low
+    if right_index == 0:
+        return 0
+    # 左侧 key 单调不增；浮点减法可能让多个左侧值得到相同 key，需回退到该 key 的首个下标。
+    left_key = abs(parameters[right_index - 1] - parameter)
+    low, high = 0, right_index - 1
+    while low < high:
+        middle = (low + high) // 2
+        if abs(parameters[middle] - parameter) <= left_key:
+            high = middle
+        else:
+            low = middle + 1
+    left_index = low
+    if right_index == count or left_key <= abs(parameters[right_index] - parameter):
+        return left_index
+    return right_index
+
+
+class PolylineIndex:
+    """有序 polyline 的 segment AABB 树。
+
+    查询对候选 segment 仍调用原先的 mathutils.geometry 计算，结果与全量遍历逐位一致；
+    树只负责按包围盒距离剪枝，构建 O(n log n)，单次查询约 O(log n)。
+
+    Args:
+        vertices: 有序 BMVert 或坐标序列；BMVert 按 .co 读取，不复制坐标。
+        cyclic: 是否闭环；闭环额外包含末点到首点的 segment。
+        segment_count: 可选 segment 数；默认 cyclic 为点数，否则为点数 - 1。
+    """
+
+    def __init__(self, vertices, cyclic, segment_count=None):
+        self.coordinates = [
+            vertex.co if hasattr(vertex, "co") else vertex
+            for vertex in vertices
+        ]
+        self.cyclic = bool(cyclic)
+        point_count = len(self.coordinates)
+        if segment_count is None:
+            segment_count = point_count if self.cyclic else point_count - 1
+        self.segment_count = max(0, segment_count) if point_count else 0
+        # 扁平节点数组：包围盒、子节点（叶子为 None）与叶子 segment 下标。
+        self.node_min = []
+        self.node_max = []
+        self.node_children = []
+        self.node_segments = []
+        self.segment_boxes = []
+        self.max_segment_length = 0.0
+        self.slack = 0.0
+        if self.segment_count <= 0:
+            return
+
+        for index in range(self.segment_count):
+            start, end = self._segment(index)
+            self.segment_boxes.append(
+                (
+                    tuple(min(start[axis], end[axis]) for axis in range(3)),
+                    tuple(max(start[axis], end[axis]) for axis in range(3)),
+                )
+            )
+            self.max_segment_length = max(self.max_segment_length, (end - start).length)
+        magnitude = max(
+            abs(value)
+            for low, high in self.segment_boxes
+            for value in low + high
+        )
+        # mathutils 坐标为 float32，剪枝用的包围盒距离需要留出舍入余量。
+        self.slack = 1.0e-5 * (magnitude + self.max_segment_length)
+        self._build_node(list(range(self.segment_count)))
+
+    def _segment(self, index):
+        return (
+            self.coordinates[index],
+            self.coordinates[(index + 1) % len(self.coordinates)],
+        )
+
+    # 按包围盒最长轴的中心中位数递归二分，返回节点下标。
+    def _build_node(self, segment_indices):
+        boxes = [self.segment_boxes[index] for index in segment_indices]
+        low = tuple(min(box[0][axis] for box in boxes) for axis in range(3))
+        high = tuple(max(box[1][axis] for box in boxes) for axis in range(3))
+        node = len(self.node_min)
+        self.node_min.append(low)
+        self.node_max.append(high)
+        self.node_children.append(None)
+        self.node_segments.append(segment_indices)
+        if len(segment_indices) <= LEAF_SEGMENT_COUNT:
+            return node
+        axis = max(range(3), key=lambda item: high[item] - low[item])
+        ordered = sorted(
+            segment_indices,
+            key=lambda index: self.segment_boxes[index][0][axis] + self.segment_boxes[index][1][axis],
+        )
+        middle = len(ordered) // 2
+        self.node_segments[node] = None
+        self.node_children[node] = (
+            self._build_node(ordered[:middle]),
+            self._build_node(ordered[middle:]),
+        )
+        return node
+
+    def _box_distance(self, node, point):
+        low = self.node_min[node]
+        high = self.node_max[node]
+        total = 0.0
+        for axis in range(3):
+            value = point[axis]
+            if value < low[axis]:
+                total += (low[axis] - value) ** 2
+            elif value > high[axis]:
+                total += (value - high[axis]) ** 2
+        return math.sqrt(total)
+
+    # 由近到远遍历叶子 segment；prune(box_distance) 为真时跳过该子树。
+    def _nearest_candidates(self, point, prune):
+        if not self.node_min:
+            return
+        stack = [(self._box_distance(0, point), 0)]
+        while stack:
+            box_distance, node = stack.pop()
+            if prune(box_distance - self.slack):
+                continue
+            children = self.node_children[node]
+            if children is None:
+                yield from self.node_segments[node]
+                continue
+            ordered = sorted(
+                ((self._box_distance(child, point), child) for child in children),
+                reverse=True,
+            )
+            stack.extend(ordered)
+
+    # 返回包围盒与 box（两角点）相交的 segment 下标。
+    def _overlapping_segments(self, box):
+        if not self.node_min:
+            return
+        low, high = box
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            node_low = self.node_min[node]
+            node_high = self.node_max[node]
+            if any(node_low[axis] > high[axis] or node_high[axis] < low[axis] for axis in range(3)):
+                continue
+            children = self.node_children[node]
+            if children is None:
+                for index in self.node_segments[node]:
+                    segment_low, segment_high = self.segment_boxes[index]
+                    if not any(
+                        segment_low[axis] > high[axis] or segment_high[axis] < low[axis]
+                        for axis in range(3)
+                    ):
+                        yield index
+                continue
+            stack.extend(children)
+
+    # 返回 point 到 polyline 的最短距离，端点外侧按最近端点计算；无 segment 时返回 inf。
+    # point: 查询坐标（Vector）。
+    def distance(self, point):
+        best = [float("inf")]
+        for index in self._nearest_candidates(point, lambda box_distance: box_distance > best[0]):
+            start, end = self._segment(index)
+            closest, factor = geometry.intersect_point_line(point, start, end)
+            if factor < 0.0:
+                closest = start
+            elif factor > 1.0:
+                closest = end
+            best[0] = min(best[0], (point - closest).length)
+        return best[0]
+
+    # 返回 (segment index, 距离, clamped factor)；距离相同取最小 segment index；无 segment 时返回 None。
+    # point: 查询坐标（Vector）。
+    def nearest_segment(self, point):
+        best = [None]
+
+        def prune(box_distance):
+            return best[0] is not None and box_distance > 0.0 and box_distance * box_distance > best[0][0]
+
+        for index in self._nearest_candidates(point, prune):
+            start, end = self._segment(index)
+            closest, factor = geometry.intersect_point_line(point, start, end)
+            factor = max(0.0, min(1.0, factor))
+            closest = start.lerp(end, factor)
+            candidate = ((point - closest).length_squared, index, factor)
+            if best[0] is None or candidate < best[0]:
+                best[0] = candidate
+        if best[0] is None:
+            return None
+        return best[0][1], math.sqrt(best[0][0]), best[0][2]
+
+    # 统计非相邻 segment 的自交数量；闭环首尾 segment 视为相邻。
+    # tolerance: 两 segment 最近点距离容差。
+    def self_intersection_count(self, tolerance):
+        if len(self.coordinates) < 4:
+            return 0
+        # 计入的交点到两条 segment 包围盒的距离分别不超过 tolerance / 2 + epsilon * length。
+        padding = (
+            tolerance
+            + 2.0 * SEGMENT_FACTOR_EPSILON * self.max_segment_length
+            + self.slack
+        )
+        intersection_count = 0
+        for first_index in range(self.segment_count):
+            first_start, first_end = self._segment(first_index)
+            low, high = self.segment_boxes[first_index]
+            query_box = (
+                tuple(value - padding for value in low),
+                tuple(value + padding for value in high),
+            )
+            for second_index in self._overlapping_segments(query_box):
+                if second_index <= first_index + 1:
+                    continue
+                if self.cyclic and first_index == 0 and second_index == self.segment_count - 1:
+                    continue
+                second_start, second_end = self._segment(second_index)
+                if _segments_intersect(first_start, first_end, second_start, second_end, tolerance):
+                    intersection_count += 1
+        return intersection_count
+
+
+# 判断两条 segment 最近点距离不超过 tolerance，且最近点落在两条 segment 参数范围内。
+# first_start/first_end/second_start/second_end: segment 端点；tolerance: 距离容差。
+def _segments_intersect(first_start, first_end, second_start, second_end, tolerance):
+    closest = geometry.intersect_line_line(
+        first_start,
+        first_end,
+        second_start,
+        second_end,
+    )
+    if closest is None or (closest[0] - closest[1]).length > tolerance:
+        return False
+    midpoint = (closest[0] + closest[1]) * 0.5
+    _, first_factor = geometry.intersect_point_line(
+        midpoint,
+        first_start,
+        first_end,
+    )
+    _, second_factor = geometry.intersect_point_line(
+        midpoint,
+        second_start,
+        second_end,
+    )
+    return (
+        -SEGMENT_FACTOR_EPSILON <= first_factor <= 1.0 + SEGMENT_FACTOR_EPSILON
+        and -SEGMENT_FACTOR_EPSILON <= second_factor <= 1.0 + SEGMENT_FACTOR_EPSILON
+    )
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Feature Chamfer 分层计时与计数：span 调用次数、累计耗时、BMesh 元素峰值，以及可选 cProfile 捕获。"""
+
+from contextlib import contextmanager
+from contextlib import nullcontext
+from datetime import datetime
+import cProfile
+import functools
+import os
+from pathlib import Path
+import time
+
+import bmesh
+
+
+# 设置后每个顶层 profiling session 额外写出一个 cProfile .prof 文件到该目录。
+PROFILE_DIR_ENV = "HST_FEATURE_CHAMFER_PROFILE_DIR"
+# span 路径分隔符；stats["timings"] 的子阶段已使用 "."，这里避免混淆。
+SPAN_PATH_SEPARATOR = "/"
+
+_ACTIVE_PROFILER = None
+
+
+class StageProfiler:
+    """一次顶层运行的层级 span 记录。
+
+    span 以嵌套路径聚合：同一路径重复进入时累加调用次数与耗时；传入 BMesh 时在进入与退出时
+    采样 verts/edges/faces 数量并保留峰值。
+
+    Args:
+        name: 顶层 session 名称，同时作为根 span。
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.spans = {}
+        self.counters = {}
+        self.profile_path = None
+        self.warnings = []
+        self._stack = []
+
+    @contextmanager
+    def span(self, name, bm=None):
+        self._stack.append(name)
+        path = SPAN_PATH_SEPARATOR.join(self._stack)
+        record = self.spans.get(path)
+        if record is None:
+            record = {"calls": 0, "seconds": 0.0}
+            self.spans[path] = record
+        self._observe_bmesh(record, bm)
+        started_at = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["calls"] += 1
+            record["seconds"] += time.perf_counter() - started_at
+            self._observe_bmesh(record, bm)
+            self._stack.pop()
+
+    # 累加一个计数器；计数器按当前 span 路径限定，便于区分不同阶段的同名计数。
+    # name: 计数器名称；value: 增量。
+    def count(self, name, value=1):
+        path = SPAN_PATH_SEPARATOR.join(self._stack + [name])
+        self.counters[path] = self.counters.get(path, 0) + value
+
+    # 在 span 内部额外采样一次 BMesh 元素数量，用于长阶段中途的峰值。
+    # bm: 当前 BMesh。
+    def observe_bmesh(self, bm):
+        if self._stack:
+            self._observe_bmesh(self.spans[SPAN_PATH_SEPARATOR.join(self._stack)], bm)
+
+    def _observe_bmesh(self, record, bm):
+        if bm is None or not bm.is_valid:
+            return
+        peak = record.setdefault("peak_bmesh", {"verts": 0, "edges": 0, "faces": 0})
+        peak["verts"] = max(peak["verts"], len(bm.verts))
+        peak["edges"] = max(peak["edges"], len(bm.edges))
+        peak["faces"] = max(peak["faces"], len(bm.faces))
+
+    # 返回 JSON 友好的汇总；spans 保持首次进入顺序。
+    def summary(self):
+        return {
+            "name": self.name,
+            "spans": {
+                path: {
+                    **record,
+                    "seconds": round(record["seconds"], 6),
+                }
+                for path, record in self.spans.items()
+            },
+            "counters": dict(self.counters),
+            "profile_path": self.profile_path,
+            "warnings": list(self.warnings),
+        }
+
+
+# 返回当前活动的 StageProfiler；无活动 session 时返回 None。
+def active_profiler():
+    return _ACTIVE_PROFILER
+
+
+# 开启一个顶层 profiling session；已有活动 session 时只在其中嵌套一个同名 span。
+# name: session / 根 span 名称；profile_dir: cProfile 输出目录，默认读取 HST_FEATURE_CHAMFER_PROFILE_DIR。
+@contextmanager
+def profiling_session(name, profile_dir=None):
+    global _ACTIVE_PROFILER
+
+    if _ACTIVE_PROFILER is not None:
+        with _ACTIVE_PROFILER.span(name):
+            yield _ACTIVE_PROFILER
+        return
+
+    profiler = StageProfiler(name)
+    profile_dir = profile_dir or os.environ.get(PROFILE_DIR_ENV)
+    capture = None
+    if profile_dir:
+        capture = cProfile.Profile()
+        try:
+            capture.enable()
+        except ValueError as error:
+            # 同一进程已有其他 profiler（调试器、外部 cProfile）时只保留 span 统计。
+            profiler.warnings.append(f"cProfile capture skipped: {error}")
+            capture = None
+    _ACTIVE_PROFILER = profiler
+    try:
+        with profiler.span(name):
+            yield profiler
+    finally:
+        _ACTIVE_PROFILER = None
+        if capture is not None:
+            capture.disable()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            profile_path = Path(profile_dir) / f"{name}_{timestamp}.prof"
+            try:
+                profile_path.parent.mkdir(parents=True, exist_ok=True)
+                capture.dump_stats(str(profile_path))
+                profiler.profile_path = str(profile_path)
+            except OSError as error:
+                profiler.warnings.append(f"cProfile write failed at {profile_path}: {error}")
+
+
+# 在活动 session 中记录一个 span；无活动 session 时返回空 context，开销可忽略。
+# name: span 名称；bm: 可选 BMesh，用于采样元素峰值。
+def profile_span(name, bm=None):
+    if _ACTIVE_PROFILER is None:
+        return nullcontext()
+    return _ACTIVE_PROFILER.span(name, bm)
+
+
+# 在活动 session 中累加计数器；无活动 session 时不做任何事。
+# name: 计数器名称；value: 增量。
+def profile_count(name, value=1):
+    if _ACTIVE_PROFILER is not None:
+        _ACTIVE_PROFILER.count(name, value)
+
+
+# 函数装饰器：活动 session 中把整个调用记为一个 span，并从参数中取第一个 BMesh 采样峰值。
+# name: span 名称。
+def profiled(name):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE_PROFILER is None:
+                return function(*args, **kwargs)
+            bm = next(
+                (
+                    value
+                    for value in (*args, *kwargs.values())
+                    if isinstance(value, bmesh.types.BMesh)
+                ),
+                None,
+            )
+            with _ACTIVE_PROFILER.span(name, bm):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
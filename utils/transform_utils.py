@@ -163,6 +163,35 @@ class Transform:
         if original_active:
             bpy.context.view_layer.objects.active = original_active
 
+    @staticmethod
+    def apply_batch(objects, location: bool = True, rotation: bool = True, scale: bool = True):
+        """
+        一次 transform_apply 应用多个对象的变换，避免逐对象 select_all
+
+        Args:
+            objects: 目标对象列表
+            location: 是否应用位置
+            rotation: 是否应用旋转
+            scale: 是否应用缩放
+        """
+        if not objects:
+            return
+        original_active = bpy.context.active_object
+        original_selected = bpy.context.selected_objects.copy()
+
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in objects:
+            obj.select_set(True)
+        bpy.context.view_layer.objects.active = objects[0]
+
+        bpy.ops.object.transform_apply(location=location, rotation=rotation, scale=scale)
+
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in original_selected:
+            obj.select_set(True)
+        if original_active:
+            bpy.context.view_layer.objects.active = original_active
+
     @staticmethod
     def ops_apply(object, location: bool = True, rotation: bool = True, scale: bool = True):
         """
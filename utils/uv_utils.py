@@ -6,9 +6,24 @@ UV 操作工具函数
 包含 UV 层管理、展开、缩放等功能。
 """
 
+import time
+
 import bpy
 from mathutils import Vector
 
+from .mesh_array_utils import HAS_NUMPY
+from .mesh_array_utils import connected_component_labels
+from .mesh_array_utils import loop_polygon_indices
+from .mesh_array_utils import manifold_edge_corners
+from .mesh_array_utils import next_loop_indices
+from .mesh_array_utils import np
+from .mesh_array_utils import read_corner_topology
+from .mesh_array_utils import read_polygon_loop_ranges
+
+# Texel Density 报告的默认面积加权分位点与直方图 bin 数
+TEXEL_DENSITY_PERCENTILES = (5, 25, 50, 75, 95)
+TEXEL_DENSITY_HISTOGRAM_BINS = 32
+
 
 def rename_uv_layers(
     target_object: bpy.types.Object, new_name: str, uv_index: int = 0
@@ -146,10 +161,174 @@ def uv_unwrap(target_objects, method: str = "ANGLE_BASED", margin: float = 0.005
     bpy.ops.object.mode_set(mode="OBJECT")
 
 
+def batch_merge_and_unwrap(
+    target_objects,
+    method: str = "ANGLE_BASED",
+    margin: float = 0.005,
+    correct_aspect: bool = True,
+    merge_doubles: bool = True,
+):
+    """
+    在一次多对象 Edit Mode 会话中合并重复顶点并展开 UV
+
+    全部 Mesh 同时进入 Edit Mode，remove_doubles 与 unwrap 各只调用一次，
+    避免逐对象 mode_set。调用前应处于 Object Mode。
+
+    Args:
+        target_objects: 目标对象列表，非 Mesh 对象被忽略
+        method: 展开方法 (ANGLE_BASED, CONFORMAL)
+        margin: 岛间距
+        correct_aspect: 是否校正宽高比
+        merge_doubles: 是否先执行合并重复顶点
+
+    Returns:
+        各阶段耗时 dict（秒）
+    """
+    timings = {}
+    meshes = [obj for obj in target_objects if obj.type == "MESH"]
+    if not meshes:
+        return timings
+
+    started_at = time.perf_counter()
+    bpy.ops.object.select_all(action="DESELECT")
+    for obj in meshes:
+        obj.select_set(True)
+    if bpy.context.view_layer.objects.active not in meshes:
+        bpy.context.view_layer.objects.active = meshes[0]
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    timings["enter_edit_mode"] = time.perf_counter() - started_at
+
+    if merge_doubles:
+        started_at = time.perf_counter()
+        bpy.ops.mesh.remove_doubles()
+        timings["merge_doubles"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    bpy.ops.uv.unwrap(
+        method=method, fill_holes=False, correct_aspect=correct_aspect, margin=margin
+    )
+    timings["unwrap"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    bpy.ops.object.mode_set(mode="OBJECT")
+    timings["exit_edit_mode"] = time.perf_counter() - started_at
+    return timings
+
+
+def uv_island_labels(mesh_data, uvs, topology: dict | None = None):
+    """
+    按 UV 连通性划分 UV 岛
+
+    两个面共享一条 manifold 边、该边不是 Seam、且两侧在边两端的 UV 完全相同时视为同一岛。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        uvs: (loop_count, 2) UV 数组
+        topology: 可选的 read_corner_topology 结果，避免重复读取
+
+    Returns:
+        (labels, island_count)：labels 为与面等长的岛编号数组
+    """
+    if topology is None:
+        topology = read_corner_topology(mesh_data)
+    corners = manifold_edge_corners(mesh_data, topology)
+    seams = np.zeros(len(mesh_data.edges), dtype=bool)
+    if len(seams):
+        mesh_data.edges.foreach_get("use_seam", seams)
+    connected = (
+        ~seams[corners["edges"]]
+        & np.all(uvs[corners["corners_a0"]] == uvs[corners["corners_b0"]], axis=1)
+        & np.all(uvs[corners["corners_a1"]] == uvs[corners["corners_b1"]], axis=1)
+    )
+    return connected_component_labels(
+        len(mesh_data.polygons),
+        corners["polygons_a"][connected],
+        corners["polygons_b"][connected],
+    )
+
+
+def average_islands_scale(target_object, uv_layer_name: str | None = None) -> dict | None:
+    """
+    不调用 bpy.ops.uv.average_islands_scale，直接用 UV / 面积数组平均各 UV 岛的缩放
+
+    与 Blender 相同：岛缩放系数为 sqrt((岛 3D 面积 / 岛 UV 面积) / (总 3D 面积 / 总 UV 面积))，
+    以岛 UV 包围盒中心为缩放中心，UV 总面积保持不变。调用时对象应处于 Object Mode。
+
+    Args:
+        target_object: 目标 mesh 对象
+        uv_layer_name: UV 层名称；None 时使用激活 UV 层
+
+    Returns:
+        {"islands", "scaled_islands"} 统计；没有对应 UV 层时返回 None
+    """
+    mesh_data = target_object.data
+    uv_layer = mesh_data.uv_layers.get(uv_layer_name) if uv_layer_name else mesh_data.uv_layers.active
+    if uv_layer is None:
+        return None
+    if len(mesh_data.polygons) == 0:
+        return {"islands": 0, "scaled_islands": 0}
+
+    topology = read_corner_topology(mesh_data)
+    loop_starts = topology["loop_starts"]
+    loop_totals = topology["loop_totals"]
+    uvs = _read_uv_array(uv_layer)
+    labels, island_count = uv_island_labels(mesh_data, uvs, topology)
+
+    island_area_3d = np.bincount(labels, weights=_read_polygon_areas(mesh_data), minlength=island_count)
+    island_area_uv = np.bincount(
+        labels, weights=_polygon_uv_areas(uvs, loop_starts, loop_totals), minlength=island_count
+    )
+    valid = (island_area_3d > 0) & (island_area_uv > 0)
+    total_area_uv = island_area_uv[valid].sum()
+    if not valid.any() or total_area_uv <= 0:
+        return {"islands": island_count, "scaled_islands": 0}
+    total_factor = island_area_3d[valid].sum() / total_area_uv
+    factors = np.ones(island_count, dtype=np.float64)
+    factors[valid] = np.sqrt(island_area_3d[valid] / island_area_uv[valid] / total_factor)
+
+    # 每个 corner 所属岛；按岛排序后用 reduceat 求各岛 UV 包围盒
+    loop_islands = labels[loop_polygon_indices(loop_starts, loop_totals)]
+    order = np.argsort(loop_islands, kind="stable")
+    island_starts = np.searchsorted(loop_islands[order], np.arange(island_count))
+    sorted_uvs = uvs[order]
+    centers = (
+        np.minimum.reduceat(sorted_uvs, island_starts, axis=0)
+        + np.maximum.reduceat(sorted_uvs, island_starts, axis=0)
+    ) / 2.0
+
+    loop_centers = centers[loop_islands]
+    scaled = loop_centers + (uvs - loop_centers) * factors[loop_islands][:, None]
+    uv_layer.data.foreach_set("uv", scaled.astype(np.float32).ravel())
+    mesh_data.update()
+    return {"islands": island_count, "scaled_islands": int(valid.sum())}
+
+
 def uv_average_scale(target_objects, uv_layer_name: str = "UVMap"):
     """
     UV 平均缩放
 
+    有 NumPy 时直接改写 UV 数组，不切换 Edit Mode；否则回退到逐对象 bpy.ops.uv.average_islands_scale。
+
+    Args:
+        target_objects: 目标对象列表
+        uv_layer_name: UV 层名称
+    """
+    if not HAS_NUMPY:
+        _uv_average_scale_ops(target_objects, uv_layer_name)
+        return
+
+    for obj in target_objects:
+        if obj.type != 'MESH' or uv_layer_name not in obj.data.uv_layers:
+            continue
+        obj.data.uv_layers[uv_layer_name].active = True
+        average_islands_scale(obj, uv_layer_name)
+
+
+def _uv_average_scale_ops(target_objects, uv_layer_name: str = "UVMap"):
+    """
+    UV 平均缩放（ops 路径），NumPy 不可用时使用
+
     Args:
         target_objects: 目标对象列表
         uv_layer_name: UV 层名称
@@ -180,9 +359,56 @@ def uv_average_scale(target_objects, uv_layer_name: str = "UVMap"):
         bpy.context.view_layer.objects.active = original_active
 
 
-def culculate_td_areas(mesh, texture_size_x: int, texture_size_y: int):
+def _read_uv_array(uv_layer):
     """
-    计算 TD 每个面的大小，输出列表
+    读取 UV 层全部 corner 坐标
+
+    Args:
+        uv_layer: MeshUVLoopLayer
+
+    Returns:
+        形状为 (loop_count, 2) 的 float64 数组
+    """
+    uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2).astype(np.float64)
+
+
+def _read_polygon_areas(mesh_data):
+    """
+    读取每个面的 3D 面积（局部坐标）
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        与面等长的 float64 数组
+    """
+    face_areas = np.empty(len(mesh_data.polygons), dtype=np.float32)
+    mesh_data.polygons.foreach_get("area", face_areas)
+    return face_areas.astype(np.float64)
+
+
+def _polygon_uv_areas(uvs, loop_starts, loop_totals):
+    """
+    shoelace 计算每个面的 UV 面积：corner 与面内下一个 corner 的叉积经 np.add.reduceat 按面求和
+
+    Args:
+        uvs: (loop_count, 2) UV 数组
+        loop_starts: 面 loop 起点数组
+        loop_totals: 面 corner 数量数组
+
+    Returns:
+        与面等长的 float64 数组
+    """
+    next_loops = next_loop_indices(loop_starts, loop_totals, len(uvs))
+    cross = uvs[:, 0] * uvs[next_loops, 1] - uvs[next_loops, 0] * uvs[:, 1]
+    return np.abs(np.add.reduceat(cross, loop_starts)) / 2.0
+
+
+def _texel_density_samples_bmesh(mesh, texture_size_x: int, texture_size_y: int):
+    """
+    BMesh 逐面计算 TD 与 3D 面积，NumPy 不可用时的回退路径
 
     Args:
         mesh: 目标 mesh 对象
@@ -190,23 +416,24 @@ def culculate_td_areas(mesh, texture_size_x: int, texture_size_y: int):
         texture_size_y: 贴图高度
 
     Returns:
-        TD 面积列表
+        (TD 列表, 3D 面积列表)，只包含 3D 面积 > 0 的面；没有激活 UV 时返回 None
     """
     import bmesh
-    
-    td_areas = []
+
     bm = bmesh.new()
     bm.from_mesh(mesh.data)
-    
+
     uv_layer = bm.loops.layers.uv.active
     if uv_layer is None:
         bm.free()
-        return td_areas
-    
+        return None
+
+    td_areas = []
+    face_areas = []
     for face in bm.faces:
         # 计算 3D 面积
         face_area_3d = face.calc_area()
-        
+
         # 计算 UV 面积
         uvs = [loop[uv_layer].uv for loop in face.loops]
         uv_area = 0.0
@@ -215,19 +442,76 @@ def culculate_td_areas(mesh, texture_size_x: int, texture_size_y: int):
             uv_area += uvs[i].x * uvs[j].y
             uv_area -= uvs[j].x * uvs[i].y
         uv_area = abs(uv_area) / 2.0
-        
+
         # 转换为像素面积
         uv_area_pixels = uv_area * texture_size_x * texture_size_y
-        
+
         if face_area_3d > 0:
-            td = (uv_area_pixels / face_area_3d) ** 0.5
-            td_areas.append(td)
-    
+            td_areas.append((uv_area_pixels / face_area_3d) ** 0.5)
+            face_areas.append(face_area_3d)
+
     bm.free()
-    return td_areas
+    return td_areas, face_areas
+
+
+def _texel_density_samples_numpy(mesh, texture_size_x: int, texture_size_y: int):
+    """
+    用 foreach_get 数组一次性计算全部面的 TD 与 3D 面积
+
+    Args:
+        mesh: 目标 mesh 对象
+        texture_size_x: 贴图宽度
+        texture_size_y: 贴图高度
+
+    Returns:
+        (TD 数组, 3D 面积数组)，只包含 3D 面积 > 0 的面；没有激活 UV 时返回 None
+    """
+    mesh_data = mesh.data
+    uv_layer = mesh_data.uv_layers.active
+    if uv_layer is None:
+        return None
+
+    if len(mesh_data.polygons) == 0:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64)
+
+    loop_starts, loop_totals = read_polygon_loop_ranges(mesh_data)
+    uvs = _read_uv_array(uv_layer)
+    uv_areas = _polygon_uv_areas(uvs, loop_starts, loop_totals)
+    face_areas = _read_polygon_areas(mesh_data)
+
+    valid = face_areas > 0
+    td_areas = np.sqrt(uv_areas[valid] * texture_size_x * texture_size_y / face_areas[valid])
+    return td_areas, face_areas[valid]
 
 
-def get_texel_density(target_object, texture_size_x: int = 1024, texture_size_y: int = 1024):
+def _texel_density_samples(mesh, texture_size_x: int, texture_size_y: int):
+    if HAS_NUMPY:
+        return _texel_density_samples_numpy(mesh, texture_size_x, texture_size_y)
+    return _texel_density_samples_bmesh(mesh, texture_size_x, texture_size_y)
+
+
+def culculate_td_areas(mesh, texture_size_x: int, texture_size_y: int):
+    """
+    计算 TD 每个面的大小，输出列表
+
+    Args:
+        mesh: 目标 mesh 对象
+        texture_size_x: 贴图宽度
+        texture_size_y: 贴图高度
+
+    Returns:
+        TD 面积列表
+    """
+    samples = _texel_density_samples(mesh, texture_size_x, texture_size_y)
+    if samples is None:
+        return []
+    td_areas = samples[0]
+    return td_areas.tolist() if HAS_NUMPY else td_areas
+
+
+def get_texel_density(
+    target_object, texture_size_x: int = 1024, texture_size_y: int = 1024, area_weighted: bool = False
+):
     """
     获取 UV 的 Texel Density
 
@@ -235,19 +519,213 @@ def get_texel_density(target_object, texture_size_x: int = 1024, texture_size_y:
         target_object: 目标对象
         texture_size_x: 贴图宽度
         texture_size_y: 贴图高度
+        area_weighted: 按 3D 面积加权平均；默认逐面等权平均
 
     Returns:
         平均 Texel Density
     """
     if target_object.type != 'MESH':
         return None
-    
-    td_areas = culculate_td_areas(target_object, texture_size_x, texture_size_y)
-    
-    if not td_areas:
+
+    samples = _texel_density_samples(target_object, texture_size_x, texture_size_y)
+    if samples is None or len(samples[0]) == 0:
         return None
-    
-    return sum(td_areas) / len(td_areas)
+
+    if area_weighted:
+        return _texel_density_means(samples)[1]
+    return _texel_density_means(samples)[0]
+
+
+def _total(values):
+    return float(values.sum()) if HAS_NUMPY else float(sum(values))
+
+
+def _value_range(values):
+    if HAS_NUMPY:
+        return float(values.min()), float(values.max())
+    return float(min(values)), float(max(values))
+
+
+def _texel_density_means(samples):
+    """
+    返回 (逐面等权平均, 3D 面积加权平均)；总面积为 0 时加权平均退回等权平均
+
+    Args:
+        samples: _texel_density_samples 的非空结果
+    """
+    td_areas, face_areas = samples
+    mean = _total(td_areas) / len(td_areas)
+    surface_area = _total(face_areas)
+    if surface_area <= 0:
+        return mean, mean
+    if HAS_NUMPY:
+        weighted_sum = float(np.dot(td_areas, face_areas))
+    else:
+        weighted_sum = sum(td * area for td, area in zip(td_areas, face_areas))
+    return mean, weighted_sum / surface_area
+
+
+def _weighted_percentiles(values, weights, percentiles):
+    """
+    面积加权分位数：累计面积占比首次达到 p% 时的 TD 值
+
+    Args:
+        values: TD 序列
+        weights: 对应 3D 面积
+        percentiles: 0-100 的分位点序列
+
+    Returns:
+        与 percentiles 对应的 TD 列表
+    """
+    if HAS_NUMPY:
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(percentiles, dtype=np.float64) / 100.0 * cumulative[-1]
+        indices = np.minimum(np.searchsorted(cumulative, targets, side="left"), len(order) - 1)
+        return [float(value) for value in values[order][indices]]
+
+    import bisect
+    from itertools import accumulate
+
+    ordered = sorted(zip(values, weights))
+    cumulative = list(accumulate(weight for _, weight in ordered))
+    return [
+        ordered[min(bisect.bisect_left(cumulative, percentile / 100.0 * cumulative[-1]), len(ordered) - 1)][0]
+        for percentile in percentiles
+    ]
+
+
+def _texel_density_histogram(values, weights, bin_edges):
+    """
+    按给定 bin 边界统计 TD 直方图；最后一个 bin 包含右边界
+
+    Args:
+        values: TD 序列
+        weights: 对应 3D 面积
+        bin_edges: 单调递增的 bin 边界
+
+    Returns:
+        {"edges", "face_counts", "areas"}
+    """
+    if HAS_NUMPY:
+        face_counts, _ = np.histogram(values, bins=bin_edges)
+        areas, _ = np.histogram(values, bins=bin_edges, weights=weights)
+        face_counts = face_counts.tolist()
+        areas = areas.tolist()
+    else:
+        import bisect
+
+        bin_count = len(bin_edges) - 1
+        face_counts = [0] * bin_count
+        areas = [0.0] * bin_count
+        for value, weight in zip(values, weights):
+            if value < bin_edges[0] or value > bin_edges[-1]:
+                continue
+            index = min(bisect.bisect_right(bin_edges, value) - 1, bin_count - 1)
+            face_counts[index] += 1
+            areas[index] += weight
+    return {"edges": [float(edge) for edge in bin_edges], "face_counts": face_counts, "areas": areas}
+
+
+def _histogram_edges(minimum: float, maximum: float, bins: int):
+    if maximum <= minimum:
+        maximum = minimum + 1.0
+    step = (maximum - minimum) / bins
+    return [minimum + step * index for index in range(bins)] + [maximum]
+
+
+def _texel_density_statistics(samples, percentiles, bin_edges):
+    td_areas, face_areas = samples
+    mean, weighted_mean = _texel_density_means(samples)
+    minimum, maximum = _value_range(td_areas)
+    return {
+        "faces": len(td_areas),
+        "surface_area": _total(face_areas),
+        "mean": mean,
+        "weighted_mean": weighted_mean,
+        "min": minimum,
+        "max": maximum,
+        "percentiles": {
+            f"p{percentile:g}": value
+            for percentile, value in zip(
+                percentiles, _weighted_percentiles(td_areas, face_areas, percentiles)
+            )
+        },
+        "histogram": _texel_density_histogram(td_areas, face_areas, bin_edges),
+    }
+
+
+def texel_density_report(
+    target_object,
+    texture_size_x: int = 1024,
+    texture_size_y: int = 1024,
+    percentiles=TEXEL_DENSITY_PERCENTILES,
+    bins: int = TEXEL_DENSITY_HISTOGRAM_BINS,
+):
+    """
+    单个对象的 Texel Density 统计：等权 / 面积加权平均、面积加权分位数与直方图
+
+    Args:
+        target_object: 目标对象
+        texture_size_x: 贴图宽度
+        texture_size_y: 贴图高度
+        percentiles: 0-100 的分位点序列
+        bins: 直方图 bin 数，范围为该对象 TD 的 min/max
+
+    Returns:
+        统计 dict；非 Mesh、没有激活 UV 或没有有效面时返回 None
+    """
+    if target_object.type != 'MESH':
+        return None
+    samples = _texel_density_samples(target_object, texture_size_x, texture_size_y)
+    if samples is None or len(samples[0]) == 0:
+        return None
+    bin_edges = _histogram_edges(*_value_range(samples[0]), bins)
+    return _texel_density_statistics(samples, percentiles, bin_edges)
+
+
+def batch_texel_density(
+    target_objects,
+    texture_size_x: int = 1024,
+    texture_size_y: int = 1024,
+    percentiles=TEXEL_DENSITY_PERCENTILES,
+    bins: int = TEXEL_DENSITY_HISTOGRAM_BINS,
+):
+    """
+    批量统计多个对象的 Texel Density，直方图使用全部对象共同的 bin 边界，便于横向比较
+
+    Args:
+        target_objects: 目标对象列表，非 Mesh 对象被忽略
+        texture_size_x: 贴图宽度
+        texture_size_y: 贴图高度
+        percentiles: 0-100 的分位点序列
+        bins: 直方图 bin 数
+
+    Returns:
+        对象名 -> texel_density_report 同结构 dict；没有激活 UV 或没有有效面的对象为 None
+    """
+    samples_by_name = {}
+    minimum = None
+    maximum = None
+    for obj in target_objects:
+        if obj.type != 'MESH':
+            continue
+        samples = _texel_density_samples(obj, texture_size_x, texture_size_y)
+        if samples is not None and len(samples[0]) == 0:
+            samples = None
+        samples_by_name[obj.name] = samples
+        if samples is not None:
+            low, high = _value_range(samples[0])
+            minimum = low if minimum is None else min(minimum, low)
+            maximum = high if maximum is None else max(maximum, high)
+
+    if minimum is None:
+        return {name: None for name in samples_by_name}
+    bin_edges = _histogram_edges(minimum, maximum, bins)
+    return {
+        name: _texel_density_statistics(samples, percentiles, bin_edges) if samples is not None else None
+        for name, samples in samples_by_name.items()
+    }
 
 
 class UV:
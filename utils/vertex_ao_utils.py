@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""CPU 顶点 AO 烘焙：BVHTree 射线遮蔽，按对象可分片给 headless Blender worker，结果 foreach_set 写入颜色属性。"""
+
+import json
+import math
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+
+import bpy
+from mathutils.bvhtree import BVHTree
+
+from .batch_export_utils import resolve_worker_count
+from .mesh_array_utils import HAS_NUMPY
+from .mesh_array_utils import np
+from .mesh_array_utils import read_corner_normals
+from .mesh_array_utils import read_loop_arrays
+from .mesh_array_utils import read_vertex_positions
+from .vertex_color_utils import add_vertexcolor_attribute
+
+VERTEX_AO_WORKER_SCRIPT_PATH = Path(__file__).with_name("vertex_ao_worker.py")
+VERTEX_AO_LOG_PREFIX = "[HST_VERTEX_AO]"
+# POINT：每顶点按平滑法线采样后写入其全部 corner；CORNER：每 corner 按 split normal 采样，保留硬边差异。
+VERTEX_AO_DOMAINS = ("POINT", "CORNER")
+# ALL：全部烘焙对象合并为一棵遮挡 BVH（与 Cycles 烘焙时可见 proxy 互相遮挡一致）；SELF：每对象只被自身遮挡。
+VERTEX_AO_OCCLUDERS = ("ALL", "SELF")
+
+
+class VertexAOBakeError(RuntimeError):
+    """CPU 顶点 AO 烘焙失败。"""
+
+
+@dataclass
+class VertexAOSettings:
+    samples: int = 64
+    distance: float = 1.0
+    seed: int = 0
+    # 射线起点沿法线的偏移，按 distance 比例计算，避免与起点所在面自相交。
+    bias: float = 1.0e-4
+    domain: str = "POINT"
+    occluders: str = "ALL"
+    # 每批处理的采样点数量，限制方向数组 (batch, samples, 3) 的内存。
+    batch_size: int = 4096
+
+
+# 生成确定性的余弦加权半球方向（局部 +Z 为法线）；两维均按 Latin hypercube 分层抖动。
+# samples: 射线数；seed: 随机种子；返回 (samples, 3) float64 数组。
+def hemisphere_directions(samples, seed):
+    rng = np.random.default_rng(seed)
+    strata = np.arange(samples, dtype=np.float64)
+    u1 = (strata + rng.random(samples)) / samples
+    u2 = (rng.permutation(samples) + rng.random(samples)) / samples
+    radius = np.sqrt(u1)
+    phi = 2.0 * math.pi * u2
+    return np.stack(
+        (radius * np.cos(phi), radius * np.sin(phi), np.sqrt(np.maximum(0.0, 1.0 - u1))),
+        axis=1,
+    )
+
+
+# 为每个采样点构造绕法线随机旋转的切线框架，打散各点共用方向表造成的条纹。
+# normals: (n, 3) 单位法线；angles: (n,) 旋转角；返回 (tangents, bitangents)。
+def _tangent_frames(normals, angles):
+    helper = np.zeros_like(normals)
+    use_x = np.abs(normals[:, 0]) < 0.9
+    helper[use_x, 0] = 1.0
+    helper[~use_x, 1] = 1.0
+    tangents = np.cross(normals, helper)
+    tangents /= np.linalg.norm(tangents, axis=1)[:, None]
+    bitangents = np.cross(normals, tangents)
+    cos_angles = np.cos(angles)[:, None]
+    sin_angles = np.sin(angles)[:, None]
+    return (
+        cos_angles * tangents + sin_angles * bitangents,
+        cos_angles * bitangents - sin_angles * tangents,
+    )
+
+
+# 对一组采样点逐批发射半球射线，返回未被遮挡的比例（1.0 为完全开放）。
+# bvh: 遮挡 BVHTree；origins/normals: (n, 3) 世界空间；settings: VertexAOSettings；返回 (n,) float32。
+def trace_ambient_occlusion(bvh, origins, normals, settings):
+    count = len(origins)
+    ao = np.ones(count, dtype=np.float32)
+    if count == 0 or settings.samples <= 0:
+        return ao
+    directions = hemisphere_directions(settings.samples, settings.seed)
+    angles = np.random.default_rng((settings.seed, count)).random(count) * (2.0 * math.pi)
+    offset = max(settings.distance * settings.bias, 1.0e-6)
+    ray_cast = bvh.ray_cast
+    distance = settings.distance
+    for start in range(0, count, max(1, settings.batch_size)):
+        stop = min(count, start + max(1, settings.batch_size))
+        batch_normals = normals[start:stop]
+        tangents, bitangents = _tangent_frames(batch_normals, angles[start:stop])
+        world_directions = (
+            directions[None, :, 0:1] * tangents[:, None, :]
+            + directions[None, :, 1:2] * bitangents[:, None, :]
+            + directions[None, :, 2:3] * batch_normals[:, None, :]
+        )
+        batch_origins = (origins[start:stop] + batch_normals * offset).tolist()
+        for local_index, (origin, point_directions) in enumerate(
+            zip(batch_origins, world_directions.tolist())
+        ):
+            hits = 0
+            for direction in point_directions:
+                if ray_cast(origin, direction, distance)[0] is not None:
+                    hits += 1
+            ao[start + local_index] = 1.0 - hits / settings.samples
+    return ao
+
+
+# 读取顶点法线，兼容 3.5 前的 MeshVertex.normal。
+# mesh_data: 目标 Mesh；返回 (vertex_count, 3) float64 数组。
+def _read_vertex_normals(mesh_data):
+    normals = np.empty(len(mesh_data.vertices) * 3, dtype=np.float32)
+    vertex_normals = getattr(mesh_data, "vertex_normals", None)
+    if vertex_normals is not None:
+        vertex_normals.foreach_get("vector", normals)
+    else:
+        mesh_data.vertices.foreach_get("normal", normals)
+    return normals.reshape(-1, 3).astype(np.float64)
+
+
+# 把局部坐标与法线变换到世界空间；法线使用逆转置矩阵并重新归一化。
+# target_object: Mesh Object；positions/normals: 局部数组；返回 (world_positions, world_normals)。
+def _to_world(target_object, positions, normals):
+    matrix = np.array(target_object.matrix_world, dtype=np.float64)
+    linear = matrix[:3, :3]
+    world_positions = positions @ linear.T + matrix[:3, 3]
+    world_normals = normals @ np.linalg.inv(linear)
+    lengths = np.linalg.norm(world_normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    return world_positions, world_normals / lengths[:, None]
+
+
+# 收集对象的世界空间采样点。
+# target_object: Mesh Object；domain: POINT / CORNER；
+# 返回 (origins, normals, loop_samples)，loop_samples 为每个 corner 对应的采样点索引。
+def object_ao_samples(target_object, domain):
+    mesh_data = target_object.data
+    loop_vertices, _ = read_loop_arrays(mesh_data)
+    positions = read_vertex_positions(mesh_data)
+    if domain == "CORNER":
+        origins, normals = _to_world(
+            target_object, positions[loop_vertices], read_corner_normals(mesh_data)
+        )
+        return origins, normals, np.arange(len(loop_vertices), dtype=np.int32)
+    origins, normals = _to_world(target_object, positions, _read_vertex_normals(mesh_data))
+    return origins, normals, loop_vertices
+
+
+# 读取对象三角化后的世界空间几何，用于构建遮挡 BVH。
+# target_object: Mesh Object；返回 (vertices (n, 3) float64, triangles (m, 3) int32)。
+def object_world_triangles(target_object):
+    mesh_data = target_object.data
+    mesh_data.calc_loop_triangles()
+    triangles = np.empty(len(mesh_data.loop_triangles) * 3, dtype=np.int32)
+    mesh_data.loop_triangles.foreach_get("vertices", triangles)
+    positions = read_vertex_positions(mesh_data)
+    matrix = np.array(target_object.matrix_world, dtype=np.float64)
+    return positions @ matrix[:3, :3].T + matrix[:3, 3], triangles.reshape(-1, 3)
+
+
+# 合并多组三角形几何，三角形索引按顶点偏移重排。
+# geometries: [(vertices, triangles)]；返回合并后的 (vertices, triangles)。
+def merge_triangle_geometries(geometries):
+    vertex_blocks = []
+    triangle_blocks = []
+    offset = 0
+    for vertices, triangles in geometries:
+        vertex_blocks.append(vertices)
+        triangle_blocks.append(triangles + offset)
+        offset += len(vertices)
+    if not vertex_blocks:
+        return np.zeros((0, 3), dtype=np.float64), np.zeros((0, 3), dtype=np.int32)
+    return np.concatenate(vertex_blocks), np.concatenate(triangle_blocks)
+
+
+# 从三角形数组构建 BVHTree。
+# vertices/triangles: merge_triangle_geometries 或 object_world_triangles 的结果；返回 BVHTree。
+def build_occluder_bvh(vertices, triangles):
+    return BVHTree.FromPolygons(vertices.tolist(), triangles.tolist(), all_triangles=True)
+
+
+# 把每 corner 的 AO 写入颜色属性（灰度，alpha=1）；属性缺失时按 wearmask 约定新建 corner BYTE_COLOR。
+# target_object: Mesh Object；attribute_name: 颜色属性名；loop_ao: 与 corner 等长的 AO 数组。
+def write_ao_color_attribute(target_object, attribute_name, loop_ao):
+    mesh_data = target_object.data
+    color_attribute = mesh_data.color_attributes.get(attribute_name)
+    if color_attribute is None:
+        color_attribute = add_vertexcolor_attribute(target_object, attribute_name)
+    if color_attribute is None:
+        raise VertexAOBakeError(f"{target_object.name}: cannot create color attribute {attribute_name}")
+    if color_attribute.domain == "POINT":
+        loop_vertices, _ = read_loop_arrays(mesh_data)
+        vertex_count = len(mesh_data.vertices)
+        totals = np.bincount(loop_vertices, minlength=vertex_count)
+        values = np.bincount(loop_vertices, weights=loop_ao, minlength=vertex_count)
+        values = np.divide(values, totals, out=np.ones(vertex_count), where=totals > 0)
+    else:
+        values = loop_ao
+    colors = np.ones((len(values), 4), dtype=np.float32)
+    colors[:, :3] = np.asarray(values, dtype=np.float32)[:, None]
+    color_attribute.data.foreach_set("color", colors.ravel())
+    mesh_data.update()
+
+
+# 为一个对象烘焙：构建（或复用）遮挡 BVH、追踪采样点，返回每 corner 的 AO。
+# samples: object_ao_samples 结果；occluder: (vertices, triangles) 或已构建的 BVHTree。
+def bake_object_ao(samples, occluder, settings):
+    origins, normals, loop_samples = samples
+    bvh = occluder if isinstance(occluder, BVHTree) else build_occluder_bvh(*occluder)
+    return trace_ambient_occlusion(bvh, origins, normals, settings)[loop_samples]
+
+
+# 最长优先分片：按采样点数从大到小分配给当前负载最小的 worker。
+# costs: 每对象开销；worker_count: 分片数；返回非空的对象索引分片列表。
+def split_ao_shards(costs, worker_count):
+    shards = [[] for _ in range(max(1, worker_count))]
+    loads = [0] * len(shards)
+    for index in sorted(range(len(costs)), key=lambda item: costs[item], reverse=True):
+        shard_index = loads.index(min(loads))
+        shards[shard_index].append(index)
+        loads[shard_index] += costs[index]
+    return [shard for shard in shards if shard]
+
+
+# 把一个分片的采样点与遮挡几何写成 .npz，并写入配套的设置 JSON。
+# shard_dir: 输出目录；shard_index: 分片号；entries: [(对象名, samples, occluder)]；返回 (npz, json) 路径。
+def write_ao_shard(shard_dir, shard_index, entries, shared_occluder, settings):
+    arrays = {}
+    names = []
+    if shared_occluder is not None:
+        arrays["occluder_vertices"], arrays["occluder_triangles"] = shared_occluder
+    for key, (name, samples, occluder) in enumerate(entries):
+        names.append(name)
+        arrays[f"origins_{key}"], arrays[f"normals_{key}"], arrays[f"loop_samples_{key}"] = samples
+        if occluder is not None:
+            arrays[f"vertices_{key}"], arrays[f"triangles_{key}"] = occluder
+    data_path = Path(shard_dir) / f"ao_shard_{shard_index}.npz"
+    plan_path = Path(shard_dir) / f"ao_shard_{shard_index}.json"
+    np.savez(data_path, **arrays)
+    plan_path.write_text(
+        json.dumps({"objects": names, "settings": asdict(settings)}, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return data_path, plan_path
+
+
+# 启动一个 headless Blender AO worker；stdout/stderr 写入独立日志文件。
+# data_path/plan_path/result_path/log_path: 分片数据、设置、结果 .npz 与日志路径；返回 (Popen, log_file)。
+def launch_ao_worker(data_path, plan_path, result_path, log_path):
+    command = [
+        bpy.app.binary_path,
+        "--background",
+        "--factory-startup",
+        "--python",
+        str(VERTEX_AO_WORKER_SCRIPT_PATH),
+        "--",
+        str(data_path),
+        str(plan_path),
+        str(result_path),
+    ]
+    log_file = open(log_path, "w", encoding="utf-8")
+    process = subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT)
+    return process, log_file
+
+
+# 分片执行：每个 worker 处理若干对象并写回 ao_<key> 数组；任一 worker 失败时保留临时目录并抛错。
+# entries: [(对象名, samples, occluder)]；返回 {对象名: loop AO 数组}。
+def _run_sharded_ao(entries, shared_occluder, settings, worker_count):
+    work_dir = Path(tempfile.mkdtemp(prefix="hst_vertex_ao_"))
+    shards = split_ao_shards([len(samples[0]) for _, samples, _ in entries], worker_count)
+    workers = []
+    try:
+        for shard_index, indices in enumerate(shards):
+            shard_entries = [entries[index] for index in indices]
+            data_path, plan_path = write_ao_shard(work_dir, shard_index, shard_entries, shared_occluder, settings)
+            result_path = work_dir / f"ao_shard_{shard_index}.result.npz"
+            log_path = work_dir / f"ao_shard_{shard_index}.log"
+            process, log_file = launch_ao_worker(data_path, plan_path, result_path, log_path)
+            workers.append((shard_entries, process, log_file, result_path, log_path))
+        for _, process, _, _, _ in workers:
+            process.wait()
+    finally:
+        for _, process, log_file, _, _ in workers:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            log_file.close()
+
+    results = {}
+    for shard_entries, process, _, result_path, log_path in workers:
+        if process.returncode != 0 or not result_path.exists():
+            raise VertexAOBakeError(
+                f"AO worker exited with code {process.returncode}; see {log_path}"
+            )
+        with np.load(result_path) as shard_results:
+            for key, (name, _, _) in enumerate(shard_entries):
+                results[name] = shard_results[f"ao_{key}"]
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+# CPU 顶点 AO 烘焙入口：收集采样点与遮挡几何，单进程或按对象分片追踪，最后 foreach_set 写回颜色属性。
+# target_objects: Mesh Object 列表；attribute_name: 目标颜色属性；settings: VertexAOSettings；
+# workers: worker 进程数，1 为进程内执行，<=0 按 CPU 核数自动选择；返回统计与分阶段耗时 dict。
+def bake_vertex_ao(target_objects, attribute_name, settings=None, workers=1):
+    if not HAS_NUMPY:
+        raise VertexAOBakeError("CPU vertex AO bake requires NumPy")
+    settings = settings or VertexAOSettings()
+    if settings.domain not in VERTEX_AO_DOMAINS:
+        raise VertexAOBakeError(f"Unknown AO sample domain: {settings.domain}")
+    if settings.occluders not in VERTEX_AO_OCCLUDERS:
+        raise VertexAOBakeError(f"Unknown AO occluder mode: {settings.occluders}")
+    target_objects = [
+        obj for obj in target_objects if obj.type == "MESH" and len(obj.data.polygons) > 0
+    ]
+    timings = {}
+
+    started_at = time.perf_counter()
+    geometries = [object_world_triangles(obj) for obj in target_objects]
+    shared_occluder = merge_triangle_geometries(geometries) if settings.occluders == "ALL" else None
+    entries = [
+        (
+            obj.name,
+            object_ao_samples(obj, settings.domain),
+            geometry if shared_occluder is None else None,
+        )
+        for obj, geometry in zip(target_objects, geometries)
+    ]
+    timings["collect"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    worker_count = resolve_worker_count(workers, len(entries)) if workers != 1 else 1
+    if worker_count > 1:
+        loop_ao_by_name = _run_sharded_ao(entries, shared_occluder, settings, worker_count)
+    else:
+        shared_bvh = build_occluder_bvh(*shared_occluder) if shared_occluder is not None else None
+        loop_ao_by_name = {
+            name: bake_object_ao(samples, shared_bvh if shared_bvh is not None else occluder, settings)
+            for name, samples, occluder in entries
+        }
+    timings["trace"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for obj in target_objects:
+        write_ao_color_attribute(obj, attribute_name, loop_ao_by_name[obj.name])
+    timings["write"] = time.perf_counter() - started_at
+
+    sample_count = sum(len(samples[0]) for _, samples, _ in entries)
+    stats = {
+        "objects": len(entries),
+        "samples": sample_count,
+        "rays": sample_count * settings.samples,
+        "workers": worker_count,
+        "timings": timings,
+    }
+    print(f"{VERTEX_AO_LOG_PREFIX} {json.dumps(stats)}")
+    return stats
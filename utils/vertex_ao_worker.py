@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""顶点 AO worker：在 headless Blender 中读取分片 .npz，用 BVHTree 追踪并把每对象 AO 写回结果 .npz。
+
+由 vertex_ao_utils.launch_ao_worker 以
+``blender --background --python vertex_ao_worker.py -- shard.npz shard.json result.npz`` 启动。
+作为插件子模块被 auto_load 导入时不执行任何操作。
+"""
+
+import importlib
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+WORKER_PACKAGE_NAME = "hst_vertex_ao_addon"
+
+
+# 以独立包名加载插件源码（不注册 UI/Operator），只用于访问 AO 引擎。
+# addon_root: 插件根目录；返回 vertex_ao_utils 模块。
+def load_vertex_ao_module(addon_root):
+    spec = importlib.util.spec_from_file_location(
+        WORKER_PACKAGE_NAME,
+        Path(addon_root) / "__init__.py",
+        submodule_search_locations=[str(addon_root)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[WORKER_PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return importlib.import_module(f"{WORKER_PACKAGE_NAME}.utils.vertex_ao_utils")
+
+
+def main(argv):
+    data_path, plan_path, result_path = argv[argv.index("--") + 1:][:3]
+    ao_utils = load_vertex_ao_module(Path(__file__).resolve().parent.parent)
+    np = ao_utils.np
+    plan = json.loads(Path(plan_path).read_text(encoding="utf-8"))
+    settings = ao_utils.VertexAOSettings(**plan["settings"])
+
+    results = {}
+    with np.load(data_path) as data:
+        shared_bvh = None
+        if "occluder_vertices" in data:
+            shared_bvh = ao_utils.build_occluder_bvh(data["occluder_vertices"], data["occluder_triangles"])
+        for key, name in enumerate(plan["objects"]):
+            samples = (data[f"origins_{key}"], data[f"normals_{key}"], data[f"loop_samples_{key}"])
+            occluder = shared_bvh
+            if occluder is None:
+                occluder = (data[f"vertices_{key}"], data[f"triangles_{key}"])
+            results[f"ao_{key}"] = ao_utils.bake_object_ao(samples, occluder, settings)
+            print(f"{ao_utils.VERTEX_AO_LOG_PREFIX} baked {name}: {len(samples[0])} samples")
+    # np.savez 会给无后缀路径补 .npz；这里直接写入文件对象以保持调用方指定的路径。
+    with open(result_path, "wb") as result_file:
+        np.savez(result_file, **results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
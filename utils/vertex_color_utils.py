@@ -9,6 +9,10 @@
 import bpy
 import bmesh
 
+from .mesh_array_utils import HAS_NUMPY, np, read_loop_arrays, read_polygon_loop_ranges
+
+COLOR_CHANNELS = 4
+
 
 def cleanup_color_attributes(target_object: bpy.types.Object) -> bool:
     """
@@ -85,6 +89,81 @@ def set_active_color_attribute(target_object, vertexcolor_name: str) -> None:
     return color_attribute
 
 
+def find_color_attribute(mesh_data: bpy.types.Mesh):
+    """
+    查找用于读取的顶点色属性：优先 active color，否则取第一个 POINT/CORNER 顶点色
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+
+    Returns:
+        顶点色属性，没有时返回 None
+    """
+    active_color = mesh_data.attributes.active_color
+    if active_color is not None and active_color.domain in {"POINT", "CORNER"}:
+        return active_color
+    for color_attribute in mesh_data.color_attributes:
+        if color_attribute.domain in {"POINT", "CORNER"}:
+            return color_attribute
+    return None
+
+
+def read_color_array(color_attribute, srgb: bool = True):
+    """
+    用 foreach_get 一次读取顶点色属性的全部颜色
+
+    Args:
+        color_attribute: 顶点色属性
+        srgb: True 读取 color_srgb，False 读取线性 color
+
+    Returns:
+        (N, 4) float32 数组
+    """
+    property_name = "color_srgb" if srgb else "color"
+    colors = np.empty(len(color_attribute.data) * COLOR_CHANNELS, dtype=np.float32)
+    color_attribute.data.foreach_get(property_name, colors)
+    return colors.reshape(-1, COLOR_CHANNELS)
+
+
+def write_color_array(color_attribute, colors, srgb: bool = True) -> None:
+    """
+    用 foreach_set 一次写入顶点色属性的全部颜色
+
+    Args:
+        color_attribute: 顶点色属性
+        colors: (N, 4) 颜色数组，N 与属性元素数一致
+        srgb: True 写入 color_srgb，False 写入线性 color
+    """
+    property_name = "color_srgb" if srgb else "color"
+    color_attribute.data.foreach_set(
+        property_name, np.ascontiguousarray(colors, dtype=np.float32).ravel()
+    )
+
+
+def average_color(color_attribute, srgb: bool = True) -> list | None:
+    """
+    计算顶点色属性的平均颜色
+
+    Args:
+        color_attribute: 顶点色属性
+        srgb: 是否在 sRGB 空间求平均
+
+    Returns:
+        平均颜色值列表 [R, G, B, A]，属性为空时返回 None
+    """
+    if len(color_attribute.data) == 0:
+        return None
+    if HAS_NUMPY:
+        colors = read_color_array(color_attribute, srgb)
+        return colors.mean(axis=0, dtype=np.float64).tolist()
+
+    property_name = "color_srgb" if srgb else "color"
+    colors = [0.0] * (len(color_attribute.data) * COLOR_CHANNELS)
+    color_attribute.data.foreach_get(property_name, colors)
+    element_count = len(color_attribute.data)
+    return [sum(colors[channel::COLOR_CHANNELS]) / element_count for channel in range(COLOR_CHANNELS)]
+
+
 def get_vertex_color_from_obj(obj) -> list:
     """
     获取对象的平均顶点色
@@ -95,38 +174,154 @@ def get_vertex_color_from_obj(obj) -> list:
     Returns:
         平均颜色值列表 [R, G, B, A]
     """
-    if obj.type == 'MESH':
-        color_attr = None
-        for attr in obj.data.color_attributes:
-            print(attr.name, attr)
-            if attr.domain in {'POINT', 'CORNER'}:
-                color_attr = obj.data.attributes[attr.name]
-            break
-        if color_attr:
-            color_data = color_attr.data
-            color_list = []
-            for i in color_data:
-                if hasattr(i, "color_srgb"):
-                    color_list.append(i.color_srgb)
-                elif hasattr(i, "color"):
-                    color_list.append(i.color)
-                elif hasattr(i, "vertex_colors"):
-                    color_list.append(i.color)
-                else:
-                    color_list.append(None)
-            if color_list:
-                color = [
-                    sum(c[i] for c in color_list) / len(color_list)
-                    for i in range(len(color_list[0]))
-                ]
-                return color
-        else:
-            return None
+    if obj.type != "MESH":
+        return None
+    color_attribute = find_color_attribute(obj.data)
+    if color_attribute is None:
+        return None
+    return average_color(color_attribute)
+
+
+def selection_mask(mesh_data: bpy.types.Mesh, domain: str):
+    """
+    从 .select_vert / .select_poly 属性读取选择遮罩，不需要进入 BMesh
+
+    编辑模式下选择存放在 BMesh 中，调用前需先 update_from_editmode 同步到 Mesh。
+    POINT 域使用顶点选择；CORNER 域使用所属面的选择，与编辑模式下按面填色一致。
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        domain: 顶点色属性域 (POINT, CORNER)
+
+    Returns:
+        与该域元素数等长的 bool 数组
+    """
+    if domain == "POINT":
+        return _read_bool_attribute(mesh_data, ".select_vert", len(mesh_data.vertices))
+    polygon_mask = _read_bool_attribute(mesh_data, ".select_poly", len(mesh_data.polygons))
+    _, loop_totals = read_polygon_loop_ranges(mesh_data)
+    return np.repeat(polygon_mask, loop_totals)
+
+
+def _read_bool_attribute(mesh_data: bpy.types.Mesh, attribute_name: str, count: int):
+    # 选择属性在没有任何选中元素时可能不存在，视为全部未选中
+    values = np.zeros(count, dtype=bool)
+    attribute = mesh_data.attributes.get(attribute_name)
+    if attribute is not None and count:
+        attribute.data.foreach_get("value", values)
+    return values
+
+
+def point_to_corner_colors(mesh_data: bpy.types.Mesh, point_colors):
+    """
+    POINT 域颜色转换为 CORNER 域：每个 corner 取其顶点颜色
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        point_colors: (顶点数, 4) 颜色数组
+
+    Returns:
+        (corner 数, 4) 颜色数组
+    """
+    loop_vertices, _ = read_loop_arrays(mesh_data)
+    return np.asarray(point_colors, dtype=np.float32)[loop_vertices]
+
+
+def corner_to_point_colors(mesh_data: bpy.types.Mesh, corner_colors):
+    """
+    CORNER 域颜色转换为 POINT 域：每个顶点取相邻 corner 的平均值
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        corner_colors: (corner 数, 4) 颜色数组
+
+    Returns:
+        (顶点数, 4) 颜色数组，没有 corner 的孤立顶点为 0
+    """
+    vertex_count = len(mesh_data.vertices)
+    loop_vertices, _ = read_loop_arrays(mesh_data)
+    corner_colors = np.asarray(corner_colors, dtype=np.float64)
+    point_colors = np.zeros((vertex_count, COLOR_CHANNELS), dtype=np.float64)
+    np.add.at(point_colors, loop_vertices, corner_colors)
+    corner_counts = np.bincount(loop_vertices, minlength=vertex_count)
+    point_colors /= np.maximum(corner_counts, 1)[:, None]
+    return point_colors.astype(np.float32)
+
+
+def convert_color_domain(mesh_data: bpy.types.Mesh, colors, source_domain: str, target_domain: str):
+    """
+    在 POINT 与 CORNER 域之间转换颜色数组
+
+    Args:
+        mesh_data: 目标 Mesh 数据
+        colors: 源域颜色数组
+        source_domain: 源域 (POINT, CORNER)
+        target_domain: 目标域 (POINT, CORNER)
+
+    Returns:
+        目标域颜色数组
+    """
+    if source_domain == target_domain:
+        return np.asarray(colors, dtype=np.float32)
+    if source_domain == "POINT" and target_domain == "CORNER":
+        return point_to_corner_colors(mesh_data, colors)
+    if source_domain == "CORNER" and target_domain == "POINT":
+        return corner_to_point_colors(mesh_data, colors)
+    raise ValueError(f"Unsupported color domain conversion: {source_domain} -> {target_domain}")
+
+
+def copy_color_attribute(source_attribute, source_mesh_data, target_attribute, target_mesh_data, srgb: bool = True) -> bool:
+    """
+    逐元素复制顶点色属性，必要时转换 POINT/CORNER 域
+
+    Args:
+        source_attribute: 源顶点色属性
+        source_mesh_data: 源 Mesh 数据
+        target_attribute: 目标顶点色属性
+        target_mesh_data: 目标 Mesh 数据，拓扑需与源一致
+        srgb: 是否按 sRGB 值复制
+
+    Returns:
+        拓扑不一致时返回 False
+    """
+    if (
+        len(source_mesh_data.vertices) != len(target_mesh_data.vertices)
+        or len(source_mesh_data.loops) != len(target_mesh_data.loops)
+    ):
+        return False
+    colors = convert_color_domain(
+        source_mesh_data,
+        read_color_array(source_attribute, srgb),
+        source_attribute.domain,
+        target_attribute.domain,
+    )
+    write_color_array(target_attribute, colors, srgb)
+    return True
+
+
+def fill_color_attribute(color_attribute, color, mask=None, srgb: bool = True) -> None:
+    """
+    把单一颜色写入顶点色属性，可选只写入遮罩内的元素
+
+    Args:
+        color_attribute: 顶点色属性
+        color: 颜色值 (R, G, B, A)
+        mask: 可选 bool 数组，与属性元素数等长
+        srgb: True 写入 color_srgb，False 写入线性 color
+    """
+    color = np.asarray(tuple(color)[:COLOR_CHANNELS], dtype=np.float32)
+    element_count = len(color_attribute.data)
+    if mask is None:
+        colors = np.broadcast_to(color, (element_count, COLOR_CHANNELS))
+    else:
+        colors = read_color_array(color_attribute, srgb)
+        colors[mask] = color
+    write_color_array(color_attribute, colors, srgb)
 
 
 def vertexcolor_to_vertices(target_mesh, color_attribute, color):
     """
-    在编辑模式下将颜色应用到选中的顶点
+    在编辑模式下将颜色应用到选中的顶点（无 NumPy 时的 BMesh 路径）
 
     Args:
         target_mesh: 目标 mesh 对象
@@ -159,23 +354,106 @@ def set_object_vertexcolor(target_object, color: tuple, vertexcolor_name: str) -
     """
     设置顶点色
 
+    物体模式下填充整个属性；编辑模式下只填充选中的顶点/面。
+
     Args:
         target_object: 目标对象
         color: 颜色值 (R, G, B, A)
         vertexcolor_name: 顶点色属性名称
     """
+    if target_object.type != "MESH":
+        return
+    if vertexcolor_name not in target_object.data.color_attributes:
+        return
+    batch_set_vertex_color([target_object], color, vertexcolor_name, use_active=False)
+
+
+def _resolve_batch_color_attribute(target_object, vertexcolor_name: str, use_active: bool):
+    mesh = target_object.data
+    color_attribute = None
+    if use_active and len(mesh.color_attributes) > 0:
+        color_attribute = mesh.attributes.active_color
+    if color_attribute is not None:
+        return color_attribute
+    # 只有新建的属性才设为 active，已有属性不改变用户的 active color
+    is_new_attribute = vertexcolor_name not in mesh.color_attributes
+    color_attribute = add_vertexcolor_attribute(target_object, vertexcolor_name)
+    if color_attribute is not None and is_new_attribute:
+        set_active_color_attribute(target_object, color_attribute.name)
+    return color_attribute
+
+
+def batch_set_vertex_color(
+    target_objects,
+    color,
+    vertexcolor_name: str,
+    use_active: bool = True,
+    srgb: bool = True,
+    selected_only: bool = False,
+) -> int:
+    """
+    为多个对象批量写入同一顶点色
+
+    已有顶点色的对象写入其 active color（use_active=True），否则写入 vertexcolor_name 属性，
+    不存在时创建并设为 active color；写入已有属性不会改变 active color。
+    不切换任何对象的模式：物体模式的对象用 foreach_set 整体写入，selected_only 时按
+    .select_vert/.select_poly 遮罩只写选中元素；处于编辑模式的对象写入编辑中的 BMesh，只改选中的顶点/面。
+
+    Args:
+        target_objects: 目标对象列表
+        color: 颜色值 (R, G, B, A)
+        vertexcolor_name: 顶点色属性名称
+        use_active: 是否优先写入已有的 active color
+        srgb: 物体模式下 True 写入 color_srgb，False 写入线性 color
+        selected_only: 物体模式的对象是否只写入选中元素
+
+    Returns:
+        写入颜色的对象数量
+    """
     color = tuple(color)
-    current_mode = bpy.context.active_object.mode
-    if target_object.type == "MESH":
-        mesh = target_object.data
-        if vertexcolor_name in mesh.color_attributes:
-            color_attribute = mesh.color_attributes.get(vertexcolor_name)
-            if current_mode == "OBJECT":
-                color_attribute.data.foreach_set(
-                    "color_srgb", color * len(mesh.loops) * 4
-                )
-            elif current_mode == "EDIT":
-                vertexcolor_to_vertices(target_object, color_attribute, color)
+    updated_count = 0
+    for obj in target_objects:
+        if obj.type != "MESH":
+            continue
+        color_attribute = _resolve_batch_color_attribute(obj, vertexcolor_name, use_active)
+        if color_attribute is None:
+            continue
+        if obj.mode == "EDIT":
+            # 编辑模式下 BMesh 是数据真源，直接写入 Mesh 会在退出编辑模式时被覆盖
+            vertexcolor_to_vertices(obj, color_attribute, color)
+        elif HAS_NUMPY:
+            mask = selection_mask(obj.data, color_attribute.domain) if selected_only else None
+            fill_color_attribute(color_attribute, color, mask, srgb)
+            obj.data.update()
+        else:
+            _fill_color_attribute_lists(obj.data, color_attribute, color, selected_only, srgb)
+        updated_count += 1
+    return updated_count
+
+
+# 无 NumPy 时的物体模式填色：foreach_get/foreach_set 扁平 list，selected_only 时按顶点/面的 select 过滤。
+def _fill_color_attribute_lists(mesh_data, color_attribute, color, selected_only, srgb):
+    property_name = "color_srgb" if srgb else "color"
+    color = list(color[:COLOR_CHANNELS])
+    element_count = len(color_attribute.data)
+    if not selected_only:
+        color_attribute.data.foreach_set(property_name, color * element_count)
+        return
+    colors = [0.0] * (element_count * COLOR_CHANNELS)
+    color_attribute.data.foreach_get(property_name, colors)
+    if color_attribute.domain == "POINT":
+        selected_elements = [vertex.index for vertex in mesh_data.vertices if vertex.select]
+    else:
+        selected_elements = [
+            loop_index
+            for polygon in mesh_data.polygons
+            if polygon.select
+            for loop_index in polygon.loop_indices
+        ]
+    for element_index in selected_elements:
+        colors[element_index * COLOR_CHANNELS:(element_index + 1) * COLOR_CHANNELS] = color
+    color_attribute.data.foreach_set(property_name, colors)
+    mesh_data.update()
 
 
 def get_color_data(color):
@@ -274,6 +552,12 @@ class VertexColor:
         if color_attr is None:
             return
             
+        if HAS_NUMPY:
+            colors = read_color_array(color_attr, srgb=False)
+            colors[:, 3] = alpha_value
+            write_color_array(color_attr, colors, srgb=False)
+            return
+
         for i in range(len(color_attr.data)):
             color = list(color_attr.data[i].color)
             color[3] = alpha_value